@@ -1,10 +1,10 @@
-import json
+from utils.bank_validation import load_bank, save_bank_and_report
+from utils.passages import bank_levels
 
 def add_passages_to_json():
     """extracted_questions.json에 지문 추가"""
     
-    with open('extracted_questions.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_bank()
     
     # 지문 정의 (레벨별)
     passages = {
@@ -82,7 +82,7 @@ Policymakers must balance short-term recovery measures with long-term structural
     }
     
     # 각 레벨별로 Reading 섹션 문항에 지문 추가
-    for level, questions in data.items():
+    for level, questions in bank_levels(data):
         if level in passages:
             passage_pool = passages[level]
             reading_questions = [q for q in questions if q.get('section') == 'Reading']
@@ -97,9 +97,8 @@ Policymakers must balance short-term recovery measures with long-term structural
                         q['passage'] = passage_pool[passage_num]
                         print(f"✓ Added passage {passage_num} to {level} Q{q.get('id')}")
     
-    # 수정된 데이터 저장
-    with open('extracted_questions.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # 수정된 데이터 저장 (지문 본문은 은행의 지문 테이블에 한 번만)
+    save_bank_and_report(data)  # 검증 보고서도 함께 갱신
     
     print("\n✅ Passages added to extracted_questions.json")
 
@@ -0,0 +1,71 @@
+import argparse
+import csv
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.db_manager import DatabaseManager
+from utils.item_analysis import DEFAULT_STATE_PATH, ItemAnalysisStore, normalize_level
+
+CSV_COLUMNS = ['level', 'id', 'n', 'key', 'p_value', 'point_biserial',
+               'share_0', 'share_1', 'share_2', 'share_3', 'omit_share', 'flags']
+
+
+def fmt(value, spec='.2f'):
+    return '-' if value is None else format(value, spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Classical item analysis of stored submissions')
+    parser.add_argument('--db', default='data/cefr_test.db', help='database file (default: data/cefr_test.db)')
+    parser.add_argument('--state', default=DEFAULT_STATE_PATH,
+                        help=f'incremental state file (default: {DEFAULT_STATE_PATH})')
+    parser.add_argument('--full', action='store_true', help='recompute from all submissions')
+    parser.add_argument('--level', help='only print this level')
+    parser.add_argument('--all', action='store_true', help='print every item, not only flagged ones')
+    parser.add_argument('--csv', help='write per-item statistics to this CSV file')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database not found: {args.db}")
+        sys.exit(1)
+
+    store = ItemAnalysisStore(args.state)
+    if args.full:
+        store.reset()
+    started = time.perf_counter()
+    added = store.update_from_db(DatabaseManager(args.db, trace=False))
+    print(f"Added {added} submissions in {time.perf_counter() - started:.2f}s (state: {args.state})")
+
+    levels = [normalize_level(args.level)] if args.level else list(store.levels)
+    rows = []
+    for level in levels:
+        analysis = store.levels.get(level)
+        if analysis is None:
+            print(f"Unknown level: {level}")
+            continue
+        summary = analysis.summary()
+        print(f"\n[{level}] {summary['students']} submissions, {summary['items']} items, "
+              f"alpha {fmt(summary['alpha'])}, skipped (no responses) {summary['skipped']}")
+        for item in analysis.item_statistics():
+            rows.append([level, item['id'], item['n'], item['key'], item['p_value'], item['point_biserial']]
+                        + item['option_share'] + [item['omit_share'], ' '.join(item['flags'])])
+            if args.all or item['flags']:
+                shares = ' '.join(f"{'*' if o == item['key'] else ' '}{s:4.0%}"
+                                  for o, s in enumerate(item['option_share']))
+                print(f"  #{item['id']:<4} n={item['n']:<7} p={fmt(item['p_value'])} "
+                      f"r={fmt(item['point_biserial'])}  {shares}  {', '.join(item['flags'])}")
+
+    if args.csv:
+        with open(args.csv, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(rows)
+        print(f"\nWrote {len(rows)} items to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 import json
 import os
-import base64
+from utils.assets import inject_css
+from utils.auth_manager import (AuthManager, LoginThrottled, client_address, logout,
+                                normalize_session_state, refresh_session_token)
+from utils.lazy_imports import lazy_import
+
+# pandas는 CEFR 레벨 가이드 표를 그릴 때만 필요하므로 지연 import
+pd = lazy_import('pandas')
 
 # 페이지 설정
 st.set_page_config(
@@ -13,46 +18,41 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# 커스텀 CSS
-with open('assets/styles.css', 'r') as f:
-    st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+# 커스텀 CSS (프로세스 단위 캐시)
+inject_css()
 
-# 세션 상태 초기화
-if 'logged_in' not in st.session_state:
-    st.session_state['logged_in'] = False
-if 'user_role' not in st.session_state:
-    st.session_state['user_role'] = None
-if 'student_info' not in st.session_state:
-    st.session_state['student_info'] = {}
+# 세션 상태 초기화 (재접속 시 URL의 서명된 세션 토큰으로 로그인 상태 복원)
+normalize_session_state()
 
 # 로그인 함수
 def login(username, password):
-    # 비밀번호 보안 처리 (Streamlit Secrets 사용)
-    if 'users' not in st.secrets:
+    # 해시 저장소(manage_users.py) 우선, 없으면 Streamlit Secrets / STREAMLIT_USERS
+    auth = AuthManager()
+    if not auth.has_users():
         st.error("설정 파일(secrets.toml)이 누락되었습니다. 관리자에게 문의하세요.")
         return False
-        
-    users = st.secrets['users']
-    
-    # 디버깅: 사용 가능한 사용자 표시
-    # st.write("Available users:", list(users.keys()))
-    # st.write("Username entered:", repr(username))
-    # st.write("Password entered:", repr(password))
-    
-    # 공백 제거 후 비교
-    username = username.strip()
-    password = password.strip()
 
-    if username in users and users[username]['password'] == password:
+    try:
+        user = auth.authenticate(username, password, client_ip=client_address())
+    except LoginThrottled as e:
+        st.error(f"로그인 시도가 너무 많습니다. {int(e.retry_after) + 1}초 후에 다시 시도하세요.")
+        return False
+
+    if user:
         st.session_state['logged_in'] = True
-        st.session_state['user_role'] = users[username]['role']
-        if users[username]['role'] == 'student':
+        st.session_state['username'] = user['username']
+        st.session_state['user_role'] = user['role']
+        if user['role'] == 'student':
             st.session_state['student_info'] = {
-                'name': username,
-                'school': 'Default School',
-                'grade': '1',
-                'class': 'A'
+                'name': user['username'],
+                'school': user['school'] or 'Default School',
+                'grade': user['grade'] if user['grade'] in ('1', '2', '3') else '1',
+                'class': user['class'] or 'A'
             }
+            # 명단(roster)으로 등록된 학생은 이름이 있으므로 정보 입력을 건너뜀
+            if user['name'] != user['username']:
+                st.session_state['student_info']['full_name'] = user['name']
+        refresh_session_token()
         return True
     return False
 
@@ -76,8 +76,7 @@ def main():
         else:
             st.success(f"로그인됨: {st.session_state['user_role']}")
             if st.button("로그아웃"):
-                for key in st.session_state.keys():
-                    del st.session_state[key]
+                logout()
                 st.rerun()
 
     # 메인 콘텐츠
@@ -86,6 +85,8 @@ def main():
             student_dashboard()
         elif st.session_state['user_role'] == 'teacher':
             teacher_dashboard()
+        elif st.session_state['user_role'] == 'admin':
+            admin_dashboard()
     else:
         welcome_page()
 
@@ -255,7 +256,7 @@ def teacher_dashboard():
     st.markdown("---")
 
     # 관리 기능
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         if st.button("📊 결과 관리", type="primary"):
@@ -266,6 +267,10 @@ def teacher_dashboard():
             st.switch_page("pages/3_Reports.py")
 
     with col3:
+        if st.button("🔬 문항 분석"):
+            st.switch_page("pages/5_Item_Analysis.py")
+
+    with col4:
         if st.button("⚙️ 설정"):
             st.info("설정 페이지 준비 중...")
 
@@ -276,5 +281,11 @@ def teacher_dashboard():
     # 데이터베이스에서 최근 제출 가져오기
     # placeholder
 
+def admin_dashboard():
+    st.title("🛠 관리자")
+
+    if st.button("⏱ 성능 계측", type="primary"):
+        st.switch_page("pages/4_Metrics.py")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+적응형 시험(CAT) 벤치마크 (utils/cat.py)
+
+Pre-A1~B2 다섯 레벨 x 레벨당 N문항(기본 35) 합성 2PL 문항 풀에서, 학생마다 자기 레벨을 고른 뒤
+- 고정형: 그 레벨 문항 전체를 풀고 EAP 추정
+- 적응형: 고른 레벨에서 시작해 목표 SE에 도달할 때까지 최대 정보량 문항 선택
+을 시뮬레이션해 학생당 문항 수, 참 능력 대비 RMSE, 문항 선택+능력 갱신 시간(단계당)을 비교합니다.
+
+사용법:
+    python benchmarks/cat_bench.py
+    python benchmarks/cat_bench.py --students 5000 --per-level 40 --target-se 0.3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, BASE_DIR)
+
+import numpy as np  # noqa: E402
+
+from utils.cat import MAX_ITEMS, MIN_ITEMS, TARGET_SE, AdaptiveTest, ItemPool  # noqa: E402
+from utils.irt import LEVEL_ANCHORS, LEVEL_NAMES, LEVEL_ORDER, estimate_abilities  # noqa: E402
+
+
+def make_pool(per_level: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    questions, a, b = [], [], []
+    for level in LEVEL_ORDER:
+        for i in range(per_level):
+            questions.append({'id': i + 1, 'level': LEVEL_NAMES[level], 'correct': 0})
+        a.extend(rng.lognormal(0.2, 0.3, per_level))
+        b.extend(rng.normal(LEVEL_ANCHORS[level], 0.8, per_level))
+    return questions, np.array(a), np.array(b)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='적응형 시험 벤치마크')
+    parser.add_argument('--students', type=int, default=2000)
+    parser.add_argument('--per-level', type=int, default=35)
+    parser.add_argument('--target-se', type=float, default=TARGET_SE)
+    args = parser.parse_args()
+
+    questions, a, b = make_pool(args.per_level)
+    pool = ItemPool(questions, a, b)
+    rng = np.random.default_rng(1)
+    levels = rng.integers(0, len(LEVEL_ORDER), args.students)
+    theta = np.array([LEVEL_ANCHORS[LEVEL_ORDER[level]] for level in levels]) + rng.normal(0, 0.7, args.students)
+
+    # 고정형: 고른 레벨의 문항 전체
+    fixed = np.empty(args.students)
+    for level_index, level in enumerate(LEVEL_ORDER):
+        who = levels == level_index
+        cols = slice(level_index * args.per_level, (level_index + 1) * args.per_level)
+        p = 1 / (1 + np.exp(-a[cols] * (theta[who, None] - b[cols])))
+        X = rng.random(p.shape) < p
+        fixed[who], _ = estimate_abilities(X, np.ones_like(X), a[cols], b[cols], LEVEL_ANCHORS[level])
+
+    # 적응형
+    adaptive = np.empty(args.students)
+    items = np.empty(args.students, dtype=int)
+    step_ms = []
+    for s in range(args.students):
+        test = AdaptiveTest(pool, LEVEL_NAMES[LEVEL_ORDER[levels[s]]], target_se=args.target_se, seed=s)
+        while True:
+            started = time.perf_counter()
+            question = test.next_item()
+            if question is None:
+                break
+            j = test.current
+            correct = rng.random() < 1 / (1 + np.exp(-a[j] * (theta[s] - b[j])))
+            test.answer(correct)
+            step_ms.append((time.perf_counter() - started) * 1000)
+        adaptive[s] = test.theta
+        items[s] = len(test.path)
+
+    step_ms.sort()
+    rmse = lambda est: float(np.sqrt(((est - theta) ** 2).mean()))  # noqa: E731
+    print(f"pool {len(pool)} items; {args.students} students; stop at SE <= {args.target_se} "
+          f"({MIN_ITEMS}-{MAX_ITEMS} items)")
+    print(f"fixed form : {args.per_level} items/student, RMSE {rmse(fixed):.3f}")
+    print(f"adaptive   : {items.mean():.1f} items/student (max {items.max()}), RMSE {rmse(adaptive):.3f}")
+    print(f"step (select + update): p50 {step_ms[len(step_ms) // 2]:.3f}ms, "
+          f"p99 {step_ms[int(len(step_ms) * 0.99)]:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+스트리밍 내보내기 메모리/시간 벤치마크 (utils/export_stream.py)
+
+합성 제출 데이터 N건(기본 50k, 500k)을 DB에 채운 뒤 CSV/NDJSON/XLSX 내보내기를 각각 별도
+프로세스에서 실행해 최대 RSS 증가량과 소요 시간을 잽니다. 건수가 10배가 되어도 RSS 증가량이
+거의 그대로면 메모리가 일정한 것입니다. 비교용으로 기존 방식(load_submissions() 전체 로드 후
+DataFrame.to_csv)도 함께 측정합니다 (--no-legacy로 생략).
+
+사용법:
+    python benchmarks/export_stream_bench.py
+    python benchmarks/export_stream_bench.py --sizes 10000,100000 --no-legacy
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import synthetic  # noqa: E402
+from utils.db_manager import DatabaseManager  # noqa: E402
+
+
+def peak_rss_mib() -> float:
+    # Linux는 KiB, macOS는 바이트 단위
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (2**20 if sys.platform == 'darwin' else 2**10)
+
+
+def _export_worker(db_path: str, fmt: str, out_path: str, queue):
+    from utils.export_stream import export_from_db
+    import xlsxwriter  # noqa: F401 - import 비용을 측정에서 제외
+    import pandas as pd
+
+    db = DatabaseManager(db_path, trace=False)
+    before = peak_rss_mib()
+    started = time.perf_counter()
+    if fmt == 'legacy-csv':
+        rows = db.load_submissions()
+        pd.DataFrame([{
+            '이름': s['studentInfo'].get('name'), '레벨': s.get('level'), '점수': s.get('score'),
+            '제출시간': s.get('submittedAt'),
+        } for s in rows]).to_csv(out_path, index=False, encoding='utf-8-sig')
+        count = len(rows)
+    else:
+        count = export_from_db(db, out_path, fmt)
+    queue.put({
+        'rows': count,
+        'seconds': time.perf_counter() - started,
+        'rss_growth_mib': peak_rss_mib() - before,
+        'file_mib': os.path.getsize(out_path) / 2**20,
+    })
+
+
+def run_export(db_path: str, fmt: str, out_path: str) -> Dict[str, float]:
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    process = ctx.Process(target=_export_worker, args=(db_path, fmt, out_path, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스트리밍 내보내기 메모리/시간 벤치마크')
+    parser.add_argument('--sizes', default='50000,500000', help='제출 건수 (쉼표 구분)')
+    parser.add_argument('--no-legacy', action='store_true', help='기존 전체 로드 방식 비교 생략')
+    args = parser.parse_args()
+
+    formats = ['csv', 'ndjson', 'xlsx'] + ([] if args.no_legacy else ['legacy-csv'])
+    workdir = tempfile.mkdtemp(prefix='cefr_export_bench_')
+    try:
+        print(f"{'rows':>8} {'format':<11} {'seconds':>8} {'RSS +MiB':>9} {'file MiB':>9}")
+        for n in [int(s) for s in args.sizes.split(',')]:
+            db_path = os.path.join(workdir, f'export_{n}.db')
+            synthetic.populate_db(DatabaseManager(db_path, trace=False), n)
+            for fmt in formats:
+                out_path = os.path.join(workdir, f'export_{n}.{fmt.split("-")[-1]}')
+                r = run_export(db_path, fmt, out_path)
+                print(f"{r['rows']:>8} {fmt:<11} {r['seconds']:>8.1f} {r['rss_growth_mib']:>9.1f} {r['file_mib']:>9.1f}")
+                os.remove(out_path)
+            os.remove(db_path)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+HTML 시험지 추출 벤치마크 (utils/paper_extraction.py)
+
+합성 시험지 N장(기본 100장 = 레벨 5개 x 20개 양식, 장당 40문항)과 js/answer-data.js를 임시 디렉터리에 만들고
+- 이전 방식: extract_questions_with_passages.py처럼 문항마다 문서 앞부분 전체에 섹션/지문 정규식을 다시 돌리고
+  레벨마다 정답 파일을 다시 읽음 (BeautifulSoup 파싱은 bs4가 설치된 경우에만 포함)
+- 새 파이프라인: 단일 패스 + 미리 컴파일한 정규식, 한 프로세스(--workers 1)
+- 새 파이프라인: 프로세스 풀 (CPU 수만큼)
+의 전체 시간을 비교하고, 세 방식의 추출 결과(문항 수)가 같은지 확인합니다.
+
+사용법:
+    python benchmarks/extraction_bench.py
+    python benchmarks/extraction_bench.py --papers 200 --questions 60 --workers 4
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from synthetic import LEVELS, make_answer_key_js, make_paper_html  # noqa: E402
+from utils.paper_extraction import extract_papers, find_papers  # noqa: E402
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+
+def legacy_extract(content, answers_path, level):
+    """이전 스크립트의 처리 순서 그대로 (문항마다 content[:위치] 재검색, 레벨마다 정답 파일 재읽기)"""
+    if BeautifulSoup is not None:
+        BeautifulSoup(content, 'html.parser')
+    q_pattern = (r'<div class="question">[^<]*<span class="question-number">(\d+)</span>(.*?)</div>'
+                 r'\s*(?=</div>|<div class="question">|</section>)')
+    questions = []
+    for number, body in re.findall(q_pattern, content, re.DOTALL):
+        options = re.findall(r'<input[^>]*\bvalue="([A-D])"[^>]*>.*?<span[^>]*>([^<]+)</span>', body, re.DOTALL)
+        q_pos = content.find(f'<span class="question-number">{number}</span>')
+        re.findall(r'<section[^>]*>.*?<div class="section-header">.*?<h2[^>]*>(.*?)</h2>', content[:q_pos], re.DOTALL)
+        re.findall(r'<div class="passage">.*?<span class="passage-label">([^<]+)</span>(.*?)</div>',
+                   content[:q_pos], re.DOTALL)
+        if len(options) == 4:
+            questions.append(number)
+    with open(answers_path, encoding='utf-8') as f:
+        re.search(rf"'{level}':.*?answers:\s*\{{([^}}]*)\}}", f.read(), re.DOTALL)
+    return questions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 시험지 추출 벤치마크')
+    parser.add_argument('--papers', type=int, default=100)
+    parser.add_argument('--questions', type=int, default=40)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as source:
+        answer_keys = {}
+        for i in range(args.papers):
+            level = LEVELS[i % len(LEVELS)].upper()
+            form = i // len(LEVELS)
+            html, answers = make_paper_html(args.questions, seed=i)
+            answer_keys.setdefault(level, answers)
+            with open(os.path.join(source, f'CEFR_{level}_English_Level_Test_Student_form{form:02d}.html'), 'w',
+                      encoding='utf-8') as f:
+                f.write(html)
+        os.makedirs(os.path.join(source, 'js'))
+        answers_path = os.path.join(source, 'js', 'answer-data.js')
+        with open(answers_path, 'w', encoding='utf-8') as f:
+            f.write(make_answer_key_js(answer_keys))
+
+        papers = find_papers(source)
+        size = sum(os.path.getsize(path) for path in glob.glob(os.path.join(source, '*.html')))
+        print(f"{len(papers)} papers x {args.questions} questions, {size / 1e6:.1f}MB HTML, "
+              f"{os.cpu_count()} CPU(s)")
+        if BeautifulSoup is None:
+            print("(bs4 not installed: previous-method timing excludes the BeautifulSoup parse)")
+
+        started = time.perf_counter()
+        legacy_count = 0
+        for path in papers:
+            with open(path, encoding='utf-8') as f:
+                content = f.read()
+            level = os.path.basename(path).split('_')[1]
+            legacy_count += len(legacy_extract(content, answers_path, level))
+        legacy = time.perf_counter() - started
+
+        serial = extract_papers(papers, answers_path, workers=1)
+        pooled = extract_papers(papers, answers_path, workers=args.workers)
+        counts = [sum(len(q) for q in result['levels'].values()) for result in (serial, pooled)]
+
+        print(f"previous method      {legacy:6.2f}s  ({legacy_count} questions)")
+        print(f"single pass, 1 proc  {serial['seconds']:6.2f}s  ({counts[0]} questions)")
+        print(f"single pass, {args.workers} proc  {pooled['seconds']:6.2f}s  ({counts[1]} questions)")
+        print(f"per paper (parse)    {sum(p['seconds'] for p in serial['papers']) / len(papers) * 1000:6.2f}ms")
+        if not legacy_count == counts[0] == counts[1]:
+            print("WARNING: question counts differ")
+
+
+if __name__ == "__main__":
+    main()
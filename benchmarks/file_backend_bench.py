@@ -0,0 +1,81 @@
+"""
+파일 백엔드 인덱스 벤치마크 (utils/submission_index.py)
+
+합성 제출 N건(기본 5000)을 제출 JSON 파일로 만든 뒤, 기존 방식(listdir 후 모든 파일을 열어
+필터링)과 사이드카 인덱스 방식으로 레벨별/학생별 조회 시간을 비교합니다.
+'cold'는 새 DataManager(인덱스 파일만 읽음), 'warm'은 같은 DataManager의 반복 조회입니다.
+
+사용법:
+    python benchmarks/file_backend_bench.py
+    python benchmarks/file_backend_bench.py --rows 20000
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import synthetic  # noqa: E402
+from utils import json_codec  # noqa: E402
+from utils.data_manager import DataManager  # noqa: E402
+from utils.submission_index import SIGNATURE_SETTLE_NS  # noqa: E402
+
+
+def legacy_load(submissions_dir):
+    """인덱스 도입 전 load_submissions()"""
+    submissions = []
+    for file in os.listdir(submissions_dir):
+        if file.endswith('.json'):
+            with open(os.path.join(submissions_dir, file), 'rb') as f:
+                submissions.append(json_codec.decode_submission(f.read()))
+    return submissions
+
+
+def timed_ms(func):
+    started = time.perf_counter()
+    result = func()
+    return (time.perf_counter() - started) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='파일 백엔드 인덱스 조회 벤치마크')
+    parser.add_argument('--rows', type=int, default=5000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='cefr_file_bench_')
+    try:
+        manager = DataManager(workdir)
+        for i, sub in enumerate(synthetic.make_submissions(args.rows)):
+            filename = f"{sub['studentInfo']['name']}_{sub['level']}_{i:07d}.json"
+            with open(os.path.join(manager.submissions_dir, filename), 'w', encoding='utf-8') as f:
+                f.write(json_codec.dumps(sub, indent=True))
+
+        build_ms, _ = timed_ms(manager.rebuild_index)
+        print(f"{args.rows} submission files, index build {build_ms:.0f} ms")
+        time.sleep(SIGNATURE_SETTLE_NS / 1e9)  # 방금 쓴 디렉토리는 매번 다시 맞추므로 안정될 때까지 대기
+
+        queries = [
+            ('level=A1', lambda s: s.get('level') == 'A1', {'level': 'A1'}),
+            ('student', lambda s: s['studentInfo']['name'] == 'student0007', {'student_name': 'student0007'}),
+        ]
+        print(f"{'query':<10} {'rows':>6} {'legacy ms':>10} {'cold ms':>9} {'warm ms':>9}")
+        for label, predicate, filters in queries:
+            legacy_ms, legacy = timed_ms(lambda: [s for s in legacy_load(manager.submissions_dir) if predicate(s)])
+            cold_ms, cold = timed_ms(lambda: list(DataManager(workdir).iter_submissions(**filters)))
+            warm_ms, warm = timed_ms(lambda: list(manager.iter_submissions(**filters)))
+            assert len(legacy) == len(cold) == len(warm)
+            print(f"{label:<10} {len(warm):>6} {legacy_ms:>10.1f} {cold_ms:>9.1f} {warm_ms:>9.1f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
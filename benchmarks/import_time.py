@@ -0,0 +1,157 @@
+"""
+엔트리 스크립트 콜드 스타트 import 시간 측정 (`python -X importtime` 기반)
+
+app.py와 pages/*.py는 Streamlit 런타임 밖에서 실행할 수 없으므로, 각 스크립트의
+모듈 최상위 import 문만 추출해 새 인터프리터에서 `-X importtime`으로 실행하고
+결과를 집계합니다. import_budget.json의 예산(ms)을 넘거나, 시작 시점에 import 되면
+안 되는 모듈(pandas, plotly 등)이 로드되면 0이 아닌 코드로 종료합니다.
+
+사용법:
+    python benchmarks/import_time.py                # 예산 검사
+    python benchmarks/import_time.py --top 15       # 느린 import 상위 15개 출력
+    python benchmarks/import_time.py --json out.json
+"""
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'import_budget.json')
+
+
+def extract_top_level_imports(script_path: str) -> str:
+    """스크립트의 모듈 최상위 import 문만 모아 실행 가능한 코드로 반환합니다."""
+    with open(script_path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=script_path)
+
+    statements = [
+        ast.unparse(node) for node in tree.body
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+    ]
+    return '\n'.join(statements)
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """
+    -X importtime 출력을 (모듈명, 깊이, self_us, cumulative_us) 리스트로 변환합니다.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # 헤더 행
+        raw_name = parts[2][1:]
+        name = raw_name.lstrip(' ')
+        depth = (len(raw_name) - len(name)) // 2
+        entries.append((name, depth, self_us, cumulative_us))
+    return entries
+
+
+def profile_entry(script: str, repeat: int = 3) -> Dict:
+    """엔트리 스크립트의 최상위 import를 repeat회 측정해 가장 빠른 실행 결과를 반환합니다."""
+    code = 'import sys\nsys.path.insert(0, {!r})\n{}'.format(
+        BASE_DIR, extract_top_level_imports(os.path.join(BASE_DIR, script))
+    )
+
+    runs = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=BASE_DIR, capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            error = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'unknown error'
+            return {'script': script, 'error': error}
+        entries = parse_importtime(proc.stderr)
+        total_us = sum(cum for _, depth, _, cum in entries if depth == 0)
+        runs.append((total_us, entries))
+
+    total_us, entries = min(runs, key=lambda r: r[0])
+    return {
+        'script': script,
+        'total_ms': total_us / 1000,
+        'median_ms': statistics.median(r[0] for r in runs) / 1000,
+        'modules': {name for name, _, _, _ in entries},
+        'top_level': sorted(
+            ((name, cum / 1000) for name, depth, _, cum in entries if depth == 0),
+            key=lambda x: x[1], reverse=True
+        ),
+    }
+
+
+def check_budget(result: Dict, budget: Dict, scale: float = 1.0) -> List[str]:
+    """예산 위반 사항 목록을 반환합니다 (비어 있으면 통과)."""
+    problems = []
+    budget_ms = budget.get('budget_ms')
+    if budget_ms is not None and result['total_ms'] > budget_ms * scale:
+        problems.append(f"import 시간 {result['total_ms']:.0f}ms > 예산 {budget_ms * scale:.0f}ms")
+
+    for forbidden in budget.get('forbidden', []):
+        loaded = sorted(m for m in result['modules'] if m == forbidden or m.startswith(forbidden + '.'))
+        if loaded:
+            problems.append(f"시작 시 '{forbidden}' import 됨 ({', '.join(loaded[:3])})")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='엔트리 스크립트 import 시간 예산 검사')
+    parser.add_argument('--repeat', type=int, default=3, help='엔트리당 측정 횟수 (최솟값 사용)')
+    parser.add_argument('--top', type=int, default=5, help='출력할 느린 최상위 import 개수')
+    parser.add_argument('--budget-scale', type=float, default=1.0,
+                        help='예산 배율 (느린 CI 머신용, 예: 2.0)')
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    with open(BUDGET_FILE, 'r', encoding='utf-8') as f:
+        budgets = json.load(f)['entries']
+
+    failed = False
+    report = []
+    for script, budget in budgets.items():
+        result = profile_entry(script, repeat=args.repeat)
+        if 'error' in result:
+            print(f"❌ {script}: import 실패 - {result['error']}")
+            failed = True
+            report.append({'script': script, 'problems': [result['error']]})
+            continue
+
+        problems = check_budget(result, budget, args.budget_scale)
+        status = '✅' if not problems else '❌'
+        print(f"{status} {script}: {result['total_ms']:.0f}ms "
+              f"(median {result['median_ms']:.0f}ms, budget {budget.get('budget_ms')}ms)")
+        for name, ms in result['top_level'][:args.top]:
+            print(f"     {ms:8.1f}ms  {name}")
+        for problem in problems:
+            print(f"   ⚠️ {problem}")
+
+        failed = failed or bool(problems)
+        report.append({
+            'script': script,
+            'total_ms': round(result['total_ms'], 1),
+            'median_ms': round(result['median_ms'], 1),
+            'top_level': [[name, round(ms, 1)] for name, ms in result['top_level'][:args.top]],
+            'problems': problems,
+        })
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
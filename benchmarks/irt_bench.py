@@ -0,0 +1,85 @@
+"""
+IRT 보정/능력 추정 처리 시간 벤치마크 (utils/irt.py)
+
+2PL 모형으로 만든 합성 응답(기본 200문항 x 100k명, 추측·미응답 없음)으로
+- 2PL / 1PL(Rasch) EM 보정 시간과 반복 횟수, 참값 대비 모수 복원 오차
+- 제출 한 건 능력 추정(ItemParameters.estimate) 시간과 일괄 EAP 시간, 참 능력과의 상관
+을 잽니다. --db를 주면 합성 제출을 DB에 채운 뒤 calibrate_items.py와 같은 경로(DB 읽기 포함)도 잽니다.
+
+사용법:
+    python benchmarks/irt_bench.py
+    python benchmarks/irt_bench.py --items 40 --rows 20000 --db
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import numpy as np  # noqa: E402
+
+import synthetic  # noqa: E402
+from utils.db_manager import DatabaseManager  # noqa: E402
+from utils.irt import ItemParameters, calibrate, calibrate_from_db, estimate_abilities  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='IRT 보정 처리 시간 벤치마크')
+    parser.add_argument('--items', type=int, default=200)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--db', action='store_true', help='DB 읽기를 포함한 calibrate_from_db도 측정')
+    args = parser.parse_args()
+
+    bank = synthetic.make_item_bank(args.items)
+    theta, responses = synthetic.simulate_responses(bank, args.rows, guessing=0.0, omit_rate=0.0)
+    X = responses == np.asarray(bank['key'])
+    M = np.ones_like(X)
+
+    results = {}
+    for model in ('2pl', '1pl'):
+        started = time.perf_counter()
+        result = calibrate(X, M, model=model)
+        elapsed = time.perf_counter() - started
+        results[model] = result
+        print(f"{model}: {args.rows} x {args.items} in {elapsed:.1f}s, {result['iterations']} iterations "
+              f"({'converged' if result['converged'] else 'not converged'}); "
+              f"mean |b error| {np.abs(result['b'] - bank['b']).mean():.3f}, "
+              f"mean |a error| {np.abs(result['a'] - bank['a']).mean():.3f}")
+
+    result = results['2pl']
+    params = ItemParameters('2pl')
+    params.set_level('A1', bank['ids'], bank['key'], result, args.rows, 0.0)
+    started = time.perf_counter()
+    for i in range(1000):
+        params.estimate('A1', bank['ids'], X[i], bank['key'])
+    print(f"per-submission estimate: {(time.perf_counter() - started) / 1000 * 1e6:.0f}us")
+
+    started = time.perf_counter()
+    estimates, se = estimate_abilities(X, M, result['a'], result['b'])
+    print(f"batch EAP {args.rows}: {time.perf_counter() - started:.2f}s, "
+          f"corr(theta) {np.corrcoef(estimates, theta)[0, 1]:.3f}, mean SE {se.mean():.3f}")
+
+    if args.db:
+        workdir = tempfile.mkdtemp(prefix='cefr_irt_bench_')
+        try:
+            db = DatabaseManager(os.path.join(workdir, 'irt.db'), trace=False)
+            synthetic.populate_db_responses(db, bank, args.rows)
+            started = time.perf_counter()
+            calibrate_from_db(db, {'A1': (bank['ids'], bank['key'])},
+                              progress=lambda level, stats: print(
+                                  f"DB read {stats['load_seconds']:.1f}s, EM {stats['seconds']:.1f}s"))
+            print(f"calibrate_from_db total: {time.perf_counter() - started:.1f}s")
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+문항 분석 처리 시간 벤치마크 (utils/item_analysis.py)
+
+3PL 모형으로 만든 합성 응답 N건(기본 100k, 40문항)을 DB에 채운 뒤
+- NumPy 집계만 (응답 행렬 -> 통계)
+- DB에서 읽기 + JSON 디코딩 + 집계 (ItemAnalysisStore.update_from_db, analyze_items.py와 같은 경로)
+- 새 제출 1,000건 증분 반영
+시간을 잽니다. 한 문항은 정답을 일부러 틀리게 넘겨 정답 오류 의심(possible_miskey) 판정을 확인합니다.
+
+사용법:
+    python benchmarks/item_analysis_bench.py
+    python benchmarks/item_analysis_bench.py --rows 20000 --items 30
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import synthetic  # noqa: E402
+from utils.db_manager import DatabaseManager  # noqa: E402
+from utils.item_analysis import ItemAnalysis, ItemAnalysisStore  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description='문항 분석 처리 시간 벤치마크')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--items', type=int, default=40)
+    args = parser.parse_args()
+
+    bank = synthetic.make_item_bank(args.items)
+    miskeyed = 0
+    key = list(bank['key'])
+    key[miskeyed] = (key[miskeyed] + 1) % bank['n_options']  # 정답 오류 문항
+    banks = {'A1': (bank['ids'], key)}
+
+    _, responses = synthetic.simulate_responses(bank, args.rows)
+    started = time.perf_counter()
+    analysis = ItemAnalysis('A1', bank['ids'], key)
+    analysis.update_matrix(responses)
+    stats = analysis.item_statistics()
+    print(f"numpy aggregation  {args.rows} x {args.items}: {time.perf_counter() - started:.3f}s")
+
+    workdir = tempfile.mkdtemp(prefix='cefr_items_bench_')
+    try:
+        db = DatabaseManager(os.path.join(workdir, 'items.db'), trace=False)
+        synthetic.populate_db_responses(db, bank, args.rows)
+        store = ItemAnalysisStore(os.path.join(workdir, 'state.json'))
+        started = time.perf_counter()
+        added = store.update_from_db(db, banks)
+        print(f"DB read + decode + aggregation: {added} submissions in {time.perf_counter() - started:.2f}s")
+
+        synthetic.populate_db_responses(db, bank, 1000, seed=1)
+        started = time.perf_counter()
+        added = ItemAnalysisStore(store.path).update_from_db(db, banks)
+        print(f"incremental: {added} new submissions in {time.perf_counter() - started:.3f}s")
+
+        summary = store.levels['A1'].summary()
+        print(f"alpha {summary['alpha']:.3f}; item #{bank['ids'][miskeyed]} (mis-keyed) flags: {stats[miskeyed]['flags']}")
+        flagged = sum(1 for item in stats if item['flags'])
+        print(f"{flagged}/{args.items} items flagged")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+JSON 코덱 벤치마크 (utils/json_codec.py)
+
+합성 제출 데이터(benchmarks/synthetic.py) N건(기본 100k)을 백엔드(msgspec/orjson/json)별로
+인코딩/디코딩해 초당 처리 건수를 비교합니다. decode는 dict로 파싱만 하고,
+decode_submission은 DB 조회 경로와 같은 함수(JSON 객체 확인만), validate는 저장/이전 때만 쓰는
+스키마 검증(validate_submission, msgspec이 설치되어 있으면 msgspec.convert)입니다.
+설치되지 않은 백엔드는 건너뜁니다.
+
+사용법:
+    python benchmarks/json_codec_bench.py
+    python benchmarks/json_codec_bench.py --rows 10000 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import synthetic  # noqa: E402
+from utils import json_codec  # noqa: E402
+
+
+def rows_per_second(func: Callable[[], object], n: int, repeat: int) -> float:
+    """repeat회 중 가장 빠른 실행 기준 초당 건수"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return n / best
+
+
+def run(rows: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    submissions = synthetic.make_submissions(rows)
+    # 저장된 형식 그대로 (기존 DB 행은 stdlib json.dumps 출력)
+    payloads = [json.dumps(s, ensure_ascii=False) for s in submissions]
+
+    results = {}
+    for backend in json_codec.BACKENDS:
+        try:
+            json_codec.set_backend(backend)
+        except ImportError:
+            results[backend] = None
+            continue
+
+        dumps, loads, decode_submission = json_codec.dumps, json_codec.loads, json_codec.decode_submission
+        validate = json_codec.validate_submission
+        results[backend] = {
+            'encode': rows_per_second(lambda: [dumps(s) for s in submissions], rows, repeat),
+            'decode': rows_per_second(lambda: [loads(p) for p in payloads], rows, repeat),
+            'decode_submission': rows_per_second(lambda: [decode_submission(p) for p in payloads], rows, repeat),
+            'validate': rows_per_second(lambda: [validate(s) for s in submissions], rows, repeat),
+        }
+        # 모든 백엔드가 같은 결과를 내야 함
+        assert [loads(p) for p in payloads[:100]] == submissions[:100]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSON 코덱 인코딩/디코딩 처리량 벤치마크')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    default_backend = json_codec.BACKEND
+    try:
+        results = run(args.rows, args.repeat)
+    finally:
+        json_codec.set_backend(default_backend)
+
+    if args.json:
+        print(json.dumps({'rows': args.rows, 'results': results}, indent=2))
+        return
+
+    print(f"{args.rows} rows (rows/s, best of {args.repeat})")
+    print(f"{'backend':<9} {'encode':>12} {'decode':>12} {'decode_submission':>18} {'validate':>12}")
+    baseline = results['json']
+    for backend, r in results.items():
+        if r is None:
+            print(f"{backend:<9} (not installed)")
+            continue
+        print(f"{backend:<9} {r['encode']:>12,.0f} {r['decode']:>12,.0f} {r['decode_submission']:>18,.0f}"
+              f" {r['validate']:>12,.0f}"
+              f"   x{r['decode'] / baseline['decode']:.1f} decode vs json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""
+교실 단위 동시 접속 부하 테스트 (Streamlit AppTest 기반)
+
+N명의 가상 학생이 로그인 → 시험 시작 → 문항마다 답 선택(think time 대기) → 제출까지
+pages/1_Student_Test.py를 진행하는 동안, T명의 가상 교사가 pages/2_Teacher_Dashboard.py를
+주기적으로 새로고침합니다. 결과로 다음을 출력합니다.
+
+- 학생/교사 rerun 지연 시간 p50/p95/p99 (대기 시간 포함 응답 시간과 순수 실행 시간)
+- DB 쓰기 지연 시간 (DatabaseManager.save_submission) p50/p95/p99
+- 세션당 메모리 (session_state 직렬화 크기, 세션당 RSS 증가량, 최대 RSS)
+
+AppTest는 실행할 때마다 전역 Runtime 인스턴스를 교체하므로 한 프로세스 안에서는
+rerun을 동시에 실행할 수 없습니다. 그래서 프로세스 하나를 Streamlit 서버 하나로 보고
+프로세스 내 rerun은 잠금으로 직렬화하며(대기 시간이 응답 시간에 포함됨), 실제 동시성은
+--processes로 늘립니다.
+
+AppTest는 커스텀 컴포넌트를 조작할 수 없으므로 학생은 CEFR_ANSWER_MODE=question
+(문항별 fragment) 모드로 시험을 봅니다. 실제 데이터를 건드리지 않도록 임시 작업
+디렉토리(data/cefr_test.db)에서 실행합니다.
+
+사용법:
+    python benchmarks/load_test.py --students 30 --teachers 2
+    python benchmarks/load_test.py --students 120 --processes 4 --think-time 0.5
+    python benchmarks/load_test.py --students 10 --questions 5 --json load.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import pickle
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STUDENT_PAGE = os.path.join(BASE_DIR, 'pages', '1_Student_Test.py')
+TEACHER_PAGE = os.path.join(BASE_DIR, 'pages', '2_Teacher_Dashboard.py')
+
+# AppTest.run()은 전역 Runtime을 교체하므로 프로세스 내에서는 한 번에 하나만 실행
+_RUN_LOCK = threading.Lock()
+
+LEVELS = ['Pre-A1', 'A1', 'A2', 'B1', 'B2']
+ABORT_LABEL = '🚫 시험 중단 및 제출'
+START_LABEL = '테스트 시작'
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    """p50/p95/p99 (nearest-rank) 및 개수/최댓값을 반환합니다 (단위는 입력과 동일)."""
+    if not values:
+        return {'count': 0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+    ordered = sorted(values)
+
+    def rank(p):
+        return ordered[min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))]
+
+    return {'count': len(ordered), 'p50': rank(50), 'p95': rank(95), 'p99': rank(99), 'max': ordered[-1]}
+
+
+SAMPLE_KINDS = ('student_rerun', 'student_service', 'teacher_rerun', 'db_write')
+
+
+class Recorder:
+    """스레드 간 공유되는 지연 시간 기록기 (ms)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {kind: [] for kind in SAMPLE_KINDS}
+        self.state_bytes = []
+        self.errors = []
+        self.completed = 0
+
+    def add(self, kind: str, ms: float):
+        with self._lock:
+            self.samples[kind].append(ms)
+
+    def error(self, message: str):
+        with self._lock:
+            self.errors.append(message)
+
+
+def instrument_db_writes(recorder: Recorder):
+    """save_submission 호출 시간을 기록하도록 감쌉니다 (AppTest 스크립트는 같은 프로세스에서 실행됨)."""
+    from utils.db_manager import DatabaseManager
+
+    original = DatabaseManager.save_submission
+
+    def timed_save(self, submission_data):
+        started = time.perf_counter()
+        try:
+            return original(self, submission_data)
+        finally:
+            recorder.add('db_write', (time.perf_counter() - started) * 1000)
+
+    DatabaseManager.save_submission = timed_save
+
+
+def _timed_run(at, recorder: Recorder, kind: str, timeout: float):
+    requested = time.perf_counter()
+    with _RUN_LOCK:
+        started = time.perf_counter()
+        at.run(timeout=timeout)
+        finished = time.perf_counter()
+    recorder.add(kind, (finished - requested) * 1000)
+    if kind == 'student_rerun':
+        recorder.add('student_service', (finished - started) * 1000)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def simulate_student(student_id: int, args, recorder: Recorder):
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(args.seed + student_id)
+    level = args.level or rng.choice(LEVELS)
+
+    at = AppTest.from_file(STUDENT_PAGE, default_timeout=args.timeout)
+    at.session_state['logged_in'] = True
+    at.session_state['user_role'] = 'student'
+    at.session_state['test_level'] = level
+    at.session_state['student_info'] = {'name': f'loadtest{student_id:04d}', 'full_name': f'Load Test {student_id}'}
+
+    try:
+        _timed_run(at, recorder, 'student_rerun', args.timeout)
+        start = next(b for b in at.button if b.label == START_LABEL)
+        start.click()
+        _timed_run(at, recorder, 'student_rerun', args.timeout)
+
+        total = len(at.session_state['shuffled_questions'])
+        limit = total if args.questions is None else min(total, args.questions)
+        for q_idx in range(limit):
+            if args.think_time:
+                time.sleep(rng.uniform(0.5, 1.5) * args.think_time)
+            options = at.session_state['shuffled_questions'][q_idx]['options']
+            at.button(key=f"q{q_idx}_option_{rng.randrange(len(options))}").click()
+            _timed_run(at, recorder, 'student_rerun', args.timeout)
+
+        # 마지막 문항(또는 --questions 제한) 이후 제출 - 남은 문항은 미응답 처리
+        next(b for b in at.button if b.label == ABORT_LABEL).click()
+        _timed_run(at, recorder, 'student_rerun', args.timeout)
+        if not at.session_state['test_completed']:
+            raise RuntimeError('test not completed after submit')
+
+        # 세션당 서버 메모리의 대부분은 session_state (셔플된 문항, 답안 등)
+        session = at.session_state
+        state = dict(session.items() if hasattr(type(session), 'items') else session.filtered_state.items())
+        with recorder._lock:
+            recorder.state_bytes.append(len(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)))
+
+        with recorder._lock:
+            recorder.completed += 1
+    except Exception as e:
+        recorder.error(f"student {student_id} ({level}): {type(e).__name__}: {e}")
+
+
+def simulate_teacher(teacher_id: int, args, recorder: Recorder, stop: threading.Event):
+    from streamlit.testing.v1 import AppTest
+
+    try:
+        while not stop.is_set():
+            # 새로고침 = 새 브라우저 세션에서 페이지 전체 실행
+            at = AppTest.from_file(TEACHER_PAGE, default_timeout=args.timeout)
+            at.session_state['logged_in'] = True
+            at.session_state['user_role'] = 'teacher'
+            _timed_run(at, recorder, 'teacher_rerun', args.timeout)
+            stop.wait(args.teacher_refresh)
+    except Exception as e:
+        recorder.error(f"teacher {teacher_id}: {type(e).__name__}: {e}")
+
+
+def run_classroom(student_ids: List[int], args, teachers: int) -> Dict:
+    """한 프로세스에서 학생 스레드와 교사 스레드를 실행하고 원시 측정값을 반환합니다."""
+    os.environ['CEFR_ANSWER_MODE'] = 'question'
+    if BASE_DIR not in sys.path:
+        sys.path.insert(0, BASE_DIR)
+
+    recorder = Recorder()
+    instrument_db_writes(recorder)
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    stop = threading.Event()
+    teachers = [
+        threading.Thread(target=simulate_teacher, args=(i, args, recorder, stop), daemon=True)
+        for i in range(teachers)
+    ]
+    students = []
+    for student_id in student_ids:
+        students.append(threading.Thread(target=simulate_student, args=(student_id, args, recorder)))
+
+    started = time.perf_counter()
+    for thread in teachers:
+        thread.start()
+    for thread in students:
+        thread.start()
+        if args.ramp_up:
+            time.sleep(args.ramp_up / max(1, len(student_ids)))
+    for thread in students:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    for thread in teachers:
+        thread.join(timeout=args.timeout)
+
+    return {
+        'samples': recorder.samples,
+        'errors': recorder.errors,
+        'completed': recorder.completed,
+        'students': len(student_ids),
+        'elapsed_s': elapsed,
+        'state_bytes': recorder.state_bytes,
+        'rss_growth_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before,
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def _worker(payload):
+    student_ids, args, teachers, workdir = payload
+    os.chdir(workdir)
+    return run_classroom(student_ids, args, teachers)
+
+
+def summarize(results: List[Dict]) -> Dict:
+    samples = {kind: [] for kind in SAMPLE_KINDS}
+    for result in results:
+        for kind, values in result['samples'].items():
+            samples[kind].extend(values)
+
+    students = sum(r['students'] for r in results)
+    state_bytes = [size for r in results for size in r['state_bytes']]
+    elapsed = max(r['elapsed_s'] for r in results)
+    return {
+        'students': students,
+        'completed': sum(r['completed'] for r in results),
+        'elapsed_s': round(elapsed, 2),
+        'reruns_per_s': round(len(samples['student_rerun']) / elapsed, 1) if elapsed else 0.0,
+        'latency_ms': {kind: {k: round(v, 1) if isinstance(v, float) else v
+                              for k, v in percentiles(values).items()}
+                       for kind, values in samples.items()},
+        'memory': {
+            'session_state_kb': round(sum(state_bytes) / max(1, len(state_bytes)) / 1024, 1),
+            'rss_per_session_kb': round(sum(r['rss_growth_kb'] for r in results) / max(1, students), 1),
+            'max_rss_mb': round(max(r['max_rss_kb'] for r in results) / 1024, 1),
+        },
+        'errors': [e for r in results for e in r['errors']],
+    }
+
+
+def print_report(summary: Dict):
+    print(f"\n👩‍🎓 학생 {summary['completed']}/{summary['students']}명 제출 완료 "
+          f"({summary['elapsed_s']}s, {summary['reruns_per_s']} reruns/s)")
+    labels = {'student_rerun': '학생 rerun', 'student_service': '  (실행 시간)',
+              'teacher_rerun': '교사 대시보드', 'db_write': 'DB 쓰기'}
+    print(f"{'':14s} {'count':>7s} {'p50':>9s} {'p95':>9s} {'p99':>9s} {'max':>9s}")
+    for kind, label in labels.items():
+        stats = summary['latency_ms'][kind]
+        print(f"{label:14s} {stats['count']:7d} {stats['p50']:8.1f}ms {stats['p95']:8.1f}ms "
+              f"{stats['p99']:8.1f}ms {stats['max']:8.1f}ms")
+    memory = summary['memory']
+    print(f"메모리: 세션당 session_state ~{memory['session_state_kb']}KB, "
+          f"RSS 증가 ~{memory['rss_per_session_kb']}KB, 최대 RSS {memory['max_rss_mb']}MB")
+    for error in summary['errors'][:10]:
+        print(f"   ⚠️ {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Streamlit AppTest 기반 교실 부하 테스트')
+    parser.add_argument('--students', type=int, default=30, help='가상 학생 수')
+    parser.add_argument('--teachers', type=int, default=1, help='대시보드를 새로고침하는 가상 교사 수')
+    parser.add_argument('--processes', type=int, default=1, help='학생을 나눠 실행할 프로세스 수')
+    parser.add_argument('--think-time', type=float, default=0.0, help='문항당 평균 대기 시간(초)')
+    parser.add_argument('--teacher-refresh', type=float, default=2.0, help='교사 새로고침 간격(초)')
+    parser.add_argument('--ramp-up', type=float, default=0.0, help='모든 학생이 접속하기까지 걸리는 시간(초)')
+    parser.add_argument('--questions', type=int, help='학생당 응답할 최대 문항 수 (기본: 전체)')
+    parser.add_argument('--level', choices=LEVELS, help='모든 학생의 레벨 고정 (기본: 무작위)')
+    parser.add_argument('--timeout', type=float, default=60.0, help='rerun당 제한 시간(초)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--keep-data', action='store_true', help='임시 작업 디렉토리를 삭제하지 않음')
+    parser.add_argument('--json', help='요약을 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='cefr_loadtest_')
+    try:
+        ids = list(range(args.students))
+        processes = max(1, min(args.processes, args.students))
+        if processes == 1:
+            os.chdir(workdir)
+            results = [run_classroom(ids, args, args.teachers)]
+        else:
+            # 교사는 첫 번째 프로세스에서만 실행 (모든 프로세스가 같은 DB 파일을 공유)
+            chunks = [(ids[i::processes], args, args.teachers if i == 0 else 0, workdir)
+                      for i in range(processes)]
+            with multiprocessing.get_context('spawn').Pool(processes) as pool:
+                results = pool.map(_worker, chunks)
+    finally:
+        os.chdir(BASE_DIR)
+        if args.keep_data:
+            print(f"작업 디렉토리: {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    summary = summarize(results)
+    print_report(summary)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    sys.exit(1 if summary['errors'] else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+로그인 처리량 벤치마크 (utils/user_store.py)
+
+학생 N명(기본 500)을 해시 저장소에 등록한 뒤, 시험 시작 직후처럼 N건의 로그인을 Streamlit
+스크립트 스레드 수(--threads)만큼 동시에 처리해 지연 시간(p50/p95/p99)과 처리량을 잽니다.
+- first: 처음 로그인 (scrypt 검증)
+- reconnect: 같은 학생의 재로그인 (검증 LRU 적중)
+- wrong: 잘못된 비밀번호 (scrypt 검증 + 실패 기록, 모두 같은 IP이므로 IP 한도를 넘으면 바로 거절)
+목표는 분당 500건이며, 처리량(logins/min)이 이를 몇 배 넘는지 출력합니다.
+
+사용법:
+    python benchmarks/login_bench.py
+    python benchmarks/login_bench.py --users 2000 --threads 16
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, BASE_DIR)
+
+from utils.auth_manager import AuthManager  # noqa: E402
+from utils.user_store import LoginThrottled, UserStore  # noqa: E402
+
+TARGET_PER_MINUTE = 500
+
+
+def run_logins(auth, attempts, threads):
+    def login(attempt):
+        username, password = attempt
+        started = time.perf_counter()
+        try:
+            result = bool(auth.authenticate(username, password, client_ip='203.0.113.7'))
+        except LoginThrottled:
+            result = None
+        return (time.perf_counter() - started) * 1000, result
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(login, attempts))
+    elapsed = time.perf_counter() - started
+    latencies = sorted(ms for ms, _ in results)
+    return {
+        'ok': sum(1 for _, ok in results if ok),
+        'throttled': sum(1 for _, ok in results if ok is None),
+        'p50': statistics.median(latencies),
+        'p95': latencies[int(len(latencies) * 0.95) - 1],
+        'p99': latencies[int(len(latencies) * 0.99) - 1],
+        'per_min': len(attempts) / elapsed * 60,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로그인 처리량 벤치마크')
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--threads', type=int, default=8, help='동시에 로그인을 처리하는 스레드 수')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='cefr_login_bench_')
+    try:
+        store = UserStore(os.path.join(workdir, 'users.db'))
+        users = [{'username': f'student{i:04d}', 'password': f'pw-{i}', 'name': f'Student {i}'}
+                 for i in range(args.users)]
+        started = time.perf_counter()
+        store.upsert_users(users)
+        print(f"{args.users} users hashed and stored in {time.perf_counter() - started:.1f}s")
+
+        auth = AuthManager(store=store)
+        credentials = [(u['username'], u['password']) for u in users]
+        rounds = [
+            ('first', credentials),
+            ('reconnect', credentials),
+            ('wrong', [(name, 'nope') for name, _ in credentials]),
+        ]
+        print(f"{'round':<10} {'ok':>5} {'throttled':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'logins/min':>11} {'x target':>9}")
+        for label, attempts in rounds:
+            r = run_logins(auth, attempts, args.threads)
+            print(f"{label:<10} {r['ok']:>5} {r['throttled']:>9} {r['p50']:>8.1f} {r['p95']:>8.1f} {r['p99']:>8.1f} "
+                  f"{r['per_min']:>11.0f} {r['per_min'] / TARGET_PER_MINUTE:>9.1f}")
+        store.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
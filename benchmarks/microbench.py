@@ -0,0 +1,238 @@
+"""
+핵심 경로 마이크로벤치마크
+
+채점, 문항 로드, 정답 분포 균등화, DB 저장/조회(1k/10k/100k 건), 대시보드 통계,
+CEFR 분석, HTML 리포트, 레이더 차트를 합성 데이터(benchmarks/synthetic.py)로 측정하고
+benchmarks/baseline.json에 저장된 기준값과 비교합니다. 기준값보다 --tolerance 이상
+느려진 항목이 있으면 0이 아닌 코드로 종료합니다.
+
+각 항목은 약 --min-time 초가 걸리도록 반복 횟수를 정한 뒤 --repeat 회 측정해
+호출당 최솟값(잡음이 가장 적음)을 기준으로 비교합니다.
+
+사용법:
+    python benchmarks/microbench.py                    # 기준값과 비교
+    python benchmarks/microbench.py -k db.             # 이름에 'db.'가 포함된 항목만
+    python benchmarks/microbench.py --sizes 1000,10000 # 100k 건 생략
+    python benchmarks/microbench.py --save             # 현재 결과를 기준값으로 저장
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import synthetic  # noqa: E402
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+
+class Benchmark:
+    def __init__(self, name: str, func: Optional[Callable[[], object]], skip: Optional[str] = None):
+        self.name = name
+        self.func = func
+        self.skip = skip
+
+
+def measure(func: Callable[[], object], repeat: int, min_time: float) -> Dict[str, float]:
+    """호출당 시간(us)의 최솟값/중앙값을 반환합니다."""
+    func()  # 워밍업 (lazy import, 캐시 등)
+
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+    runs = [elapsed / number]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        runs.append((time.perf_counter() - started) / number)
+
+    return {'min_us': min(runs) * 1e6, 'median_us': statistics.median(runs) * 1e6, 'number': number}
+
+
+def build_benchmarks(workdir: str, sizes: List[int]) -> List[Benchmark]:
+    """측정 대상 목록 - 데이터 준비는 여기서 끝내고 측정 함수에는 호출만 남깁니다."""
+    from utils.question_bank import load_questions
+    from utils.scoring import calculate_score
+    from utils.question_balancer import balance_and_shuffle_quiz
+    from utils.db_manager import DatabaseManager
+    from utils.submission_stats import calculate_statistics
+    from utils.records import as_submissions
+    from utils.cefr_analyzer import CEFRAnalyzer
+    from utils.report_generator import generate_premium_report
+    from utils.visualization import create_radar_chart
+
+    benches = []
+
+    def add(name, func, skip=None):
+        benches.append(Benchmark(name, func, skip))
+
+    # 문항 로드 / 채점 / 정답 분포 균등화 (레벨별 실제 문항)
+    for level in synthetic.LEVELS:
+        questions = load_questions(level)
+        answers = synthetic.make_answers(questions, seed=1)
+        add(f"question_bank.load_questions[{level}]", lambda level=level: load_questions(level))
+        add(f"scoring.calculate_score[{level}]",
+            lambda answers=answers, questions=questions: calculate_score(answers, questions))
+        add(f"question_balancer.balance_and_shuffle_quiz[{level}]",
+            lambda questions=questions: balance_and_shuffle_quiz(questions))
+
+    # DB 저장/조회
+    new_submission = synthetic.make_submissions(1, seed=99)[0]
+    month_ago = datetime.now() - timedelta(days=30)
+    for size in sizes:
+        db = DatabaseManager(os.path.join(workdir, f"bench_{size}.db"))
+        synthetic.populate_db(db, size, seed=size)
+        add(f"db.save_submission[{size}]", lambda db=db: db.save_submission(dict(new_submission)))
+        add(f"db.load_submissions[{size}]", lambda db=db: db.load_submissions())
+        add(f"db.load_submission_records[{size}]", lambda db=db: db.load_submission_records())
+        add(f"db.filter_submissions[{size}]",
+            lambda db=db: db.filter_submissions(level='B1', start_date=month_ago))
+
+    # 대시보드 통계 (DB 크기와 같은 건수의 메모리 데이터, 대시보드처럼 레코드로 전달)
+    for size in sizes:
+        submissions = as_submissions(synthetic.make_submissions(size, seed=size))
+        add(f"submission_stats.calculate_statistics[{size}]",
+            lambda submissions=submissions: calculate_statistics(submissions))
+
+    # 분석 / 리포트 / 차트 (제출 1건)
+    analyzer = CEFRAnalyzer()
+    submission = synthetic.make_submissions(1, seed=7)[0]
+    analysis = analyzer.analyze_test_results(submission)
+    add("cefr_analyzer.analyze_test_results", lambda: analyzer.analyze_test_results(submission))
+    add("report_generator.generate_premium_report",
+        lambda: generate_premium_report(submission['studentInfo'], submission, analysis))
+    add("visualization.create_radar_chart", lambda: create_radar_chart(submission['sectionResults']))
+
+    try:
+        from utils.counseling_report_generator import generate_printable_report_html
+    except SyntaxError as e:
+        # Python 3.12 미만에서는 모듈 자체를 import 할 수 없음 (중첩 f-string) - 건너뜀으로 표시
+        add("counseling_report_generator.generate_printable_report_html", None,
+            skip=f"import 불가 ({type(e).__name__}: {e.msg})")
+    else:
+        questions = load_questions(submission['level'])
+        detailed = [{
+            'question': q['question'], 'options': q['options'],
+            'user_answer': a, 'correct_answer': q['correct'], 'is_correct': a == q['correct'],
+            'section': q.get('section', 'General'), 'explanation': '',
+        } for q, a in zip(questions, submission['answers'])]
+        add("counseling_report_generator.generate_printable_report_html",
+            lambda: generate_printable_report_html(submission['studentInfo'], submission, analysis, detailed))
+
+    return benches
+
+
+def compare(name: str, result: Dict, baseline: Optional[Dict], tolerance: float) -> Optional[str]:
+    if not baseline or 'min_us' not in baseline:
+        return None
+    ratio = result['min_us'] / baseline['min_us'] if baseline['min_us'] else 1.0
+    if ratio > 1 + tolerance:
+        return f"{name}: {result['min_us']:.1f}us vs 기준 {baseline['min_us']:.1f}us (x{ratio:.2f})"
+    return None
+
+
+def format_us(us: float) -> str:
+    if us >= 1e6:
+        return f"{us / 1e6:8.2f}s "
+    if us >= 1e3:
+        return f"{us / 1e3:8.2f}ms"
+    return f"{us:8.1f}us"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='핵심 경로 마이크로벤치마크')
+    parser.add_argument('-k', '--filter', help='이름에 이 문자열이 포함된 항목만 실행')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='DB/통계 데이터 크기 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='측정 1회당 최소 시간(초)')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='기준값 대비 허용 증가율 (0.5 = 50%% 느려지면 실패)')
+    parser.add_argument('--save', action='store_true', help='결과를 baseline.json에 저장(병합)')
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('results', {})
+
+    workdir = tempfile.mkdtemp(prefix='cefr_bench_')
+    results = {}
+    regressions = []
+    errors = []
+    try:
+        print(f"데이터 준비 중 (sizes={sizes})...")
+        benches = build_benchmarks(workdir, sizes)
+        if args.filter:
+            benches = [b for b in benches if args.filter in b.name]
+
+        for bench in benches:
+            if bench.skip:
+                print(f"⏭  {bench.name:60s} {bench.skip}")
+                continue
+            try:
+                result = measure(bench.func, args.repeat, args.min_time)
+            except Exception as e:
+                errors.append(f"{bench.name}: {e}")
+                print(f"❌ {bench.name:60s} {e}")
+                continue
+
+            results[bench.name] = {k: round(v, 2) if isinstance(v, float) else v for k, v in result.items()}
+            problem = compare(bench.name, result, baseline.get(bench.name), args.tolerance)
+            base = baseline.get(bench.name, {}).get('min_us')
+            delta = f" ({(result['min_us'] / base - 1) * 100:+.0f}%)" if base else ''
+            status = '❌' if problem else '✅'
+            print(f"{status} {bench.name:60s} {format_us(result['min_us'])} "
+                  f"(median {format_us(result['median_us']).strip()}){delta}")
+            if problem:
+                regressions.append(problem)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.save:
+        merged = dict(baseline)
+        merged.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'machine': {'python': platform.python_version(), 'platform': platform.platform()},
+                'saved_at': datetime.now().isoformat(timespec='seconds'),
+                'results': dict(sorted(merged.items())),
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 기준값 저장: {args.baseline}")
+
+    if regressions:
+        print(f"\n⚠️ 성능 저하 {len(regressions)}건 (허용 +{args.tolerance * 100:.0f}%):")
+        for problem in regressions:
+            print(f"   {problem}")
+    if errors:
+        print(f"\n⚠️ 실행 실패 {len(errors)}건")
+
+    sys.exit(1 if regressions or errors else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+근접 중복 탐지 벤치마크 (utils/near_duplicates.py)
+
+임의 단어로 만든 합성 문항 N개(기본 5만) 중 일부를 단어 하나만 바꿔 복제하고(근접 중복),
+일부 문항에는 같은 선택지를 두 번 넣은 뒤, shingle/MinHash/LSH 단계별 시간과
+심어 둔 중복 쌍을 찾은 비율(재현율), 심지 않은 쌍이 묶인 수를 출력합니다.
+
+사용법:
+    python benchmarks/near_duplicates_bench.py
+    python benchmarks/near_duplicates_bench.py --items 100000 --duplicates 0.02
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, BASE_DIR)
+
+from utils.near_duplicates import (SHINGLE, THRESHOLD, cluster_pairs, item_text, jaccard,  # noqa: E402
+                                   lsh_candidates, minhash_signatures, shingle_hashes)
+from utils.bank_validation import repeated_options  # noqa: E402
+
+
+def make_items(n: int, duplicate_share: float, repeated_share: float, seed: int = 0):
+    """합성 문항과 심어 둔 근접 중복 쌍 (원본 위치, 복제 위치)"""
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 9)))
+                  for _ in range(5000)]
+
+    def sentence(words):
+        return ' '.join(rng.choice(vocabulary) for _ in range(words))
+
+    items = []
+    for i in range(n):
+        options = [sentence(rng.randint(1, 3)) for _ in range(4)]
+        if rng.random() < repeated_share:
+            options[3] = options[0]
+        items.append({'id': i + 1, 'question': sentence(rng.randint(8, 16)) + '?', 'options': options})
+
+    planted = []
+    for original in rng.sample(range(n), int(n * duplicate_share)):
+        copy = dict(items[original], id=len(items) + 1)
+        words = copy['question'].split()
+        words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        copy['question'] = ' '.join(words)
+        planted.append((original, len(items)))
+        items.append(copy)
+    return items, planted
+
+
+def main():
+    parser = argparse.ArgumentParser(description='근접 중복 탐지 벤치마크')
+    parser.add_argument('--items', type=int, default=50000)
+    parser.add_argument('--duplicates', type=float, default=0.01, help='복제해 넣을 문항 비율')
+    parser.add_argument('--repeated', type=float, default=0.01, help='중복 선택지를 넣을 문항 비율')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    args = parser.parse_args()
+
+    items, planted = make_items(args.items, args.duplicates, args.repeated)
+    print(f"{len(items)} items, {len(planted)} planted near-duplicate pairs")
+
+    started = time.perf_counter()
+    texts = [item_text(item) for item in items]
+    hashes, counts = shingle_hashes(texts)
+    shingled = time.perf_counter()
+    signatures = minhash_signatures(hashes, counts)
+    hashed = time.perf_counter()
+    pairs = lsh_candidates(signatures, skip=counts == 0)
+    candidates = time.perf_counter()
+    clusters = cluster_pairs(pairs, jaccard(hashes, counts, pairs), args.threshold)
+    clustered = time.perf_counter()
+    repeated = sum(1 for item in items if repeated_options(item['options']))
+    finished = time.perf_counter()
+
+    cluster_of = {}
+    for number, (indexes, _) in enumerate(clusters):
+        for index in indexes:
+            cluster_of[index] = number
+    planted_items = {index for pair in planted for index in pair}
+    unexpected = sum(1 for indexes, _ in clusters if not set(indexes) <= planted_items)
+
+    # 심어 둔 쌍의 실제 Jaccard 유사도 (임계값 이상인 쌍만 재현율 계산)
+    def grams(text):
+        return {text[i:i + SHINGLE] for i in range(len(text) - SHINGLE + 1)}
+
+    similar = []
+    for original, copy in planted:
+        a, b = grams(texts[original]), grams(texts[copy])
+        if len(a & b) / len(a | b) >= args.threshold:
+            similar.append((original, copy))
+    found = sum(1 for original, copy in similar
+                if original in cluster_of and cluster_of.get(original) == cluster_of.get(copy))
+    print(f"shingles   {shingled - started:6.2f}s")
+    print(f"minhash    {hashed - shingled:6.2f}s")
+    print(f"lsh        {candidates - hashed:6.2f}s  ({len(pairs)} candidate pairs)")
+    print(f"verify     {clustered - candidates:6.2f}s")
+    print(f"options    {finished - clustered:6.2f}s  ({repeated} questions with repeated options)")
+    print(f"total      {finished - started:6.2f}s")
+    print(f"recall {found}/{len(similar)} planted pairs with Jaccard >= {args.threshold} "
+          f"({found / max(len(similar), 1):.1%}), "
+          f"{len(clusters)} clusters, {unexpected} containing unplanted items")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+제출 데이터 압축 저장 벤치마크
+
+같은 합성 제출 데이터(benchmarks/synthetic.py)로 평문 TEXT DB와 압축 BLOB DB를 만들어
+파일 크기(건당 바이트), 페이로드 크기, load_submissions()/filter_submissions() 조회 시간을
+비교합니다. 압축 DB는 평문 DB를 compress_db.py로 변환(청크 재작성 + VACUUM INTO)해
+만들므로 마이그레이션 경로도 함께 검증됩니다.
+
+사용법:
+    python benchmarks/payload_compression.py
+    python benchmarks/payload_compression.py --sizes 1000,10000,100000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import Callable, Dict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import synthetic  # noqa: E402
+from compress_db import rewrite_payloads, vacuum_into  # noqa: E402
+from utils.db_manager import DatabaseManager  # noqa: E402
+from utils.payload_codec import zstandard  # noqa: E402
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    """repeat회 실행 중 최소 시간(ms)"""
+    func()  # 워밍업 (페이지 캐시)
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - started) * 1000)
+    return min(times)
+
+
+def payload_bytes(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute(
+            'SELECT SUM(LENGTH(CAST(submission_data AS BLOB))) + SUM(COALESCE(LENGTH(submission_blob), 0)) '
+            'FROM submissions'
+        ).fetchone()
+        return row[0] or 0
+    finally:
+        conn.close()
+
+
+def measure(db_path: str, n: int, repeat: int) -> Dict[str, float]:
+    db = DatabaseManager(db_path, trace=False)
+    return {
+        'file_bytes_per_row': os.path.getsize(db_path) / n,
+        'payload_bytes_per_row': payload_bytes(db_path) / n,
+        'load_all_ms': best_of(db.load_submissions, repeat),
+        'filter_level_ms': best_of(lambda: db.filter_submissions(level='A1'), repeat),
+    }
+
+
+def run(n: int, repeat: int, workdir: str) -> Dict[str, Dict[str, float]]:
+    plain_path = os.path.join(workdir, f'plain_{n}.db')
+    synthetic.populate_db(DatabaseManager(plain_path, trace=False), n)
+    vacuum_into(plain_path)  # 두 DB 모두 VACUUM 직후 상태로 비교
+
+    compressed_path = os.path.join(workdir, f'compressed_{n}.db')
+    shutil.copyfile(plain_path, compressed_path)
+    started = time.perf_counter()
+    rewrite_payloads(compressed_path)
+    vacuum_into(compressed_path)
+    migrate_s = time.perf_counter() - started
+
+    plain = measure(plain_path, n, repeat)
+    compressed = measure(compressed_path, n, repeat)
+    compressed['migrate_s'] = migrate_s
+
+    # 압축 여부와 관계없이 같은 데이터를 돌려줘야 함
+    assert DatabaseManager(plain_path).load_submissions() == DatabaseManager(compressed_path).load_submissions()
+    return {'plain': plain, 'compressed': compressed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='제출 데이터 압축 저장 크기/조회 시간 벤치마크')
+    parser.add_argument('--sizes', default='1000,10000', help='제출 건수 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    codec = 'zstd' if zstandard is not None else 'zlib (preset dictionary)'
+    results = {}
+    workdir = tempfile.mkdtemp(prefix='cefr_payload_bench_')
+    try:
+        for n in [int(s) for s in args.sizes.split(',')]:
+            results[n] = run(n, args.repeat, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps({'codec': codec, 'results': results}, indent=2))
+        return
+
+    print(f"codec: {codec}")
+    print(f"{'rows':>8} {'storage':<11} {'file B/row':>11} {'payload B/row':>14} "
+          f"{'load_all ms':>12} {'filter ms':>10}")
+    for n, pair in results.items():
+        for label, r in pair.items():
+            print(f"{n:>8} {label:<11} {r['file_bytes_per_row']:>11.0f} {r['payload_bytes_per_row']:>14.0f} "
+                  f"{r['load_all_ms']:>12.1f} {r['filter_level_ms']:>10.1f}")
+        ratio = pair['compressed']['file_bytes_per_row'] / pair['plain']['file_bytes_per_row']
+        print(f"{'':>8} -> file size x{ratio:.2f}, migration {pair['compressed']['migrate_s']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
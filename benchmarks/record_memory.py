@@ -0,0 +1,85 @@
+"""
+제출 dict vs Submission 레코드 메모리/접근 비용 비교 (utils/records.py)
+
+합성 제출 N건(기본 100k)의 JSON을 디코딩해 dict 목록과 레코드 목록을 각각 만들고
+tracemalloc으로 유지 메모리를 잽니다 (DB 조회 결과를 대시보드가 들고 있는 상황).
+이어서 대시보드 표 만들기와 같은 필드 읽기(이름/학교/레벨/점수/합격/제출일)를
+dict .get() 체인과 속성 접근으로 각각 수행해 시간을 비교합니다.
+
+사용법:
+    python benchmarks/record_memory.py
+    python benchmarks/record_memory.py --rows 10000
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+import synthetic  # noqa: E402
+from utils.records import Submission  # noqa: E402
+
+
+def retained_bytes(build):
+    """build()가 반환한 객체가 유지하는 메모리 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def read_dicts(rows):
+    return [(s.get('studentInfo', {}).get('name', 'Unknown'), s.get('studentInfo', {}).get('school', '-'),
+             s.get('level', '-'), s.get('score', 0), s.get('passed', False), s.get('submittedAt', ''))
+            for s in rows]
+
+
+def read_records(rows):
+    return [(s.student_name, s.student_info.school or '-', s.level or '-', s.score, s.passed,
+             s.submitted_at or '') for s in rows]
+
+
+def best_ms(func, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='제출 dict vs 레코드 메모리/접근 비용 비교')
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    payloads = [json.dumps(s, ensure_ascii=False) for s in synthetic.make_submissions(args.rows)]
+
+    dicts, dict_bytes = retained_bytes(lambda: [json.loads(p) for p in payloads])
+    records, record_bytes = retained_bytes(lambda: [Submission.from_dict(json.loads(p)) for p in payloads])
+    assert read_dicts(dicts) == read_records(records)
+
+    n = args.rows
+    print(f"{n} submissions")
+    print(f"{'':<10} {'retained MiB':>13} {'bytes/row':>10} {'field reads ms':>15}")
+    print(f"{'dict':<10} {dict_bytes / 2**20:>13.1f} {dict_bytes / n:>10.0f} "
+          f"{best_ms(lambda: read_dicts(dicts)):>15.1f}")
+    print(f"{'record':<10} {record_bytes / 2**20:>13.1f} {record_bytes / n:>10.0f} "
+          f"{best_ms(lambda: read_records(records)):>15.1f}")
+    print(f"-> records use {record_bytes / dict_bytes:.0%} of dict memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+벤치마크용 합성 데이터 생성기
+
+실제 제출 데이터(data/)를 사용하지 않고, 시드 고정 난수로 재현 가능한 제출 결과/문항/
+데이터베이스를 만듭니다. 구조는 pages/1_Student_Test.py의 save_results()가 저장하는
+제출 JSON과 같습니다.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+
+LEVELS = ['Pre-A1', 'A1', 'A2', 'B1', 'B2']
+SECTIONS = ['Reading', 'Listening', 'Grammar', 'Vocabulary']
+
+
+def make_questions(n: int, seed: int = 0, passage_every: int = 4) -> List[Dict[str, Any]]:
+    """4지선다 문항 n개를 생성합니다 (passage_every 문항마다 같은 지문 공유)."""
+    rng = random.Random(seed)
+    questions = []
+    for i in range(n):
+        q = {
+            'id': i + 1,
+            'question': f"Synthetic question {i + 1}: choose the best answer.",
+            'options': [f"Option {chr(65 + k)} for {i + 1}" for k in range(4)],
+            'correct': rng.randrange(4),
+            'section': SECTIONS[(i // passage_every) % len(SECTIONS)],
+        }
+        if q['section'] == 'Reading':
+            q['passage'] = f"Synthetic passage {i // passage_every}. " * 20
+        questions.append(q)
+    return questions
+
+
+def make_answers(questions: List[Dict[str, Any]], accuracy: float = 0.7, seed: int = 0) -> List[int]:
+    rng = random.Random(seed)
+    return [
+        q['correct'] if rng.random() < accuracy else rng.randrange(len(q['options']))
+        for q in questions
+    ]
+
+
+def make_submission(i: int, rng: random.Random, now: datetime) -> Dict[str, Any]:
+    """제출 결과 1건 (save_results()와 같은 구조)"""
+    level = rng.choice(LEVELS)
+    total = rng.randint(25, 42)
+    section_results = {}
+    correct = 0
+    remaining = total
+    for k, section in enumerate(SECTIONS):
+        section_total = remaining if k == len(SECTIONS) - 1 else total // len(SECTIONS)
+        remaining -= section_total
+        section_correct = rng.randint(0, section_total)
+        correct += section_correct
+        section_results[section] = {'correct': section_correct, 'total': section_total}
+    score = round(correct / total * 100)
+
+    return {
+        'studentInfo': {
+            'name': f"student{i % 500:04d}",
+            'full_name': f"Student {i % 500}",
+            'school': 'Synthetic School',
+            'grade': str(rng.randint(1, 6)),
+            'class': rng.choice('ABCD'),
+        },
+        'level': level,
+        'submittedAt': (now - timedelta(minutes=rng.randint(0, 60 * 24 * 180))).isoformat(),
+        'score': score,
+        'passed': score >= 70,
+        'correct': correct,
+        'total': total,
+        'sectionResults': section_results,
+        'answers': [rng.randrange(4) for _ in range(total)],
+    }
+
+
+def make_submissions(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    now = datetime.now()
+    return [make_submission(i, rng, now) for i in range(n)]
+
+
+def populate_db(db, n: int, seed: int = 0, chunk_size: int = 5000) -> None:
+    """
+    DatabaseManager의 submissions 테이블에 합성 제출 n건을 채웁니다.
+    save_submission()을 n번 호출하면 100k 건에서 너무 느리므로 같은 컬럼으로 일괄 삽입합니다.
+    """
+    rng = random.Random(seed)
+    now = datetime.now()
+    conn = db.connect()
+    try:
+        for start in range(0, n, chunk_size):
+            rows = []
+            for i in range(start, min(n, start + chunk_size)):
+                sub = make_submission(i, rng, now)
+                rows.append((
+                    sub['studentInfo']['name'], sub['level'], sub['score'], sub['total'],
+                    sub['passed'], datetime.fromisoformat(sub['submittedAt']),
+                    json.dumps(sub, ensure_ascii=False),
+                ))
+            conn.executemany('''
+            INSERT INTO submissions (student_name, level, score, total_questions, passed, submitted_at, submission_data)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            conn.commit()
+    finally:
+        conn.close()
+
+
+def make_item_bank(n_items: int, seed: int = 0, n_options: int = 4) -> Dict[str, Any]:
+    """
+    문항 분석/IRT 벤치마크용 문항 은행: id, 정답 번호, 난이도(b), 변별도(a), 오답 매력도.
+    numpy는 이 함수들을 쓸 때만 import 합니다.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    return {
+        'ids': list(range(1, n_items + 1)),
+        'key': rng.integers(0, n_options, n_items).tolist(),
+        'b': rng.normal(0, 1, n_items),
+        'a': rng.lognormal(0, 0.3, n_items),
+        'distractor_weights': rng.dirichlet(np.ones(n_options - 1), n_items),
+        'n_options': n_options,
+    }
+
+
+def simulate_responses(bank: Dict[str, Any], n_students: int, seed: int = 0,
+                       guessing: float = 0.2, omit_rate: float = 0.02):
+    """
+    3PL 모형으로 응답을 생성합니다. (능력 theta, 응답 행렬[원래 선택지 번호, -1 = 미응답]) 반환.
+    오답은 문항마다 정해진 오답 매력도 비율로 고릅니다.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed + 1)
+    n_items = len(bank['ids'])
+    key = np.asarray(bank['key'])
+    theta = rng.normal(0, 1, n_students)
+    p = guessing + (1 - guessing) / (1 + np.exp(-bank['a'] * (theta[:, None] - bank['b'])))
+    correct = rng.random((n_students, n_items)) < p
+
+    # 오답: 문항별 오답 분포에서 뽑은 k번째 오답 -> 정답을 건너뛴 선택지 번호
+    cumulative = np.cumsum(bank['distractor_weights'], axis=1)
+    k = (rng.random((n_students, n_items))[:, :, None] > cumulative[None, :, :]).sum(axis=2)
+    k = np.minimum(k, bank['n_options'] - 2)
+    wrong = k + (k >= key)
+
+    responses = np.where(correct, key, wrong).astype(np.int8)
+    responses[rng.random((n_students, n_items)) < omit_rate] = -1
+    return theta, responses
+
+
+def populate_db_responses(db, bank: Dict[str, Any], n: int, level: str = 'A1', seed: int = 0,
+                          chunk_size: int = 5000) -> None:
+    """
+    questionIds/responses가 들어간 합성 제출 n건을 한 레벨로 채웁니다 (선택지를 섞지 않은 것으로 간주).
+    """
+    import numpy as np
+
+    _, responses = simulate_responses(bank, n, seed)
+    key = np.asarray(bank['key'])
+    correct = (responses == key).sum(axis=1)
+    total = len(bank['ids'])
+    now = datetime.now()
+    conn = db.connect()
+    try:
+        for start in range(0, n, chunk_size):
+            rows = []
+            for i in range(start, min(n, start + chunk_size)):
+                score = round(int(correct[i]) / total * 100)
+                answers = responses[i].tolist()
+                sub = {
+                    'studentInfo': {'name': f"student{i % 500:04d}"},
+                    'level': level,
+                    'submittedAt': (now - timedelta(minutes=i)).isoformat(),
+                    'score': score,
+                    'passed': score >= 70,
+                    'correct': int(correct[i]),
+                    'total': total,
+                    'answers': answers,
+                    'questionIds': bank['ids'],
+                    'responses': answers,
+                }
+                rows.append((sub['studentInfo']['name'], level, score, total, sub['passed'],
+                             datetime.fromisoformat(sub['submittedAt']), json.dumps(sub)))
+            conn.executemany('''
+            INSERT INTO submissions (student_name, level, score, total_questions, passed, submitted_at, submission_data)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            conn.commit()
+    finally:
+        conn.close()
+
+
+PAPER_SECTIONS = ['Reading', 'Vocabulary', 'Grammar', 'Conversation']
+
+
+def make_paper_html(n_questions: int = 40, seed: int = 0, passage_every: int = 4) -> Tuple[str, Dict[int, str]]:
+    """
+    기존 HTML 버전과 같은 구조의 학생용 시험지 한 장과 정답 (문항 번호 -> 'A'~'D').
+    섹션 4개에 문항을 고르게 나누고, Reading 섹션은 passage_every 문항마다 지문을 넣습니다.
+    """
+    rng = random.Random(seed)
+    answers = {}
+    parts = ['<!DOCTYPE html>\n<html>\n<head>\n<title>CEFR English Level Test</title>\n',
+             '<style>\n' + '.question { margin: 1em; }\n' * 200 + '</style>\n</head>\n<body>\n<div class="container">\n']
+    per_section = -(-n_questions // len(PAPER_SECTIONS))
+    number = 1
+    for s, section in enumerate(PAPER_SECTIONS):
+        parts.append(f'<section class="test-section" id="section{s + 1}">\n'
+                     f'  <div class="section-header">\n    <h2>Part {s + 1}: {section}</h2>\n  </div>\n')
+        for k in range(per_section):
+            if number > n_questions:
+                break
+            if section == 'Reading' and k % passage_every == 0:
+                parts.append(f'  <div class="passage">\n    <span class="passage-label">Passage {k // passage_every + 1}'
+                             f'</span>\n    <p>{"Synthetic passage sentence %d. " % number * 12}</p>\n  </div>\n')
+            answer = rng.choice('ABCD')
+            answers[number] = answer
+            options = ''.join(
+                f'      <label class="option"><input type="radio" name="Q{number}" value="{letter}">'
+                f'<span>{letter}) option {letter.lower()} for question {number}</span></label>\n'
+                for letter in 'ABCD')
+            parts.append(f'  <div class="question">\n    <span class="question-number">{number}</span>\n'
+                         f'    <span class="question-text">Synthetic {section.lower()} question {number}?</span>\n'
+                         f'    <div class="options">\n{options}    </div>\n  </div>\n')
+            number += 1
+        parts.append('</section>\n')
+    parts.append('</div>\n<script src="js/answer-data.js"></script>\n</body>\n</html>\n')
+    return ''.join(parts), answers
+
+
+def make_answer_key_js(answer_keys: Dict[str, Dict[int, str]]) -> str:
+    """js/answer-data.js 형식 (레벨 -> {answers: {'Q1': 'A', ...}})"""
+    blocks = []
+    for level, answers in answer_keys.items():
+        pairs = ', '.join(f"'Q{number}': '{answer}'" for number, answer in sorted(answers.items()))
+        blocks.append(f"  '{level}': {{\n    title: '{level} Test',\n    answers: {{ {pairs} }}\n  }}")
+    return 'const answerData = {\n' + ',\n'.join(blocks) + '\n};\n'
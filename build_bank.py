@@ -0,0 +1,84 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.bank_build import CHANGELOG_PATH, MANIFEST_PATH, build_bank, plan_build
+from utils.bank_validation import BANK_PATH, REPORT_PATH
+from utils.paper_extraction import ANSWER_KEY_PATH, find_papers
+
+
+def load_json(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def default_path(bank, default, suffix):
+    """Default side file: the project file for the default bank, otherwise <bank>_<suffix>.json"""
+    return default if os.path.abspath(bank) == BANK_PATH else f"{os.path.splitext(bank)[0]}_{suffix}.json"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract questions from the HTML test papers into the question bank '
+                                                 '(only levels whose papers or answer keys changed)')
+    parser.add_argument('--source', default='.',
+                        help='directory with CEFR_<level>_English_Level_Test_Student.html papers (default: .)')
+    parser.add_argument('--answers', help=f'answer key file (default: <source>/{ANSWER_KEY_PATH})')
+    parser.add_argument('--bank', default=BANK_PATH, help=f'question bank to update (default: {BANK_PATH})')
+    parser.add_argument('--report', help=f'validation report (default: {REPORT_PATH} for the default bank, '
+                                         'otherwise <bank>_report.json)')
+    parser.add_argument('--manifest', help=f'source hash manifest (default: {MANIFEST_PATH} for the default bank, '
+                                           'otherwise <bank>_manifest.json)')
+    parser.add_argument('--changelog', help=f'build change log (default: {CHANGELOG_PATH} for the default bank, '
+                                            'otherwise <bank>_changelog.json)')
+    parser.add_argument('--level', action='append', help='only consider this level (repeatable)')
+    parser.add_argument('--workers', type=int, help='worker processes (default: one per CPU, 1 = no pool)')
+    parser.add_argument('--force', action='store_true', help='re-extract every level even if unchanged')
+    parser.add_argument('--dry-run', action='store_true', help='list the levels that would be rebuilt and exit')
+    args = parser.parse_args()
+
+    if not find_papers(args.source):
+        print(f"No test papers found in {args.source}")
+        sys.exit(1)
+    answers = args.answers or os.path.join(args.source, ANSWER_KEY_PATH)
+    if not os.path.exists(answers):
+        print(f"Answer key not found: {answers} (all answers default to A)")
+    manifest_path = args.manifest or default_path(args.bank, MANIFEST_PATH, 'manifest')
+
+    if args.dry_run:
+        plan = plan_build(args.source, load_json(args.bank), load_json(manifest_path), answers, args.level, args.force)
+        for level in sorted(plan['papers']):
+            state = 'rebuild' if level in plan['changed'] else 'up to date'
+            print(f"[{level}] {state} ({len(plan['papers'][level])} papers)")
+        return
+
+    started = time.perf_counter()
+    entry = build_bank(args.source, args.bank, answers,
+                       report_path=args.report or default_path(args.bank, REPORT_PATH, 'report'),
+                       manifest_path=manifest_path,
+                       changelog_path=args.changelog or default_path(args.bank, CHANGELOG_PATH, 'changelog'),
+                       levels=args.level, force=args.force, workers=args.workers)
+    if entry['extraction'] is None:
+        print(f"Question bank is up to date (build {entry['build']})")
+        return
+
+    for paper in entry['extraction']['papers']:
+        print(f"[{paper['level']}] {paper['questions']} questions ({paper['passages']} with passages) "
+              f"from {os.path.basename(paper['path'])} in {paper['seconds'] * 1000:.1f}ms")
+    for level, changes in entry['levels'].items():
+        print(f"[{level}] added {len(changes['added'])}, removed {len(changes['removed'])}, "
+              f"changed {len(changes['changed'])}, unchanged {changes['unchanged']}")
+    print(f"Build {entry['build']}: updated {', '.join(entry['levels'])} in {args.bank} "
+          f"({time.perf_counter() - started:.2f}s)")
+    if entry['validation']:
+        print(f"Validation: {entry['validation']['errors']} errors, {entry['validation']['warnings']} warnings")
+
+
+if __name__ == "__main__":
+    main()
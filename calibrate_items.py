@@ -0,0 +1,56 @@
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.db_manager import DatabaseManager
+from utils.irt import DEFAULT_PARAMS_PATH, MIN_RESPONDENTS, ItemParameters, calibrate_from_db
+
+
+def report(level, stats):
+    if stats.get('skipped'):
+        print(f"[{level}] skipped: {stats['respondents']} respondents")
+        return
+    status = 'converged' if stats['converged'] else 'NOT converged'
+    print(f"[{level}] {stats['respondents']} respondents x {stats['items']} items: "
+          f"{stats['iterations']} EM iterations, {status}, {stats['seconds']:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Calibrate IRT item parameters from stored responses')
+    parser.add_argument('--db', default='data/cefr_test.db', help='database file (default: data/cefr_test.db)')
+    parser.add_argument('--out', default=DEFAULT_PARAMS_PATH, help=f'parameter file (default: {DEFAULT_PARAMS_PATH})')
+    parser.add_argument('--model', choices=['1pl', '2pl'], default='2pl', help='1pl (Rasch) or 2pl (default)')
+    parser.add_argument('--level', action='append', help='calibrate only this level (repeatable)')
+    parser.add_argument('--max-iter', type=int, default=100, help='maximum EM iterations (default: 100)')
+    parser.add_argument('--tol', type=float, default=1e-3, help='stop when no parameter moves more than this')
+    parser.add_argument('--min-respondents', type=int, default=MIN_RESPONDENTS,
+                        help=f'skip levels with fewer responses (default: {MIN_RESPONDENTS})')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database not found: {args.db}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    params = calibrate_from_db(DatabaseManager(args.db, trace=False), model=args.model, levels=args.level,
+                               max_iter=args.max_iter, tol=args.tol, min_respondents=args.min_respondents,
+                               progress=report)
+    if not params.levels:
+        print("Nothing calibrated; parameter file left unchanged.")
+        sys.exit(1)
+    if args.level and os.path.exists(args.out):
+        # keep the other levels' existing parameters
+        previous = ItemParameters.load(args.out)
+        if previous.model == params.model:
+            params.levels = dict(previous.levels, **params.levels)
+    params.save(args.out)
+    print(f"Saved {args.model} parameters for {', '.join(params.levels)} to {args.out} "
+          f"({time.perf_counter() - started:.1f}s total)")
+
+
+if __name__ == "__main__":
+    main()
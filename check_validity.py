@@ -1,11 +1,17 @@
-import json
 from collections import Counter
 
-def analyze_level_validity(data):
-    """레벨별 타당도 분석"""
+from utils.bank_validation import build_report, load_bank
+from utils.passages import PASSAGES_KEY, bank_levels, passage_text
+
+SEVERITY_MARKS = {'error': '❌ ERROR', 'warning': '⚠️ WARNING'}
+
+
+def analyze_level_validity(data, validation):
+    """레벨별 타당도 분석 (검사 결과는 utils/bank_validation 보고서를 사용)"""
     report = []
+    table = data.get(PASSAGES_KEY) or {}
     
-    for level, questions in data.items():
+    for level, questions in bank_levels(data):
         report.append(f"\n{'='*60}")
         report.append(f"LEVEL: {level}")
         report.append(f"{'='*60}")
@@ -19,11 +25,12 @@ def analyze_level_validity(data):
             report.append(f"   - {section}: {count}")
         
         # 지문 유무 확인
-        with_passage = sum(1 for q in questions if q.get('passage'))
+        with_passage = sum(1 for q in questions if passage_text(q, table))
         without_passage = len(questions) - with_passage
         report.append(f"\n📄 Passage Status:")
         report.append(f"   - With passage: {with_passage}")
         report.append(f"   - Without passage: {without_passage}")
+        report.append(f"   - Distinct passages: {len({q.get('passage_id') for q in questions if q.get('passage_id')})}")
         
         # 정답 위치 분포 (0, 1, 2, 3)
         correct_answers = [q.get('correct', -1) for q in questions]
@@ -34,26 +41,25 @@ def analyze_level_validity(data):
             percentage = (count / len(questions)) * 100 if questions else 0
             report.append(f"   - Position {pos} ({['A', 'B', 'C', 'D'][pos]}): {count} ({percentage:.1f}%)")
         
-        # 쏠림 현상 확인
-        max_count = max(answer_dist.values()) if answer_dist else 0
-        min_count = min(answer_dist.values()) if answer_dist else 0
-        if max_count - min_count > len(questions) * 0.2:  # 20% 이상 차이
-            report.append(f"   ⚠️ WARNING: Answer distribution is uneven (max: {max_count}, min: {min_count})")
-        else:
-            report.append(f"   ✅ Answer distribution is balanced")
-        
-        # Reading 섹션의 지문 체크
+        # Reading 섹션의 지문 수
         reading_questions = [q for q in questions if q.get('section') == 'Reading']
         if reading_questions:
-            reading_with_passage = sum(1 for q in reading_questions if q.get('passage'))
+            reading_with_passage = sum(1 for q in reading_questions if passage_text(q, table))
             report.append(f"\n📖 Reading Section:")
             report.append(f"   - Total reading questions: {len(reading_questions)}")
             report.append(f"   - Reading questions with passage: {reading_with_passage}")
-            if reading_with_passage < len(reading_questions):
-                report.append(f"   ⚠️ WARNING: Some reading questions lack passages!")
+        
+        # 검증 규칙 결과
+        level_report = validation['levels'][level]
+        report.append(f"\n🔎 Validation ({len(level_report['valid'])}/{level_report['questions']} usable):")
+        for issue in level_report['issues']:
+            where = f"Q{issue['id']}: " if issue['index'] is not None else ''
+            report.append(f"   {SEVERITY_MARKS[issue['severity']]} [{issue['rule']}] {where}{issue['message']}")
+        if not level_report['issues']:
+            report.append(f"   ✅ All rules passed")
         
         # 지문 내용 샘플
-        passages = [(q.get('id'), q.get('passage', '')) for q in questions if q.get('passage')]
+        passages = [(q.get('id'), passage_text(q, table)) for q in questions if passage_text(q, table)]
         if passages:
             report.append(f"\n📝 Sample Passages:")
             for q_id, passage in passages[:3]:  # 처음 3개만 표시
@@ -63,10 +69,11 @@ def analyze_level_validity(data):
     return '\n'.join(report)
 
 if __name__ == "__main__":
-    with open('extracted_questions.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_bank()
     
-    report = analyze_level_validity(data)
+    # 검증 보고서(bank_report.json)도 함께 갱신
+    validation = build_report()
+    report = analyze_level_validity(data, validation)
     print(report)
     
     # 보고서 저장
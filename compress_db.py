@@ -0,0 +1,115 @@
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils import query_audit
+from utils.db_manager import DatabaseManager
+from utils.payload_codec import compress_payload, decompress_payload
+
+CHUNK_SIZE = 1000
+
+SELECT_CHUNK_SQL = '''
+    SELECT id, submission_data, submission_blob FROM submissions
+    WHERE id > ? ORDER BY id LIMIT ?
+    '''
+UPDATE_PAYLOAD_SQL = 'UPDATE submissions SET submission_data = ?, submission_blob = ? WHERE id = ?'
+
+query_audit.register_query('compress_db.select_chunk', SELECT_CHUNK_SQL, (0, CHUNK_SIZE))
+query_audit.register_query('compress_db.update_payload', UPDATE_PAYLOAD_SQL, ('', None, 1))
+
+
+def rewrite_payloads(db_path: str, decompress: bool = False, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Move payloads into (or, with decompress=True, out of) submission_blob.
+    Rows are rewritten in id order, one transaction per chunk, so the app can keep
+    writing in between and an interrupted run simply resumes on the next invocation.
+    Returns the number of rows rewritten.
+    """
+    DatabaseManager(db_path, trace=False)  # adds the submission_blob column if missing
+
+    conn = query_audit.connect(db_path, trace=False)
+    rewritten = 0
+    last_id = 0
+    try:
+        while True:
+            rows = conn.execute(SELECT_CHUNK_SQL, (last_id, chunk_size)).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            updates = []
+            for row_id, text, blob in rows:
+                if decompress and blob is not None:
+                    updates.append((decompress_payload(blob), None, row_id))
+                elif not decompress and blob is None:
+                    updates.append(('', compress_payload(text), row_id))
+
+            if updates:
+                with conn:
+                    conn.executemany(UPDATE_PAYLOAD_SQL, updates)
+                rewritten += len(updates)
+                print(f"  ... {rewritten} rows rewritten (up to id {last_id})")
+    finally:
+        conn.close()
+    return rewritten
+
+
+def vacuum_into(db_path: str) -> str:
+    """
+    VACUUM INTO a fresh file and swap it in, keeping the original as <db>.bak.
+    Rewritten rows leave free pages behind, and only a vacuum returns them to the
+    filesystem. Stop the app before swapping so no connection holds the old file.
+    """
+    compact_path = f"{db_path}.compact"
+    if os.path.exists(compact_path):
+        os.remove(compact_path)
+
+    conn = query_audit.connect(db_path, trace=False)
+    try:
+        conn.execute('VACUUM INTO ?', (compact_path,))
+    finally:
+        conn.close()
+
+    backup_path = f"{db_path}.bak"
+    os.replace(db_path, backup_path)
+    os.replace(compact_path, db_path)
+    # WAL/SHM files belong to the old file
+    for suffix in ('-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.replace(db_path + suffix, backup_path + suffix)
+    return backup_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compress stored submission payloads and compact the database')
+    parser.add_argument('--db', default='data/cefr_test.db', help='database file (default: data/cefr_test.db)')
+    parser.add_argument('--decompress', action='store_true', help='move payloads back to plain JSON text')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='rows per transaction')
+    parser.add_argument('--no-vacuum', action='store_true', help='skip VACUUM INTO after rewriting')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database not found: {args.db}")
+        sys.exit(1)
+
+    size_before = os.path.getsize(args.db)
+    started = time.perf_counter()
+    action = 'Decompressing' if args.decompress else 'Compressing'
+    print(f"{action} submission payloads in {args.db}...")
+    rewritten = rewrite_payloads(args.db, args.decompress, args.chunk_size)
+    print(f"Rewrote {rewritten} rows in {time.perf_counter() - started:.1f}s.")
+
+    if not args.no_vacuum:
+        backup_path = vacuum_into(args.db)
+        print(f"Compacted with VACUUM INTO (previous file kept at {backup_path}).")
+
+    size_after = os.path.getsize(args.db)
+    print(f"Size: {size_before / 1024:.0f} KiB -> {size_after / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import os
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils import query_audit
+from utils.db_manager import DatabaseManager
+from utils.session_store import SessionStore
+from utils.user_store import UserStore
+
+
+def audit_queries(db_path: str, strict_sort: bool = False) -> int:
+    """
+    Run EXPLAIN QUERY PLAN for every registered query and flag full table scans.
+    Returns the number of problems found.
+    """
+    # Make sure every table/index the application creates exists in the audited database
+    DatabaseManager(db_path, trace=False)
+    SessionStore(db_path)
+    UserStore(db_path).close()
+
+    conn = query_audit.connect(db_path, trace=False)
+    problems = 0
+    try:
+        for name, sql, params, allow_scan in query_audit.registered_queries():
+            plan = query_audit.explain(conn, sql, params)
+            scans = [] if allow_scan else query_audit.find_full_scans(plan)
+            sorts = query_audit.find_temp_sorts(plan)
+            failed = bool(scans) or (strict_sort and bool(sorts))
+            problems += failed
+
+            status = '❌' if failed else ('⚠️ ' if sorts else '✅')
+            print(f"{status} {name}")
+            print(f"     {sql}")
+            for line in plan:
+                print(f"       {line}")
+            for scan in scans:
+                print(f"     -> full table scan: {scan}")
+    finally:
+        conn.close()
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EXPLAIN QUERY PLAN audit of registered SQLite queries')
+    parser.add_argument('--db', help='database to audit (default: a fresh database with the current schema)')
+    parser.add_argument('--strict-sort', action='store_true',
+                        help='also fail on temporary B-tree sorts (ORDER BY not served by an index)')
+    args = parser.parse_args()
+
+    if args.db:
+        problems = audit_queries(args.db, args.strict_sort)
+    else:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            problems = audit_queries(os.path.join(tmpdir, 'audit.db'), args.strict_sort)
+
+    total = len(query_audit.registered_queries())
+    print(f"\nAudited {total} queries: {problems} problem(s).")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.db_manager import DatabaseManager
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Write a columnar analytics snapshot of submissions (partitioned by level/month)')
+    parser.add_argument('--db', default='data/cefr_test.db', help='database file (default: data/cefr_test.db)')
+    parser.add_argument('--out', default='data/snapshots', help='snapshot directory (default: data/snapshots)')
+    parser.add_argument('--format', choices=['parquet', 'ipc'], default='parquet',
+                        help='file format: parquet or ipc (Arrow IPC / Feather v2)')
+    parser.add_argument('--full', action='store_true', help='rewrite the whole snapshot instead of appending new rows')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Database not found: {args.db}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    info = DatabaseManager(args.db).export_snapshot(args.out, args.format, args.full)
+    elapsed = time.perf_counter() - started
+
+    if info['rows']:
+        print(f"Snapshot #{info['seq']}: {info['rows']} submissions (id {info['from_id'] + 1}..{info['to_id']}) "
+              f"in {info['files']} files, {elapsed:.1f}s -> {args.out}")
+    else:
+        print(f"No new submissions since id {info['from_id']}; snapshot in {args.out} is up to date.")
+
+
+if __name__ == "__main__":
+    main()
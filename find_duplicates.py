@@ -0,0 +1,50 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.bank_validation import BANK_PATH
+from utils.near_duplicates import BANDS, NUM_PERM, THRESHOLD, bank_items, find_duplicates
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find near-duplicate questions across all levels (MinHash/LSH)')
+    parser.add_argument('--bank', default=BANK_PATH, help=f'question bank (default: {BANK_PATH})')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help=f'minimum estimated Jaccard similarity (default: {THRESHOLD})')
+    parser.add_argument('--perms', type=int, default=NUM_PERM, help=f'MinHash permutations (default: {NUM_PERM})')
+    parser.add_argument('--bands', type=int, default=BANDS, help=f'LSH bands (default: {BANDS})')
+    parser.add_argument('--json', help='also write the findings to this JSON file')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.bank):
+        print(f"Question bank not found: {args.bank}")
+        sys.exit(1)
+    with open(args.bank, encoding='utf-8') as f:
+        items = bank_items(json.load(f))
+
+    started = time.perf_counter()
+    report = find_duplicates(items, threshold=args.threshold, num_perm=args.perms, bands=args.bands)
+    elapsed = time.perf_counter() - started
+
+    for number, cluster in enumerate(report['clusters'], 1):
+        print(f"Cluster {number} (similarity >= {cluster['similarity']:.2f}):")
+        for item in cluster['items']:
+            print(f"  [{item['level']}] Q{item['id']}: {item['question'][:70]}")
+    for item in report['duplicateOptions']:
+        print(f"[{item['level']}] Q{item['id']}: repeated options {', '.join(item['options'])}")
+    print(f"{report['items']} questions scanned in {elapsed:.2f}s: {len(report['clusters'])} near-duplicate "
+          f"clusters, {len(report['duplicateOptions'])} questions with repeated options")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"Saved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-import json
+from utils.bank_validation import load_bank, save_bank_and_report
+from utils.passages import bank_levels
 
 def fix_question_sections():
     """
@@ -7,8 +8,7 @@ def fix_question_sections():
     """
     
     # JSON 파일 로드
-    with open('extracted_questions.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_bank()
     
     # 섹션 분류 키워드
     vocabulary_keywords = ['color', 'opposite', 'number', 'word', 'meaning']
@@ -18,7 +18,7 @@ def fix_question_sections():
     
     stats = {'changed': 0, 'total': 0}
     
-    for level, questions in data.items():
+    for level, questions in bank_levels(data):
         print(f"\n처리 중: {level}")
         for q in questions:
             stats['total'] += 1
@@ -75,14 +75,13 @@ def fix_question_sections():
                 print(f"    질문: {question_text[:60]}...")
     
     # 수정된 데이터 저장
-    with open('extracted_questions.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_bank_and_report(data)  # 검증 보고서도 함께 갱신
     
     print(f"\n완료! 총 {stats['total']}개 문제 중 {stats['changed']}개 수정됨")
     
     # 레벨별 섹션 분포 출력
     print("\n=== 레벨별 섹션 분포 ===")
-    for level, questions in data.items():
+    for level, questions in bank_levels(data):
         section_counts = {}
         for q in questions:
             section = q.get('section', 'General')
@@ -0,0 +1,101 @@
+import argparse
+import csv
+import getpass
+import json
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.user_store import UserStore
+
+
+def load_plaintext_users(path: str = None) -> dict:
+    """Users from a STREAMLIT_USERS-style JSON file, the env var, or .streamlit/secrets.toml."""
+    if path:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    if os.getenv('STREAMLIT_USERS'):
+        return json.loads(os.environ['STREAMLIT_USERS'])
+
+    secrets_path = os.path.join('.streamlit', 'secrets.toml')
+    if os.path.exists(secrets_path):
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11 (toml is installed with streamlit)
+            import toml
+            return toml.load(secrets_path).get('users', {})
+        with open(secrets_path, 'rb') as f:
+            return tomllib.load(f).get('users', {})
+    return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Manage the hashed user store used for login')
+    parser.add_argument('--db', default='data/cefr_test.db', help='database file (default: data/cefr_test.db)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    roster = commands.add_parser('import-roster', help='add/update users from a class roster CSV')
+    roster.add_argument('csv', help='CSV with username,password,name,school,grade,class[,role] columns')
+    roster.add_argument('--role', default='student', help='role for rows without one (default: student)')
+    roster.add_argument('--out', help='write username/password/name rows (incl. generated passwords) here')
+
+    secrets = commands.add_parser('import-secrets',
+                                  help='hash the plaintext users from STREAMLIT_USERS or secrets.toml')
+    secrets.add_argument('--json', help='read users from this JSON file instead')
+
+    add = commands.add_parser('add', help='add or update one user (prompts for the password)')
+    add.add_argument('username')
+    add.add_argument('--role', default='student')
+    add.add_argument('--name')
+    add.add_argument('--school')
+    add.add_argument('--grade')
+    add.add_argument('--class', dest='class_name')
+
+    delete = commands.add_parser('delete', help='remove a user')
+    delete.add_argument('username')
+
+    commands.add_parser('list', help='list users')
+    args = parser.parse_args()
+
+    store = UserStore(args.db)
+    try:
+        if args.command == 'import-roster':
+            users = store.import_roster(args.csv, default_role=args.role)
+            print(f"Imported {len(users)} users from {args.csv}")
+            if args.out:
+                with open(args.out, 'w', encoding='utf-8-sig', newline='') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(['username', 'password', 'name', 'class'])
+                    for user in users:
+                        writer.writerow([user['username'], user['password'], user.get('name', ''),
+                                         user.get('class', '')])
+                print(f"Credentials written to {args.out}")
+
+        elif args.command == 'import-secrets':
+            plaintext = load_plaintext_users(args.json)
+            count = store.upsert_users([dict(info, username=name) for name, info in plaintext.items()
+                                        if info.get('password')])
+            print(f"Hashed {count} users into {args.db}. Plaintext entries can now be removed.")
+
+        elif args.command == 'add':
+            password = getpass.getpass(f"Password for {args.username}: ")
+            store.add_user(args.username, password, args.role, name=args.name, school=args.school,
+                           grade=args.grade, **{'class': args.class_name})
+            print(f"Saved user {args.username}")
+
+        elif args.command == 'delete':
+            store.delete_user(args.username)
+            print(f"Deleted user {args.username}")
+
+        elif args.command == 'list':
+            for username in store.usernames():
+                user = store.get_user(username)
+                print(f"{username:<20} {user['role']:<8} {user['name'] or ''} {user['class'] or ''}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,210 @@
-
+import argparse
+import hashlib
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from utils.data_manager import DataManager
-from utils.db_manager import DatabaseManager
-
-def migrate_json_to_sqlite():
-    print("Starting migration from JSON files to SQLite database...")
-    
-    # Initialize managers
-    data_manager = DataManager()
-    db_manager = DatabaseManager()
-    
-    # Load existing JSON submissions
-    # Note: If existing JSONs are corrupted, DataManager might skip them or print errors.
-    submissions = data_manager.load_submissions()
-    
-    if not submissions:
-        print("No JSON submissions found to migrate.")
-        return
-
-    print(f"Found {len(submissions)} submissions. Migrating...")
-    
-    count = 0
-    for sub in submissions:
+from utils import json_codec, query_audit
+from utils.db_manager import DatabaseManager, submission_row
+
+BATCH_SIZE = 2000
+WORKERS = 8
+
+IMPORT_SUBMISSION_SQL = '''
+    INSERT OR IGNORE INTO submissions (student_name, level, score, total_questions, passed, submitted_at,
+                                       submission_data, submission_blob, source_file, content_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+CHECKPOINT_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS migration_checkpoints (
+        source TEXT PRIMARY KEY,
+        last_file TEXT NOT NULL,
+        files INTEGER NOT NULL,
+        inserted INTEGER NOT NULL,
+        updated_at TIMESTAMP NOT NULL
+    )
+    '''
+LOAD_CHECKPOINT_SQL = 'SELECT last_file, files, inserted FROM migration_checkpoints WHERE source = ?'
+SAVE_CHECKPOINT_SQL = 'INSERT OR REPLACE INTO migration_checkpoints VALUES (?, ?, ?, ?, ?)'
+DELETE_CHECKPOINT_SQL = 'DELETE FROM migration_checkpoints WHERE source = ?'
+
+query_audit.register_query('migrate_db.import_submission', IMPORT_SUBMISSION_SQL,
+                           ('student', 'A1', 80, 40, True, datetime(2024, 1, 1), '{}', None, 'submissions/a.json', 'hash'))
+query_audit.register_query('migrate_db.load_checkpoint', LOAD_CHECKPOINT_SQL, ('data/submissions',))
+query_audit.register_query('migrate_db.save_checkpoint', SAVE_CHECKPOINT_SQL,
+                           ('data/submissions', 'a.json', 1, 1, datetime(2024, 1, 1)))
+query_audit.register_query('migrate_db.delete_checkpoint', DELETE_CHECKPOINT_SQL, ('data/submissions',))
+
+
+def content_hash(submission: Dict[str, Any]) -> str:
+    """Hash of the payload independent of key order and of the file it was saved under."""
+    canonical = {k: v for k, v in submission.items() if k != 'filename'}
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True, ensure_ascii=False,
+                                     default=str).encode('utf-8')).hexdigest()
+
+
+def source_key(path: str, data_root: str) -> str:
+    """
+    Dedupe key stored in submissions.source_file: the file's path relative to data_root,
+    with '/' separators. Same-named files in different directories get different keys.
+    """
+    path = os.path.abspath(path)
+    try:
+        key = os.path.relpath(path, data_root)
+    except ValueError:  # different drive on Windows
+        key = path
+    return key.replace(os.sep, '/')
+
+
+def read_submission_file(path: str, compress: bool, data_root: Optional[str] = None) -> tuple:
+    """
+    Read one JSON file into (IMPORT_SUBMISSION_SQL row, schema problem or None); runs on the
+    worker threads. Files that do not match the submission schema are still imported (the
+    readers accept legacy shapes) and their problem is reported.
+    """
+    with open(path, 'rb') as f:
+        submission = json_codec.decode_submission(f.read())
+    try:
+        json_codec.validate_submission(submission)
+        problem = None
+    except ValueError as e:
+        problem = str(e)
+    digest = content_hash(submission)
+    submission.setdefault('savedAt', datetime.now().isoformat())
+    key = source_key(path, data_root or os.path.dirname(os.path.abspath(path)))
+    return submission_row(submission, compress) + (key, digest), problem
+
+
+def migrate_json_dir(source_dir: str, db_path: str, batch_size: int = BATCH_SIZE, workers: int = WORKERS,
+                     restart: bool = False, compress: Optional[bool] = None, data_root: Optional[str] = None,
+                     progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Import every *.json submission file in source_dir into the database.
+
+    Files are read and decoded on a thread pool one batch ahead of the writer, and each
+    batch is inserted with executemany in a single transaction together with a checkpoint
+    (the last file name, in sorted order), so an interrupted run resumes after the last
+    committed batch. Rows already imported from the same file or with the same payload
+    hash are skipped, which makes re-running over the same archive safe. Files are keyed
+    by their path relative to data_root (default: the database's directory, so
+    data/submissions/a.json is 'submissions/a.json'), so same-named files in different
+    source directories do not collide. Files that parse but do not match the submission
+    schema are imported anyway and listed in stats['invalid']; unreadable files go to
+    stats['errors'].
+    The checkpoint is removed once the directory has been fully processed.
+    """
+    db = DatabaseManager(db_path, trace=False, compress=compress)  # adds source_file/content_hash if missing
+    source = os.path.abspath(source_dir)
+    data_root = os.path.abspath(data_root or os.path.dirname(os.path.abspath(db_path)))
+
+    conn = query_audit.connect(db_path, trace=False)
+    conn.execute(CHECKPOINT_TABLE_SQL)
+    if restart:
+        with conn:
+            conn.execute(DELETE_CHECKPOINT_SQL, (source,))
+    checkpoint = conn.execute(LOAD_CHECKPOINT_SQL, (source,)).fetchone()
+    last_file, files_done, inserted = checkpoint or ('', 0, 0)
+
+    files = sorted(name for name in os.listdir(source) if name.endswith('.json') and name > last_file)
+    stats = {
+        'resumed_after': last_file or None,
+        'total_files': files_done + len(files),
+        'files': files_done,
+        'inserted': inserted,
+        'duplicates': 0,
+        'errors': [],
+        'invalid': [],
+        'rows_per_sec': 0.0,
+    }
+
+    def read(name):
         try:
-            # Check for duplicates? For now, we just insert. 
-            # Ideally we might check if filename exists in submission_data, 
-            # but for a one-time migration to a fresh DB, simple insert is fine.
-            db_manager.save_submission(sub)
-            count += 1
+            return read_submission_file(os.path.join(source, name), db.compress, data_root)
         except Exception as e:
-            print(f"Failed to migrate submission for {sub.get('studentInfo', {}).get('name')}: {e}")
-            
-    print(f"Migration complete. Successfully migrated {count}/{len(submissions)} records.")
-    print(f"Database located at: {db_manager.db_path}")
+            return e
+
+    started = time.perf_counter()
+    processed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
+            pending = pool.map(read, batches[0]) if batches else None
+            for k, batch in enumerate(batches):
+                results = list(pending)
+                # Read the next batch while this one is written
+                pending = pool.map(read, batches[k + 1]) if k + 1 < len(batches) else None
+
+                rows = []
+                for name, result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        stats['errors'].append((name, str(result)))
+                    else:
+                        row, problem = result
+                        rows.append(row)
+                        if problem:
+                            stats['invalid'].append((name, problem))
+
+                with conn:
+                    added = conn.executemany(IMPORT_SUBMISSION_SQL, rows).rowcount if rows else 0
+                    stats['files'] += len(batch)
+                    stats['inserted'] += added
+                    conn.execute(SAVE_CHECKPOINT_SQL, (source, batch[-1], stats['files'], stats['inserted'],
+                                                       datetime.now()))
+
+                stats['duplicates'] += len(rows) - added
+                processed += len(batch)
+                stats['rows_per_sec'] = processed / max(time.perf_counter() - started, 1e-9)
+                if progress:
+                    progress(stats)
+
+        with conn:
+            conn.execute(DELETE_CHECKPOINT_SQL, (source,))
+    finally:
+        conn.close()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import JSON submission files into the SQLite database')
+    parser.add_argument('--source', default='data/submissions', help='directory of submission JSON files')
+    parser.add_argument('--db', default='data/cefr_test.db', help='database file (default: data/cefr_test.db)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='files per transaction')
+    parser.add_argument('--workers', type=int, default=WORKERS, help='reader threads')
+    parser.add_argument('--restart', action='store_true', help='ignore the checkpoint of an interrupted run')
+    parser.add_argument('--data-root', help='directory source file keys are relative to (default: the database directory)')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.source):
+        print(f"Source directory not found: {args.source}")
+        sys.exit(1)
+
+    print(f"Migrating JSON submissions from {args.source} to {args.db}...")
+
+    def report(stats):
+        print(f"  ... {stats['files']}/{stats['total_files']} files, {stats['inserted']} inserted, "
+              f"{stats['duplicates']} duplicates, {len(stats['errors'])} errors, "
+              f"{stats['rows_per_sec']:.0f} rows/s")
+
+    stats = migrate_json_dir(args.source, args.db, args.batch_size, args.workers, args.restart,
+                             data_root=args.data_root, progress=report)
+
+    if stats['resumed_after']:
+        print(f"Resumed after {stats['resumed_after']}.")
+    for name, error in stats['errors']:
+        print(f"Failed to migrate {name}: {error}")
+    for name, problem in stats['invalid']:
+        print(f"Imported {name} despite schema mismatch: {problem}")
+    print(f"Migration complete. {stats['inserted']} inserted, {stats['duplicates']} duplicates skipped, "
+          f"{len(stats['errors'])} errors ({stats['rows_per_sec']:.0f} rows/s).")
+    print(f"Database located at: {args.db}")
+
 
 if __name__ == "__main__":
-    migrate_json_to_sqlite()
+    main()
@@ -1,6 +1,5 @@
 import streamlit as st
 import streamlit.components.v1 as components
-import pandas as pd
 import json
 import time
 from datetime import datetime
@@ -9,6 +8,17 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.cefr_analyzer import CEFRAnalyzer
+from utils.question_bank import load_questions
+from utils.scoring import calculate_score, estimate_ability, original_responses
+from utils.assets import inject_css, load_css
+from utils.auth_manager import normalize_session_state, refresh_session_token
+from utils.test_progress import (build_progress_index, sync_progress, record_answer, fill_unanswered,
+                                 build_question_blocks, find_block, group_passages, merge_answer_batch,
+                                 passage_key)
+from utils.passages import passage_text
+from utils.question_block import question_block
+from utils.session_store import get_session_store, session_key
+from utils.metrics import timer
 
 # 페이지 설정
 st.set_page_config(
@@ -17,9 +27,14 @@ st.set_page_config(
     layout="wide"
 )
 
-# 커스텀 CSS
-with open('assets/styles.css', 'r') as f:
-    st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+# 커스텀 CSS (프로세스 단위 캐시)
+inject_css()
+
+# 시험 화면 전용 정적 CSS (헤더, 문항 카드)
+TEST_PAGE_CSS = 'assets/test_page.css'
+# calibrate_items.py가 만드는 문항 모수 파일 - 있을 때만 적응형 선택지를 보여줌
+# (utils.cat은 numpy를 쓰므로 적응형 시험을 시작할 때만 import)
+ITEM_PARAMS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'item_params.json')
 
 # 세션 상태 초기화
 if 'current_question' not in st.session_state:
@@ -35,546 +50,17 @@ if 'shuffled_questions' not in st.session_state:
 if 'answer_mappings' not in st.session_state:
     st.session_state['answer_mappings'] = None
 
+# 재접속 시 URL의 세션 토큰으로 로그인 상태 복원
+normalize_session_state()
+
 # 로그인 확인
 if not st.session_state.get('logged_in', False) or st.session_state.get('user_role') != 'student':
     st.error("학생 계정으로 로그인해주세요.")
     st.switch_page("app.py")
 
-# 질문 데이터 (실제로는 파일이나 데이터베이스에서 로드)
-def load_questions(level):
-    """
-    PRE-A1 UnboundLocalError 방지를 위한 특수 처리 로더
-    """
-    # 입력값 유효성 검사
-    if not level or not isinstance(level, str):
-        level = 'A1'  # 기본값
-
-    # PRE-A1 완전 격리 처리 - Ultra-think 해결책 (대소문자 무관)
-    if level.upper() == 'PRE-A1':
-        return load_preA1_questions_isolated()
-
-    # 다른 레벨은 기존 로직 사용
-    return load_other_level_questions(level)
-
-def load_preA1_questions_isolated():
-    """
-    PRE-A1 전용 완전 격리 로더 - 다른 어떤 코드도 섞이지 않음
-    """
-    # A1 지문 정의 (PRE-A1에도 적용)
-    passages = {
-        1: "Hi Tom,\n\nI am at the library. Please come at 3 o'clock.\nBring your English book.\nSee you soon!\n\nMia",
-        3: "Henry and his big dog Mudge went camping. Henry's mother knew all about camping. She knew how to set up a tent. She knew how to build a campfire. Henry's father didn't know anything about camping. He just came with a guitar and a smile. They walked and walked. It was beautiful. Henry saw fish in the stream and a rainbow.",
-        5: "Nate is a detective. He likes pancakes very much. He had pancakes for breakfast. Then the telephone rang. It was Annie. Annie lost a picture. The picture was of her dog, Fang. Nate said, \"I will find the picture.\""
-    }
-    # 1. 첫 번째 시도: 좋은 데이터가 있는 extracted_questions.json에서만 로드
-    try:
-        import json
-        import os
-        # 프로젝트 루트 경로 계산 (현재 파일의 상위 상위 디렉토리)
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        json_path = os.path.join(base_dir, 'extracted_questions.json')
-        
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # 대소문자 무관한 PRE-A1 검색
-        pre_a1_key = None
-        for key in data.keys():
-            if key.upper() == 'PRE-A1':
-                pre_a1_key = key
-                break
-
-        if isinstance(data, dict) and pre_a1_key:
-            raw_questions = data[pre_a1_key]
-
-            if isinstance(raw_questions, list) and len(raw_questions) > 0:
-                cleaned_questions = []
-
-                for q in raw_questions:
-                    try:
-                        if (isinstance(q, dict) and
-                            'options' in q and isinstance(q['options'], list) and
-                            len(q['options']) == 4 and
-                            all(opt and str(opt).strip() for opt in q['options'])):
-
-                            cleaned_q = {
-                                'id': int(q.get('id', 0)),
-                                'question': str(q.get('question', '')).replace('<span class="question-text">', '').replace('</span>', ''),
-                                'options': [str(opt).replace('A)', '').replace('B)', '').replace('C)', '').replace('D)', '') for opt in q['options']],
-                                'correct': int(q.get('correct', 0)),  # 내부 채점용 - UI에 표시 안됨
-                                'section': str(q.get('section', 'General'))
-                            }
-
-                            # JSON에서 passage 필드가 있으면 그대로 사용
-                            if 'passage' in q and q['passage']:
-                                cleaned_q['passage'] = q['passage']
-                            # passage가 없고 PRE-A1 Reading 섹션이면 fallback 지문 연결
-                            elif cleaned_q['section'] == 'Reading':
-                                q_id = cleaned_q['id']
-                                # 지문 공유 규칙: 1-2번은 지문 1 공유, 3-4번은 지문 2 공유, 5-8번은 지문 3 공유
-                                if q_id in [1, 2]:
-                                    cleaned_q['passage'] = passages[1]
-                                elif q_id in [3, 4]:
-                                    cleaned_q['passage'] = passages[3]
-                                elif q_id in [5, 6, 7, 8]:
-                                    cleaned_q['passage'] = passages[5]
-
-                            cleaned_questions.append(cleaned_q)
-                    except Exception:
-                        continue  # 개별 질문 오류는 무시
-
-                if cleaned_questions:
-                    return cleaned_questions
-
-    except Exception:
-        pass  # 실패 시 조용히 계속 진행
-
-    # 2. 두 번째 시도: A1 질문을 PRE-A1으로 사용 (fallback)
-    try:
-        a1_questions = load_other_level_questions('A1')
-        if a1_questions and len(a1_questions) > 0:
-            # ID를 PRE-A1 스타일로 조정
-            for q in a1_questions:
-                q['id'] = q['id']  # ID는 그대로 유지
-                q['original_level'] = 'A1'  # 원본 레벨 표시
-            return a1_questions
-    except Exception:
-        pass
-
-    # 3. 최후의 수단: 하드코딩된 비상 질문 (지문 포함)
-    return [
-        {
-            'id': 1,
-            'question': 'Where is Mia?',
-            'options': ['At school', 'At the library', 'At home', 'At the park'],
-            'correct': 1,  # 내부 채점용
-            'section': 'Reading',
-            'passage': passages[1]  # 지문 포함
-        },
-        {
-            'id': 2,
-            'question': 'What should Tom bring?',
-            'options': ['His lunch box', 'His math book', 'His English book', 'His pencil case'],
-            'correct': 2,  # 내부 채점용
-            'section': 'Reading',
-            'passage': passages[1]  # 지문 공유
-        },
-        {
-            'id': 3,
-            'question': 'My name _______ Alex.',
-            'options': ['am', 'is', 'are', 'be'],
-            'correct': 1,  # 내부 채점용
-            'section': 'Grammar'
-        },
-        {
-            'id': 4,
-            'question': 'I _______ from Korea.',
-            'options': ['am', 'is', 'are', 'be'],
-            'correct': 0,  # 내부 채점용
-            'section': 'Grammar'
-        },
-        {
-            'id': 5,
-            'question': 'What do you say when you meet someone?',
-            'options': ['Hello', 'Goodbye', 'Thank you', 'Sorry'],
-            'correct': 0,  # 내부 채점용
-            'section': 'Conversation'
-        }
-    ]
-
-def load_other_level_questions(level):
-    """
-    A1, A2, B1, B2 등 PRE-A1 외 레벨용 로더
-    """
-    questions = []  # 기본값으로 빈 리스트 초기화
-    
-    # 지문 정의 (모든 레벨 공통)
-    passages = {
-        1: "Hi Tom,\n\nI am at the library. Please come at 3 o'clock.\nBring your English book.\nSee you soon!\n\nMia",
-        3: "Henry and his big dog Mudge went camping. Henry's mother knew all about camping. She knew how to set up a tent. She knew how to build a campfire. Henry's father didn't know anything about camping. He just came with a guitar and a smile. They walked and walked. It was beautiful. Henry saw fish in the stream and a rainbow.",
-        5: "Nate is a detective. He likes pancakes very much. He had pancakes for breakfast. Then the telephone rang. It was Annie. Annie lost a picture. The picture was of her dog, Fang. Nate said, \"I will find the picture.\""
-    }
-
-    # JSON 파일에서 로드 시도
-    try:
-        import json
-        import os
-        # 프로젝트 루트 경로 계산 (현재 파일의 상위 상위 디렉터리)
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        json_path = os.path.join(base_dir, 'extracted_questions.json')
-        
-        with open(json_path, 'r', encoding='utf-8') as f:
-            extracted_questions = json.load(f)
-
-        # 딕셔너리 구조 확인 및 안전한 접근 (대소문자 무관)
-        level_key = None
-        for key in extracted_questions.keys():
-            if key.upper() == level.upper():
-                level_key = key
-                break
-
-        if isinstance(extracted_questions, dict) and level_key:
-            questions = extracted_questions[level_key]
-
-            # 데이터 정리 및 유효성 검사
-            if isinstance(questions, list):
-                cleaned_questions = []
-                for q in questions:
-                    try:
-                        if (isinstance(q, dict) and
-                            'options' in q and isinstance(q['options'], list) and
-                            len(q['options']) == 4 and
-                            all(opt and opt.strip() for opt in q['options'])):
-
-                            cleaned_q = {
-                                'id': q.get('id', 0),
-                                'question': str(q.get('question', '')).replace('<span class="question-text">', '').replace('</span>', ''),
-                                'options': [str(opt).replace('A)', '').replace('B)', '').replace('C)', '').replace('D)', '') for opt in q['options']],
-                                'correct': int(q.get('correct', 0)),  # 내부 채점용 - UI에 표시 안됨
-                                'section': str(q.get('section', 'General'))
-                            }
-                            
-                            # JSON에서 passage 필드가 있으면 그대로 사용
-                            if 'passage' in q and q['passage']:
-                                cleaned_q['passage'] = q['passage']
-                            
-                            cleaned_questions.append(cleaned_q)
-                    except Exception:
-                        continue  # 개별 질문 오류는 무시하고 계속 진행
-
-                questions = cleaned_questions
-                if questions:
-                    return questions
-            else:
-                questions = []
-        else:
-            questions = []
-
-    except Exception:
-        questions = []  # 예외 발생시 빈 리스트로 초기화
-
-    # 2. A1 레벨은 하드코딩된 데이터 사용 (fallback)
-    if level == 'A1' and not questions:
-        # 지문 정의 (문제 그룹별)
-        passages = {
-            1: "Hi Tom,\n\nI am at the library. Please come at 3 o'clock.\nBring your English book.\nSee you soon!\n\nMia",
-            3: "Henry and his big dog Mudge went camping. Henry's mother knew all about camping. She knew how to set up a tent. She knew how to build a campfire. Henry's father didn't know anything about camping. He just came with a guitar and a smile. They walked and walked. It was beautiful. Henry saw fish in the stream and a rainbow.",
-            5: "Nate is a detective. He likes pancakes very much. He had pancakes for breakfast. Then the telephone rang. It was Annie. Annie lost a picture. The picture was of her dog, Fang. Nate said, \"I will find the picture.\""
-        }
-
-        questions = [
-            # Reading Comprehension (8문항) - 지문 포함
-            {
-                'id': 1,
-                'question': 'Where is Mia?',
-                'options': ['At school', 'At the library', 'At home', 'At the park'],
-                'correct': 1,
-                'section': 'Reading'
-            },
-            {
-                'id': 2,
-                'question': 'What should Tom bring?',
-                'options': ['His lunch box', 'His math book', 'His English book', 'His pencil case'],
-                'correct': 2,
-                'section': 'Reading'
-            },
-            {
-                'id': 3,
-                'question': 'Who knew about camping?',
-                'options': ['Henry\'s father', 'Henry\'s mother', 'Mudge the dog', 'Henry'],
-                'correct': 1,
-                'section': 'Reading'
-            },
-            {
-                'id': 4,
-                'question': 'What did Henry see?',
-                'options': ['Fish and a rainbow', 'Just a rainbow', 'Just fish', 'A guitar'],
-                'correct': 0,
-                'section': 'Reading'
-            },
-            {
-                'id': 5,
-                'question': 'What does Nate like to eat?',
-                'options': ['Sandwiches', 'Pancakes', 'Pizza', 'Cookies'],
-                'correct': 1,
-                'section': 'Reading'
-            },
-            {
-                'id': 6,
-                'question': 'What did Annie lose?',
-                'options': ['Her dog', 'A picture', 'Her phone', 'Her keys'],
-                'correct': 1,
-                'section': 'Reading'
-            },
-            {
-                'id': 7,
-                'question': 'What is the name of Annie\'s dog?',
-                'options': ['Mudge', 'Henry', 'Fang', 'Tom'],
-                'correct': 2,
-                'section': 'Reading'
-            },
-            {
-                'id': 8,
-                'question': 'What does Nate do?',
-                'options': ['He is a teacher', 'He is a doctor', 'He is a detective', 'He is a cook'],
-                'correct': 2,
-                'section': 'Reading'
-            },
-
-            # Vocabulary (12문항)
-            {
-                'id': 9,
-                'question': 'Choose the correct word: I ___ a student.',
-                'options': ['am', 'is', 'are', 'be'],
-                'correct': 0,
-                'section': 'Vocabulary'
-            },
-            {
-                'id': 10,
-                'question': 'What is the opposite of "big"?',
-                'options': ['Small', 'Large', 'Tall', 'Short'],
-                'correct': 0,
-                'section': 'Vocabulary'
-            },
-            {
-                'id': 11,
-                'question': 'What color is the sky?',
-                'options': ['Red', 'Blue', 'Green', 'Yellow'],
-                'correct': 1,
-                'section': 'Vocabulary'
-            },
-            {
-                'id': 12,
-                'question': 'How many days are in a week?',
-                'options': ['5', '6', '7', '8'],
-                'correct': 2,
-                'section': 'Vocabulary'
-            },
-            {
-                'id': 13,
-                'question': 'What do we use to write?',
-                'options': ['Pen', 'Book', 'Table', 'Chair'],
-                'correct': 0,
-                'section': 'Vocabulary'
-            },
-            {
-                'id': 14,
-                'question': 'Which animal says "meow"?',
-                'options': ['Dog', 'Cat', 'Bird', 'Fish'],
-                'correct': 1,
-                'section': 'Vocabulary'
-            },
-            {
-                'id': 15,
-                'question': 'What is the opposite of "hot"?',
-                'options': ['Cold', 'Warm', 'Cool', 'Ice'],
-                'correct': 0,
-                'section': 'Vocabulary'
-            },
-            {
-                'id': 16,
-                'question': 'How many legs does a dog have?',
-                'options': ['Two', 'Four', 'Six', 'Eight'],
-                'correct': 1,
-                'section': 'Vocabulary'
-            },
-            {
-                'id': 17,
-                'question': 'What is the opposite of "happy"?',
-                'options': ['Sad', 'Angry', 'Excited', 'Surprised'],
-                'correct': 0,
-                'section': 'Vocabulary'
-            },
-            {
-                'id': 18,
-                'question': 'What do you do with your eyes?',
-                'options': ['See', 'Hear', 'Smell', 'Taste'],
-                'correct': 0,
-                'section': 'Vocabulary'
-            },
-            {
-                'id': 19,
-                'question': 'What color is an apple?',
-                'options': ['Red', 'Blue', 'Green', 'Yellow'],
-                'correct': 0,
-                'section': 'Vocabulary'
-            },
-            {
-                'id': 20,
-                'question': 'What do you do when you are thirsty?',
-                'options': ['Drink', 'Eat', 'Sleep', 'Run'],
-                'correct': 0,
-                'section': 'Vocabulary'
-            },
-
-            # Conversation (5문항)
-            {
-                'id': 21,
-                'question': 'A: "Hello, how are you?" B: "___"',
-                'options': ['I\'m fine, thank you', 'I\'m 25 years old', 'I\'m a teacher', 'I\'m from Korea'],
-                'correct': 0,
-                'section': 'Conversation'
-            },
-            {
-                'id': 22,
-                'question': 'A: "What time is it?" B: "___"',
-                'options': ['It\'s 3 o\'clock', 'It\'s Monday', 'It\'s sunny', 'It\'s hot'],
-                'correct': 0,
-                'section': 'Conversation'
-            },
-            {
-                'id': 23,
-                'question': 'A: "Where is the library?" B: "___"',
-                'options': ['It\'s over there', 'It\'s expensive', 'It\'s delicious', 'It\'s cold'],
-                'correct': 0,
-                'section': 'Conversation'
-            },
-            {
-                'id': 24,
-                'question': 'A: "Thank you for your help." B: "___"',
-                'options': ['You\'re welcome', 'Thank you too', 'Goodbye', 'Hello'],
-                'correct': 0,
-                'section': 'Conversation'
-            },
-            {
-                'id': 25,
-                'question': 'A: "See you tomorrow." B: "___"',
-                'options': ['See you later', 'Nice to meet you', 'How are you', 'What\'s your name'],
-                'correct': 0,
-                'section': 'Conversation'
-            },
-
-            # Grammar (10문항)
-            {
-                'id': 26,
-                'question': 'She ___ a doctor.',
-                'options': ['am', 'is', 'are', 'be'],
-                'correct': 1,
-                'section': 'Grammar'
-            },
-            {
-                'id': 27,
-                'question': 'They ___ happy.',
-                'options': ['am', 'is', 'are', 'be'],
-                'correct': 2,
-                'section': 'Grammar'
-            },
-            {
-                'id': 28,
-                'question': '___ is your name?',
-                'options': ['What', 'Where', 'When', 'Who'],
-                'correct': 0,
-                'section': 'Grammar'
-            },
-            {
-                'id': 29,
-                'question': '___ do you live?',
-                'options': ['What', 'Where', 'When', 'Who'],
-                'correct': 1,
-                'section': 'Grammar'
-            },
-            {
-                'id': 30,
-                'question': 'She ___ to school every day.',
-                'options': ['go', 'goes', 'going', 'is go'],
-                'correct': 1,
-                'section': 'Grammar'
-            },
-            {
-                'id': 31,
-                'question': 'I ___ coffee every morning.',
-                'options': ['drink', 'drinks', 'drinking', 'is drink'],
-                'correct': 0,
-                'section': 'Grammar'
-            },
-            {
-                'id': 32,
-                'question': 'They ___ in London.',
-                'options': ['live', 'lives', 'living', 'is live'],
-                'correct': 0,
-                'section': 'Grammar'
-            },
-            {
-                'id': 33,
-                'question': 'He ___ very hard.',
-                'options': ['work', 'works', 'working', 'is work'],
-                'correct': 1,
-                'section': 'Grammar'
-            },
-            {
-                'id': 34,
-                'question': '___ old are you?',
-                'options': ['What', 'Where', 'When', 'How'],
-                'correct': 3,
-                'section': 'Grammar'
-            }
-        ]
-
-        # A1 레벨의 Reading 섹션에만 하드코딩된 지문 연결 (fallback용)
-        for question in questions:
-            if question.get('section') == 'Reading' and 'passage' not in question:
-                q_id = question['id']
-                # 지문 공유 규칙: 1-2번은 지문 1 공유, 3-4번은 지문 2 공유, 5-8번은 지문 3 공유
-                if q_id in [1, 2]:
-                    question['passage'] = passages[1]
-                elif q_id in [3, 4]:
-                    question['passage'] = passages[3]
-                elif q_id in [5, 6, 7, 8]:
-                    question['passage'] = passages[5]
-
-        return questions
-
-    # 최종 안전장치: questions가 리스트인지 확인하고 반환
-    if not isinstance(questions, list):
-        print(f"Warning: questions is not a list, it's {type(questions)}. Returning empty list.")
-        return []
-
-    return questions
-
-# 채점 함수
-def calculate_score(answers, questions):
-    correct = 0
-    penalty_deduction = 0
-    total = len(questions)
-    section_results = {}
-
-    for i, question in enumerate(questions):
-        # 섹션 초기화
-        section = question['section']
-        if section not in section_results:
-            section_results[section] = {'correct': 0, 'total': 0}
-        section_results[section]['total'] += 1
-
-        # 정답 체크
-        if i < len(answers):
-            if answers[i] == question['correct']:
-                correct += 1
-                section_results[section]['correct'] += 1
-            elif answers[i] == -1: # 미응시/시험중단 패널티
-                # 틀린 것으로 처리됨(점수 없음) + 추가 패널티 부여
-                # 패널티: 1문항 당 0.25점 감점 (예시) -> 총점 백분율에서 차감용
-                # 혹은 맞은 개수에서 차감할 수도 있음.
-                # 여기서는 '추가 패널티'를 정답 수에서 0.25개 차감하는 것으로 구현 (부분 점수 깎임)
-                penalty_deduction += 0.25
-        # answers 길이가 부족한 경우(혹시나)는 틀린걸로 처리됨 (0점)
-
-    # 기본 점수 계산 (백분율)
-    # 패널티 적용: 정답 수에서 패널티만큼 차감
-    adjusted_correct = max(0, correct - penalty_deduction)
-    percentage = (adjusted_correct / total) * 100 if total > 0 else 0
-
-    return {
-        'score': round(percentage),
-        'correct': correct, # 실제 맞은 개수
-        'total': total,
-        'passed': percentage >= 70,
-        'section_results': section_results,
-        'penalty_deduction': penalty_deduction # 정보용
-    }
-
 # 결과 저장 함수
 # 결과 저장 함수
-def save_results(level, score_data):
+def save_results(level, score_data, ability=None):
     # DB 매니저 초기화
     from utils.db_manager import DatabaseManager
     try:
@@ -591,6 +77,20 @@ def save_results(level, score_data):
             'sectionResults': score_data['section_results'],
             'answers': st.session_state['answers']
         }
+        cat = st.session_state.get('cat') if st.session_state.get('cat_result') else None
+        if cat is not None:
+            # 적응형: 여러 레벨 문항이 섞이므로 questionIds 대신 선택 경로(레벨, 문항, 응답, theta/SE)를 저장
+            result['mode'] = 'adaptive'
+            result['catPath'] = cat.path
+        else:
+            # 문항 분석용: 문항 id와 원래 선택지 번호 기준 응답 (utils/item_analysis.py)
+            questions = st.session_state.get('shuffled_questions') or []
+            responses = original_responses(st.session_state['answers'], questions)
+            if responses is not None:
+                result['questionIds'] = [q['id'] for q in questions]
+                result['responses'] = responses
+        if ability:
+            result['ability'] = ability
         
         # DB에 저장
         submission_id = db.save_submission(result)
@@ -602,6 +102,424 @@ def save_results(level, score_data):
         # 에러를 반환할 수 있습니다. 여기서는 에러 로그만 남깁니다.
         return None
 
+# 문항 패널 밖의 진행 현황 패널 갱신 주기(초) - 클릭마다 다시 그리지 않고 주기적으로만 갱신
+PROGRESS_REFRESH_SECONDS = 10
+# 클릭당 서버 처리 시간 기록 개수
+CLICK_TIMING_HISTORY = 50
+# 답안 입력 방식: 'question' = 문항마다 서버 처리 (기본), 'block' = 블록 단위로 브라우저에 버퍼링 후 동기화
+ANSWER_MODE = os.getenv('CEFR_ANSWER_MODE', 'question')
+# 블록 모드에서 버퍼링된 답안을 서버로 동기화하는 주기(초)
+BLOCK_SYNC_SECONDS = 60
+# 시도마다 새로 만드는 세션 상태 (다시 풀기/메인으로 이동 시 모두 삭제)
+ATTEMPT_STATE_KEYS = [
+    'current_question', 'answers', 'test_completed', 'start_time',
+    'shuffled_questions', 'answer_mappings', 'test_mode',
+    'section_progress', 'question_blocks', 'block_sync_ids', 'pinned_passage', 'click_timings',
+    'autosave_key', 'autosave_start', 'autosaved_position', 'restored_test_session',
+    'cat', 'cat_start', 'cat_question', 'cat_questions', 'cat_answers', 'cat_result',
+]
+
+def ensure_progress_index(questions):
+    """세션의 섹션 진행 인덱스를 준비합니다 (문항이 바뀌었거나 답안이 초기화된 경우 재생성)."""
+    progress = st.session_state.get('section_progress')
+    if progress is None or len(progress['section_of']) != len(questions):
+        progress = build_progress_index(questions)
+        st.session_state['section_progress'] = progress
+    return sync_progress(progress, len(st.session_state['answers']))
+
+def go_to_question(index):
+    st.session_state['current_question'] = index
+
+def autosave_answers(start, end=None):
+    """진행 중인 답안을 자동 저장 큐에 넣습니다 (DB 쓰기는 백그라운드 스레드가 일괄 처리)."""
+    key = st.session_state.get('autosave_key')
+    if key:
+        get_session_store().record_answers(key, start, st.session_state['answers'][start:end])
+
+def autosave_position():
+    key = st.session_state.get('autosave_key')
+    position = st.session_state['current_question']
+    if key and st.session_state.get('autosaved_position') != position:
+        get_session_store().record_position(key, position)
+        st.session_state['autosaved_position'] = position
+
+def resume_saved_session(level):
+    """작업자 재시작 등으로 세션이 사라졌을 때 자동 저장된 시험 상태를 복원합니다."""
+    student_name = st.session_state.get('student_info', {}).get('name')
+    if not student_name:
+        return False
+
+    # 세션 토큰으로 복원된 경우 토큰에 담긴 시험 세션 (같은 학생/레벨)
+    key = st.session_state.pop('restored_test_session', None) or session_key(student_name, level)
+    saved = get_session_store().load_session(key)
+    if not saved:
+        return False
+
+    st.session_state['shuffled_questions'] = saved['questions']
+    st.session_state['answer_mappings'] = saved['answer_mappings']
+    st.session_state['answers'] = saved['answers']
+    st.session_state['current_question'] = saved['current_question']
+    st.session_state['start_time'] = saved['start_time']
+    st.session_state['test_completed'] = False
+    st.session_state['autosave_key'] = key
+    st.session_state['autosave_start'] = saved['start_time']
+    st.session_state['autosaved_position'] = saved['current_question']
+    st.session_state.pop('section_progress', None)
+    return True
+
+def start_autosave(level):
+    """새 시험 시도를 자동 저장에 등록합니다 (시작 시각이 바뀔 때마다 한 번)."""
+    student_name = st.session_state.get('student_info', {}).get('name')
+    if not student_name or st.session_state.get('autosave_start') == st.session_state['start_time']:
+        return
+
+    key = session_key(student_name, level)
+    get_session_store().start_session(
+        key, student_name, level, st.session_state['start_time'],
+        st.session_state['shuffled_questions'], st.session_state['answer_mappings']
+    )
+    st.session_state['autosave_key'] = key
+    st.session_state['autosave_start'] = st.session_state['start_time']
+    st.session_state['autosaved_position'] = None
+    autosave_answers(0)
+    refresh_session_token()  # 재접속 시 이 시험으로 복원되도록 토큰에 시험 세션 추가
+
+def finish_autosave():
+    key = st.session_state.pop('autosave_key', None)
+    if key:
+        get_session_store().finish_session(key)
+        refresh_session_token()
+
+def reset_attempt():
+    """현재 시도를 끝내고 (자동 저장 세션 포함) 시도별 세션 상태를 모두 지웁니다."""
+    finish_autosave()
+    for key in ATTEMPT_STATE_KEYS:
+        st.session_state.pop(key, None)
+
+def select_option(q_idx, option, total_questions):
+    """선택지 클릭 콜백: 답안 기록 후 다음 문제로 이동 (fragment rerun 전에 실행됨)"""
+    record_answer(st.session_state['answers'], st.session_state['section_progress'], q_idx, option)
+    autosave_answers(q_idx, q_idx + 1)
+
+    # 자동으로 다음 문제로 이동 (마지막 문제가 아닌 경우)
+    if q_idx < total_questions - 1:
+        st.session_state['current_question'] = q_idx + 1
+
+def record_click_timing(elapsed_ms):
+    timings = st.session_state.setdefault('click_timings', [])
+    timings.append(elapsed_ms)
+    if len(timings) > CLICK_TIMING_HISTORY:
+        del timings[:-CLICK_TIMING_HISTORY]
+
+def shuffle_question(question):
+    """정답 편향 해결: 선택지를 섞은 문항 사본 (원래 정답/선택지 순서 보관)"""
+    q_copy = question.copy()
+    original_correct = question['correct']
+
+    # 선택지를 인덱스와 함께 셌플
+    indexed_options = list(enumerate(question['options']))
+    random.shuffle(indexed_options)
+
+    # 새로운 선택지 순서와 정답 인덱스 찾기
+    q_copy['options'] = [opt for idx, opt in indexed_options]
+    q_copy['correct'] = next(i for i, (orig_idx, _) in enumerate(indexed_options) if orig_idx == original_correct)
+    q_copy['original_correct'] = original_correct  # 원본 정답 보관
+    q_copy['option_order'] = [orig_idx for orig_idx, _ in indexed_options]  # 표시 순서 -> 원래 번호
+    return q_copy
+
+def start_adaptive_test(level):
+    """적응형 시험 상태를 준비합니다 (시작 시각마다 한 번). 보정된 문항 풀이 없으면 False."""
+    if st.session_state.get('cat_start') == st.session_state['start_time']:
+        return True
+    from utils.cat import AdaptiveTest, get_item_pool
+    pool = get_item_pool()
+    if pool is None:
+        return False
+    st.session_state['cat'] = AdaptiveTest(pool, level)
+    st.session_state['cat_start'] = st.session_state['start_time']
+    st.session_state['cat_questions'] = []
+    st.session_state['cat_answers'] = []
+    st.session_state.pop('cat_question', None)
+    return True
+
+def select_adaptive_option(option):
+    """적응형 선택지 클릭 콜백: 능력 추정치를 갱신하고 다음 문항은 fragment rerun에서 고름"""
+    question = st.session_state.pop('cat_question')
+    st.session_state['cat'].answer(option == question['correct'], response=question['option_order'][option])
+    st.session_state['cat_questions'].append(question)
+    st.session_state['cat_answers'].append(option)
+
+def finish_adaptive_test():
+    """푼 문항만으로 채점/결과 화면을 그리도록 세션을 정리합니다."""
+    cat = st.session_state['cat']
+    if st.session_state.pop('cat_question', None) is not None:
+        cat.current = None  # 중단 시 보여주기만 한 문항은 경로에 넣지 않음
+    questions = st.session_state['cat_questions']
+    st.session_state['shuffled_questions'] = questions
+    st.session_state['answer_mappings'] = [q['correct'] for q in questions]
+    st.session_state['answers'] = list(st.session_state['cat_answers'])
+    st.session_state['current_question'] = len(questions)
+    st.session_state['cat_result'] = cat.result()
+    st.session_state.pop('section_progress', None)
+    st.session_state['test_completed'] = True
+
+@st.fragment
+def render_exam_header(start_ts):
+    """상단 고정 헤더와 타이머 - 타이머는 브라우저에서 갱신되므로 서버 rerun이 필요 없음"""
+    components.html(f"""
+<div class="sticky-header">
+    <div class="header-left">
+        <div class="header-logo">EduPrompT <span style="font-weight:300; color:var(--text-secondary);">Test</span></div>
+    </div>
+
+    <div class="header-right">
+        <div class="timer-box">
+            <span>⏱</span>
+            <span id="exam-timer">00:00</span>
+        </div>
+    </div>
+</div>
+
+<script>
+    function updateTimer() {{
+        const startTime = {start_ts};
+        const now = new Date().getTime() / 1000;
+        const diff = now - startTime;
+
+        const minutes = Math.floor(diff / 60);
+        const seconds = Math.floor(diff % 60);
+
+        const timerElement = document.getElementById('exam-timer');
+        if (timerElement) {{
+            timerElement.innerText =
+                (minutes < 10 ? "0" + minutes : minutes) + ":" +
+                (seconds < 10 ? "0" + seconds : seconds);
+        }}
+    }}
+    setInterval(updateTimer, 1000);
+    updateTimer();
+</script>
+    """, height=80)
+
+@st.fragment(run_every=PROGRESS_REFRESH_SECONDS)
+def render_progress_panel(total_questions):
+    """섹션별 진행 현황 - 증분 계산된 응답 수만 읽어 O(섹션 수)로 그림"""
+    progress = st.session_state.get('section_progress')
+    if not progress:
+        return
+
+    answered_count = len(st.session_state['answers'])
+
+    st.markdown("### 📊 문제 진도")
+    for section, done, total in zip(progress['sections'], progress['answered'], progress['totals']):
+        # 섹션별 진행률 막대
+        ratio = done / total if total > 0 else 0
+        st.write(f"**{section}**: {done}/{total} ({ratio*100:.0f}%)")
+        st.progress(ratio)
+
+    st.markdown("### 📋 문제 목록")
+    # 모든 문제 상태 표시
+    status_text = " | ".join(
+        f"Q{i+1}: {'✅' if i < answered_count else '⭕'}" for i in range(total_questions)
+    )
+    st.markdown(f"<small>{status_text}</small>", unsafe_allow_html=True)
+
+def render_passage(question):
+    """지문 카드 (지문이 있으면). 문항에는 지문 id만 있고 본문은 은행의 지문 테이블에서 찾음"""
+    text = passage_text(question)
+    if text.strip():
+        st.markdown(f"""
+        <div class="edu-card-passage animate-fade-up">
+            <h3 style="font-family:var(--font-display); color:var(--accent-sage); margin-top:0; border-bottom:1px solid #eee; padding-bottom:15px; margin-bottom:20px;">
+                Reading Passage
+            </h3>
+            {text}
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_question_content(current_q):
+    """질문 카드 (지문은 render_passage()가 따로 그림)"""
+    # 질문 표시
+    st.markdown(f"""
+    <div class="edu-card-question animate-fade-up" style="animation-delay: 0.1s;">
+        <span class="question-meta">{current_q.get('section', 'General Question')}</span>
+        <div class="question-title">{current_q['question']}</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+@st.fragment
+def render_question_panel(total_questions):
+    """
+    현재 문항 패널 - 선택지 클릭은 이 fragment만 다시 실행합니다.
+    문항 데이터는 시험 시작 시 한 번 검증되었으므로 여기서는 다시 검사하지 않습니다.
+    """
+    started = time.perf_counter()
+
+    questions = st.session_state['shuffled_questions']
+    current_idx = st.session_state['current_question']
+    answers = st.session_state['answers']
+
+    if st.session_state['test_completed'] or current_idx >= total_questions:
+        return
+
+    current_q = questions[current_idx]
+    # 지문은 fragment 밖에 그룹당 한 번 그려 두므로, 다른 지문의 문항으로 넘어갈 때만 페이지 전체를 다시 그림
+    if passage_key(current_q) != st.session_state.get('pinned_passage'):
+        st.rerun()
+    autosave_position()
+
+    # 진행률 및 현재 문제 상태 (더 명확하게)
+    st.progress(len(answers) / total_questions, text=f"Q {current_idx + 1} / {total_questions}")
+    if current_idx < len(answers):
+        st.success(f"✅ **문제 {current_idx + 1}**: 이미 답변 완료됨")
+    else:
+        st.warning(f"❓ **문제 {current_idx + 1}**: 답변이 필요합니다")
+
+    render_question_content(current_q)
+
+    # 현재 선택된 답변 확인
+    current_answer = answers[current_idx] if current_idx < len(answers) else None
+
+    # 옵션 버튼을 위한 CSS 스타일 주입 (선택된 항목 하이라이트)
+    current_ans = current_answer if current_answer is not None else 'X'
+    st.markdown(f"""
+    <style>
+    .stButton > button[k*="q{current_idx}_option_{current_ans}"] {{
+        background-color: rgba(123, 163, 140, 0.1) !important;
+        border: 2px solid #7BA38C !important;
+        color: #7BA38C !important;
+        font-weight: 700 !important;
+        box-shadow: 0 0 0 4px rgba(123, 163, 140, 0.15) !important;
+    }}
+    </style>
+    """, unsafe_allow_html=True)
+
+    # 선택지 - 클릭 콜백에서 답안을 기록하므로 별도의 st.rerun()이 필요 없음
+    for i, option in enumerate(current_q['options']):
+        st.button(f"{option}", key=f"q{current_idx}_option_{i}",
+                  on_click=select_option, args=(current_idx, i, total_questions))
+
+    # 버튼 영역
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.button("← 이전 문제", disabled=current_idx == 0,
+                  on_click=go_to_question, args=(current_idx - 1,))
+
+    with col2:
+        if st.button("🚫 시험 중단 및 제출", type="secondary", help="현재까지 푼 문제로만 채점합니다. 남은 문제는 오답 처리되며 추가 패널티가 있습니다."):
+            # 남은 문제 오답 처리 (패널티 -1로 표시)
+            filled_from = len(answers)
+            fill_unanswered(answers, st.session_state['section_progress'], total_questions)
+            autosave_answers(filled_from)
+            st.session_state['test_completed'] = True
+            st.rerun()  # 결과 화면은 페이지 전체를 다시 그림
+
+    with col3:
+        pass
+
+    with col4:
+        if st.button("다음 문제 →", disabled=current_idx >= total_questions - 1):
+            # 현재 문제에 답했는지 확인
+            if current_idx < len(answers):
+                st.session_state['current_question'] += 1
+                st.rerun(scope="fragment")
+            else:
+                st.error("⚠️ 현재 문제에 답해야 다음 문제로 넘어갈 수 있습니다.")
+
+    # 클릭당 서버 처리 시간 측정 (?debug=1 일 때 표시)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    record_click_timing(elapsed_ms)
+    if st.query_params.get('debug') == '1':
+        timings = sorted(st.session_state['click_timings'])
+        st.caption(f"⏱ 서버 처리 {elapsed_ms:.1f}ms (최근 {len(timings)}회 중앙값 {timings[len(timings) // 2]:.1f}ms)")
+
+@st.fragment
+def render_block_panel(total_questions):
+    """
+    현재 블록(같은 섹션/지문 문항 묶음) 패널 - 선택과 블록 내 이동은 브라우저에서 처리되고,
+    서버는 블록 제출/이전 블록/중단 시와 BLOCK_SYNC_SECONDS마다 한 번씩만 실행됩니다.
+    """
+    questions = st.session_state['shuffled_questions']
+    answers = st.session_state['answers']
+    progress = st.session_state['section_progress']
+
+    if st.session_state['test_completed'] or st.session_state['current_question'] >= total_questions:
+        return
+
+    blocks = st.session_state.get('question_blocks')
+    if blocks is None or (blocks and blocks[-1][1] != total_questions):
+        blocks = build_question_blocks(questions)
+        st.session_state['question_blocks'] = blocks
+
+    block_idx = find_block(blocks, st.session_state['current_question'])
+    start, end = blocks[block_idx]
+    autosave_position()
+
+    st.progress(len(answers) / total_questions,
+                text=f"Q {start + 1}-{end} / {total_questions} (블록 {block_idx + 1}/{len(blocks)})")
+
+    value = question_block(questions, answers, start, end, total_questions,
+                           session_id=str(st.session_state['start_time']),
+                           sync_interval=BLOCK_SYNC_SECONDS,
+                           key=f"question_block_{start}")
+
+    # 같은 컴포넌트 값은 rerun마다 다시 반환되므로 sync_id로 한 번만 처리
+    seen = st.session_state.setdefault('block_sync_ids', {})
+    if not value or value.get('start') != start or seen.get(start) == value.get('sync_id'):
+        return
+    seen[start] = value.get('sync_id')
+
+    if merge_answer_batch(answers, progress, start, value.get('answers') or []):
+        autosave_answers(start, end)
+    action = value.get('action')
+
+    if action == 'abort':
+        # 남은 문제 오답 처리 (패널티 -1로 표시)
+        filled_from = len(answers)
+        fill_unanswered(answers, progress, total_questions)
+        autosave_answers(filled_from)
+        st.session_state['test_completed'] = True
+        st.rerun()
+    elif action == 'submit_block':
+        st.session_state['current_question'] = end
+        # 마지막 블록이면 완료 화면을 위해 페이지 전체를 다시 그림
+        st.rerun(scope="fragment" if end < total_questions else "app")
+    elif action == 'prev_block' and block_idx > 0:
+        st.session_state['current_question'] = blocks[block_idx - 1][0]
+        st.rerun(scope="fragment")
+
+@st.fragment
+def render_adaptive_panel():
+    """
+    적응형 문항 패널 - 선택지 클릭 시 이 fragment만 다시 실행되어 다음 문항을 고릅니다
+    (미리 계산된 정보량 표 조회라 단계당 1ms 미만). 종료 조건에 도달하면 결과 화면으로 전체 rerun.
+    """
+    cat = st.session_state['cat']
+    if 'cat_question' not in st.session_state:
+        question = cat.next_item()
+        if question is None:
+            finish_adaptive_test()
+            st.rerun()
+        st.session_state['cat_question'] = shuffle_question(question)
+    current_q = st.session_state['cat_question']
+    answered = len(cat.path)
+
+    st.progress(answered / cat.max_items,
+                text=f"Q {answered + 1} (최대 {cat.max_items}문항) · 측정 오차 {cat.se:.2f} → 목표 {cat.target_se:.2f}")
+    render_passage(current_q)
+    render_question_content(current_q)
+
+    for i, option in enumerate(current_q['options']):
+        st.button(f"{option}", key=f"cat{answered}_option_{i}", on_click=select_adaptive_option, args=(i,))
+
+    if st.button("🚫 시험 중단 및 제출", type="secondary", help="현재까지 푼 문제로 능력을 추정합니다."):
+        finish_adaptive_test()
+        st.rerun()
+
+    if st.query_params.get('debug') == '1' and cat.path:
+        st.caption(f"⏱ 문항 선택 {cat.path[-1]['selectMs']:.2f}ms · θ = {cat.theta:.2f}")
+
 # 메인 함수
 def main():
     st.title("📝 CEFR Level Test")
@@ -648,48 +566,22 @@ def main():
         st.error(f"❌ '{level}' 레벨에 사용 가능한 질문이 없습니다.")
         st.stop()
 
-    # 데이터 품질 검사
-    valid_questions = []
-    for q in questions:
-        if (q and isinstance(q, dict) and
-            'question' in q and q['question'].strip() and
-            'options' in q and isinstance(q['options'], list) and len(q['options']) == 4 and
-            all(opt.strip() for opt in q['options'])):
-            valid_questions.append(q)
+    # 문항 검사는 은행 빌드 시 한 번 (validate_bank.py) - 로더가 유효한 문항만 반환함
+    valid_questions = questions
 
-    if len(valid_questions) != len(questions):
-        st.warning(f"⚠️ {len(questions) - len(valid_questions)}개의 잘못된 질문을 제외했습니다.")
-
-    if len(valid_questions) == 0:
-        st.error("❌ 유효한 질문이 없습니다. 관리자에게 문의해주세요.")
-        st.stop()
+    # 진행 중이던 시험 복원 (서버 재시작 등으로 세션이 초기화된 경우, 세션당 한 번 확인)
+    if not st.session_state['start_time'] and not st.session_state.get('resume_checked'):
+        st.session_state['resume_checked'] = True
+        if resume_saved_session(level):
+            st.toast("이전에 진행 중이던 시험을 이어서 진행합니다.")
 
     # 정답 편향 해결: 시험 시작 시 한 번만 선택지 셌플
     if st.session_state['shuffled_questions'] is None:
         # 처음 시험 시작 시에만 실행
-        shuffled_questions = []
-        answer_mappings = []  # 원본 정답 인덱스 -> 셌플된 정답 인덱스 매핑
-        
-        for q in valid_questions:
-            q_copy = q.copy()
-            original_correct = q['correct']
-            options = q['options'][:]
-            
-            # 선택지를 인덱스와 함께 셌플
-            indexed_options = list(enumerate(options))
-            random.shuffle(indexed_options)
-            
-            # 새로운 선택지 순서와 정답 인덱스 찾기
-            new_options = [opt for idx, opt in indexed_options]
-            new_correct = next(i for i, (orig_idx, _) in enumerate(indexed_options) if orig_idx == original_correct)
-            
-            q_copy['options'] = new_options
-            q_copy['correct'] = new_correct
-            q_copy['original_correct'] = original_correct  # 원본 정답 보관
-            
-            shuffled_questions.append(q_copy)
-            answer_mappings.append(new_correct)
-        
+        # 같은 지문의 문항은 떨어져 있어도 한 블록으로 풀도록 모음
+        shuffled_questions = [shuffle_question(q) for q in group_passages(valid_questions)]
+        answer_mappings = [q['correct'] for q in shuffled_questions]  # 셌플된 정답 인덱스
+
         st.session_state['shuffled_questions'] = shuffled_questions
         st.session_state['answer_mappings'] = answer_mappings
     
@@ -700,7 +592,17 @@ def main():
 
     # 테스트 시작
     if not st.session_state['start_time']:
+        # 보정된 문항 모수가 있으면 적응형 선택 가능 (calibrate_items.py)
+        mode = 'fixed'
+        if os.path.exists(ITEM_PARAMS_PATH):
+            choice = st.radio("시험 방식", ["고정형 (레벨 전체 문항)", "적응형 (실력에 맞춰 문항 수 단축)"],
+                              help="적응형은 선택한 레벨에서 시작해 답에 따라 Pre-A1~B2 문항을 골라 내며, "
+                                   "측정 오차가 충분히 작아지면 끝납니다.")
+            mode = 'adaptive' if choice.startswith("적응형") else 'fixed'
         if st.button("테스트 시작", type="primary"):
+            st.session_state['test_mode'] = mode
+            for key in ['cat', 'cat_start', 'cat_question', 'cat_result']:
+                st.session_state.pop(key, None)
             st.session_state['start_time'] = time.time()
             # 선택지 셌플 초기화 (새 시험 시작시 재셌플)
             st.session_state['shuffled_questions'] = None
@@ -708,411 +610,61 @@ def main():
             st.rerun()
         return
 
-    # --- UX UI 개선: Sticky Header & Timer & Professional Layout ---
-    
-    # 진행률 및 타이머 계산
-    progress_val = len(st.session_state['answers']) / total_questions
-    progress_percent = progress_val * 100
-    
-    start_ts = st.session_state['start_time'] if st.session_state['start_time'] else time.time()
-    
-    # CSS for sticky header
-    st.markdown(f"""
-<style>
-/* 1. Streamlit Override */
-header[data-testid="stHeader"] {{display: none !important;}}
-footer {{display: none !important;}}
-.stApp {{margin-top: -30px;}}
-
-/* 2. Professional Layout */
-.main .block-container {{
-    max-width: 900px !important;
-    padding-top: 100px !important;
-    padding-bottom: 100px !important;
-    background-color: var(--bg-primary);
-}}
-
-/* 3. Sticky Header (EduPrompT Style) */
-.sticky-header {{
-    position: fixed;
-    top: 0;
-    left: 0;
-    width: 100%;
-    height: 80px;
-    background: rgba(253, 252, 250, 0.95);
-    backdrop-filter: blur(12px);
-    border-bottom: 1px solid rgba(0,0,0,0.05);
-    z-index: 10000;
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    padding: 0 5%;
-    box-shadow: 0 4px 6px -1px rgba(0,0,0,0.02);
-}}
-
-.header-left {{
-    display: flex;
-    align-items: center;
-    gap: 12px;
-}}
-.header-logo {{ 
-    font-family: var(--font-display);
-    font-size: 1.4rem; 
-    font-weight: 700; 
-    color: var(--text-primary); 
-    letter-spacing: -0.02em;
-}}
-
-.header-center {{
-    position: absolute;
-    left: 50%;
-    transform: translateX(-50%);
-    font-family: var(--font-mono);
-    color: var(--text-secondary);
-    font-size: 0.9rem;
-    letter-spacing: 0.05em;
-    background: var(--bg-secondary);
-    padding: 6px 16px;
-    border-radius: 20px;
-}}
-
-.header-right {{
-    display: flex;
-    align-items: center;
-    gap: 20px;
-}}
-
-.timer-box {{
-    font-family: var(--font-mono);
-    color: var(--accent-coral);
-    font-weight: 600;
-    font-size: 1.1rem;
-    display: flex;
-    align-items: center;
-    gap: 8px;
-    background: rgba(232, 120, 90, 0.1);
-    padding: 6px 14px;
-    border-radius: 8px;
-}}
-
-/* 4. Progress Line */
-.progress-line-container {{
-    position: absolute;
-    bottom: 0;
-    left: 0;
-    width: 100%;
-    height: 3px;
-    background: transparent;
-}}
-.progress-line-fill {{
-    height: 100%;
-    width: {progress_percent}%;
-    background: var(--accent-sage);
-    transition: width 0.6s cubic-bezier(0.4, 0, 0.2, 1);
-    box-shadow: 0 0 10px rgba(123, 163, 140, 0.3);
-}}
-</style>
-    """, unsafe_allow_html=True)
-    
-    # Timer HTML component with JavaScript
-    components.html(f"""
-<div class="sticky-header">
-    <div class="header-left">
-        <div class="header-logo">EduPrompT <span style="font-weight:300; color:var(--text-secondary);">Test</span></div>
-    </div>
-    
-    <div class="header-center">
-        Q {st.session_state['current_question'] + 1} <span style="color:#e2e8f0; margin:0 8px;">/</span> {total_questions}
-    </div>
-    
-    <div class="header-right">
-        <div class="timer-box">
-            <span>⏱</span>
-            <span id="exam-timer">00:00</span>
-        </div>
-    </div>
-    
-    <div class="progress-line-container">
-        <div class="progress-line-fill"></div>
-    </div>
-</div>
-
-<script>
-    function updateTimer() {{
-        const startTime = {start_ts};
-        const now = new Date().getTime() / 1000;
-        const diff = now - startTime;
-        
-        const minutes = Math.floor(diff / 60);
-        const seconds = Math.floor(diff % 60);
-        
-        const timerElement = document.getElementById('exam-timer');
-        if (timerElement) {{
-            timerElement.innerText = 
-                (minutes < 10 ? "0" + minutes : minutes) + ":" + 
-                (seconds < 10 ? "0" + seconds : seconds);
-        }}
-    }}
-    setInterval(updateTimer, 1000);
-    updateTimer();
-</script>
-    """, height=80)
-
-    # 현재 문제 상태 (더 명확하게)
-    if st.session_state['current_question'] < len(st.session_state['answers']):
-        st.success(f"✅ **문제 {st.session_state['current_question'] + 1}**: 이미 답변 완료됨")
-    else:
-        st.warning(f"❓ **문제 {st.session_state['current_question'] + 1}**: 답변이 필요합니다")
-
-    # 문제 목록과 네비게이션
-    st.markdown("---")
-
-    # 네비게이션과 문제 목록
-    col1, col2, col3 = st.columns([2, 1, 1])
-
-    with col2:
-        st.markdown("### 🧭 빠른 이동")
-        # 첫 번째 문제로 이동
-        if st.button("⬅ 첫 문제", key="first_question", disabled=st.session_state['current_question'] == 0):
-            st.session_state['current_question'] = 0
-            st.rerun()
+    # 적응형 시험 (문항이 답에 따라 정해지므로 자동 저장 대신 세션 안에서만 진행)
+    if st.session_state.get('test_mode') == 'adaptive' and not st.session_state['test_completed']:
+        if start_adaptive_test(level):
+            st.markdown(load_css(TEST_PAGE_CSS), unsafe_allow_html=True)
+            render_exam_header(st.session_state['start_time'])
+            st.markdown("---")
+            render_adaptive_panel()
+            return
+        st.warning("보정된 문항이 없어 고정형 시험으로 진행합니다.")
+        st.session_state['test_mode'] = 'fixed'
+
+    # 자동 저장 등록 (새 시도일 때만, 이후 답안/위치는 변경분만 큐에 추가)
+    if not st.session_state['test_completed']:
+        start_autosave(level)
 
-        # 마지막 문제로 이동
-        if st.button("⬅ 마지막 문제", key="last_question", disabled=st.session_state['current_question'] >= total_questions - 1):
-            st.session_state['current_question'] = total_questions - 1
-            st.rerun()
+    # --- UX UI 개선: Sticky Header & Timer & Professional Layout ---
+    # 정적 CSS는 전체 rerun 때만 전송되고, 문항 클릭(fragment rerun) 때는 다시 보내지 않음
+    st.markdown(load_css(TEST_PAGE_CSS), unsafe_allow_html=True)
 
-    with col3:
-        st.markdown("### 📋 문제 목록")
-        # 문제 1-8 표시 (읽기 문제는 지문 표시)
-        st.write("문제 1-8 (읽기 이해)")
-
-        # 모든 문제 상태 표시
-        problem_status = []
-        for i in range(total_questions):
-            if i < len(st.session_state['answers']):
-                problem_status.append(f"Q{i+1}: ✅")
-            else:
-                problem_status.append(f"Q{i+1}: ⭕")
+    start_ts = st.session_state['start_time'] if st.session_state['start_time'] else time.time()
+    render_exam_header(start_ts)
 
-        status_text = " | ".join(problem_status)
-        st.markdown(f"<small>{status_text}</small>", unsafe_allow_html=True)
+    # 섹션 진행 인덱스 (시험 시작 시 한 번 생성, 이후 증분 갱신)
+    ensure_progress_index(questions)
 
-    with col1:
-        st.markdown("### 📊 문제 진도")
-
-        # 구간별 문제 구분
-        section_questions = {}
-        for i, q in enumerate(questions):
-            section = q['section']
-            if section not in section_questions:
-                section_questions[section] = []
-            section_questions[section].append(i + 1)
-
-        # 섹션별 진행 상황
-        for section, q_list in section_questions.items():
-            section_completed = sum(1 for q_num in q_list if q_num <= len(st.session_state['answers']))
-            section_total = len(q_list)
-
-            # 섹션별 진행률 막대
-            progress = section_completed / section_total if section_total > 0 else 0
-            st.write(f"**{section}**: {section_completed}/{section_total} ({progress*100:.0f}%)")
-            st.progress(progress)
-
-            # 섹션별 문제 번호 표시
-            q_status = []
-            for q_num in q_list:
-                if q_num <= len(st.session_state['answers']):
-                    q_status.append(f"Q{q_num} ✅")
-                else:
-                    q_status.append(f"Q{q_num} ⭕")
-
-            st.markdown(f"<small>{' | '.join(q_status)}</small>", unsafe_allow_html=True)
-
-    # 현재 질문 표시
     if not st.session_state['test_completed'] and st.session_state['current_question'] < total_questions:
-        current_q = questions[st.session_state['current_question']]
-
-        # 데이터 유효성 검사
-        if not current_q or not isinstance(current_q, dict):
-            st.error("❌ 질문 데이터가 올바르지 않습니다.")
-            st.stop()
-
-        if 'question' not in current_q or not current_q['question'].strip():
-            st.error("❌ 질문 내용이 없습니다.")
-            st.stop()
-
-        if 'options' not in current_q or not isinstance(current_q['options'], list) or len(current_q['options']) != 4:
-            st.error("❌ 선택지 데이터가 올바르지 않습니다.")
-            st.stop()
+        # 문제 목록과 네비게이션
+        st.markdown("---")
 
-        if not all(opt.strip() for opt in current_q['options']):
-            st.error("❌ 일부 선택지가 비어있습니다.")
-            st.stop()
-
-        # 구글 폰트 및 컴포넌트 스타일 적용
-        st.markdown(f"""
-        <style>
-            /* 질문 및 본문 스타일 (EduPrompT Design System) */
-            
-            .edu-card-passage {{
-                background-color: #ffffff;
-                border-radius: var(--radius-lg);
-                padding: 2.5rem;
-                border-left: 4px solid var(--accent-sage);
-                box-shadow: var(--shadow-soft);
-                margin-bottom: 2rem;
-                font-family: var(--font-body);
-                line-height: 1.8;
-                color: var(--text-primary);
-            }}
-            
-            .edu-card-question {{
-                margin-bottom: 2rem;
-            }}
-            
-            .question-meta {{
-                font-family: var(--font-mono);
-                font-size: 0.8rem;
-                color: var(--accent-coral);
-                text-transform: uppercase;
-                letter-spacing: 0.1em;
-                margin-bottom: 1rem;
-                display: block;
-            }}
-            
-            .question-title {{
-                font-family: var(--font-display);
-                font-size: 1.6rem;
-                font-weight: 600;
-                color: var(--text-primary);
-                line-height: 1.4;
-            }}
-            
-            /* 선택지 버튼 오버라이드 */
-            .stButton > button {{
-                width: 100%;
-                background-color: #ffffff !important;
-                color: var(--text-secondary) !important;
-                border: 1px solid #e2e8f0 !important;
-                border-radius: var(--radius-md) !important;
-                padding: 1.25rem 1.5rem !important;
-                font-family: var(--font-body) !important;
-                font-size: 1.05rem !important;
-                text-align: left !important;
-                margin-bottom: 0.75rem !important;
-                transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-            }}
-            
-            .stButton > button:hover {{
-                border-color: var(--accent-sage) !important;
-                background-color: var(--bg-secondary) !important;
-                transform: translateY(-2px);
-                box-shadow: var(--shadow-medium);
-            }}
-        </style>
-        """, unsafe_allow_html=True)
-
-        # 지문 표시
-        if 'passage' in current_q and current_q['passage'] and current_q['passage'].strip():
-            st.markdown(f"""
-            <div class="edu-card-passage animate-fade-up">
-                <h3 style="font-family:var(--font-display); color:var(--accent-sage); margin-top:0; border-bottom:1px solid #eee; padding-bottom:15px; margin-bottom:20px;">
-                    Reading Passage
-                </h3>
-                {current_q['passage']}
-            </div>
-            """, unsafe_allow_html=True)
-
-        # 질문 표시
-        st.markdown(f"""
-        <div class="edu-card-question animate-fade-up" style="animation-delay: 0.1s;">
-            <span class="question-meta">{current_q.get('section', 'General Question')}</span>
-            <div class="question-title">{current_q['question']}</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # 선택지
-        selected_option = None
-
-        # 현재 선택된 답변 확인
-        current_answer = None
-        if st.session_state['current_question'] < len(st.session_state['answers']):
-            current_answer = st.session_state['answers'][st.session_state['current_question']]
-
-        # 옵션 버튼을 위한 CSS 스타일 주입 (선택된 항목 하이라이트)
-        current_q_num = st.session_state['current_question']
-        current_ans = current_answer if current_answer is not None else 'X'
-
-        selection_style = f"""
-        <style>
-        .stButton > button[k*="q{current_q_num}_option_{current_ans}"] {{
-            background-color: rgba(123, 163, 140, 0.1) !important;
-            border: 2px solid #7BA38C !important;
-            color: #7BA38C !important;
-            font-weight: 700 !important;
-            box-shadow: 0 0 0 4px rgba(123, 163, 140, 0.15) !important;
-        }}
-        </style>
-        """
-        st.markdown(selection_style, unsafe_allow_html=True)
-
-        for i, option in enumerate(current_q['options']):
-            is_selected = (i == current_answer)
-            button_symbol = '●' if is_selected else '○'
-
-            # 선택된 옵션은 단순히 텍스트만 표시 (스타일은 CSS로 처리)
-            button_text = f"{option}" 
-            
-            # 버튼 클릭 처리
-            if st.button(button_text,
-                        key=f"q{st.session_state['current_question']}_option_{i}"):
-                    current_q_idx = st.session_state['current_question']
-                    
-                    # 선택된 옵션을 세션 상킬에 저장
-                    if current_q_idx < len(st.session_state['answers']):
-                        # 이미 답한 문제인 경우 업데이트
-                        st.session_state['answers'][current_q_idx] = i
-                    else:
-                        # 새로운 답변인 경우 추가
-                        st.session_state['answers'].append(i)
-                    
-                    # 자동으로 다음 문제로 이동 (마지막 문제가 아닌 경우)
-                    if current_q_idx < total_questions - 1:
-                        st.session_state['current_question'] = current_q_idx + 1
-                    
-                    st.rerun()  # 페이지 다시 로드하여 변경사항 반영
-
-        # 버튼 영역
-        col1, col2, col3, col4 = st.columns(4)
+        col1, col2 = st.columns([3, 1])
 
         with col1:
-            if st.button("← 이전 문제", disabled=st.session_state['current_question'] == 0):
-                st.session_state['current_question'] -= 1
-                st.rerun()
+            render_progress_panel(total_questions)
 
         with col2:
-             if st.button("🚫 시험 중단 및 제출", type="secondary", help="현재까지 푼 문제로만 채점합니다. 남은 문제는 오답 처리되며 추가 패널티가 있습니다."):
-                if st.session_state['current_question'] < total_questions:
-                     # 남은 문제 오답 처리 (패널티 -1로 표시)
-                     remaining = total_questions - len(st.session_state['answers'])
-                     for _ in range(remaining):
-                         st.session_state['answers'].append(-1) # -1은 오답/미응시
-                st.session_state['test_completed'] = True
-                st.rerun()
-
-        with col3:
-            pass 
-
-        with col4:
-            if st.button("다음 문제 →", disabled=st.session_state['current_question'] >= total_questions - 1):
-                # 현재 문제에 답했는지 확인
-                current_answered = st.session_state['current_question'] < len(st.session_state['answers'])
-                if current_answered:
-                    st.session_state['current_question'] += 1
-                    st.rerun()
-                else:
-                    st.error("⚠️ 현재 문제에 답해야 다음 문제로 넘어갈 수 있습니다.")
+            st.markdown("### 🧭 빠른 이동")
+            # 첫 번째 문제로 이동
+            st.button("⬅ 첫 문제", key="first_question",
+                      disabled=st.session_state['current_question'] == 0,
+                      on_click=go_to_question, args=(0,))
+
+            # 마지막 문제로 이동
+            st.button("⬅ 마지막 문제", key="last_question",
+                      disabled=st.session_state['current_question'] >= total_questions - 1,
+                      on_click=go_to_question, args=(total_questions - 1,))
+
+        # 현재 질문 표시 (문항 클릭/블록 동기화 시 이 영역만 다시 실행됨)
+        if ANSWER_MODE == 'question':
+            # 현재 지문 그룹의 지문은 여기서 한 번만 그려 두고, 같은 지문 문항을 푸는 동안(fragment rerun)은 다시 보내지 않음
+            current_q = questions[st.session_state['current_question']]
+            st.session_state['pinned_passage'] = passage_key(current_q)
+            render_passage(current_q)
+            render_question_panel(total_questions)
+        else:
+            render_block_panel(total_questions)
 
     # 테스트 완료
     elif st.session_state['current_question'] >= total_questions and not st.session_state['test_completed']:
@@ -1130,9 +682,9 @@ footer {{display: none !important;}}
             with col_b:
                 if st.button("⚠️ 미답변 문항 오답 처리 후 제출", type="secondary"):
                     # 남은 문제 -1 (오답) 처리
-                    remaining = total_questions - len(st.session_state['answers'])
-                    for _ in range(remaining):
-                         st.session_state['answers'].append(-1)
+                    filled_from = len(st.session_state['answers'])
+                    fill_unanswered(st.session_state['answers'], st.session_state['section_progress'], total_questions)
+                    autosave_answers(filled_from)
                     st.session_state['test_completed'] = True
                     st.rerun()
 
@@ -1170,13 +722,20 @@ footer {{display: none !important;}}
             'sectionResults': score_data['section_results'],
             'answers': st.session_state['answers']
         }
+        # IRT 능력 추정 (적응형은 시험 중 갱신한 추정치, 고정형은 문항 모수가 보정된 레벨만)
+        ability = (st.session_state.get('cat_result')
+                   or estimate_ability(level, st.session_state['answers'], questions_for_scoring))
+        if ability:
+            test_results['ability'] = ability
 
         # CEFR 분석
         analyzer = CEFRAnalyzer()
         analysis = analyzer.analyze_test_results(test_results)
 
         # 결과 저장
-        saved_file = save_results(level, score_data)
+        saved_file = save_results(level, score_data, ability)
+        # 제출이 끝난 시도는 자동 저장에서 제거
+        finish_autosave()
 
         # 결과 화면
         st.success("🎉 테스트 완료! 상세한 학습 분석 리포트가 생성되었습니다.")
@@ -1201,6 +760,8 @@ footer {{display: none !important;}}
                     </p>
                 </div>
                 """, unsafe_allow_html=True)
+                if ability:
+                    st.caption(f"IRT 능력 추정치 θ = {ability['theta']:.2f} (±{ability['se']:.2f}, {ability['items']}문항)")
 
             with col2:
                 st.markdown(f"""
@@ -1303,18 +864,12 @@ footer {{display: none !important;}}
 
         with col1:
             if st.button("🏠 메인으로", type="secondary"):
-                # 세션 초기화
-                for key in ['current_question', 'answers', 'test_completed', 'start_time']:
-                    if key in st.session_state:
-                        del st.session_state[key]
+                reset_attempt()
                 st.switch_page("app.py")
 
         with col2:
             if st.button("🔄 다시 풀기"):
-                # 세션 초기화
-                for key in ['current_question', 'answers', 'test_completed', 'start_time']:
-                    if key in st.session_state:
-                        del st.session_state[key]
+                reset_attempt()
                 st.rerun()
 
         with col3:
@@ -1322,4 +877,5 @@ footer {{display: none !important;}}
                 st.success("상담 신청이 완료되었습니다! 교사가 연락드릴 것입니다.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with timer('page.student_test'):
+        main()
@@ -1,14 +1,18 @@
 import streamlit as st
-import pandas as pd
-import json
 import os
 from datetime import datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.cefr_analyzer import CEFRAnalyzer
+from utils.submission_stats import calculate_statistics
+from utils.metrics import timer
+from utils.assets import inject_css
+from utils.auth_manager import normalize_session_state
+from utils.lazy_imports import lazy_import
+
+# 차트/표 라이브러리는 실제로 그릴 때 import (콜드 스타트 단축)
+pd = lazy_import('pandas')
+px = lazy_import('plotly.express')
 
 # 페이지 설정
 st.set_page_config(
@@ -17,9 +21,11 @@ st.set_page_config(
     layout="wide"
 )
 
-# 커스텀 CSS
-with open('assets/styles.css', 'r') as f:
-    st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+# 커스텀 CSS (프로세스 단위 캐시)
+inject_css()
+
+# 재접속 시 URL의 세션 토큰으로 로그인 상태 복원
+normalize_session_state()
 
 # 로그인 확인
 if not st.session_state.get('logged_in', False) or st.session_state.get('user_role') != 'teacher':
@@ -31,83 +37,11 @@ def load_submissions():
     from utils.db_manager import DatabaseManager
     try:
         db = DatabaseManager()
-        return db.load_submissions()
+        return db.load_submission_records()
     except Exception as e:
         st.error(f"데이터베이스 로드 오류: {e}")
         return []
 
-# 통계 계산 함수
-def calculate_statistics(submissions):
-    if not submissions:
-        return {
-            'total_students': 0,
-            'avg_score': 0,
-            'pass_rate': 0,
-            'today_submissions': 0,
-            'level_distribution': {},
-            'score_distribution': {},
-            'section_averages': {}
-        }
-
-    total_students = len(submissions)
-    avg_score = sum(s.get('score', 0) for s in submissions) / total_students
-    passed_count = sum(1 for s in submissions if s.get('passed', False))
-    pass_rate = (passed_count / total_students) * 100
-
-    # 오늘 제출 수
-    today = datetime.now().date()
-    today_submissions = sum(1 for s in submissions
-                          if datetime.fromisoformat(s.get('submittedAt', '')).date() == today)
-
-    # 레벨별 분포
-    level_distribution = {}
-    for s in submissions:
-        level = s.get('level', 'Unknown')
-        level_distribution[level] = level_distribution.get(level, 0) + 1
-
-    # 점수 분포
-    score_ranges = {
-        '90-100': 0, '80-89': 0, '70-79': 0,
-        '60-69': 0, '50-59': 0, '0-49': 0
-    }
-    for s in submissions:
-        score = s.get('score', 0)
-        if score >= 90: score_ranges['90-100'] += 1
-        elif score >= 80: score_ranges['80-89'] += 1
-        elif score >= 70: score_ranges['70-79'] += 1
-        elif score >= 60: score_ranges['60-69'] += 1
-        elif score >= 50: score_ranges['50-59'] += 1
-        else: score_ranges['0-49'] += 1
-
-    # 섹션별 평균
-    section_totals = {}
-    section_counts = {}
-    for s in submissions:
-        section_results = s.get('sectionResults', {})
-        for section, data in section_results.items():
-            if section not in section_totals:
-                section_totals[section] = 0
-                section_counts[section] = 0
-            if data.get('total', 0) > 0:
-                percentage = (data.get('correct', 0) / data.get('total', 1)) * 100
-                section_totals[section] += percentage
-                section_counts[section] += 1
-
-    section_averages = {
-        section: section_totals[section] / section_counts[section]
-        for section in section_totals
-    }
-
-    return {
-        'total_students': total_students,
-        'avg_score': round(avg_score),
-        'pass_rate': round(pass_rate),
-        'today_submissions': today_submissions,
-        'level_distribution': level_distribution,
-        'score_distribution': score_ranges,
-        'section_averages': section_averages
-    }
-
 # 메인 함수
 def main():
     st.title("👨‍🏫 교사용 대시보드")
@@ -174,86 +108,95 @@ def main():
     filtered_submissions = submissions.copy()
 
     if level_filter != "전체":
-        filtered_submissions = [s for s in filtered_submissions if s.get('level') == level_filter]
+        filtered_submissions = [s for s in filtered_submissions if s.level == level_filter]
 
     if date_filter != "전체":
         today = datetime.now().date()
         if date_filter == "오늘":
             filtered_submissions = [
                 s for s in filtered_submissions
-                if datetime.fromisoformat(s.get('submittedAt', '')).date() == today
+                if datetime.fromisoformat(s.submitted_at or '').date() == today
             ]
         elif date_filter == "최근 7일":
             week_ago = today - timedelta(days=7)
             filtered_submissions = [
                 s for s in filtered_submissions
-                if datetime.fromisoformat(s.get('submittedAt', '')).date() >= week_ago
+                if datetime.fromisoformat(s.submitted_at or '').date() >= week_ago
             ]
         elif date_filter == "최근 30일":
             month_ago = today - timedelta(days=30)
             filtered_submissions = [
                 s for s in filtered_submissions
-                if datetime.fromisoformat(s.get('submittedAt', '')).date() >= month_ago
+                if datetime.fromisoformat(s.submitted_at or '').date() >= month_ago
             ]
 
+    # 내보내기는 같은 조건으로 DB에서 직접 스트리밍 (목록을 다시 만들지 않음)
+    export_filters = {}
+    if level_filter != "전체":
+        export_filters['level'] = level_filter
+    if date_filter != "전체":
+        days_back = {"오늘": 0, "최근 7일": 7, "최근 30일": 30}[date_filter]
+        export_filters['start_date'] = datetime.combine(datetime.now().date() - timedelta(days=days_back), datetime.min.time())
+
     # 정렬
     if sort_by == "최신순":
-        filtered_submissions.sort(key=lambda x: x.get('submittedAt', ''), reverse=True)
+        filtered_submissions.sort(key=lambda x: x.submitted_at or '', reverse=True)
     elif sort_by == "점수 높은순":
-        filtered_submissions.sort(key=lambda x: x.get('score', 0), reverse=True)
+        filtered_submissions.sort(key=lambda x: x.score, reverse=True)
     elif sort_by == "점수 낮은순":
-        filtered_submissions.sort(key=lambda x: x.get('score', 0))
+        filtered_submissions.sort(key=lambda x: x.score)
     elif sort_by == "이름순":
-        filtered_submissions.sort(key=lambda x: x.get('studentInfo', {}).get('name', ''))
-
-    # 그래프 섹션
-    if submissions:
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # 레벨별 분포
-            if stats['level_distribution']:
-                fig = px.pie(
-                    values=list(stats['level_distribution'].values()),
-                    names=list(stats['level_distribution'].keys()),
-                    title="레벨별 분포"
+        filtered_submissions.sort(key=lambda x: x.student_info.name or '')
+
+    # 그래프 섹션 (Plotly 생성/직렬화 시간 계측)
+    with timer('dashboard.charts'):
+        if submissions:
+            col1, col2 = st.columns(2)
+
+            with col1:
+                # 레벨별 분포
+                if stats['level_distribution']:
+                    fig = px.pie(
+                        values=list(stats['level_distribution'].values()),
+                        names=list(stats['level_distribution'].keys()),
+                        title="레벨별 분포"
+                    )
+                    fig.update_layout(height=400)
+                    st.plotly_chart(fig, use_container_width=True)
+
+            with col2:
+                # 점수 분포
+                if stats['score_distribution']:
+                    fig = px.bar(
+                        x=list(stats['score_distribution'].keys()),
+                        y=list(stats['score_distribution'].values()),
+                        title="점수 분포",
+                        labels={'x': '점수 구간', 'y': '학생 수'}
+                    )
+                    fig.update_layout(height=400)
+                    st.plotly_chart(fig, use_container_width=True)
+
+            # 시간별 추세
+            if len(submissions) > 0:
+                daily_stats = {}
+                for s in submissions:
+                    date = datetime.fromisoformat(s.submitted_at or '').date().strftime('%Y-%m-%d')
+                    if date not in daily_stats:
+                        daily_stats[date] = []
+                    daily_stats[date].append(s.score)
+
+                dates = sorted(daily_stats.keys())
+                avg_scores = [sum(daily_stats[d]) / len(daily_stats[d]) for d in dates]
+
+                fig = px.line(
+                    x=dates,
+                    y=avg_scores,
+                    title="일별 평균 점수 추세",
+                    labels={'x': '날짜', 'y': '평균 점수'}
                 )
                 fig.update_layout(height=400)
                 st.plotly_chart(fig, use_container_width=True)
 
-        with col2:
-            # 점수 분포
-            if stats['score_distribution']:
-                fig = px.bar(
-                    x=list(stats['score_distribution'].keys()),
-                    y=list(stats['score_distribution'].values()),
-                    title="점수 분포",
-                    labels={'x': '점수 구간', 'y': '학생 수'}
-                )
-                fig.update_layout(height=400)
-                st.plotly_chart(fig, use_container_width=True)
-
-        # 시간별 추세
-        if len(submissions) > 0:
-            daily_stats = {}
-            for s in submissions:
-                date = datetime.fromisoformat(s.get('submittedAt', '')).date().strftime('%Y-%m-%d')
-                if date not in daily_stats:
-                    daily_stats[date] = []
-                daily_stats[date].append(s.get('score', 0))
-
-            dates = sorted(daily_stats.keys())
-            avg_scores = [sum(daily_stats[d]) / len(daily_stats[d]) for d in dates]
-
-            fig = px.line(
-                x=dates,
-                y=avg_scores,
-                title="일별 평균 점수 추세",
-                labels={'x': '날짜', 'y': '평균 점수'}
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
-
     # 학생 결과 테이블
     st.subheader(f"📋 학생 결과 목록 (총 {len(filtered_submissions)}명)")
 
@@ -263,9 +206,10 @@ def main():
             analyzer = CEFRAnalyzer()
 
             # 리포트 컨테이너
-            for submission in filtered_submissions:
-                student_info = submission.get('studentInfo', {})
-                student_name = student_info.get('name', 'Unknown')
+            for record in filtered_submissions:
+                # 분석기/리포트는 저장 형식(dict)을 사용
+                submission = record.to_dict()
+                student_name = record.student_name
 
                 with st.expander(f"👤 {student_name} - 상담 리포트"):
                     # 분석 수행
@@ -311,16 +255,16 @@ def main():
         # 테이블 데이터 준비 (개별 리포트 버튼 추가)
         table_data = []
         for s in filtered_submissions:
-            student_info = s.get('studentInfo', {})
-            submitted_date = datetime.fromisoformat(s.get('submittedAt', ''))
+            student_info = s.student_info
+            submitted_date = datetime.fromisoformat(s.submitted_at or '')
 
             table_data.append({
-                '이름': student_info.get('name', 'Unknown'),
-                '학교': student_info.get('school', '-'),
-                '학년/반': f"{student_info.get('grade', '-')}/{student_info.get('class', '-')}",
-                '레벨': s.get('level', '-'),
-                '점수': f"{s.get('score', 0)}점",
-                '결과': '✅ 합격' if s.get('passed', False) else '❌ 불합격',
+                '이름': s.student_name,
+                '학교': student_info.school or '-',
+                '학년/반': f"{student_info.grade or '-'}/{student_info.class_name or '-'}",
+                '레벨': s.level or '-',
+                '점수': f"{s.score}점",
+                '결과': '✅ 합격' if s.passed else '❌ 불합격',
                 '제출일': submitted_date.strftime('%Y-%m-%d %H:%M')
             })
 
@@ -332,15 +276,15 @@ def main():
 
         # 학생 선택
         if filtered_submissions:
-            student_names = list(set(s.get('studentInfo', {}).get('name', 'Unknown') for s in filtered_submissions))
+            student_names = list(set(s.student_name for s in filtered_submissions))
             selected_student = st.selectbox("학생 선택", student_names)
 
             if selected_student and selected_student != 'Unknown':
                 # 선택된 학생의 최근 테스트 결과
-                student_tests = [s for s in filtered_submissions if s.get('studentInfo', {}).get('name') == selected_student]
+                student_tests = [s for s in filtered_submissions if s.student_info.name == selected_student]
                 if student_tests:
                     # 가장 최근 테스트 선택
-                    latest_test = sorted(student_tests, key=lambda x: x.get('submittedAt', ''), reverse=True)[0]
+                    latest_test = max(student_tests, key=lambda x: x.submitted_at or '').to_dict()
 
                     if st.button(f"📊 {selected_student}님 상세 리포트 생성"):
                         analyzer = CEFRAnalyzer()
@@ -358,30 +302,28 @@ def main():
                             mime="text/markdown"
                         )
 
-        # 내보내기 버튼
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            if st.button("📊 CSV로 내보내기"):
-                csv = df.to_csv(index=False, encoding='utf-8-sig')
-                st.download_button(
-                    label="다운로드",
-                    data=csv,
-                    file_name=f"cefr_results_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
-
-        with col2:
-            if st.button("📄 JSON으로 내보내기"):
-                json_data = json.dumps(filtered_submissions, ensure_ascii=False, indent=2)
-                st.download_button(
-                    label="다운로드",
-                    data=json_data,
-                    file_name=f"cefr_results_{datetime.now().strftime('%Y%m%d')}.json",
-                    mime="application/json"
-                )
-
-        with col3:
+        # 내보내기 버튼 (utils/export_stream.py - DB 커서에서 청크 단위로 파일에 기록)
+        col1, col2, col3, col4 = st.columns(4)
+        export_formats = [
+            (col1, "📊 CSV로 내보내기", 'csv', 'text/csv'),
+            (col2, "📄 JSON으로 내보내기", 'ndjson', 'application/x-ndjson'),
+            (col3, "📗 Excel로 내보내기", 'xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+        ]
+        for col, label, fmt, mime in export_formats:
+            with col:
+                if st.button(label):
+                    from utils.db_manager import DatabaseManager
+                    from utils.export_stream import export_from_db, export_to_bytes
+                    db = DatabaseManager()
+                    data = export_to_bytes(lambda path: export_from_db(db, path, fmt, **export_filters), f'.{fmt}')
+                    st.download_button(
+                        label="다운로드",
+                        data=data,
+                        file_name=f"cefr_results_{datetime.now().strftime('%Y%m%d')}.{fmt}",
+                        mime=mime
+                    )
+
+        with col4:
             if st.button("🔄 새로고침"):
                 st.rerun()
 
@@ -398,4 +340,5 @@ def main():
         st.dataframe(section_df, use_container_width=True, hide_index=True)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with timer('page.teacher_dashboard'):
+        main()
@@ -1,17 +1,23 @@
 import streamlit as st
 import streamlit.components.v1 as components
-import pandas as pd
 import json
 import os
 from datetime import datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from utils.counseling_report_generator import (
     generate_student_counseling_report,
     generate_printable_report_html,
     save_report_as_html
 )
+from utils.assets import inject_css
+from utils.auth_manager import normalize_session_state
+from utils.lazy_imports import lazy_import
+from utils.metrics import timer
+
+# 차트/표 라이브러리는 실제로 그릴 때 import (콜드 스타트 단축)
+pd = lazy_import('pandas')
+px = lazy_import('plotly.express')
+go = lazy_import('plotly.graph_objects')
+plotly_subplots = lazy_import('plotly.subplots')
 
 # 페이지 설정
 st.set_page_config(
@@ -20,9 +26,11 @@ st.set_page_config(
     layout="wide"
 )
 
-# 커스텀 CSS
-with open('assets/styles.css', 'r') as f:
-    st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+# 커스텀 CSS (프로세스 단위 캐시)
+inject_css()
+
+# 재접속 시 URL의 세션 토큰으로 로그인 상태 복원
+normalize_session_state()
 
 # 로그인 확인
 if not st.session_state.get('logged_in', False) or st.session_state.get('user_role') != 'teacher':
@@ -34,15 +42,15 @@ def load_submissions():
     from utils.db_manager import DatabaseManager
     try:
         db = DatabaseManager()
-        return db.load_submissions()
+        return db.load_submission_records()
     except Exception as e:
         st.error(f"데이터베이스 로드 오류: {e}")
         return []
 
 # 학생별 진행 추적 함수
 def track_student_progress(submissions, student_name):
-    student_submissions = [s for s in submissions if s.get('studentInfo', {}).get('name') == student_name]
-    student_submissions.sort(key=lambda x: x.get('submittedAt', ''))
+    student_submissions = [s for s in submissions if s.student_info.name == student_name]
+    student_submissions.sort(key=lambda x: x.submitted_at or '')
 
     if not student_submissions:
         return None
@@ -53,19 +61,19 @@ def track_student_progress(submissions, student_name):
         'test_history': [],
         'average_score': 0,
         'best_score': 0,
-        'current_level': student_submissions[-1].get('level', 'Unknown'),
+        'current_level': student_submissions[-1].level or 'Unknown',
         'improvement_trend': 'stable'
     }
 
     scores = []
     for s in student_submissions:
         progress['test_history'].append({
-            'date': s.get('submittedAt', ''),
-            'level': s.get('level', 'Unknown'),
-            'score': s.get('score', 0),
-            'passed': s.get('passed', False)
+            'date': s.submitted_at or '',
+            'level': s.level or 'Unknown',
+            'score': s.score,
+            'passed': s.passed
         })
-        scores.append(s.get('score', 0))
+        scores.append(s.score)
 
     if scores:
         progress['average_score'] = round(sum(scores) / len(scores))
@@ -95,19 +103,19 @@ def generate_detailed_report(submissions):
 
     # 기본 통계
     total_students = len(submissions)
-    avg_score = round(sum(s.get('score', 0) for s in submissions) / total_students)
-    passed_count = sum(1 for s in submissions if s.get('passed', False))
+    avg_score = round(sum(s.score for s in submissions) / total_students)
+    passed_count = sum(1 for s in submissions if s.passed)
     pass_rate = round((passed_count / total_students) * 100)
 
     # 레벨별 분석
     level_stats = {}
     for s in submissions:
-        level = s.get('level', 'Unknown')
+        level = s.level or 'Unknown'
         if level not in level_stats:
             level_stats[level] = {'count': 0, 'total_score': 0, 'passed': 0}
         level_stats[level]['count'] += 1
-        level_stats[level]['total_score'] += s.get('score', 0)
-        if s.get('passed', False):
+        level_stats[level]['total_score'] += s.score
+        if s.passed:
             level_stats[level]['passed'] += 1
 
     # HTML 리포트 생성
@@ -299,14 +307,14 @@ def main():
         # 필터링
         filtered_submissions = [
             s for s in submissions
-            if start_date <= datetime.fromisoformat(s.get('submittedAt', '')).date() <= end_date
+            if start_date <= datetime.fromisoformat(s.submitted_at or '').date() <= end_date
         ]
 
         if filtered_submissions:
             # 통계 계산
             total = len(filtered_submissions)
-            avg_score = round(sum(s.get('score', 0) for s in filtered_submissions) / total)
-            pass_count = sum(1 for s in filtered_submissions if s.get('passed', False))
+            avg_score = round(sum(s.score for s in filtered_submissions) / total)
+            pass_count = sum(1 for s in filtered_submissions if s.passed)
             pass_rate = round((pass_count / total) * 100)
 
             # 통계 카드
@@ -334,7 +342,7 @@ def main():
         st.subheader("학생별 진행 현황")
 
         # 학생 목록
-        students = list(set(s.get('studentInfo', {}).get('name', 'Unknown') for s in submissions))
+        students = list(set(s.student_name for s in submissions))
         selected_student = st.selectbox("학생 선택:", students)
 
         if selected_student and selected_student != 'Unknown':
@@ -388,12 +396,12 @@ def main():
         # 레벨별 통계
         level_stats = {}
         for s in submissions:
-            level = s.get('level', 'Unknown')
+            level = s.level or 'Unknown'
             if level not in level_stats:
                 level_stats[level] = {'scores': [], 'passed': 0, 'total': 0}
-            level_stats[level]['scores'].append(s.get('score', 0))
+            level_stats[level]['scores'].append(s.score)
             level_stats[level]['total'] += 1
-            if s.get('passed', False):
+            if s.passed:
                 level_stats[level]['passed'] += 1
 
         # 레벨별 점수 분포 박스플롯
@@ -439,11 +447,11 @@ def main():
         # 요일별 분석
         weekday_data = {}
         for s in submissions:
-            date = datetime.fromisoformat(s.get('submittedAt', ''))
+            date = datetime.fromisoformat(s.submitted_at or '')
             weekday = date.strftime('%A')
             if weekday not in weekday_data:
                 weekday_data[weekday] = []
-            weekday_data[weekday].append(s.get('score', 0))
+            weekday_data[weekday].append(s.score)
 
         weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         weekday_names_ko = ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일']
@@ -471,17 +479,17 @@ def main():
         # 시간대별 분석
         hourly_data = {}
         for s in submissions:
-            hour = datetime.fromisoformat(s.get('submittedAt', '')).hour
+            hour = datetime.fromisoformat(s.submitted_at or '').hour
             if hour not in hourly_data:
                 hourly_data[hour] = []
-            hourly_data[hour].append(s.get('score', 0))
+            hourly_data[hour].append(s.score)
 
         if hourly_data:
             hours = sorted(hourly_data.keys())
             avg_scores = [round(sum(hourly_data[h]) / len(hourly_data[h])) for h in hours]
             counts = [len(hourly_data[h]) for h in hours]
 
-            fig = make_subplots(
+            fig = plotly_subplots.make_subplots(
                 specs=[[{"secondary_y": True}]],
                 subplot_titles=["시간대별 응시자 수 및 평균 점수"]
             )
@@ -507,7 +515,7 @@ def main():
         st.info("📄 A4 형식의 프린트 가능한 상담 리포트를 생성합니다.")
         
         # 학생 선택
-        students = list(set(s.get('studentInfo', {}).get('name', 'Unknown') for s in submissions))
+        students = list(set(s.student_name for s in submissions))
         students = [s for s in students if s != 'Unknown']
         
         if not students:
@@ -524,19 +532,19 @@ def main():
             # 해당 학생의 최근 테스트 데이터 가져오기
             student_submissions = [
                 s for s in submissions
-                if s.get('studentInfo', {}).get('name') == selected_student
+                if s.student_info.name == selected_student
             ]
-            student_submissions.sort(key=lambda x: x.get('submittedAt', ''), reverse=True)
+            student_submissions.sort(key=lambda x: x.submitted_at or '', reverse=True)
             
             if student_submissions:
                 # 테스트 선택
                 st.subheader("테스트 기록 선택")
                 test_options = []
                 for i, sub in enumerate(student_submissions[:test_count]):
-                    date = datetime.fromisoformat(sub.get('submittedAt', '')).strftime('%Y-%m-%d %H:%M')
-                    level = sub.get('level', 'Unknown')
-                    score = sub.get('score', 0)
-                    status = "합격" if sub.get('passed', False) else "불합격"
+                    date = datetime.fromisoformat(sub.submitted_at or '').strftime('%Y-%m-%d %H:%M')
+                    level = sub.level or 'Unknown'
+                    score = sub.score
+                    status = "합격" if sub.passed else "불합격"
                     test_options.append(f"{date} | {level} | {score}점 | {status}")
                 
                 selected_test_idx = st.selectbox(
@@ -545,7 +553,8 @@ def main():
                     format_func=lambda x: test_options[x]
                 )
                 
-                selected_submission = student_submissions[selected_test_idx]
+                # 리포트 생성기는 저장 형식(dict)을 사용
+                selected_submission = student_submissions[selected_test_idx].to_dict()
                 
                 # 상세 정보 표시
                 st.markdown("---")
@@ -682,4 +691,5 @@ def main():
                         st.error(traceback.format_exc())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with timer('page.reports'):
+        main()
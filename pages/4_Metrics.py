@@ -0,0 +1,84 @@
+import streamlit as st
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.assets import inject_css
+from utils.auth_manager import normalize_session_state
+from utils import metrics
+
+# 페이지 설정
+st.set_page_config(
+    page_title="Metrics",
+    page_icon="⏱",
+    layout="wide"
+)
+
+# 커스텀 CSS (프로세스 단위 캐시)
+inject_css()
+
+# 재접속 시 URL의 세션 토큰으로 로그인 상태 복원
+normalize_session_state()
+
+# 로그인 확인 (관리자 전용 - secrets의 users에 role = "admin"인 계정)
+if not st.session_state.get('logged_in', False) or st.session_state.get('user_role') != 'admin':
+    st.error("관리자 계정으로 로그인해주세요.")
+    st.switch_page("app.py")
+
+DEFAULT_DUMP_PATH = os.getenv('CEFR_METRICS_FILE', 'data/metrics.prom')
+
+# 메인 함수
+def main():
+    st.title("⏱ 성능 계측")
+    st.caption("이 서버 프로세스에서 수집된 핵심 경로 실행 시간입니다 (프로세스 재시작 시 초기화).")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if metrics.is_enabled():
+            st.success("계측 켜짐")
+            if st.button("계측 끄기"):
+                metrics.disable()
+                st.rerun()
+        else:
+            st.warning("계측 꺼짐 (CEFR_METRICS=1로 시작하거나 여기서 켜세요)")
+            if st.button("계측 켜기", type="primary"):
+                metrics.enable()
+                st.rerun()
+    with col2:
+        if st.button("측정값 초기화"):
+            metrics.reset()
+            st.rerun()
+    with col3:
+        if st.button("Prometheus 파일로 저장"):
+            path = metrics.dump_prometheus(DEFAULT_DUMP_PATH)
+            st.success(f"저장됨: {path}")
+
+    rows = metrics.snapshot()
+    if not rows:
+        st.info("아직 수집된 측정값이 없습니다.")
+        return
+
+    st.subheader("📊 항목별 실행 시간 (ms)")
+    table = [{
+        '항목': row['name'],
+        '호출 수': row['count'],
+        '합계': round(row['total'] * 1000, 1),
+        '평균': round(row['mean'] * 1000, 2),
+        'p50': round(row['p50'] * 1000, 2),
+        'p95': round(row['p95'] * 1000, 2),
+        'p99': round(row['p99'] * 1000, 2),
+        '최대': round(row['max'] * 1000, 2),
+    } for row in sorted(rows, key=lambda r: r['total'], reverse=True)]
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+    prometheus_text = metrics.render_prometheus()
+    with st.expander("Prometheus 텍스트"):
+        st.code(prometheus_text, language='text')
+    st.download_button(
+        label="📥 metrics.prom 다운로드",
+        data=prometheus_text,
+        file_name="metrics.prom",
+        mime="text/plain"
+    )
+
+if __name__ == "__main__":
+    main()
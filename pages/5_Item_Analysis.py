@@ -0,0 +1,121 @@
+import streamlit as st
+import os
+import sys
+import threading
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.assets import inject_css
+from utils.auth_manager import normalize_session_state
+from utils.item_analysis import ItemAnalysisStore
+from utils.lazy_imports import lazy_import
+
+# 차트는 실제로 그릴 때 import (콜드 스타트 단축)
+pd = lazy_import('pandas')
+px = lazy_import('plotly.express')
+
+# 페이지 설정
+st.set_page_config(
+    page_title="Item Analysis",
+    page_icon="🔬",
+    layout="wide"
+)
+
+# 커스텀 CSS (프로세스 단위 캐시)
+inject_css()
+
+# 재접속 시 URL의 세션 토큰으로 로그인 상태 복원
+normalize_session_state()
+
+# 로그인 확인
+if not st.session_state.get('logged_in', False) or st.session_state.get('user_role') != 'teacher':
+    st.error("교사 계정으로 로그인해주세요.")
+    st.switch_page("app.py")
+
+FLAG_LABELS = {
+    'too_easy': '너무 쉬움',
+    'too_hard': '너무 어려움',
+    'low_discrimination': '변별도 낮음',
+    'negative_discrimination': '변별도 음수',
+    'possible_miskey': '정답 오류 의심',
+}
+OPTION_LABELS = ['①', '②', '③', '④']
+
+
+@st.cache_resource
+def get_store():
+    """프로세스당 하나 (새 제출만 증분 반영)"""
+    return ItemAnalysisStore(), threading.Lock()
+
+
+def refresh_store():
+    from utils.db_manager import DatabaseManager
+    store, lock = get_store()
+    with lock:
+        store.update_from_db(DatabaseManager())
+    return store
+
+
+def fmt(value):
+    return '-' if value is None else round(value, 2)
+
+
+# 메인 함수
+def main():
+    st.title("🔬 문항 분석")
+    st.caption("저장된 응답으로 계산한 문항별 정답률·변별도·선택지 분포입니다 (새 제출만 증분 반영).")
+
+    try:
+        store = refresh_store()
+    except Exception as e:
+        st.error(f"문항 분석 실패: {e}")
+        return
+
+    levels = [level for level, analysis in store.levels.items() if analysis.n_students]
+    if not levels:
+        st.info("아직 분석할 응답이 없습니다.")
+        return
+
+    level = st.selectbox("레벨", levels)
+    analysis = store.levels[level]
+    summary = analysis.summary()
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("응답 수", summary['students'])
+    with col2:
+        st.metric("문항 수", summary['items'])
+    with col3:
+        st.metric("Cronbach's α", fmt(summary['alpha']))
+    with col4:
+        st.metric("제외 (이전 형식)", summary['skipped'])
+
+    items = analysis.item_statistics()
+    only_flagged = st.checkbox("검토가 필요한 문항만 보기", value=True)
+    table = [{
+        '문항': item['id'],
+        '응답 수': item['n'],
+        '정답': OPTION_LABELS[item['key']],
+        '정답률': fmt(item['p_value']),
+        '변별도': fmt(item['point_biserial']),
+        **{label: round(share, 2) for label, share in zip(OPTION_LABELS, item['option_share'])},
+        '미응답': round(item['omit_share'], 2),
+        '판정': ', '.join(FLAG_LABELS[flag] for flag in item['flags']),
+    } for item in items if item['flags'] or not only_flagged]
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+    st.subheader("📊 선택지 분석")
+    answered = [item for item in items if item['n']]
+    if not answered:
+        return
+    item_id = st.selectbox("문항", [item['id'] for item in answered])
+    item = next(item for item in answered if item['id'] == item_id)
+    chart = pd.DataFrame([{
+        '선택지': label + (' (정답)' if option == item['key'] else ''),
+        '선택 비율': share,
+        '선택 학생 평균 나머지 점수': mean,
+    } for option, (label, share, mean) in enumerate(zip(OPTION_LABELS, item['option_share'],
+                                                         item['option_mean_score']))])
+    fig = px.bar(chart, x='선택지', y='선택 비율', hover_data=['선택 학생 평균 나머지 점수'])
+    st.plotly_chart(fig, use_container_width=True)
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,17 @@
-import json
 from collections import Counter
 
+from utils.bank_validation import load_bank, save_bank_and_report
+from utils.passages import bank_levels
+
 def shuffle_options_to_balance():
     """
     옵션을 섞어서 정답 분포를 균형 있게 만듭니다.
     실제 정답의 내용도 함께 변경됩니다.
     """
     
-    with open('extracted_questions.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_bank()
     
-    for level, questions in data.items():
+    for level, questions in bank_levels(data):
         if level not in ['A2', 'B1']:
             continue  # 쏠림 현상이 있는 레벨만 처리
         
@@ -133,8 +134,7 @@ def shuffle_options_to_balance():
             print(f"   Position {pos} ({['A', 'B', 'C', 'D'][pos]}): {count} ({percentage:.1f}%)")
     
     # 수정된 데이터 저장
-    with open('extracted_questions.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_bank_and_report(data)  # 검증 보고서도 함께 갱신
     
     print("\n\n✅ Balanced questions saved to extracted_questions.json")
 
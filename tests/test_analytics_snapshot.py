@@ -0,0 +1,61 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.db_manager import DatabaseManager
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+def make_submission(name, level, month):
+    return {
+        'studentInfo': {'name': name, 'grade': 3},
+        'level': level, 'score': 80, 'passed': True, 'correct': 2, 'total': 3,
+        'submittedAt': f'2025-{month:02d}-10T09:00:00',
+        'sectionResults': {'Reading': {'correct': 2, 'total': 3}},
+        'answers': [0, 1, -1],
+    }
+
+@unittest.skipUnless(pyarrow, 'pyarrow is not installed')
+class TestAnalyticsSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.tmpdir, 'test.db'))
+        self.out = os.path.join(self.tmpdir, 'snap')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_incremental_partitioned_snapshot(self):
+        from utils.analytics_snapshot import open_snapshot
+
+        self.db.save_submission(make_submission('kim', 'A1', 3))
+        self.db.save_submission(make_submission('lee', 'B1', 4))
+        first = self.db.export_snapshot(self.out)
+        self.assertEqual((first['seq'], first['rows']), (1, 2))
+        self.assertTrue(os.path.isdir(os.path.join(self.out, 'submissions', 'level=A1', 'month=2025-03')))
+
+        self.assertEqual(self.db.export_snapshot(self.out)['rows'], 0)
+        self.db.save_submission(make_submission('park', 'A1', 3))
+        second = self.db.export_snapshot(self.out)
+        self.assertEqual((second['seq'], second['from_id'], second['rows']), (2, 2, 1))
+
+        submissions = open_snapshot(self.out).to_table().to_pydict()
+        self.assertEqual(sorted(submissions['student_name']), ['kim', 'lee', 'park'])
+        self.assertEqual(sorted(submissions['grade']), ['3', '3', '3'])
+        self.assertEqual(open_snapshot(self.out, 'answers').count_rows(), 9)
+        self.assertEqual(open_snapshot(self.out, 'section_results').to_table()['percentage'][0].as_py(),
+                         2 / 3 * 100)
+
+        self.assertEqual(self.db.export_snapshot(self.out, full=True)['rows'], 3)
+        self.assertEqual(open_snapshot(self.out).count_rows(), 3)
+
+if __name__ == '__main__':
+    unittest.main()
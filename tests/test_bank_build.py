@@ -0,0 +1,106 @@
+import sys
+import os
+import json
+import tempfile
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.bank_build import assign_stable_ids, build_bank, changes_since
+
+def paper(questions):
+    parts = ['<html><body>\n<section class="test-section">\n<div class="section-header">\n<h2>Part 1: Grammar</h2>\n</div>\n']
+    for number, (text, options) in enumerate(questions, 1):
+        inputs = ''.join(f'<label><input type="radio" name="Q{number}" value="{letter}"><span>{letter}) {option}</span></label>\n'
+                         for letter, option in zip('ABCD', options))
+        parts.append(f'<div class="question">\n<span class="question-number">{number}</span>\n'
+                     f'<span class="question-text">{text}</span>\n<div class="options">\n{inputs}</div>\n</div>\n')
+    parts.append('</section>\n</body></html>\n')
+    return ''.join(parts)
+
+A1 = [('She ___ happy.', ['is', 'are', 'am', 'be']), ('They ___ here.', ['is', 'are', 'am', 'be'])]
+A2 = [('I ___ yesterday.', ['go', 'went', 'gone', 'going'])]
+ANSWER_KEY = """const answerData = {
+  'A1': { title: 'A1', answers: { 'Q1': 'A', 'Q2': 'B' } },
+  'A2': { title: 'A2', answers: { 'Q1': 'B' } }
+};
+"""
+
+class TestStableIds(unittest.TestCase):
+    def test_reorder_insert_and_change(self):
+        previous = [{'id': 1, 'question': 'Q one', 'options': ['a', 'b', 'c', 'd'], 'correct': 0},
+                    {'id': 2, 'question': 'Q two', 'options': ['e', 'f', 'g', 'h'], 'correct': 0},
+                    {'id': 3, 'question': 'Q three', 'options': ['i', 'j', 'k', 'l'], 'correct': 0}]
+        extracted = [{'id': 1, 'question': 'Q new', 'options': ['w', 'x', 'y', 'z'], 'correct': 0},
+                     {'id': 2, 'question': 'Q three', 'options': ['i', 'j', 'k', 'l'], 'correct': 0},
+                     {'id': 3, 'question': 'Q one', 'options': ['a', 'b', 'c', 'd'], 'correct': 2},
+                     {'id': 4, 'question': 'Q two!', 'options': ['e', 'f', 'g', 'h'], 'correct': 0}]
+        questions, changes = assign_stable_ids(previous, extracted)
+        self.assertEqual([q['id'] for q in questions], [4, 3, 1, 2])
+        self.assertEqual(changes, {'added': [4], 'removed': [], 'changed': [1, 2], 'unchanged': 1})
+
+        questions, changes = assign_stable_ids(previous, extracted[1:3])
+        self.assertEqual(changes['removed'], [2])
+
+class TestBuildBank(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = self.tmp.name
+        self.write('CEFR_A1_English_Level_Test_Student.html', paper(A1))
+        self.write('CEFR_A2_English_Level_Test_Student.html', paper(A2))
+        self.write('answer-data.js', ANSWER_KEY)
+        self.paths = {name: os.path.join(root, f'{name}.json') for name in ('bank', 'report', 'manifest', 'changelog')}
+
+    def write(self, name, content):
+        with open(os.path.join(self.tmp.name, name), 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def build(self, **kwargs):
+        paths = self.paths
+        return build_bank(self.tmp.name, paths['bank'], os.path.join(self.tmp.name, 'answer-data.js'),
+                          report_path=paths['report'], manifest_path=paths['manifest'],
+                          changelog_path=paths['changelog'], workers=1, **kwargs)
+
+    def test_only_changed_levels_rebuild(self):
+        first = self.build()
+        self.assertEqual((first['build'], sorted(first['levels'])), (1, ['A1', 'A2']))
+        self.assertEqual(first['validation']['errors'], 0)
+        with open(self.paths['report'], encoding='utf-8') as f:
+            a2_report = json.load(f)['levels']['A2']
+
+        second = self.build()
+        self.assertEqual((second['build'], second['levels'], second['extraction']), (1, {}, None))
+
+        # A1 시험지만 수정: 문항 하나 앞에 추가 -> 기존 문항 id는 유지
+        self.write('CEFR_A1_English_Level_Test_Student.html', paper([('New one?', ['w', 'x', 'y', 'z'])] + A1))
+        self.write('answer-data.js', ANSWER_KEY.replace("'Q1': 'A', 'Q2': 'B'", "'Q1': 'A', 'Q2': 'A', 'Q3': 'B'"))
+        third = self.build()
+        self.assertEqual(third['build'], 2)
+        self.assertEqual(list(third['levels']), ['A1'])
+        self.assertEqual(third['levels']['A1']['added'], [3])
+        self.assertEqual(third['extraction']['papers'][0]['level'], 'A1')
+        with open(self.paths['bank'], encoding='utf-8') as f:
+            bank = json.load(f)
+        self.assertEqual([q['id'] for q in bank['A1']], [3, 1, 2])
+        with open(self.paths['report'], encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['levels']['A2'], a2_report)
+
+        self.assertEqual(changes_since(1, self.paths['changelog']), (2, {'A1': {3}}))
+        self.assertEqual(changes_since(2, self.paths['changelog']), (2, {}))
+        self.assertEqual(changes_since(0, self.paths['changelog'])[1]['A2'], {1})
+
+        # 정답만 바뀌어도 그 레벨은 다시 추출, 문항은 'changed'
+        self.write('answer-data.js', ANSWER_KEY.replace("'Q1': 'A', 'Q2': 'B'", "'Q1': 'A', 'Q2': 'A', 'Q3': 'B'")
+                   .replace("'Q1': 'B' }", "'Q1': 'C' }"))
+        fourth = self.build()
+        self.assertEqual(list(fourth['levels']), ['A2'])
+        self.assertEqual(fourth['levels']['A2']['changed'], [1])
+
+        forced = self.build(force=True, levels=['a2'])
+        self.assertEqual(list(forced['levels']), ['A2'])
+        self.assertEqual(forced['levels']['A2']['unchanged'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
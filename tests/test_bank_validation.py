@@ -0,0 +1,113 @@
+import sys
+import os
+import json
+import tempfile
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.bank_validation import build_report, get_bank_report, load_bank, save_bank_and_report, validate_level
+
+def make_question(qid, correct=0, **overrides):
+    question = {'id': qid, 'question': f'Question {qid}?', 'options': ['A) one', 'B) two', 'C) three', 'D) four'],
+                'correct': correct, 'section': 'Grammar'}
+    question.update(overrides)
+    return question
+
+def rules_for(report, index):
+    return {issue['rule'] for issue in report['issues'] if issue['index'] == index}
+
+class TestValidateLevel(unittest.TestCase):
+    def test_errors_exclude_questions(self):
+        questions = [
+            make_question(1),
+            make_question(2, options=['A) one', 'B) two', 'C) three']),
+            make_question(3, options=['A) one', '', 'C) three', 'D) four']),
+            make_question(4, correct=4),
+            make_question(5, section='Reading'),
+            make_question(1, question='Another question?'),
+            'not a question',
+        ]
+        report = validate_level(questions)
+        self.assertEqual(report['valid'], [0])
+        self.assertEqual(rules_for(report, 1), {'four_options'})
+        self.assertEqual(rules_for(report, 2), {'four_options'})
+        self.assertEqual(rules_for(report, 3), {'valid_correct'})
+        self.assertEqual(rules_for(report, 4), {'reading_passage'})
+        self.assertEqual(rules_for(report, 5), {'unique_id'})
+        self.assertEqual(rules_for(report, 6), {'structure'})
+
+    def test_warnings_keep_questions(self):
+        questions = [
+            make_question(1, options=['A) read books', 'B) Read  books', 'C) three', 'D) four']),
+            make_question(2, correct=1),
+            make_question(3, correct=2, options=['A) four', 'B) three', 'C) two', 'D) one']),
+            make_question(4, correct=3),
+        ]
+        report = validate_level(questions)
+        self.assertEqual(report['valid'], [0, 1, 2, 3])
+        self.assertEqual(rules_for(report, 0), {'duplicate_options'})
+        # 선택지 순서만 다른 같은 문항
+        self.assertEqual(rules_for(report, 2), set())
+        questions[2]['question'] = 'Question 2?'
+        self.assertEqual(rules_for(validate_level(questions), 2), {'duplicate_question'})
+
+    def test_answer_balance(self):
+        balanced = [make_question(i, correct=i % 4) for i in range(8)]
+        self.assertFalse(validate_level(balanced)['issues'])
+        skewed = [make_question(i, correct=0) for i in range(8)]
+        issues = validate_level(skewed)['issues']
+        self.assertEqual([(issue['rule'], issue['index']) for issue in issues], [('answer_balance', None)])
+
+class TestBankReport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.bank_path = os.path.join(self.tmp.name, 'bank.json')
+        self.report_path = os.path.join(self.tmp.name, 'report.json')
+        self.write_bank({'A1': [make_question(i, correct=i % 4) for i in range(4)]})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_bank(self, data):
+        with open(self.bank_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_saved_report_is_used(self):
+        report = build_report(self.bank_path, self.report_path)
+        self.assertEqual(report['summary'], {'questions': 4, 'valid': 4, 'errors': 0, 'warnings': 0})
+        loaded = get_bank_report(self.bank_path, self.report_path)
+        self.assertEqual(loaded['generatedAt'], report['generatedAt'])
+        self.assertEqual(loaded['bankHash'], report['bankHash'])
+
+    def test_stale_report_falls_back_to_validation(self):
+        build_report(self.bank_path, self.report_path)
+        self.write_bank({'A1': [make_question(1), make_question(2, correct=9)]})
+        os.utime(self.bank_path, (1, 1))
+        report = get_bank_report(self.bank_path, self.report_path)
+        self.assertEqual(report['levels']['A1']['valid'], [0])
+        self.assertEqual(report['summary']['errors'], 1)
+
+    def test_save_helper_and_passage_table_changes(self):
+        text = 'Hi Tom,\n\nI am at the library.'
+        data = {'A1': [make_question(i, correct=i % 4, section='Reading', passage=text) for i in range(4)]}
+        report = save_bank_and_report(data, self.bank_path, self.report_path, quiet=True)
+        self.assertEqual(report['summary']['errors'], 0)
+        saved = load_bank(self.bank_path)
+        self.assertEqual(list(saved['passages'].values()), [text])  # 지문은 테이블로
+        self.assertEqual(get_bank_report(self.bank_path, self.report_path)['bankHash'], report['bankHash'])
+
+        # 문항은 그대로 두고 지문 테이블만 비움: 이전 결과를 재사용하지 않고 다시 검사
+        saved['passages'] = {}
+        with open(self.bank_path, 'w', encoding='utf-8') as f:
+            json.dump(saved, f)
+        report = build_report(self.bank_path, self.report_path)
+        self.assertEqual(report['levels']['A1']['valid'], [])
+        self.assertEqual(report['summary']['errors'], 4)
+
+    def test_missing_bank(self):
+        self.assertIsNone(get_bank_report(os.path.join(self.tmp.name, 'missing.json'), self.report_path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import sys
+import os
+import unittest
+
+import numpy as np
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cat import AdaptiveTest, ItemPool
+from utils.irt import ItemParameters
+
+def make_pool(n_items=60):
+    b = np.linspace(-3, 3, n_items)
+    questions = [{'id': i + 1, 'level': 'A1', 'correct': 0} for i in range(n_items)]
+    return ItemPool(questions, np.full(n_items, 1.5), b), b
+
+class TestAdaptiveTest(unittest.TestCase):
+    def test_first_item_is_most_informative_at_start_level(self):
+        pool, b = make_pool()
+        test = AdaptiveTest(pool, 'B1', randomesque=1)  # B1 기준점 theta = 1
+        question = test.next_item()
+        self.assertAlmostEqual(b[question['id'] - 1], 1.0, delta=0.1)
+        self.assertIs(test.next_item(), question)  # 답하기 전에는 같은 문항
+
+    def test_stops_at_target_se_without_repeats(self):
+        pool, b = make_pool()
+        test = AdaptiveTest(pool, 'A2', target_se=0.45, min_items=5, max_items=40, seed=0)
+        rng = np.random.default_rng(0)
+        while (question := test.next_item()) is not None:
+            p = 1 / (1 + np.exp(-1.5 * (0.5 - b[question['id'] - 1])))
+            test.answer(rng.random() < p)
+
+        ids = [step['id'] for step in test.path]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertLess(len(ids), 40)
+        result = test.result()
+        self.assertEqual(result['stop'], 'target_se')
+        self.assertLessEqual(result['se'], 0.45)
+        self.assertEqual(result['items'], len(ids))
+        self.assertEqual(test.path[-1]['theta'], result['theta'])
+
+    def test_max_items_and_direction(self):
+        pool, _ = make_pool()
+        test = AdaptiveTest(pool, 'A2', target_se=0.01, max_items=6)
+        while test.next_item() is not None:
+            test.answer(True, response=0)
+        self.assertEqual(test.result()['stop'], 'max_items')
+        self.assertGreater(test.theta, 0.5)  # 모두 맞히면 추정치가 올라감
+        self.assertEqual(test.path[0]['response'], 0)
+        with self.assertRaises(ValueError):
+            test.answer(True)
+
+    def test_pool_skips_uncalibrated_and_rekeyed_items(self):
+        result = {'a': np.ones(3), 'b': np.zeros(3), 'n': np.array([100, 100, 5]), 'iterations': 1,
+                  'converged': True}
+        params = ItemParameters()
+        params.set_level('A1', [1, 2, 3], [0, 1, 2], result, 100, -1.0)
+        bank = [{'id': 1, 'correct': 0}, {'id': 2, 'correct': 3}, {'id': 3, 'correct': 2}, {'id': 4, 'correct': 0}]
+        pool = ItemPool.from_parameters(params, {'A1': bank, 'B2': bank})
+        self.assertEqual([(q['level'], q['id']) for q in pool.questions], [('A1', 1)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import sys
+import os
+import csv
+import json
+import shutil
+import tempfile
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.db_manager import DatabaseManager
+from utils.export_stream import export_from_db
+
+class TestExportStream(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.tmpdir, 'test.db'))
+        for i, level in enumerate(['A1', 'B1', 'A1']):
+            self.db.save_submission({
+                'studentInfo': {'name': f'student{i}', 'school': 'Seoul'},
+                'level': level, 'score': 60 + i * 10, 'passed': i > 0, 'correct': 3, 'total': 5,
+                'submittedAt': f'2025-03-0{i + 1}T10:00:00',
+                'sectionResults': {'Reading': {'correct': 3, 'total': 5}},
+            })
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_csv_and_ndjson(self):
+        path = os.path.join(self.tmpdir, 'out.csv')
+        self.assertEqual(export_from_db(self.db, path, 'csv', chunk_rows=2, level='A1'), 2)
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0][-1], 'Reading_점수')
+        self.assertEqual([r[0] for r in rows[1:]], ['student2', 'student0'])
+
+        path = os.path.join(self.tmpdir, 'out.ndjson')
+        self.assertEqual(export_from_db(self.db, path, 'ndjson'), 3)
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(json.loads(f.readline())['studentInfo']['name'], 'student2')
+
+    def test_xlsx_sheets_per_level(self):
+        import openpyxl
+
+        path = os.path.join(self.tmpdir, 'out.xlsx')
+        self.assertEqual(export_from_db(self.db, path, 'xlsx'), 3)
+        workbook = openpyxl.load_workbook(path, read_only=True)
+        self.assertEqual(workbook.sheetnames, ['전체 결과', 'A1 레벨', 'B1 레벨', '통계 요약'])
+        self.assertEqual(len(list(workbook['A1 레벨'].iter_rows())), 3)
+        stats = list(workbook['통계 요약'].iter_rows(values_only=True))
+        self.assertEqual(stats[1], ('전체', 3, 70, '67%', 2, 1))
+        workbook.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cefr_analyzer import CEFRAnalyzer
+from utils.irt import ItemParameters, calibrate, cefr_from_theta, estimate_abilities, get_item_parameters
+
+def simulate(n_students=4000, n_items=30, seed=0):
+    rng = np.random.default_rng(seed)
+    a = rng.lognormal(0, 0.3, n_items)
+    b = rng.normal(0, 1, n_items)
+    theta = rng.normal(0, 1, n_students)
+    X = rng.random((n_students, n_items)) < 1 / (1 + np.exp(-a * (theta[:, None] - b)))
+    return theta, a, b, X
+
+class TestIRT(unittest.TestCase):
+    def test_recovers_2pl_parameters(self):
+        theta, a, b, X = simulate()
+        result = calibrate(X, np.ones_like(X))
+        self.assertTrue(result['converged'])
+        self.assertLess(np.abs(result['b'] - b).mean(), 0.1)
+        self.assertLess(np.abs(result['a'] - a).mean(), 0.1)
+
+        estimates, se = estimate_abilities(X, np.ones_like(X), result['a'], result['b'])
+        self.assertGreater(np.corrcoef(estimates, theta)[0, 1], 0.9)
+        self.assertTrue((se > 0).all())
+
+    def test_missing_items_are_ignored(self):
+        _, _, b, X = simulate()
+        M = np.ones_like(X)
+        M[:2000, :10] = False  # 앞쪽 학생은 1~10번을 보지 않음
+        result = calibrate(X & M, M, model='1pl')
+        self.assertEqual(result['n'][0], 2000)
+        self.assertGreater(np.corrcoef(result['b'], b)[0, 1], 0.95)
+
+    def test_single_estimate_matches_batch(self):
+        _, _, _, X = simulate()
+        result = calibrate(X, np.ones_like(X))
+        params = ItemParameters()
+        params.set_level('a1', range(1, 31), [0] * 30, result, len(X), 0.0)
+        theta, se = estimate_abilities(X[:1], np.ones((1, 30)), result['a'], result['b'])
+
+        estimate = params.estimate('A1', list(range(1, 31)), X[0].tolist())
+        self.assertAlmostEqual(estimate['theta'], theta[0], places=2)
+        self.assertAlmostEqual(estimate['se'], se[0], places=2)
+        self.assertEqual(estimate['items'], 30)
+        # 보정 이후 정답이 바뀐 문항은 제외
+        changed = params.estimate('A1', list(range(1, 31)), X[0].tolist(), keys=[1] + [0] * 29)
+        self.assertEqual(changed['items'], 29)
+        self.assertIsNone(params.estimate('B2', [1], [True]))
+
+    def test_saved_parameters_drive_cefr_level(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'item_params.json')
+            result = {'a': np.ones(2), 'b': np.zeros(2), 'n': np.array([100, 100]), 'iterations': 1,
+                      'converged': True}
+            params = ItemParameters()
+            params.set_level('B1', [1, 2], [0, 1], result, 100, 1.0)
+            params.save(path)
+            loaded = get_item_parameters(path)
+            self.assertEqual(loaded.levels['B1']['items'][1]['key'], 1)
+            self.assertIsNone(get_item_parameters(os.path.join(tmpdir, 'missing.json')))
+        finally:
+            shutil.rmtree(tmpdir)
+
+        self.assertEqual([cefr_from_theta(t) for t in (-3, -1.2, 0.4, 2.6)], ['Pre-A1', 'A1', 'A2', 'B2'])
+        self.assertEqual(cefr_from_theta(2.6, 'A1'), 'A2')
+        analysis = CEFRAnalyzer().analyze_test_results(
+            {'level': 'A1', 'score': 40, 'ability': {'theta': 1.1, 'cefr': 'B1'}})
+        self.assertEqual(analysis['current_cefr_level'], 'B1')
+
+if __name__ == '__main__':
+    unittest.main()
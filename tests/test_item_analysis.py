@@ -0,0 +1,143 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import json_codec
+from utils.db_manager import DatabaseManager
+from utils.item_analysis import ItemAnalysis, ItemAnalysisStore
+from utils.scoring import original_responses
+
+ITEM_IDS = [1, 2, 3]
+KEY = [0, 1, 2]
+
+def make_rows(seed=0, n=200):
+    """문항 1, 2는 능력과 관련, 문항 3은 무작위 응답"""
+    rng = np.random.default_rng(seed)
+    ability = rng.normal(size=n)
+    rows = np.empty((n, 3), dtype=np.int8)
+    for col, key in enumerate(KEY[:2]):
+        correct = rng.random(n) < 1 / (1 + np.exp(-2 * ability))
+        rows[:, col] = np.where(correct, key, (key + rng.integers(1, 4, n)) % 4)
+    rows[:, 2] = rng.integers(0, 4, n)
+    rows[0, 2] = -1
+    return rows
+
+def reference_statistics(rows):
+    X = (rows == np.array(KEY)).astype(float)
+    T = X.sum(axis=1)
+    p = X.mean(axis=0)
+    r_pb = [np.corrcoef(X[:, j], T - X[:, j])[0, 1] for j in range(X.shape[1])]
+    k = X.shape[1]
+    alpha = k / (k - 1) * (1 - X.var(axis=0).sum() / T.var())
+    return p, r_pb, alpha
+
+class TestItemAnalysis(unittest.TestCase):
+    def test_matches_direct_computation(self):
+        rows = make_rows()
+        analysis = ItemAnalysis('A1', ITEM_IDS, KEY)
+        analysis.update_matrix(rows)
+        p, r_pb, alpha = reference_statistics(rows)
+
+        stats = analysis.item_statistics()
+        for col, item in enumerate(stats):
+            self.assertAlmostEqual(item['p_value'], p[col])
+            self.assertAlmostEqual(item['point_biserial'], r_pb[col])
+            self.assertAlmostEqual(sum(item['option_share']) + item['omit_share'], 1.0)
+        self.assertAlmostEqual(analysis.cronbach_alpha(), alpha)
+        self.assertAlmostEqual(stats[2]['omit_share'], 1 / len(rows))
+
+    def test_incremental_equals_batch(self):
+        rows = make_rows()
+        batch = ItemAnalysis('A1', ITEM_IDS, KEY)
+        batch.update_matrix(rows)
+
+        incremental = ItemAnalysis('A1', ITEM_IDS, KEY)
+        incremental.update_matrix(rows[:50])
+        incremental = ItemAnalysis.from_state('A1', incremental.to_state())
+        incremental.update_matrix(rows[50:])
+        self.assertEqual(incremental.item_statistics(), batch.item_statistics())
+
+    def test_submissions_grouped_by_form(self):
+        rows = make_rows(n=40)
+        submissions = [{'questionIds': [3, 1, 2], 'responses': [int(r[2]), int(r[0]), int(r[1])]} for r in rows]
+        submissions.append({'answers': [0, 1, 2]})  # responses 없는 이전 형식
+        analysis = ItemAnalysis('A1', ITEM_IDS, KEY)
+        self.assertEqual(analysis.update(submissions), 40)
+        self.assertEqual(analysis.skipped, 1)
+
+        direct = ItemAnalysis('A1', ITEM_IDS, KEY)
+        direct.update_matrix(rows)
+        self.assertEqual(analysis.item_statistics(), direct.item_statistics())
+
+    def test_statistics_from_saved_submissions(self):
+        rows = make_rows(n=30)
+        direct = ItemAnalysis('A1', ITEM_IDS, KEY)
+        direct.update_matrix(rows)
+        tmpdir = tempfile.mkdtemp()
+        previous = json_codec.BACKEND
+        try:
+            for backend in json_codec.BACKENDS:
+                if not json_codec._available(backend):
+                    continue
+                with self.subTest(backend=backend):
+                    json_codec.set_backend(backend)
+                    db = DatabaseManager(os.path.join(tmpdir, f'{backend}.db'), trace=False)
+                    for i, r in enumerate(rows):
+                        db.save_submission({'studentInfo': {'name': f's{i}'}, 'level': 'A1', 'score': 50,
+                                            'questionIds': ITEM_IDS, 'responses': [int(x) for x in r]})
+                    analysis = ItemAnalysis('A1', ITEM_IDS, KEY)
+                    for chunk in db.iter_rows_by_id(0, db.max_submission_id(), 7):
+                        analysis.update(data for _, data in chunk)
+                    self.assertEqual(analysis.item_statistics(), direct.item_statistics())
+        finally:
+            json_codec.set_backend(previous)
+            shutil.rmtree(tmpdir)
+
+    def test_flags_miskeyed_item(self):
+        rows = make_rows()
+        analysis = ItemAnalysis('A1', ITEM_IDS, [1, 1, 2])  # 1번 문항 정답을 잘못 입력
+        analysis.update_matrix(rows)
+        flags = analysis.item_statistics()[0]['flags']
+        self.assertIn('possible_miskey', flags)
+        self.assertIn('negative_discrimination', flags)
+
+    def test_store_rebuilds_changed_levels(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'state.json')
+            store = ItemAnalysisStore(path)
+            store.sync_bank({'A1': (ITEM_IDS, KEY)})
+            store.add([{'level': 'a1', 'questionIds': ITEM_IDS, 'responses': [0, 1, 2]}])
+            store.last_id = 1
+            store.save()
+
+            reloaded = ItemAnalysisStore(path)
+            self.assertEqual(reloaded.levels['A1'].n_students, 1)
+            reloaded.sync_bank({'A1': (ITEM_IDS + [4], KEY + [3])})  # 문항 추가: 유지
+            self.assertEqual((reloaded.last_id, reloaded.levels['A1'].n_students), (1, 1))
+            reloaded.sync_bank({'A1': (ITEM_IDS + [4], KEY + [3]), 'A2': (ITEM_IDS, KEY)})
+            replay = reloaded.sync_bank({'A1': (ITEM_IDS, [0, 1, 3]), 'A2': (ITEM_IDS, KEY)})  # 정답 변경: A1만 처음부터
+            self.assertEqual(replay, {'A1'})
+            self.assertEqual((reloaded.last_id, reloaded.levels['A1'].n_students), (1, 0))
+            # 변경 기록에서 기존 문항이 바뀐 레벨도 처음부터
+            reloaded.levels['A2'].n_students = 5
+            self.assertEqual(reloaded.sync_bank({'A1': (ITEM_IDS, [0, 1, 3]), 'A2': (ITEM_IDS, KEY)},
+                                                {'A2': {2}}), {'A2'})
+            self.assertEqual(reloaded.levels['A2'].n_students, 0)
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_original_responses(self):
+        questions = [{'option_order': [2, 0, 3, 1]}, {'option_order': [0, 1, 2, 3]}]
+        self.assertEqual(original_responses([0, -1], questions), [2, -1])
+        self.assertIsNone(original_responses([0], [{'question': 'no order'}]))
+
+if __name__ == '__main__':
+    unittest.main()
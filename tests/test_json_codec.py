@@ -0,0 +1,88 @@
+import sys
+import os
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import json_codec
+
+SUBMISSION = {
+    'studentInfo': {'name': 'kim', 'full_name': '김철수', 'grade': 3, 'class': 'A'},
+    'level': 'A1',
+    'submittedAt': '2025-03-01T10:00:00',
+    'score': 80,
+    'passed': True,
+    'correct': 4,
+    'total': 5,
+    'sectionResults': {'Reading': {'correct': 4, 'total': 5}},
+    'answers': [0, 1, 2, 3, -1],
+}
+
+class TestJsonCodec(unittest.TestCase):
+    def setUp(self):
+        self.default_backend = json_codec.BACKEND
+
+    def tearDown(self):
+        json_codec.set_backend(self.default_backend)
+
+    def test_backends_round_trip(self):
+        for backend in json_codec.BACKENDS:
+            try:
+                json_codec.set_backend(backend)
+            except ImportError:
+                continue
+            with self.subTest(backend=backend):
+                text = json_codec.dumps(SUBMISSION)
+                self.assertIn('김철수', text)
+                self.assertEqual(json_codec.loads(text), SUBMISSION)
+                self.assertEqual(json_codec.decode_submission(text.encode('utf-8')), SUBMISSION)
+                self.assertEqual(json_codec.loads(json_codec.dumps({1: 'a'})), {'1': 'a'})
+
+    def test_submission_keeps_unknown_keys_and_defaults(self):
+        submission = dict(SUBMISSION, passed=False, correct=0, answers=[], questionIds=[3, 1], responses=[0, 2],
+                          mode='adaptive', extra={'note': None})
+        for backend in json_codec.BACKENDS:
+            try:
+                json_codec.set_backend(backend)
+            except ImportError:
+                continue
+            with self.subTest(backend=backend):
+                text = json_codec.dumps(submission)
+                self.assertEqual(json_codec.decode_submission(text), submission)
+
+    def test_reads_do_not_apply_schema(self):
+        legacy = {'studentInfo': {}, 'level': 'A1', 'score': '85'}
+        for backend in json_codec.BACKENDS:
+            try:
+                json_codec.set_backend(backend)
+            except ImportError:
+                continue
+            with self.subTest(backend=backend):
+                self.assertEqual(json_codec.decode_submission(json_codec.dumps(legacy)), legacy)
+                self.assertEqual(json_codec.decode_submission(json_codec.dumps({'score': 'high'})), {'score': 'high'})
+
+    def test_validate_submission(self):
+        json_codec.validate_submission(SUBMISSION)
+        json_codec.validate_submission({'studentInfo': {}, 'level': 'A1', 'score': '85'})  # 예전 형식 허용
+        for bad in ({'level': 'A1', 'score': 1}, dict(SUBMISSION, score=None), dict(SUBMISSION, level=3)):
+            with self.assertRaises(ValueError):
+                json_codec.validate_submission(bad)
+
+    @unittest.skipIf(json_codec.msgspec is None, "msgspec not installed")
+    def test_msgspec_schema_fields(self):
+        with self.assertRaises(ValueError):
+            json_codec.validate_submission(dict(SUBMISSION, responses=['B']))
+        adaptive = dict(SUBMISSION, mode='adaptive', ability={'theta': 0.4, 'se': 0.28, 'cefr': 'A2', 'items': 12},
+                        catPath=[{'level': 'A1', 'id': 3, 'correct': True, 'theta': 0.5, 'se': 0.9}])
+        json_codec.validate_submission(adaptive)
+        with self.assertRaises(ValueError):
+            json_codec.validate_submission(dict(adaptive, catPath='A1,A2'))
+
+    def test_invalid_payloads_raise_value_error(self):
+        for payload in ('{"level": ', '[1, 2]'):
+            with self.assertRaises(ValueError):
+                json_codec.decode_submission(payload)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import sys
+import os
+import tempfile
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.lazy_imports import lazy_import, is_loaded
+from utils.assets import load_text_asset, load_css
+
+class TestLazyImports(unittest.TestCase):
+    def test_module_loaded_on_first_attribute_access(self):
+        sys.modules.pop('wave', None)
+        wave = lazy_import('wave')
+
+        self.assertFalse(is_loaded(wave))
+        self.assertNotIn('wave', sys.modules)
+
+        # 속성 접근 시 실제 모듈이 import 됨
+        self.assertTrue(callable(wave.open))
+        self.assertTrue(is_loaded(wave))
+        self.assertIn('wave', sys.modules)
+
+    def test_already_imported_module_returned_directly(self):
+        import json
+        self.assertIs(lazy_import('json'), json)
+
+class TestAssetLoader(unittest.TestCase):
+    def test_css_is_cached_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'style.css')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('body { color: red; }')
+
+            first = load_text_asset(path)
+            self.assertIs(load_text_asset(path), first)  # 같은 mtime이면 캐시 사용
+
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('body { color: blue; }')
+            os.utime(path, (os.path.getmtime(path) + 10,) * 2)
+
+            self.assertIn('blue', load_text_asset(path))
+            self.assertTrue(load_css(path).startswith('<style>'))
+
+if __name__ == '__main__':
+    unittest.main()
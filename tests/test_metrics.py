@@ -0,0 +1,41 @@
+import sys
+import os
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import metrics
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+
+    def tearDown(self):
+        metrics.disable()
+        metrics.reset()
+
+    def test_disabled_records_nothing(self):
+        metrics.disable()
+        metrics.timed('noop')(lambda: None)()
+        with metrics.timer('noop.block'):
+            pass
+        self.assertEqual(metrics.snapshot(), [])
+
+    def test_histogram_and_prometheus_output(self):
+        metrics.enable()
+        for seconds in (0.0002, 0.003, 0.003, 0.2):
+            metrics.observe('db.load_submissions', seconds)
+
+        row = metrics.snapshot()[0]
+        self.assertEqual(row['count'], 4)
+        self.assertAlmostEqual(row['max'], 0.2)
+        self.assertTrue(0.0025 <= row['p50'] <= 0.005)
+
+        text = metrics.render_prometheus()
+        self.assertIn('cefr_hot_path_duration_seconds_bucket{name="db.load_submissions",le="0.005"} 3', text)
+        self.assertIn('cefr_hot_path_duration_seconds_bucket{name="db.load_submissions",le="+Inf"} 4', text)
+        self.assertIn('cefr_hot_path_duration_seconds_count{name="db.load_submissions"} 4', text)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from migrate_db import migrate_json_dir
+from utils import json_codec
+from utils.db_manager import DatabaseManager
+
+def make_submission(i):
+    return {
+        'studentInfo': {'name': f'student{i}'}, 'level': 'A1', 'score': 80, 'passed': True,
+        'submittedAt': f'2025-03-{i + 1:02d}T10:00:00', 'correct': 4, 'total': 5,
+        'filename': f'student{i}_A1.json',
+    }
+
+class TestMigrateDb(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.source = os.path.join(self.tmpdir, 'submissions')
+        self.db_path = os.path.join(self.tmpdir, 'test.db')
+        os.makedirs(self.source)
+        for i in range(5):
+            self.write(f'student{i}_A1.json', make_submission(i))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def write(self, name, data):
+        with open(os.path.join(self.source, name), 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+    def test_dedup_and_errors(self):
+        self.write('student0_A1_copy.json', make_submission(0))  # same payload under another name
+        with open(os.path.join(self.source, 'broken.json'), 'w') as f:
+            f.write('{"level": ')
+
+        stats = migrate_json_dir(self.source, self.db_path, batch_size=2, workers=2)
+        self.assertEqual((stats['inserted'], stats['duplicates']), (5, 1))
+        self.assertEqual([name for name, _ in stats['errors']], ['broken.json'])
+
+        again = migrate_json_dir(self.source, self.db_path, batch_size=2)
+        self.assertEqual((again['inserted'], again['duplicates']), (0, 6))
+        self.assertEqual(len(DatabaseManager(self.db_path).load_submissions()), 5)
+
+    def test_same_name_in_other_directory(self):
+        other = os.path.join(self.tmpdir, 'archive', '2024')
+        os.makedirs(other)
+        for i in range(2):
+            with open(os.path.join(other, f'student{i}_A1.json'), 'w', encoding='utf-8') as f:
+                json.dump(dict(make_submission(i), score=55, passed=False), f)
+
+        self.assertEqual(migrate_json_dir(self.source, self.db_path)['inserted'], 5)
+        stats = migrate_json_dir(other, self.db_path)
+        self.assertEqual((stats['inserted'], stats['duplicates']), (2, 0))
+
+        conn = DatabaseManager(self.db_path).connect()
+        keys = [row[0] for row in conn.execute('SELECT source_file FROM submissions WHERE source_file LIKE ?',
+                                               ('%student0_A1.json',))]
+        conn.close()
+        self.assertEqual(sorted(keys), ['archive/2024/student0_A1.json', 'submissions/student0_A1.json'])
+
+    def test_legacy_rows_are_imported_and_read(self):
+        self.write('legacy_a.json', {'studentInfo': {}, 'level': 'A1', 'score': '85'})
+        self.write('legacy_b.json', {'level': 'A1', 'score': 70, 'submittedAt': '2024-01-01T09:00:00'})
+        previous = json_codec.BACKEND
+        try:
+            for backend in json_codec.BACKENDS:
+                if not json_codec._available(backend):
+                    continue
+                with self.subTest(backend=backend):
+                    json_codec.set_backend(backend)
+                    db_path = os.path.join(self.tmpdir, f'{backend}.db')
+                    stats = migrate_json_dir(self.source, db_path)
+                    self.assertEqual((stats['inserted'], stats['errors']), (7, []))
+                    self.assertEqual([name for name, _ in stats['invalid']], ['legacy_b.json'])
+
+                    db = DatabaseManager(db_path)
+                    self.assertEqual(len(db.load_submissions()), 7)
+                    self.assertEqual(len(db.filter_submissions(level='A1')), 7)
+                    self.assertEqual(len(list(db.iter_submissions())), 7)
+                    rows = [r for chunk in db.iter_rows_by_id(0, db.max_submission_id(), 3) for r in chunk]
+                    self.assertEqual(len(rows), 7)
+                    with self.assertRaises(ValueError):
+                        db.save_submission({'level': 'A1', 'score': 1})
+                    self.assertEqual(db.max_submission_id(), 7)
+        finally:
+            json_codec.set_backend(previous)
+
+    def test_resume_after_interruption(self):
+        def interrupt(stats):
+            if stats['files'] == 2:
+                raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            migrate_json_dir(self.source, self.db_path, batch_size=2, progress=interrupt)
+
+        stats = migrate_json_dir(self.source, self.db_path, batch_size=2)
+        self.assertEqual(stats['resumed_after'], 'student1_A1.json')
+        self.assertEqual((stats['files'], stats['inserted'], stats['duplicates']), (5, 5, 0))
+        self.assertEqual(migrate_json_dir(self.source, self.db_path)['resumed_after'], None)
+
+if __name__ == '__main__':
+    unittest.main()
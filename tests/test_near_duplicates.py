@@ -0,0 +1,56 @@
+import sys
+import os
+import unittest
+
+import numpy as np
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.near_duplicates import find_duplicates, item_text, jaccard, shingle_hashes
+
+def make_question(qid, question, options=('apple', 'banana', 'cherry', 'grape')):
+    return {'id': qid, 'question': question, 'options': list(options), 'correct': 0}
+
+class TestShingles(unittest.TestCase):
+    def test_hashes_do_not_cross_texts(self):
+        hashes, counts = shingle_hashes(['abcdefg', '', 'xyz', 'abcdefg'])
+        self.assertEqual(counts.tolist(), [3, 0, 1, 3])
+        self.assertEqual(len(hashes), 7)
+        self.assertEqual(hashes[:3].tolist(), hashes[4:].tolist())
+
+    def test_exact_jaccard(self):
+        hashes, counts = shingle_hashes(['abcdef', 'abcdeg'])
+        # {abcde, bcdef} vs {abcde, bcdeg}
+        self.assertAlmostEqual(jaccard(hashes, counts, np.array([[0, 1]]))[0], 1 / 3)
+
+class TestFindDuplicates(unittest.TestCase):
+    def test_near_duplicates_across_levels(self):
+        items = [
+            ('A1', make_question(1, 'What time does the school library open on Saturday mornings?')),
+            ('A2', make_question(7, 'What time does the school library open on Sunday mornings?')),
+            ('A2', make_question(8, 'Where did Mia leave her umbrella yesterday?', ('home', 'bus', 'school', 'park'))),
+            ('B1', make_question(3, '<span class="question-text">What time does the school library open on '
+                                    'Saturday mornings?</span>', ('A) apple', 'B) banana', 'C) cherry', 'D) grape'))),
+            ('B2', make_question(9, '')),
+            ('B2', {'id': 10}),
+        ]
+        report = find_duplicates(items, threshold=0.7)
+        self.assertEqual(len(report['clusters']), 1)
+        cluster = report['clusters'][0]
+        self.assertEqual([(item['level'], item['id']) for item in cluster['items']],
+                         [('A1', 1), ('A2', 7), ('B1', 3)])
+        self.assertGreaterEqual(cluster['similarity'], 0.7)
+        self.assertEqual(item_text(items[0][1]), item_text(items[3][1]))
+
+    def test_duplicate_options(self):
+        items = [('A2', make_question(19, 'The soup tastes ___.', ('deliciously', 'delicious', 'Deliciously', 'C) x')))]
+        report = find_duplicates(items)
+        self.assertEqual(report['duplicateOptions'], [{'level': 'A2', 'id': 19, 'options': ['deliciously']}])
+
+    def test_distinct_questions(self):
+        items = [('A1', make_question(i, f'Question number {i} asks about topic {i * 7919}')) for i in range(50)]
+        self.assertFalse(find_duplicates(items, threshold=0.9)['clusters'])
+
+if __name__ == '__main__':
+    unittest.main()
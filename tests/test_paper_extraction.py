@@ -0,0 +1,86 @@
+import sys
+import os
+import tempfile
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.paper_extraction import extract_papers, find_papers, load_answer_keys, merge_levels, parse_paper
+
+def question_html(number, text, options):
+    inputs = ''.join(f'<label><input type="radio" name="Q{number}" value="{letter}"><span>{letter}) {option}</span></label>\n'
+                     for letter, option in zip('ABCD', options))
+    return (f'<div class="question">\n<span class="question-number">{number}</span>\n'
+            f'<span class="question-text">{text}</span>\n<div class="options">\n{inputs}</div>\n</div>\n')
+
+PAPER = (
+    '<html><body><div class="container">\n'
+    '<section class="test-section">\n<div class="section-header">\n<h2>Part 1: Reading</h2>\n</div>\n'
+    '<div class="passage"><span class="passage-label">Passage 1</span><p>Hi Tom,<br>I am at the library.</p></div>\n'
+    + question_html(1, 'Where is <b>Mia</b>?', ['At school', 'At the library', 'At home', 'At the park'])
+    + question_html(2, 'Who wrote it?', ['Tom', 'Mia', 'Ann', 'Bob'])
+    + '</section>\n'
+    '<section class="test-section">\n<div class="section-header">\n<h2>Part 2: Grammar</h2>\n</div>\n'
+    + question_html(3, 'She ___ happy.', ['is', 'are', 'am', 'be'])
+    + question_html(4, 'Only three options', ['a', 'b', 'c'])
+    + '</section>\n</div></body></html>\n'
+)
+
+ANSWER_KEY = """const answerData = {
+  'A1': { title: 'A1', answers: { 'Q1': 'B', 'Q2': 'B', 'Q3': 'A' } },
+  'A2': { title: 'A2', answers: { 'Q1': 'D' } }
+};
+"""
+
+class TestParsePaper(unittest.TestCase):
+    def test_single_pass_extraction(self):
+        questions = parse_paper(PAPER, {1: 'B', 3: 'A'})
+        self.assertEqual([q['id'] for q in questions], [1, 2, 3])
+        first, second, third = questions
+        self.assertEqual(first['question'], 'Where is Mia?')
+        self.assertEqual(first['options'], ['At school', 'At the library', 'At home', 'At the park'])
+        self.assertEqual(first['correct'], 1)
+        self.assertEqual(first['section'], 'Reading')
+        self.assertIn('I am at the library.', first['passage'])
+        self.assertEqual(second['passage'], first['passage'])
+        self.assertEqual(second['correct'], 0)
+        # 섹션이 바뀌면 지문은 이어지지 않음
+        self.assertEqual(third['section'], 'Grammar')
+        self.assertNotIn('passage', third)
+
+    def test_answer_keys(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'answer-data.js')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(ANSWER_KEY)
+            self.assertEqual(load_answer_keys(path, ['A1', 'A2', 'B1']),
+                             {'A1': {1: 'B', 2: 'B', 3: 'A'}, 'A2': {1: 'D'}})
+            self.assertEqual(load_answer_keys(os.path.join(tmp, 'missing.js'), ['A1']), {})
+
+class TestExtractPapers(unittest.TestCase):
+    def test_extract_and_merge(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ['CEFR_A1_English_Level_Test_Student.html', 'CEFR_A2_English_Level_Test_Student.html',
+                         'notes.html']:
+                with open(os.path.join(tmp, name), 'w', encoding='utf-8') as f:
+                    f.write(PAPER)
+            answers = os.path.join(tmp, 'answer-data.js')
+            with open(answers, 'w', encoding='utf-8') as f:
+                f.write(ANSWER_KEY)
+
+            papers = find_papers(tmp)
+            self.assertEqual([os.path.basename(path)[:7] for path in papers], ['CEFR_A1', 'CEFR_A2'])
+            result = extract_papers(papers, answers, workers=1)
+            self.assertEqual([p['questions'] for p in result['papers']], [3, 3])
+            self.assertEqual([q['correct'] for q in result['levels']['A1']], [1, 1, 0])
+            self.assertEqual([q['correct'] for q in result['levels']['A2']], [3, 0, 0])
+
+        bank = {'PRE-A1': [{'id': 1}], 'a1': [{'id': 99}]}
+        merged = merge_levels(bank, result['levels'])
+        self.assertEqual(list(merged), ['PRE-A1', 'a1', 'A2'])
+        self.assertEqual(merged['PRE-A1'], [{'id': 1}])
+        self.assertEqual(len(merged['a1']), 3)
+
+if __name__ == '__main__':
+    unittest.main()
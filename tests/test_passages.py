@@ -0,0 +1,58 @@
+import sys
+import os
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.bank_validation import validate_bank
+from utils.passages import PASSAGES_KEY, bank_levels, dedupe_passages, passage_id, passage_text, register_passage
+from utils.question_block import client_passages, client_questions
+
+LETTER = "Hi Tom,\n\nI am at the library."
+
+def question(qid, section='Reading', **extra):
+    return dict({'id': qid, 'question': f'Question {qid}?', 'options': ['a', 'b', 'c', 'd'], 'correct': 0,
+                 'section': section}, **extra)
+
+class TestPassageTable(unittest.TestCase):
+    def test_dedupe_moves_text_once(self):
+        data = {
+            'PRE-A1': [question(1, passage=LETTER)],
+            'A1': [question(1, passage=LETTER), question(2, passage=LETTER), question(3, section='Grammar')],
+            PASSAGES_KEY: {'pstale': 'unused'},
+        }
+        result = dedupe_passages(data)
+        pid = passage_id(LETTER)
+        self.assertEqual(result[PASSAGES_KEY], {pid: LETTER})
+        self.assertEqual(list(result), ['PRE-A1', 'A1', PASSAGES_KEY])
+        self.assertEqual(list(result['A1'][0]), ['id', 'question', 'options', 'correct', 'section', 'passage_id'])
+        self.assertEqual([q.get('passage_id') for q in result['A1']], [pid, pid, None])
+        self.assertEqual([level for level, _ in bank_levels(result)], ['PRE-A1', 'A1'])
+        # 이미 정리된 은행은 그대로
+        self.assertEqual(dedupe_passages(result), result)
+
+        self.assertEqual(passage_text(result['A1'][0], result[PASSAGES_KEY]), LETTER)
+        self.assertEqual(passage_text(question(9, passage=LETTER)), LETTER)  # 예전 형식
+        self.assertEqual(passage_text(result['A1'][2], result[PASSAGES_KEY]), '')
+
+    def test_validation_resolves_ids(self):
+        data = dedupe_passages({'A1': [question(1, passage=LETTER), question(2, passage_id='pmissing')]})
+        report = validate_bank(data)
+        self.assertEqual(list(report['levels']), ['A1'])
+        self.assertEqual(report['levels']['A1']['valid'], [0])
+        errors = [issue for issue in report['levels']['A1']['issues'] if issue['severity'] == 'error']
+        self.assertEqual([(issue['rule'], issue['id']) for issue in errors], [('reading_passage', 2)])
+
+class TestClientPayload(unittest.TestCase):
+    def test_block_sends_each_passage_once(self):
+        pid = register_passage(LETTER)
+        block = [question(1, passage_id=pid), question(2, passage_id=pid)]
+        payload = client_questions(block)
+        self.assertEqual([q['passage_id'] for q in payload], [pid, pid])
+        self.assertNotIn('correct', payload[0])
+        self.assertNotIn(LETTER, str(payload))
+        self.assertEqual(client_passages(block + [question(3, section='Grammar')]), {pid: LETTER})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import sys
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from compress_db import rewrite_payloads
+from utils.db_manager import DatabaseManager
+from utils import payload_codec
+from utils.payload_codec import compress_payload, decompress_payload
+
+class TestPayloadCodec(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmpdir, 'test.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_round_trip(self):
+        text = '{"studentInfo": {"name": "김철수"}, "answers": [0, 1, 2, 3]}'
+        blob = compress_payload(text, codec='zlib')
+        self.assertEqual(decompress_payload(blob), text)
+        with self.assertRaises(ValueError):
+            decompress_payload(b'z\x01garbage')
+
+    def test_mixed_rows_and_migration(self):
+        DatabaseManager(self.db_path).save_submission({'studentInfo': {'name': 'kim'}, 'level': 'A1', 'score': 80})
+        DatabaseManager(self.db_path, compress=True).save_submission(
+            {'studentInfo': {'name': 'lee'}, 'level': 'A1', 'score': 60})
+        db = DatabaseManager(self.db_path)
+        before = db.load_submissions()
+        self.assertEqual({s['studentInfo']['name'] for s in before}, {'kim', 'lee'})
+
+        self.assertEqual(rewrite_payloads(self.db_path), 1)
+        self.assertEqual(rewrite_payloads(self.db_path), 0)
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(conn.execute('SELECT COUNT(*) FROM submissions WHERE submission_blob IS NULL').fetchone()[0], 0)
+        conn.close()
+        self.assertEqual(db.load_submissions(), before)
+
+        self.assertEqual(rewrite_payloads(self.db_path, decompress=True), 2)
+        self.assertEqual(db.filter_submissions(level='A1'), before)
+
+def samples(tag, n=300):
+    return [f'{{"studentInfo": {{"name": "{tag}{i}"}}, "level": "A{i % 2 + 1}", "score": {i % 100}, '
+            f'"answers": [{i % 4}, {(i + 1) % 4}, {(i + 2) % 4}], "passed": {"true" if i % 3 else "false"}}}'
+            for i in range(n)]
+
+@unittest.skipIf(payload_codec.zstandard is None, "zstandard not installed")
+class TestZstdDictionaries(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        store = os.path.join(self.tmpdir, 'zstd-dicts')
+        for name, value in (('ZSTD_DICTIONARY_DIR', store),
+                            ('ZSTD_DICTIONARY_PATH', os.path.join(self.tmpdir, 'submission.zstd-dict'))):
+            patcher = mock.patch.object(payload_codec, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_retraining_keeps_old_blobs_readable(self):
+        text = samples('kim')[5]
+        first = payload_codec.train_zstd_dictionary(samples('kim'), size=2048)
+        old_blob = compress_payload(text)
+        self.assertEqual(old_blob[:5], b'S' + first.to_bytes(4, 'big'))
+
+        second = payload_codec.train_zstd_dictionary(samples('lee'), size=2048)
+        self.assertEqual(second, first + 1)
+        self.assertEqual(payload_codec.stored_zstd_dictionary_ids(), [first, second])
+        new_blob = compress_payload(text)
+        self.assertEqual(new_blob[1:5], second.to_bytes(4, 'big'))
+        self.assertEqual((decompress_payload(old_blob), decompress_payload(new_blob)), (text, text))
+
+        # A dictionary that is gone (or an unknown id) is a ValueError like any unreadable blob
+        os.remove(os.path.join(payload_codec.ZSTD_DICTIONARY_DIR, f'{first}.dict'))
+        payload_codec._zstd_dicts.clear()
+        with self.assertRaises(ValueError):
+            decompress_payload(old_blob)
+        with self.assertRaises(ValueError):
+            decompress_payload(b'S' + (first + 256).to_bytes(4, 'big') + old_blob[5:])
+        with self.assertRaises(ValueError):
+            decompress_payload(b'S\x00')
+
+    def test_legacy_single_file_blobs(self):
+        zstandard = payload_codec.zstandard
+        legacy = zstandard.train_dictionary(2048, [s.encode() for s in samples('old')],
+                                            dict_id=payload_codec.ZSTD_FIRST_DICT_ID + 256)
+        with open(payload_codec.ZSTD_DICTIONARY_PATH, 'wb') as f:
+            f.write(legacy.as_bytes())
+        text = samples('old')[7]
+        body = zstandard.ZstdCompressor(dict_data=legacy, write_dict_id=False).compress(text.encode())
+        legacy_blob = b's' + bytes([legacy.dict_id() & 0xFF]) + body
+
+        # A stored dictionary whose id has the same low byte does not shadow the legacy file
+        other = zstandard.train_dictionary(2048, [s.encode() for s in samples('other')],
+                                           dict_id=payload_codec.ZSTD_FIRST_DICT_ID)
+        os.makedirs(payload_codec.ZSTD_DICTIONARY_DIR)
+        with open(os.path.join(payload_codec.ZSTD_DICTIONARY_DIR, f'{other.dict_id()}.dict'), 'wb') as f:
+            f.write(other.as_bytes())
+        self.assertEqual(other.dict_id() & 0xFF, legacy.dict_id() & 0xFF)
+        self.assertEqual(decompress_payload(legacy_blob), text)
+
+        # New dictionaries get ids above every known one, including the legacy file's
+        new_id = payload_codec.train_zstd_dictionary(samples('new'), size=2048)
+        self.assertEqual(new_id, legacy.dict_id() + 1)
+        self.assertEqual(decompress_payload(compress_payload(text)), text)
+        with self.assertRaises(ValueError):
+            decompress_payload(b's\x07' + body)
+
+if __name__ == '__main__':
+    unittest.main()
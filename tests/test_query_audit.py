@@ -0,0 +1,47 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import query_audit
+from utils.db_manager import DatabaseManager
+
+class TestQueryAudit(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.tmpdir, 'test.db'), trace=True)
+        query_audit.query_log.clear()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_traced_queries_record_shape_and_rows(self):
+        self.db.save_submission({'studentInfo': {'name': 'kim'}, 'level': 'A1', 'score': 80})
+        self.db.save_submission({'studentInfo': {'name': 'lee'}, 'level': 'A2', 'score': 60})
+        self.assertEqual(len(self.db.filter_submissions(level='A1')), 1)
+
+        select = [e for e in query_audit.query_log.recent if e['sql'].startswith('SELECT')][-1]
+        self.assertIn('level = ?', select['sql'])
+        self.assertEqual(select['params'], 'str')
+        self.assertEqual(select['rows'], 1)
+
+        insert = query_audit.query_log.recent[0]
+        self.assertTrue(insert['sql'].startswith('INSERT INTO submissions'))
+        self.assertEqual(insert['rows'], 1)
+
+    def test_explain_flags_full_scan(self):
+        conn = self.db.connect()
+        plan = query_audit.explain(conn, 'SELECT * FROM submissions WHERE score > ?', (50,))
+        self.assertTrue(query_audit.find_full_scans(plan))
+
+        plan = query_audit.explain(conn, 'SELECT * FROM submissions WHERE level = ? ORDER BY submitted_at', ('A1',))
+        self.assertEqual(query_audit.find_full_scans(plan), [])
+        self.assertEqual(query_audit.find_temp_sorts(plan), [])
+        conn.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import sys
+import os
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.records import Submission, as_submissions
+from utils.submission_stats import calculate_statistics
+
+SUBMISSION = {
+    'studentInfo': {'name': 'kim', 'school': 'Seoul', 'grade': '3', 'class': 'A'},
+    'level': 'A1',
+    'submittedAt': '2025-03-01T10:00:00',
+    'score': 80,
+    'passed': True,
+    'correct': 4,
+    'total': 5,
+    'sectionResults': {'Reading': {'correct': 4, 'total': 5}},
+    'answers': [0, 1, 2, 3, -1],
+    'filename': 'kim_A1.json',
+}
+
+class TestRecords(unittest.TestCase):
+    def test_submission_round_trip_and_dict_access(self):
+        record = Submission.from_dict(SUBMISSION)
+        self.assertEqual(record.to_dict(), SUBMISSION)
+        self.assertEqual(record.student_info.class_name, 'A')
+        self.assertEqual(record.section_results['Reading'].percentage, 80.0)
+        self.assertEqual(record.get('studentInfo', {}).get('class'), 'A')
+        self.assertEqual(record.get('filename'), 'kim_A1.json')
+        self.assertEqual(record.get('accuracy', 0), 0)
+        self.assertFalse(hasattr(record, '__dict__'))
+        with self.assertRaises(FrozenInstanceError):
+            record.score = 100
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+
+    def test_consumers_accept_records(self):
+        self.assertEqual(calculate_statistics(as_submissions([SUBMISSION])), calculate_statistics([SUBMISSION]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import closing
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import query_audit
+from utils.session_store import SessionStore, session_key
+
+class TestSessionStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.store = SessionStore(os.path.join(self.tmpdir, 'test.db'), flush_interval=0)
+        self.key = session_key('darlbit', 'A1')
+        self.questions = [{'id': i, 'question': f'Q{i}', 'options': ['a', 'b'], 'correct': 1} for i in range(4)]
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_resume_restores_answers_and_position(self):
+        self.store.start_session(self.key, 'darlbit', 'A1', 123.0, self.questions, [1, 1, 1, 1])
+        self.store.record_answer(self.key, 0, 1)
+        self.store.record_answer(self.key, 1, 0)
+        self.store.record_answer(self.key, 1, 1)  # 답 변경은 마지막 값으로 덮어씀
+        self.store.record_position(self.key, 2)
+
+        saved = self.store.load_session(self.key)
+        self.assertEqual(saved['answers'], [1, 1])
+        self.assertEqual(saved['current_question'], 2)
+        self.assertEqual(saved['start_time'], 123.0)
+        self.assertEqual(saved['questions'], self.questions)
+
+    def test_restart_and_finish_clear_previous_attempt(self):
+        self.store.start_session(self.key, 'darlbit', 'A1', 1.0, self.questions)
+        self.store.record_answers(self.key, 0, [0, 1, 0])
+        self.store.start_session(self.key, 'darlbit', 'A1', 2.0, self.questions)
+
+        saved = self.store.load_session(self.key)
+        self.assertEqual(saved['answers'], [])
+        self.assertEqual(saved['start_time'], 2.0)
+
+        self.store.finish_session(self.key)
+        self.assertIsNone(self.store.load_session(self.key))
+
+    def test_updates_after_finish_in_same_batch_are_dropped(self):
+        self.store.start_session(self.key, 'darlbit', 'A1', 1.0, self.questions)
+        self.store.flush()
+        # 제출 직후 늦게 도착한 답안/위치가 같은 배치에 들어와도 고아 행으로 남지 않아야 함
+        with closing(self.store.connect()) as conn:
+            self.store._write_batch(conn, [
+                ('answer', self.key, (0, 1)),
+                ('finish', self.key, None),
+                ('answer', self.key, (1, 0)),
+                ('position', self.key, 2),
+            ])
+            self.assertEqual(conn.execute('SELECT COUNT(*) FROM test_session_answers').fetchone()[0], 0)
+        self.assertIsNone(self.store.load_session(self.key))
+
+        # 제출 뒤 새 시도를 시작하면 그 시도의 답안은 저장됨
+        with closing(self.store.connect()) as conn:
+            self.store._write_batch(conn, [
+                ('finish', self.key, None),
+                ('start', self.key, ('darlbit', 'A1', 2.0, '[]', None)),
+                ('answer', self.key, (0, 1)),
+            ])
+        self.assertEqual(self.store.load_session(self.key)['answers'], [1])
+
+    def test_autosave_writes_are_traced(self):
+        store = SessionStore(os.path.join(self.tmpdir, 'traced.db'), flush_interval=0, trace=True)
+        query_audit.query_log.clear()
+        try:
+            store.start_session(self.key, 'darlbit', 'A1', 1.0, self.questions)
+            store.record_answer(self.key, 0, 1)
+            store.flush()
+        finally:
+            store.close()
+        statements = [e['sql'] for e in query_audit.query_log.recent]
+        self.assertTrue(any(sql.startswith('INSERT INTO test_sessions') for sql in statements))
+        self.assertTrue(any(sql.startswith('INSERT INTO test_session_answers') for sql in statements))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import sys
+import os
+import shutil
+import tempfile
+import time
+import types
+import unittest
+from unittest import mock
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import auth_manager, session_token
+from utils.user_store import UserStore
+
+class TestSessionToken(unittest.TestCase):
+    def setUp(self):
+        session_token.set_secret(b'test-secret')
+
+    def tearDown(self):
+        session_token.set_secret(None)
+
+    def test_round_trip(self):
+        info = {'name': 'kim01', 'full_name': '김민수', 'grade': '2'}
+        token = session_token.issue_token('kim01', 'student', info, 'kim01:A1', 'A1')
+        claims = session_token.verify_token(token)
+        self.assertEqual((claims['username'], claims['role'], claims['student_info']),
+                         ('kim01', 'student', info))
+        self.assertEqual((claims['test_session'], claims['test_level']), ('kim01:A1', 'A1'))
+
+    def test_rejects_tampered_expired_and_foreign_tokens(self):
+        token = session_token.issue_token('kim01', 'student')
+        payload, signature = token.split('.')
+        forged = session_token.issue_token('kim01', 'teacher').split('.')[0]
+
+        self.assertIsNone(session_token.verify_token(f'{forged}.{signature}'))
+        self.assertIsNone(session_token.verify_token(payload))
+        self.assertIsNone(session_token.verify_token('not base64!.sig'))
+        self.assertIsNone(session_token.verify_token(session_token.issue_token('kim01', 'student', ttl=-1)))
+
+        session_token.set_secret(b'another-server')
+        self.assertIsNone(session_token.verify_token(token))
+
+    def test_privileged_tokens_are_short_lived(self):
+        self.assertEqual(session_token.token_ttl('student'), session_token.TOKEN_TTL)
+        self.assertLess(session_token.token_ttl('teacher'), session_token.TOKEN_TTL)
+
+        claims = session_token.verify_token(session_token.issue_token('teacher', 'teacher'))
+        self.assertLessEqual(claims['expires_at'] - time.time(), session_token.PRIVILEGED_TOKEN_TTL)
+        # A long-lived token is only accepted for students
+        self.assertIsNotNone(session_token.verify_token(
+            session_token.issue_token('kim01', 'student', ttl=session_token.TOKEN_TTL)))
+        self.assertIsNone(session_token.verify_token(
+            session_token.issue_token('admin', 'admin', ttl=session_token.TOKEN_TTL)))
+
+class TestTokenRevocation(unittest.TestCase):
+    def setUp(self):
+        session_token.set_secret(b'test-secret')
+        self.tmpdir = tempfile.mkdtemp()
+        self.store = UserStore(os.path.join(self.tmpdir, 'test.db'))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmpdir)
+        session_token.set_secret(None)
+
+    def test_logout_revokes_issued_tokens(self):
+        fake_st = types.SimpleNamespace(session_state={}, query_params={})
+        with mock.patch.object(auth_manager, 'st', fake_st), \
+                mock.patch.object(auth_manager, 'get_user_store', return_value=self.store):
+            fake_st.session_state.update(logged_in=True, username='kim01', user_role='student',
+                                         student_info={'name': 'kim01'})
+            auth_manager.refresh_session_token()
+            token = fake_st.query_params[auth_manager.TOKEN_PARAM]
+            self.assertEqual(auth_manager.verify_session_token(token)['username'], 'kim01')
+
+            # Another tab restored from the same URL
+            other_tab = dict(fake_st.session_state)
+
+            auth_manager.logout()
+            self.assertFalse(fake_st.session_state['logged_in'])
+            self.assertNotIn(auth_manager.TOKEN_PARAM, fake_st.query_params)
+            self.assertIsNone(auth_manager.verify_session_token(token))
+
+            # The old URL no longer logs in
+            fake_st.query_params[auth_manager.TOKEN_PARAM] = token
+            self.assertFalse(auth_manager.restore_session_from_token())
+
+            # and the other tab is logged out on its next rerun instead of getting a fresh token
+            fake_st.session_state.clear()
+            fake_st.session_state.update(other_tab)
+            fake_st.query_params[auth_manager.TOKEN_PARAM] = token
+            auth_manager.refresh_session_token()
+            self.assertFalse(fake_st.session_state['logged_in'])
+            self.assertNotIn(auth_manager.TOKEN_PARAM, fake_st.query_params)
+
+            # A new login gets a token that is valid again
+            fake_st.session_state.update(logged_in=True, username='kim01', user_role='student')
+            auth_manager.refresh_session_token()
+            self.assertIsNotNone(auth_manager.verify_session_token(fake_st.query_params[auth_manager.TOKEN_PARAM]))
+
+if __name__ == '__main__':
+    unittest.main()
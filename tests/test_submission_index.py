@@ -0,0 +1,66 @@
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_manager import DataManager
+from utils.submission_index import INDEX_FILE
+
+def make_submission(name, level, score=80):
+    return {
+        'studentInfo': {'name': name}, 'level': level, 'score': score, 'passed': score >= 70,
+        'submittedAt': '2025-03-01T10:00:00', 'correct': 4, 'total': 5, 'answers': [0, 1, 2, 3, -1],
+    }
+
+class TestSubmissionIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.manager = DataManager(self.tmpdir)
+        self.manager.save_submission(make_submission('kim', 'A1'))
+        self.manager.save_submission(make_submission('lee', 'B1', 60))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_filters_open_only_matching_files(self):
+        with mock.patch.object(self.manager.index, 'load', wraps=self.manager.index.load) as load:
+            result = self.manager.get_submissions_by_level('B1')
+        self.assertEqual([s['studentInfo']['name'] for s in result], ['lee'])
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(self.manager.get_student_submissions('kim')[0]['level'], 'A1')
+
+    def test_refresh_picks_up_external_changes(self):
+        submissions_dir = self.manager.submissions_dir
+        self.manager.load_submissions()
+        with open(os.path.join(submissions_dir, 'park_A1_copied.json'), 'w', encoding='utf-8') as f:
+            json.dump(make_submission('park', 'A1'), f)
+        os.remove(os.path.join(submissions_dir, self.manager.get_student_submissions('lee')[0]['filename']))
+
+        names = sorted(s['studentInfo']['name'] for s in self.manager.load_submissions())
+        self.assertEqual(names, ['kim', 'park'])
+        # 다른 DataManager(다른 프로세스)도 갱신된 인덱스 파일만으로 같은 결과
+        with open(os.path.join(submissions_dir, INDEX_FILE), encoding='utf-8') as f:
+            self.assertEqual(sorted(json.loads(line)['name'] for line in f), ['kim', 'park'])
+
+        os.remove(os.path.join(submissions_dir, INDEX_FILE))
+        self.assertEqual(self.manager.rebuild_index(), 2)
+        self.assertEqual(len(DataManager(self.tmpdir).get_submissions_by_level('A1')), 2)
+
+    def test_cleanup_uses_index_saved_time(self):
+        old = make_submission('choi', 'A2')
+        old['savedAt'] = '2020-01-01T00:00:00'
+        with open(os.path.join(self.manager.submissions_dir, 'choi_A2_old.json'), 'w', encoding='utf-8') as f:
+            json.dump(old, f)
+
+        self.manager.cleanup_old_files(days=30)
+        self.assertFalse(os.path.exists(os.path.join(self.manager.submissions_dir, 'choi_A2_old.json')))
+        self.assertEqual(sorted(s['studentInfo']['name'] for s in self.manager.load_submissions()), ['kim', 'lee'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import sys
+import os
+import unittest
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.test_progress import (build_progress_index, sync_progress, record_answer, fill_unanswered,
+                                 build_question_blocks, find_block, group_passages, merge_answer_batch)
+
+class TestSectionProgress(unittest.TestCase):
+    def setUp(self):
+        sections = ['Reading', 'Reading', 'Grammar', 'Vocabulary', 'Grammar']
+        self.questions = [{'id': i, 'section': s} for i, s in enumerate(sections)]
+        self.progress = build_progress_index(self.questions)
+
+    def test_index_groups_sections_in_order(self):
+        self.assertEqual(self.progress['sections'], ['Reading', 'Grammar', 'Vocabulary'])
+        self.assertEqual(self.progress['totals'], [2, 2, 1])
+        self.assertEqual(self.progress['section_of'], [0, 0, 1, 2, 1])
+
+    def test_record_answer_updates_counts_incrementally(self):
+        answers = []
+        record_answer(answers, self.progress, 0, 2)
+        record_answer(answers, self.progress, 1, 3)
+        record_answer(answers, self.progress, 2, 0)
+        self.assertEqual(self.progress['answered'], [2, 1, 0])
+
+        # 이미 답한 문항을 바꾸면 응답 수는 그대로
+        record_answer(answers, self.progress, 0, 1)
+        self.assertEqual(answers, [1, 3, 0])
+        self.assertEqual(self.progress['answered'], [2, 1, 0])
+
+    def test_fill_unanswered_marks_remaining(self):
+        answers = [0]
+        sync_progress(self.progress, len(answers))
+        fill_unanswered(answers, self.progress, len(self.questions))
+        self.assertEqual(answers, [0, -1, -1, -1, -1])
+        self.assertEqual(self.progress['answered'], self.progress['totals'])
+
+    def test_sync_rebuilds_after_reset(self):
+        self.progress['answered'] = [2, 2, 1]
+        sync_progress(self.progress, 0)
+        self.assertEqual(self.progress['answered'], [0, 0, 0])
+
+class TestQuestionBlocks(unittest.TestCase):
+    def setUp(self):
+        self.questions = [
+            {'section': 'Reading', 'passage': 'A'},
+            {'section': 'Reading', 'passage': 'A'},
+            {'section': 'Reading', 'passage': 'B'},
+            {'section': 'Grammar'},
+            {'section': 'Grammar'},
+        ]
+        self.progress = build_progress_index(self.questions)
+
+    def test_blocks_split_on_section_and_passage(self):
+        blocks = build_question_blocks(self.questions)
+        self.assertEqual(blocks, [(0, 2), (2, 3), (3, 5)])
+        self.assertEqual(find_block(blocks, 4), 2)
+        # 은행 문항은 지문 id로 묶임
+        by_id = [{'section': 'Reading', 'passage_id': 'p1'}, {'section': 'Reading', 'passage_id': 'p1'},
+                 {'section': 'Reading', 'passage_id': 'p2'}]
+        self.assertEqual(build_question_blocks(by_id), [(0, 2), (2, 3)])
+
+    def test_interleaved_passages_form_one_block_each(self):
+        # A1처럼 1, 3, 5, 7번과 2, 4, 6, 8번이 서로 다른 지문
+        questions = [{'id': i, 'section': 'Reading', 'passage_id': 'p1' if i % 2 else 'p2'} for i in range(1, 9)]
+        questions.insert(4, {'id': 'g1', 'section': 'Grammar'})
+        questions.append({'id': 'g2', 'section': 'Grammar'})
+        grouped = group_passages(questions)
+        self.assertEqual([q['id'] for q in grouped], [1, 3, 5, 7, 2, 4, 6, 8, 'g1', 'g2'])
+        self.assertEqual(build_question_blocks(grouped), [(0, 4), (4, 8), (8, 10)])
+        self.assertEqual(group_passages(grouped), grouped)
+        self.assertEqual(group_passages(self.questions), self.questions)
+
+    def test_merge_batch_appends_contiguous_answers_only(self):
+        answers = [1, 0]
+        sync_progress(self.progress, len(answers))
+        # 3번 문항이 비어 있으므로 4번 답안은 아직 반영하지 않음
+        merged = merge_answer_batch(answers, self.progress, 2, [3, None, 2])
+        self.assertEqual(merged, 1)
+        self.assertEqual(answers, [1, 0, 3])
+        self.assertEqual(self.progress['answered'], [3, 0])
+
+        merge_answer_batch(answers, self.progress, 0, [2, 0])
+        self.assertEqual(answers, [2, 0, 3])
+
+if __name__ == '__main__':
+    unittest.main()
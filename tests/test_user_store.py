@@ -0,0 +1,85 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Add parent directory to path to allow importing from utils
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import user_store
+from utils.auth_manager import AuthManager, forwarded_client
+from utils.user_store import LoginThrottled, UserStore
+
+@mock.patch.object(user_store, 'SCRYPT_N', 2 ** 8)  # fast hashes for tests
+class TestUserStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.store = UserStore(os.path.join(self.tmpdir, 'test.db'))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.tmpdir)
+
+    def test_roster_import_and_cached_verification(self):
+        roster = os.path.join(self.tmpdir, 'roster.csv')
+        with open(roster, 'w', encoding='utf-8-sig') as f:
+            f.write('아이디,비밀번호,이름,학교,학년,반\nkim01,pw1,김민수,Seoul,2,3\nlee02,,이서연,Seoul,2,3\n')
+        users = self.store.import_roster(roster)
+        generated = users[1]['password']
+        self.assertEqual(len(generated), 8)
+
+        self.assertEqual(self.store.verify('kim01', 'pw1')['name'], '김민수')
+        self.assertIsNone(self.store.verify('kim01', 'wrong'))
+        self.assertIsNotNone(self.store.verify('lee02', generated))
+
+        with mock.patch.object(user_store, 'verify_password') as verify:
+            self.assertIsNotNone(self.store.verify('kim01', 'pw1'))  # served from the LRU
+            verify.assert_not_called()
+
+        # A password changed through another connection invalidates the cached verification
+        UserStore(self.store.db_path).add_user('kim01', 'pw2', name='김민수')
+        self.assertIsNone(self.store.verify('kim01', 'pw1'))
+        self.assertIsNotNone(self.store.verify('kim01', 'pw2'))
+
+    def test_throttling_and_legacy_fallback(self):
+        self.store.add_user('kim01', 'pw1')
+        auth = AuthManager(store=self.store)
+        auth.add_user('teacher', 'secret', role='teacher')
+
+        self.assertEqual(auth.authenticate(' teacher ', 'secret')['role'], 'teacher')
+        for _ in range(user_store.MAX_FAILURES_PER_USER):
+            self.assertEqual(auth.authenticate('kim01', 'bad', client_ip='10.0.0.1'), {})
+        with self.assertRaises(LoginThrottled):
+            auth.authenticate('kim01', 'pw1', client_ip='10.0.0.1')
+        # Other students behind the same classroom IP are unaffected
+        self.assertEqual(auth.authenticate('teacher', 'secret', client_ip='10.0.0.1')['username'], 'teacher')
+        # Guessing from another address does not lock the owner out
+        self.assertEqual(auth.authenticate('kim01', 'pw1', client_ip='10.0.0.2')['username'], 'kim01')
+
+    def test_reload_only_on_user_changes(self):
+        self.store.add_user('kim01', 'pw1')
+        self.assertEqual(self.store.usernames(), ['kim01'])
+        conn = self.store.connect()
+        with conn:
+            conn.execute('CREATE TABLE other (x)')
+            conn.execute('INSERT INTO other VALUES (1)')
+        conn.close()
+        with mock.patch.object(self.store, 'connect') as connect:
+            self.assertEqual(self.store.usernames(), ['kim01'])  # commits to other tables keep the index
+            connect.assert_not_called()
+
+        UserStore(self.store.db_path).delete_user('kim01')
+        self.assertEqual(self.store.usernames(), [])
+
+class TestClientAddress(unittest.TestCase):
+    def test_only_proxy_appended_hops_are_trusted(self):
+        self.assertEqual(forwarded_client('1.2.3.4', '10.0.0.9', 0), '10.0.0.9')
+        self.assertEqual(forwarded_client('1.2.3.4, 203.0.113.7', '10.0.0.9', 1), '203.0.113.7')
+        self.assertEqual(forwarded_client('1.2.3.4, 203.0.113.7, 10.0.0.5', '10.0.0.9', 2), '203.0.113.7')
+        self.assertEqual(forwarded_client(None, '10.0.0.9', 1), '10.0.0.9')
+        self.assertEqual(forwarded_client('203.0.113.7', '10.0.0.9', 2), '10.0.0.9')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+"""
+분석용 컬럼형 스냅샷 (Parquet / Arrow IPC)
+
+운영 DB의 JSON 컬럼을 노트북에서 직접 파싱하지 않도록, 제출 데이터를 평탄화한 세 개의
+데이터셋으로 내보냅니다. 모두 level/month(제출 월) 기준 hive 파티션입니다.
+
+    out_dir/
+      submissions/level=A1/month=2025-03/part-00001-00000-0.parquet   제출 1건 = 1행
+      section_results/level=.../month=.../...                         제출 x 섹션 = 1행
+      answers/level=.../month=.../...                                 제출 x 문항 = 1행
+      _snapshot.json                                                   마지막으로 내보낸 id 등
+
+세 데이터셋은 submission_id(DB의 submissions.id)로 조인합니다. 스냅샷을 다시 만들면
+지난번 이후 추가된 행(id > last_id)만 새 파일로 추가합니다 (full=True면 전체 재작성).
+DB는 id 범위로 청크 단위로만 읽고, 청크마다 파일을 쓰므로 메모리는 청크 크기로 제한됩니다.
+
+    import pyarrow.dataset as ds
+    table = open_snapshot('data/snapshots', 'submissions').to_table(filter=ds.field('level') == 'A1')
+
+pyarrow가 필요합니다 (선택 의존성 - 스냅샷 기능에서만 import).
+"""
+
+import glob
+import json
+import os
+import shutil
+from datetime import datetime
+from typing import Any, Dict, List
+
+from utils.lazy_imports import lazy_import
+
+pa = lazy_import('pyarrow')
+ds = lazy_import('pyarrow.dataset')
+
+FORMATS = {'parquet': 'parquet', 'ipc': 'arrow'}  # 형식 -> 파일 확장자
+TABLES = ('submissions', 'section_results', 'answers')
+STATE_FILE = '_snapshot.json'
+# 청크당 제출 건수 (answers는 이 값 x 문항 수 행)
+SNAPSHOT_CHUNK_ROWS = 50000
+
+
+def _partitioning():
+    return ds.partitioning(pa.schema([('level', pa.string()), ('month', pa.string())]), flavor='hive')
+
+
+def _schemas() -> Dict[str, Any]:
+    partition_fields = [('level', pa.string()), ('month', pa.string())]
+    return {
+        'submissions': pa.schema([
+            ('submission_id', pa.int64()),
+            ('student_name', pa.string()),
+            ('full_name', pa.string()),
+            ('school', pa.string()),
+            ('grade', pa.string()),
+            ('class', pa.string()),
+            ('submitted_at', pa.timestamp('us')),
+            ('score', pa.float64()),
+            ('passed', pa.bool_()),
+            ('correct', pa.int32()),
+            ('total', pa.int32()),
+            ('answered', pa.int32()),
+        ] + partition_fields),
+        'section_results': pa.schema([
+            ('submission_id', pa.int64()),
+            ('section', pa.string()),
+            ('correct', pa.int32()),
+            ('total', pa.int32()),
+            ('percentage', pa.float64()),
+        ] + partition_fields),
+        'answers': pa.schema([
+            ('submission_id', pa.int64()),
+            ('q_idx', pa.int32()),
+            ('answer', pa.int8()),
+        ] + partition_fields),
+    }
+
+
+def _parse_time(value: Any):
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _chunk_tables(chunk: List[tuple], schemas: Dict[str, Any]) -> Dict[str, Any]:
+    """(id, 제출 dict) 청크를 세 테이블로 평탄화합니다."""
+    columns = {name: {field.name: [] for field in schema} for name, schema in schemas.items()}
+    sub, sec, ans = columns['submissions'], columns['section_results'], columns['answers']
+
+    for row_id, data in chunk:
+        info = data.get('studentInfo') or {}
+        submitted_at = _parse_time(data.get('submittedAt'))
+        level = data.get('level') or 'Unknown'
+        month = submitted_at.strftime('%Y-%m') if submitted_at else 'unknown'
+        answers = data.get('answers') or []
+        grade = info.get('grade')
+
+        sub['submission_id'].append(row_id)
+        sub['student_name'].append(info.get('name'))
+        sub['full_name'].append(info.get('full_name'))
+        sub['school'].append(info.get('school'))
+        sub['grade'].append(None if grade is None else str(grade))
+        sub['class'].append(info.get('class'))
+        sub['submitted_at'].append(submitted_at)
+        sub['score'].append(data.get('score', 0))
+        sub['passed'].append(bool(data.get('passed', False)))
+        sub['correct'].append(data.get('correct', 0))
+        sub['total'].append(data.get('total', 0))
+        sub['answered'].append(len(answers))
+        sub['level'].append(level)
+        sub['month'].append(month)
+
+        for section, result in (data.get('sectionResults') or {}).items():
+            total = result.get('total', 0)
+            sec['submission_id'].append(row_id)
+            sec['section'].append(section)
+            sec['correct'].append(result.get('correct', 0))
+            sec['total'].append(total)
+            sec['percentage'].append(result.get('correct', 0) / total * 100 if total else None)
+            sec['level'].append(level)
+            sec['month'].append(month)
+
+        n = len(answers)
+        ans['submission_id'].extend([row_id] * n)
+        ans['q_idx'].extend(range(n))
+        ans['answer'].extend(answers)
+        ans['level'].extend([level] * n)
+        ans['month'].extend([month] * n)
+
+    return {name: pa.Table.from_pydict(columns[name], schema=schemas[name]) for name in schemas}
+
+
+def _load_state(out_dir: str) -> Dict[str, Any]:
+    path = os.path.join(out_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return {'last_id': 0, 'format': None, 'snapshots': []}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _save_state(out_dir: str, state: Dict[str, Any]):
+    path = os.path.join(out_dir, STATE_FILE)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def write_snapshot(db, out_dir: str, fmt: str = 'parquet', full: bool = False,
+                   chunk_rows: int = SNAPSHOT_CHUNK_ROWS) -> Dict[str, Any]:
+    """
+    스냅샷을 쓰고 이번 실행 정보(seq, from_id, to_id, rows, files)를 반환합니다.
+    상태 파일은 모든 파일을 쓴 뒤에 갱신되므로, 중간에 실패하면 다음 실행이
+    같은 seq의 남은 파일을 지우고 같은 범위를 다시 씁니다.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown snapshot format: {fmt} (expected one of {', '.join(FORMATS)})")
+
+    if full and os.path.isdir(out_dir):
+        for table in TABLES:
+            shutil.rmtree(os.path.join(out_dir, table), ignore_errors=True)
+        if os.path.exists(os.path.join(out_dir, STATE_FILE)):
+            os.remove(os.path.join(out_dir, STATE_FILE))
+    os.makedirs(out_dir, exist_ok=True)
+
+    state = _load_state(out_dir)
+    if state['format'] not in (None, fmt):
+        raise ValueError(f"Snapshot in {out_dir} is {state['format']}; use the same format or full=True")
+
+    seq = len(state['snapshots']) + 1
+    ext = FORMATS[fmt]
+    for table in TABLES:  # 실패한 이전 실행이 남긴 같은 seq 파일
+        for leftover in glob.glob(os.path.join(out_dir, table, '**', f'part-{seq:05d}-*'), recursive=True):
+            os.remove(leftover)
+
+    from_id = state['last_id']
+    to_id = db.max_submission_id()  # 실행 중 추가되는 행은 다음 스냅샷에서
+    schemas = _schemas()
+    partitioning = _partitioning()
+    rows = files = 0
+
+    for chunk_no, chunk in enumerate(db.iter_rows_by_id(from_id, to_id, chunk_rows)):
+        written = []
+        for name, table in _chunk_tables(chunk, schemas).items():
+            if table.num_rows:
+                ds.write_dataset(
+                    table, os.path.join(out_dir, name), format=fmt, partitioning=partitioning,
+                    basename_template=f'part-{seq:05d}-{chunk_no:05d}-{{i}}.{ext}',
+                    existing_data_behavior='overwrite_or_ignore',
+                    file_visitor=lambda f: written.append(f.path),
+                )
+        rows += len(chunk)
+        files += len(written)
+
+    info = {'seq': seq, 'from_id': from_id, 'to_id': to_id, 'rows': rows, 'files': files,
+            'created_at': datetime.now().isoformat()}
+    if rows:
+        state['snapshots'].append(info)
+    state['last_id'] = to_id
+    state['format'] = fmt
+    _save_state(out_dir, state)
+    return info
+
+
+def open_snapshot(out_dir: str, table: str = 'submissions'):
+    """스냅샷 데이터셋 (pyarrow.dataset.Dataset, level/month 파티션 열 포함)"""
+    if table not in TABLES:
+        raise ValueError(f"Unknown snapshot table: {table} (expected one of {', '.join(TABLES)})")
+    state = _load_state(out_dir)
+    return ds.dataset(os.path.join(out_dir, table), format=state['format'] or 'parquet',
+                      partitioning=_partitioning(), schema=_schemas()[table])
@@ -0,0 +1,51 @@
+"""
+정적 에셋(CSS 등) 로더
+
+페이지마다 rerun 때마다 assets/styles.css를 디스크에서 다시 읽지 않도록
+파일 내용을 프로세스 단위로 캐시합니다. 파일이 수정되면(mtime 변경) 다시 읽습니다.
+"""
+
+import os
+from functools import lru_cache
+
+# 프로젝트 루트 (utils/의 상위 디렉토리) - 실행 위치(cwd)와 무관하게 에셋을 찾기 위함
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(BASE_DIR, 'assets')
+DEFAULT_STYLESHEET = os.path.join(ASSETS_DIR, 'styles.css')
+
+
+@lru_cache(maxsize=32)
+def _read_text(path: str, mtime: float) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=32)
+def _read_bytes(path: str, mtime: float) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def load_text_asset(path: str) -> str:
+    """텍스트 에셋을 캐시를 통해 읽습니다. 상대 경로는 프로젝트 루트 기준입니다."""
+    if not os.path.isabs(path):
+        path = os.path.join(BASE_DIR, path)
+    return _read_text(path, os.path.getmtime(path))
+
+
+def load_binary_asset(path: str) -> bytes:
+    """바이너리 에셋(이미지 등)을 캐시를 통해 읽습니다."""
+    if not os.path.isabs(path):
+        path = os.path.join(BASE_DIR, path)
+    return _read_bytes(path, os.path.getmtime(path))
+
+
+def load_css(path: str = DEFAULT_STYLESHEET) -> str:
+    """<style> 태그로 감싼 CSS 문자열을 반환합니다."""
+    return f'<style>{load_text_asset(path)}</style>'
+
+
+def inject_css(path: str = DEFAULT_STYLESHEET):
+    """현재 페이지에 공통 스타일시트를 주입합니다."""
+    import streamlit as st
+    st.markdown(load_css(path), unsafe_allow_html=True)
@@ -1,43 +1,94 @@
+import hmac
+import json
 import os
+import time
 import streamlit as st
-from typing import Dict, Optional, List, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, List
+
+from utils import session_token
+from utils.user_store import LoginThrottled, UserStore, get_user_store  # noqa: F401 - LoginThrottled re-exported
+
+# Query parameter holding the signed session token (utils/session_token.py)
+TOKEN_PARAM = 't'
+# Reverse proxies in front of Streamlit that append to X-Forwarded-For (0 = use the socket peer)
+TRUSTED_PROXY_HOPS = int(os.getenv('CEFR_TRUSTED_PROXY_HOPS', '0'))
+
+
+@lru_cache(maxsize=4)
+def _parse_env_users(env_users: str) -> Dict:
+    try:
+        return json.loads(env_users)
+    except ValueError:
+        return {}
+
+
+def _legacy_users() -> Dict:
+    """
+    Plaintext users from environment variables or Streamlit secrets
+    Priority:
+    1. Environment variables (Vercel/production) - parsed once per value
+    2. Streamlit secrets (local development)
+    """
+    env_users = os.getenv('STREAMLIT_USERS')
+    if env_users:
+        users = _parse_env_users(env_users)
+        if users:
+            return users
+
+    try:
+        if 'users' in st.secrets:
+            return st.secrets['users']
+    except Exception:  # no secrets.toml
+        pass
+    return {}
+
+
+def forwarded_client(forwarded: Optional[str], peer: Optional[str], trusted_hops: int) -> Optional[str]:
+    """
+    Client IP given the X-Forwarded-For header, the socket peer and the number of
+    reverse proxies in front of the app. Each proxy appends the address it received the
+    request from, so only the last trusted_hops entries are trustworthy; anything left
+    of them was supplied by the client. With trusted_hops=0 the header is ignored.
+    """
+    if trusted_hops <= 0 or not forwarded:
+        return peer
+    hops = [hop.strip() for hop in forwarded.split(',') if hop.strip()]
+    if len(hops) < trusted_hops:
+        return peer
+    return hops[-trusted_hops]
+
+
+def client_address() -> Optional[str]:
+    """Client IP of the current Streamlit session (see forwarded_client and TRUSTED_PROXY_HOPS)."""
+    try:
+        return forwarded_client(st.context.headers.get('X-Forwarded-For'), st.context.ip_address,
+                                TRUSTED_PROXY_HOPS)
+    except Exception:  # outside a script run
+        return None
+
 
 class AuthManager:
     """
     Normalize authentication across different environments (local, Vercel, etc.)
+
+    Users come from the hashed user store (utils/user_store.py, filled by
+    manage_users.py) first; usernames not in the store fall back to the plaintext
+    STREAMLIT_USERS / st.secrets['users'] configuration.
     """
     
-    def __init__(self):
-        self.users = self._load_users()
+    def __init__(self, store: Optional[UserStore] = None):
+        self.store = store or get_user_store()
+        self.users = dict(_legacy_users())
     
-    def _load_users(self) -> Dict:
-        """
-        Load users from environment variables or Streamlit secrets
-        Priority:
-        1. Environment variables (Vercel/production)
-        2. Streamlit secrets (local development)
-        """
-        users = {}
-        
-        # Try to load from environment variables first
-        env_users = os.getenv('STREAMLIT_USERS')
-        if env_users:
-            try:
-                import json
-                users = json.loads(env_users)
-            except:
-                pass
-        
-        # Fall back to Streamlit secrets
-        if not users and 'users' in st.secrets:
-            users = dict(st.secrets['users'])
-        
-        return users
-    
-    def authenticate(self, username: str, password: str) -> Dict:
+    def has_users(self) -> bool:
+        return bool(self.users) or self.store.has_users()
+
+    def authenticate(self, username: str, password: str, client_ip: Optional[str] = None) -> Dict:
         """
         Authenticate user and return user info
         Returns empty dict if authentication fails
+        Raises LoginThrottled after too many failures for the user or client address
         """
         # Normalize input
         username = username.strip() if username else ""
@@ -45,29 +96,38 @@ class AuthManager:
         
         if not username or not password:
             return {}
-        
-        user = self.users.get(username)
-        
-        if user and user.get('password') == password:
+
+        self.store.check_throttle(username, client_ip)
+
+        legacy = self.users.get(username) if self.store.get_user(username) is None else None
+        if legacy:
+            matched = hmac.compare_digest(str(legacy.get('password', '')).encode('utf-8'),
+                                          password.encode('utf-8'))
+            user = dict(legacy) if matched else None
+        else:
+            user = self.store.verify(username, password)
+
+        self.store.record_result(username, client_ip, user is not None)
+        if user:
             return {
                 'username': username,
-                'role': user.get('role', 'student'),
-                'name': user.get('name', username),
-                'school': user.get('school', ''),
-                'grade': user.get('grade', ''),
-                'class': user.get('class', '')
+                'role': user.get('role') or 'student',
+                'name': user.get('name') or username,
+                'school': user.get('school') or '',
+                'grade': user.get('grade') or '',
+                'class': user.get('class') or ''
             }
         
         return {}
     
     def get_user_list(self) -> List[str]:
         """Get list of usernames (for debug purposes)"""
-        return list(self.users.keys()) or []
+        return sorted(set(self.store.usernames()) | set(self.users.keys()))
     
-    def add_user(self, username: str, password: str, role: str = 'student', **kwargs):
+    def add_user(self, username: str, password: str, role: str = 'student', **kwargs: Any):
         """
         Add a new user
-        This method is for testing/local development only
+        This method is for testing/local development only (in-memory, plaintext)
         """
         self.users[username] = {
             'password': password,
@@ -78,7 +138,12 @@ class AuthManager:
 def normalize_session_state():
     """
     Normalize session state to ensure all required keys exist
+    A new session (e.g. after the websocket reconnects) is restored from the signed
+    token in the URL, and a logged-in session keeps that token up to date.
     """
+    if not st.session_state.get('logged_in'):
+        restore_session_from_token()
+
     if 'logged_in' not in st.session_state:
         st.session_state['logged_in'] = False
     
@@ -94,6 +159,81 @@ def normalize_session_state():
     if 'start_time' not in st.session_state:
         st.session_state['start_time'] = None
 
+    refresh_session_token()
+
+def verify_session_token(token: Optional[str], store: Optional[UserStore] = None) -> Optional[Dict[str, Any]]:
+    """
+    Claims of a valid token that has not been revoked by a logout, else None
+    (signature/expiry check plus one cached generation lookup in the user store)
+    """
+    claims = session_token.verify_token(token)
+    if not claims:
+        return None
+    if claims['generation'] != (store or get_user_store()).token_generation(claims['username']):
+        return None
+    return claims
+
+def restore_session_from_token() -> bool:
+    """
+    Log in from the token query parameter (no password check; revoked tokens are refused)
+    Also restores the level of an in-progress test, which the test page then resumes
+    from the autosave (utils/session_store.py)
+    """
+    token = st.query_params.get(TOKEN_PARAM)
+    claims = verify_session_token(token)
+    if not claims:
+        return False
+
+    st.session_state['logged_in'] = True
+    st.session_state['username'] = claims['username']
+    st.session_state['user_role'] = claims['role']
+    st.session_state['student_info'] = claims['student_info']
+    if claims['test_session'] and claims['test_level']:
+        st.session_state['test_level'] = claims['test_level']
+        st.session_state['restored_test_session'] = claims['test_session']
+    st.session_state['session_token'] = token
+    st.session_state['session_token_state'] = _token_state()
+    return True
+
+def _token_state() -> tuple:
+    """Session values carried by the token; a new token is issued when they change"""
+    test_session = st.session_state.get('autosave_key')
+    return (
+        st.session_state.get('username') or st.session_state.get('student_info', {}).get('name'),
+        st.session_state.get('user_role'),
+        json.dumps(st.session_state.get('student_info') or {}, sort_keys=True, ensure_ascii=False),
+        test_session,
+        st.session_state.get('test_level') if test_session else None,
+    )
+
+def refresh_session_token():
+    """
+    Keep the URL token in sync with the login state (cheap: one HMAC when something changed)
+    A session whose user logged out elsewhere (token generation bumped) is logged out too.
+    """
+    if not st.session_state.get('logged_in'):
+        return
+
+    state = _token_state()
+    username, role, _, test_session, test_level = state
+    generation = get_user_store().token_generation(username)
+    token = st.session_state.get('session_token')
+    claims = session_token.verify_token(token) if token else None
+    if claims and claims['generation'] != generation:
+        _clear_session()
+        return
+
+    half_life = session_token.token_ttl(role) / 2
+    if (claims is None or state != st.session_state.get('session_token_state')
+            or claims['expires_at'] - time.time() < half_life):
+        token = session_token.issue_token(username, role, st.session_state.get('student_info'),
+                                          test_session, test_level, generation=generation)
+        st.session_state['session_token'] = token
+        st.session_state['session_token_state'] = state
+
+    if st.query_params.get(TOKEN_PARAM) != token:
+        st.query_params[TOKEN_PARAM] = token
+
 def check_permission(required_role: Optional[str] = None) -> bool:
     """
     Check if current user has required permission
@@ -107,12 +247,21 @@ def check_permission(required_role: Optional[str] = None) -> bool:
     
     return True
 
-def logout():
-    """
-    Clear session state for logout
-    """
+def _clear_session():
     for key in list(st.session_state.keys()):
         del st.session_state[key]
-    
+    st.query_params.pop(TOKEN_PARAM, None)
+
     # Re-initialize required session state
     normalize_session_state()
+
+def logout():
+    """
+    Clear session state for logout
+    Also revokes every session token of the user, so a copied or bookmarked URL
+    (or another open tab) cannot restore the session afterwards
+    """
+    username = st.session_state.get('username') or st.session_state.get('student_info', {}).get('name')
+    if st.session_state.get('logged_in') and username:
+        get_user_store().revoke_tokens(username)
+    _clear_session()
@@ -0,0 +1,231 @@
+"""
+증분 문항 은행 빌드
+
+시험지 HTML과 정답 파일의 해시를 bank_manifest.json에 기록해 두고, 원본이 바뀐 레벨만 다시 추출해
+extracted_questions.json에 반영합니다 (python build_bank.py). 빌드마다 레벨별 변경 내용(추가/삭제/변경된 문항 id)을
+bank_changelog.json에 남겨, 문항 캐시·검증 보고서·문항 통계가 바뀐 레벨만 다시 계산할 수 있게 합니다.
+
+- 원본 해시: 레벨 키마다 시험지 파일 내용 해시 + 그 레벨의 정답 블록. 파일 크기/mtime이 매니페스트와 같으면
+  파일을 다시 읽지 않고 기록된 해시를 씁니다.
+- 문항 id 유지: 다시 추출한 문항을 기존 레벨 문항과 (1) 질문+선택지 집합, (2) 질문, (3) 선택지 집합 순으로 맞춰
+  (2, 3은 양쪽에서 유일할 때만) 기존 id를 그대로 씁니다. 새 문항은 시험지 번호가 기존 은행에서 쓰인 적이 없으면
+  그 번호, 아니면 가장 큰 id 다음 번호를 받습니다 (삭제된 문항의 id를 다른 문항이 물려받지 않음).
+- 지문 본문은 은행의 지문 테이블에 한 번만 저장하고 문항에는 지문 id만 둡니다 (utils/passages.py).
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.bank_validation import (BANK_PATH, REPORT_PATH, file_hash, level_hash, option_text, question_text,
+                                   save_bank_and_report)
+from utils.paper_extraction import (extract_papers, find_papers, load_answer_keys, merge_levels, paper_base_level,
+                                    paper_level)
+from utils.passages import PASSAGES_KEY, bank_levels, split_passages
+
+BASE_DIR = os.path.dirname(BANK_PATH)
+MANIFEST_PATH = os.path.join(BASE_DIR, 'bank_manifest.json')
+CHANGELOG_PATH = os.path.join(BASE_DIR, 'bank_changelog.json')
+CHANGELOG_LIMIT = 100
+
+
+def _read_json(path: str, default: Any) -> Any:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _write_json(path: str, data: Any, indent: Optional[int] = 1):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+    os.replace(tmp_path, path)
+
+
+def file_digests(paths: List[str], previous: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """파일 이름 -> {size, mtime, sha256}. 크기와 mtime이 이전 기록과 같으면 해시를 다시 계산하지 않습니다."""
+    digests = {}
+    for path in paths:
+        name = os.path.basename(path)
+        stat = os.stat(path)
+        entry = previous.get(name)
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+            digests[name] = entry
+            continue
+        with open(path, 'rb') as f:
+            digests[name] = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'sha256': file_hash(f.read())}
+    return digests
+
+
+def source_hashes(papers: List[str], files: Dict[str, Dict[str, Any]],
+                  answer_keys: Dict[str, Dict[int, str]]) -> Dict[str, str]:
+    """레벨 키 -> 원본 해시 (그 레벨 시험지들의 파일 해시 + 정답 블록)"""
+    parts: Dict[str, List[str]] = {}
+    for path in papers:
+        name = os.path.basename(path)
+        answers = json.dumps(sorted(answer_keys.get(paper_base_level(path), {}).items()))
+        parts.setdefault(paper_level(path), []).append(f"{name}:{files[name]['sha256']}:{answers}")
+    return {level: file_hash('\n'.join(sorted(items)).encode('utf-8')) for level, items in parts.items()}
+
+
+def _content(question: Dict[str, Any]) -> Tuple[str, Tuple[str, ...]]:
+    options = question.get('options') if isinstance(question.get('options'), list) else []
+    return question_text(question).lower(), tuple(sorted(option_text(option) for option in options))
+
+
+def assign_stable_ids(previous: List[Dict[str, Any]],
+                      extracted: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    다시 추출한 문항에 기존 id를 이어 붙입니다. (id를 붙인 문항 목록, 변경 내용) 반환.
+    변경 내용: added/removed/changed = 문항 id 목록, unchanged = 문항 수
+    """
+    previous = [q for q in previous if isinstance(q, dict)]
+    keys = [_content(q) for q in previous]
+    new_keys = [_content(q) for q in extracted]
+    matched: Dict[int, int] = {}         # 새 문항 위치 -> 기존 문항 위치
+    used = set()
+
+    def match(key_of, unique_only):
+        old_by_key: Dict[Any, List[int]] = {}
+        new_by_key: Dict[Any, List[int]] = {}
+        for index, key in enumerate(keys):
+            if index not in used:
+                old_by_key.setdefault(key_of(key), []).append(index)
+        for index, key in enumerate(new_keys):
+            if index not in matched:
+                new_by_key.setdefault(key_of(key), []).append(index)
+        for key, new_indexes in new_by_key.items():
+            old_indexes = old_by_key.get(key, [])
+            if not key or not old_indexes or (unique_only and (len(new_indexes) > 1 or len(old_indexes) > 1)):
+                continue
+            for new_index, old_index in zip(new_indexes, old_indexes):
+                matched[new_index] = old_index
+                used.add(old_index)
+
+    match(lambda key: key, unique_only=False)
+    match(lambda key: key[0], unique_only=True)
+    match(lambda key: key[1], unique_only=True)
+
+    previous_ids = {q.get('id') for q in previous}
+    next_id = max([i for i in previous_ids if isinstance(i, int)] + [0]) + 1
+    assigned = set()
+    questions, changes = [], {'added': [], 'removed': [], 'changed': [], 'unchanged': 0}
+    for index, question in enumerate(extracted):
+        question = dict(question)
+        if index in matched:
+            old = previous[matched[index]]
+            question['id'] = old.get('id')
+            if {k: v for k, v in old.items() if k != 'id'} == {k: v for k, v in question.items() if k != 'id'}:
+                changes['unchanged'] += 1
+            else:
+                changes['changed'].append(question['id'])
+        else:
+            if question.get('id') in previous_ids or question.get('id') in assigned:
+                question['id'] = next_id
+            next_id = max(next_id, question['id'] + 1)
+            changes['added'].append(question['id'])
+        assigned.add(question['id'])
+        questions.append(question)
+    changes['removed'] = [q.get('id') for index, q in enumerate(previous) if index not in used]
+    return questions, changes
+
+
+def plan_build(source_dir: str, bank: Dict[str, Any], manifest: Dict[str, Any],
+               answer_key_path: Optional[str] = None, levels: Optional[List[str]] = None,
+               force: bool = False) -> Dict[str, Any]:
+    """
+    다시 추출할 레벨 결정. 반환: papers(레벨 키 -> 시험지 경로), files(파일 해시), sources(레벨 키 -> 원본 해시),
+    answers(정답), changed(다시 추출할 레벨 키 목록)
+    """
+    papers = find_papers(source_dir)
+    if levels:
+        wanted = {level.upper() for level in levels}
+        papers = [path for path in papers if paper_level(path).upper() in wanted]
+    bases = sorted({paper_base_level(path) for path in papers})
+    answers = load_answer_keys(answer_key_path, bases) if answer_key_path else {}
+    files = file_digests(papers, manifest.get('files', {}))
+    sources = source_hashes(papers, files, answers)
+
+    built_levels = {key.upper() for key, _ in bank_levels(bank)}
+    built = manifest.get('levels', {})
+    changed = [level for level, digest in sources.items()
+               if force or level.upper() not in built_levels or built.get(level, {}).get('source') != digest]
+    by_level: Dict[str, List[str]] = {}
+    for path in papers:
+        by_level.setdefault(paper_level(path), []).append(path)
+    return {'papers': by_level, 'files': files, 'sources': sources, 'answers': answers, 'changed': changed}
+
+
+def build_bank(source_dir: str, bank_path: str = BANK_PATH, answer_key_path: Optional[str] = None,
+               report_path: Optional[str] = REPORT_PATH, manifest_path: str = MANIFEST_PATH,
+               changelog_path: str = CHANGELOG_PATH, levels: Optional[List[str]] = None, force: bool = False,
+               workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    원본이 바뀐 레벨만 다시 추출해 은행에 반영합니다. 반환: 이번 빌드의 변경 기록
+    ({build, builtAt, levels: 레벨 -> {hash, added, removed, changed, unchanged}}, 추출 정보 'extraction',
+    검증 요약 'validation').
+    바뀐 레벨이 없으면 은행/보고서/변경 기록 파일을 건드리지 않고 levels가 빈 기록을 반환합니다.
+    """
+    bank = _read_json(bank_path, {})
+    manifest = _read_json(manifest_path, {})
+    plan = plan_build(source_dir, bank, manifest, answer_key_path, levels, force)
+    entry: Dict[str, Any] = {'build': manifest.get('build', 0), 'builtAt': None, 'levels': {}, 'extraction': None,
+                             'validation': None}
+    if not plan['changed']:
+        return entry
+
+    paths = [path for level in plan['changed'] for path in plan['papers'][level]]
+    extraction = extract_papers(paths, workers=workers, answer_keys=plan['answers'])
+    existing = {key.upper(): key for key, _ in bank_levels(bank)}
+    passages = dict(bank.get(PASSAGES_KEY) or {})
+    updated = {}
+    for level, questions in extraction['levels'].items():
+        previous = bank.get(existing.get(level.upper(), level), [])
+        # 지문 본문은 은행의 지문 테이블로 (문항에는 지문 id만)
+        questions = split_passages(questions, passages)
+        questions, changes = assign_stable_ids(previous if isinstance(previous, list) else [], questions)
+        updated[level] = questions
+        entry['levels'][level] = dict(changes, hash=level_hash(questions))
+
+    merged = merge_levels(bank, updated)
+    merged[PASSAGES_KEY] = passages
+    report = save_bank_and_report(merged, bank_path, report_path, quiet=True)
+    if report is not None:
+        entry['validation'] = report['summary']
+
+    entry['build'] += 1
+    entry['builtAt'] = datetime.now().isoformat(timespec='seconds')
+    manifest_levels = dict(manifest.get('levels', {}))
+    for level in updated:
+        manifest_levels[level] = {'source': plan['sources'][level], 'hash': entry['levels'][level]['hash']}
+    _write_json(manifest_path, {'build': entry['build'], 'files': dict(manifest.get('files', {}), **plan['files']),
+                                'levels': manifest_levels})
+
+    changelog = _read_json(changelog_path, [])
+    changelog.append({key: entry[key] for key in ('build', 'builtAt', 'levels')})
+    _write_json(changelog_path, changelog[-CHANGELOG_LIMIT:])
+    entry['extraction'] = extraction
+    return entry
+
+
+def changes_since(build: int, changelog_path: str = CHANGELOG_PATH) -> Tuple[int, Optional[Dict[str, set]]]:
+    """
+    build 이후 빌드에서 바뀐 문항 id (레벨 키 대문자 -> 추가/삭제/변경된 id 집합)와 마지막 빌드 번호.
+    기록이 잘려 build 다음 빌드부터 남아 있지 않으면 None (전부 다시 계산해야 함).
+    """
+    changelog = _read_json(changelog_path, [])
+    if not changelog:
+        return build, {}
+    latest = changelog[-1]['build']
+    newer = [entry for entry in changelog if entry['build'] > build]
+    if newer and newer[0]['build'] != build + 1:
+        return latest, None
+    changed: Dict[str, set] = {}
+    for entry in newer:
+        for level, changes in entry['levels'].items():
+            ids = set(changes['added']) | set(changes['removed']) | set(changes['changed'])
+            changed.setdefault(level.upper(), set()).update(ids)
+    return latest, changed
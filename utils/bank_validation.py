@@ -0,0 +1,355 @@
+"""
+문항 은행 검증 엔진
+
+extracted_questions.json을 선언적 규칙으로 한 번에 검사하고 기계가 읽을 수 있는 보고서
+(bank_report.json)를 만듭니다. 문항 은행을 만들거나 고치는 스크립트가 끝날 때 한 번 실행하며
+(python validate_bank.py), 시험 페이지/로더는 보고서의 문항 위치 목록만 보고 문항을 거르므로
+실행 중에 다시 검사하지 않습니다.
+
+- 규칙은 @rule 데코레이터로 등록합니다: 이름, 심각도('error' = 시험에서 제외 / 'warning' = 보고만),
+  범위('question' = 문항 하나, 'level' = 레벨 전체)
+- 보고서에는 은행 파일의 sha256이 들어가며, 은행이 바뀌었는데 보고서를 다시 만들지 않았으면
+  get_bank_report()가 메모리에서 한 번 검사한 결과를 대신 씁니다 (프로세스 단위, 파일 mtime 기준 캐시).
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import Counter, namedtuple
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.passages import PASSAGES_KEY, bank_levels, dedupe_passages
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BANK_PATH = os.path.join(BASE_DIR, 'extracted_questions.json')
+REPORT_PATH = os.path.join(BASE_DIR, 'bank_report.json')
+
+N_OPTIONS = 4
+# 정답 위치 개수의 최대-최소 차이가 문항 수의 이 비율을 넘으면 경고 (check_validity.py와 같은 기준)
+ANSWER_BALANCE_TOLERANCE = 0.2
+
+Rule = namedtuple('Rule', 'name severity scope description check')
+RULES: List[Rule] = []
+
+_TAG = re.compile(r'<[^>]+>')
+_OPTION_LABEL = re.compile(r'^\s*[A-D]\)\s*')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def rule(name: str, severity: str = 'error', scope: str = 'question', description: str = ''):
+    """
+    검사 규칙 등록.
+    question 범위: check(question) -> 문제가 있으면 메시지, 없으면 None
+    level 범위: check(questions) -> [(문항 위치, 메시지), ...]
+    """
+    def register(check: Callable):
+        RULES.append(Rule(name, severity, scope, description or (check.__doc__ or '').strip(), check))
+        return check
+    return register
+
+
+def question_text(question: Dict[str, Any]) -> str:
+    return _TAG.sub('', str(question.get('question') or '')).strip()
+
+
+def option_text(option: Any) -> str:
+    """비교용 선택지 텍스트 (A)~D) 라벨 제거, 소문자, 공백 정리)"""
+    return _WHITESPACE.sub(' ', _OPTION_LABEL.sub('', str(option or ''))).strip().lower()
+
+
+def repeated_options(options: List[Any]) -> List[str]:
+    """한 문항 안에서 두 번 이상 나오는 선택지 (비교용 텍스트)"""
+    counts = Counter(option_text(option) for option in options)
+    return [text for text, count in counts.items() if text and count > 1]
+
+
+# -- 문항 규칙 --------------------------------------------------------------
+
+@rule('question_text')
+def _check_question_text(question):
+    """질문 문장이 있어야 함"""
+    if not question_text(question):
+        return "질문이 비어 있음"
+
+
+@rule('four_options')
+def _check_options(question):
+    """비어 있지 않은 선택지 4개"""
+    options = question.get('options')
+    if not isinstance(options, list) or len(options) != N_OPTIONS:
+        return f"선택지가 {N_OPTIONS}개가 아님 ({len(options) if isinstance(options, list) else 0}개)"
+    empty = [i for i, option in enumerate(options) if not option_text(option)]
+    if empty:
+        return f"빈 선택지: {', '.join('ABCD'[i] for i in empty)}"
+
+
+@rule('valid_correct')
+def _check_correct(question):
+    """정답 번호가 0~3 정수"""
+    correct = question.get('correct')
+    if isinstance(correct, bool) or not isinstance(correct, int) or not 0 <= correct < N_OPTIONS:
+        return f"정답 번호가 올바르지 않음: {correct!r}"
+
+
+@rule('reading_passage')
+def _check_passage(question):
+    """Reading 문항은 지문이 있어야 함"""
+    has_passage = question.get('passage_id') or str(question.get('passage') or '').strip()
+    if question.get('section') == 'Reading' and not has_passage:
+        return "Reading 문항에 지문이 없음"
+
+
+@rule('duplicate_options', severity='warning')
+def _check_duplicate_options(question):
+    """한 문항 안에 같은 선택지가 두 번 이상"""
+    options = question.get('options')
+    if not isinstance(options, list):
+        return None
+    repeated = repeated_options(options)
+    if repeated:
+        return f"중복 선택지: {', '.join(repeated)}"
+
+
+# -- 레벨 규칙 --------------------------------------------------------------
+
+@rule('unique_id', scope='level')
+def _check_unique_ids(questions):
+    """레벨 안에서 문항 id가 겹치지 않아야 함 (두 번째부터 제외)"""
+    seen = set()
+    issues = []
+    for index, question in enumerate(questions):
+        question_id = question.get('id')
+        if question_id in seen:
+            issues.append((index, f"문항 id {question_id} 중복"))
+        seen.add(question_id)
+    return issues
+
+
+@rule('duplicate_question', severity='warning', scope='level')
+def _check_duplicate_questions(questions):
+    """질문과 선택지가 모두 같은 문항"""
+    first = {}
+    issues = []
+    for index, question in enumerate(questions):
+        key = (question_text(question).lower(),
+               tuple(sorted(option_text(option) for option in question.get('options') or [])))
+        if key in first:
+            issues.append((index, f"{first[key]}번 문항과 같은 문항"))
+        else:
+            first[key] = question.get('id')
+    return issues
+
+
+@rule('answer_balance', severity='warning', scope='level')
+def _check_answer_balance(questions):
+    """정답 위치(A~D) 분포 쏠림"""
+    counts = Counter(question.get('correct') for question in questions)
+    values = [counts.get(position, 0) for position in range(N_OPTIONS)]
+    if questions and max(values) - min(values) > len(questions) * ANSWER_BALANCE_TOLERANCE:
+        distribution = ', '.join(f"{'ABCD'[i]}={v}" for i, v in enumerate(values))
+        return [(None, f"정답 위치 분포 쏠림 ({distribution})")]
+    return []
+
+
+# -- 실행 --------------------------------------------------------------------
+
+def validate_level(questions: List[Dict[str, Any]], passages: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    레벨 하나 검사: 문항 수, 시험에 쓸 문항 위치(valid), 문제 목록(issues).
+    passages(은행의 지문 테이블)를 주면 문항의 지문 id를 본문으로 바꿔 검사합니다 (테이블에 없는 id = 지문 없음).
+    """
+    issues = []
+    excluded = set()
+
+    def add(item_rule, index, message):
+        question = questions[index] if index is not None else {}
+        issues.append({'rule': item_rule.name, 'severity': item_rule.severity, 'index': index,
+                       'id': question.get('id'), 'message': message})
+        if item_rule.severity == 'error' and index is not None:
+            excluded.add(index)
+
+    for index, question in enumerate(questions):
+        if not isinstance(question, dict):
+            issues.append({'rule': 'structure', 'severity': 'error', 'index': index, 'id': None,
+                           'message': "문항이 객체가 아님"})
+            excluded.add(index)
+            continue
+        pid = question.get('passage_id')
+        if passages is not None and pid:
+            question = {key: value for key, value in question.items() if key != 'passage_id'}
+            question['passage'] = passages.get(pid, '')
+        for item_rule in RULES:
+            if item_rule.scope == 'question':
+                message = item_rule.check(question)
+                if message:
+                    add(item_rule, index, message)
+
+    dict_questions = [q if isinstance(q, dict) else {} for q in questions]
+    for item_rule in RULES:
+        if item_rule.scope == 'level':
+            for index, message in item_rule.check(dict_questions):
+                add(item_rule, index, message)
+
+    return {
+        'questions': len(questions),
+        'valid': [index for index in range(len(questions)) if index not in excluded],
+        'issues': issues,
+    }
+
+
+def level_hash(questions: Any) -> str:
+    """레벨 내용의 sha256 (키 순서 무관). 레벨 단위 캐시와 변경 기록(utils/bank_build.py)의 버전으로 씁니다."""
+    return hashlib.sha256(json.dumps(questions, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def passages_hash(questions: Any, passages: Dict[str, str]) -> str:
+    """레벨이 참조하는 지문(id -> 본문, 테이블에 없으면 None)의 sha256. 지문 테이블만 바뀌어도 레벨을 다시 검사하도록."""
+    ids = sorted({q['passage_id'] for q in questions if isinstance(q, dict) and q.get('passage_id')}
+                 if isinstance(questions, list) else ())
+    return level_hash({pid: passages.get(pid) for pid in ids})
+
+
+def rule_list() -> List[Dict[str, str]]:
+    return [{'name': r.name, 'severity': r.severity, 'scope': r.scope, 'description': r.description} for r in RULES]
+
+
+def validate_bank(data: Dict[str, Any], bank_hash: Optional[str] = None,
+                  previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    은행 전체 검사 보고서. previous(이전 보고서)의 규칙 목록이 같으면 내용 해시와 참조하는 지문의
+    해시가 그대로인 레벨은 다시 검사하지 않고 이전 결과를 씁니다.
+    """
+    rules = rule_list()
+    reusable = previous['levels'] if previous and previous.get('rules') == rules else {}
+    passages = data.get(PASSAGES_KEY) or {}
+    levels = {}
+    for level, questions in bank_levels(data):
+        # 지문 테이블에서 지문이 빠지거나 손으로 고쳐질 수 있으므로 지문 해시도 함께 비교
+        digest = level_hash(questions)
+        passage_digest = passages_hash(questions, passages)
+        cached = reusable.get(level, {})
+        if cached.get('hash') == digest and cached.get('passagesHash') == passage_digest:
+            levels[level] = cached
+        else:
+            levels[level] = dict(validate_level(questions if isinstance(questions, list) else [], passages),
+                                 hash=digest, passagesHash=passage_digest)
+    issues = [issue for report in levels.values() for issue in report['issues']]
+    return {
+        'generatedAt': datetime.now().isoformat(timespec='seconds'),
+        'bankHash': bank_hash,
+        'rules': rules,
+        'summary': {
+            'questions': sum(report['questions'] for report in levels.values()),
+            'valid': sum(len(report['valid']) for report in levels.values()),
+            'errors': sum(1 for issue in issues if issue['severity'] == 'error'),
+            'warnings': sum(1 for issue in issues if issue['severity'] == 'warning'),
+        },
+        'levels': levels,
+    }
+
+
+def file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def build_report(bank_path: str = BANK_PATH, report_path: Optional[str] = REPORT_PATH) -> Dict[str, Any]:
+    """
+    은행 파일을 검사하고 보고서를 저장합니다 (report_path가 None이면 저장하지 않음).
+    기존 보고서가 있으면 내용이 바뀐 레벨만 다시 검사합니다.
+    """
+    with open(bank_path, 'rb') as f:
+        raw = f.read()
+    previous = None
+    if report_path and os.path.exists(report_path):
+        try:
+            with open(report_path, encoding='utf-8') as f:
+                previous = json.load(f)
+        except ValueError:
+            previous = None
+    report = validate_bank(json.loads(raw), file_hash(raw), previous)
+    if report_path:
+        tmp_path = f"{report_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, report_path)
+    return report
+
+
+def load_bank(bank_path: str = BANK_PATH) -> Dict[str, Any]:
+    with open(bank_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_bank_and_report(data: Dict[str, Any], bank_path: str = BANK_PATH,
+                         report_path: Optional[str] = REPORT_PATH, quiet: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    은행을 고치는 스크립트의 공통 저장 단계: 지문 본문을 지문 테이블로 정리(dedupe_passages)해 은행을
+    원자적으로 저장하고, 검증 보고서를 다시 만듭니다 (바뀐 레벨만 다시 검사, report_path가 None이면 생략).
+    시험 페이지/로더는 이 보고서로 문항을 거르므로 은행을 저장한 뒤에는 항상 이 함수를 씁니다.
+    """
+    data = dedupe_passages(data)
+    tmp_path = f"{bank_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, bank_path)
+    if not report_path:
+        return None
+    report = build_report(bank_path, report_path)
+    if not quiet:
+        summary = report['summary']
+        print(f"🔎 Validation: {summary['errors']} errors, {summary['warnings']} warnings "
+              f"({os.path.basename(report_path)})")
+    return report
+
+
+@lru_cache(maxsize=4)
+def _report_for(bank_path: str, report_path: str, bank_mtime: float, report_mtime: float) -> Dict[str, Any]:
+    with open(bank_path, 'rb') as f:
+        raw = f.read()
+    digest = file_hash(raw)
+    report = None
+    if report_mtime:
+        with open(report_path, encoding='utf-8') as f:
+            report = json.load(f)
+        if report.get('bankHash') == digest:
+            return report
+    # 보고서가 없거나 은행이 바뀐 뒤 다시 만들지 않음: 바뀐 레벨만 메모리에서 한 번 검사
+    return validate_bank(json.loads(raw), digest, report)
+
+
+def get_bank_report(bank_path: str = BANK_PATH, report_path: str = REPORT_PATH) -> Optional[Dict[str, Any]]:
+    """현재 은행 파일에 맞는 검증 보고서 (은행 파일이 없으면 None)"""
+    try:
+        bank_mtime = os.path.getmtime(bank_path)
+    except OSError:
+        return None
+    try:
+        report_mtime = os.path.getmtime(report_path)
+    except OSError:
+        report_mtime = 0.0
+    return _report_for(bank_path, report_path, bank_mtime, report_mtime)
+
+
+def level_version(level: str, bank_path: str = BANK_PATH) -> Optional[tuple]:
+    """
+    레벨 캐시 키: (내용 해시, 유효 문항 위치) (레벨 이름 대소문자 무관). 은행이나 레벨이 없으면 None.
+    규칙이 바뀌어 유효 문항이 달라져도 키가 바뀝니다.
+    """
+    report = get_bank_report(bank_path)
+    if report is None:
+        return None
+    for key, level_report in report['levels'].items():
+        if key.upper() == level.upper():
+            return level_report.get('hash'), tuple(level_report['valid'])
+    return None
+
+
+def valid_indexes(level_key: str, bank_path: str = BANK_PATH) -> Optional[set]:
+    """시험에 쓸 수 있는 문항 위치 (은행의 레벨 키 그대로). 보고서를 만들 수 없으면 None."""
+    report = get_bank_report(bank_path)
+    if report is None or level_key not in report['levels']:
+        return None
+    return set(report['levels'][level_key]['valid'])
@@ -0,0 +1,171 @@
+"""
+적응형 시험(CAT: Computerized Adaptive Testing)
+
+보정된 문항 모수(item_params.json)가 있는 Pre-A1~B2 전체 문항을 하나의 문항 풀로 보고,
+현재 능력 추정치에서 정보량이 가장 큰 문항을 골라 내다가 표준오차가 목표 이하가 되면 멈춥니다.
+
+- 능력 격자(GRID) 위의 문항 정보량 I(theta) = a^2 P (1 - P)와 로그 정답/오답 확률을 풀을 만들 때
+  한 번만 계산해 둡니다 (격자 x 문항 표). 문항 선택은 추정치에 가장 가까운 격자 행에서 아직 내지 않은
+  문항의 argmax, 능력 갱신은 로그 사후분포에 표의 한 열을 더하는 것이라 단계마다 O(문항 수 + 격자 수)
+  입니다 (1ms 미만, benchmarks/cat_bench.py).
+- 같은 학생들이 매번 같은 문항만 받지 않도록 정보량 상위 RANDOMESQUE개 중 하나를 무작위로 고릅니다.
+- 시작 능력은 학생이 고른 레벨의 기준점(utils/irt.LEVEL_ANCHORS), 종료는 MIN_ITEMS 이상이면서
+  SE <= TARGET_SE 이거나 MAX_ITEMS에 도달했을 때입니다.
+- 문항별 선택 경로(문항, 정오답, 갱신된 theta/SE, 선택 시간)를 path에 기록합니다.
+"""
+
+import os
+import random
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from utils.irt import (BASE_DIR, LEVEL_ANCHORS, LEVEL_NAMES, LEVEL_ORDER, MIN_ITEM_RESPONSES, cefr_from_theta,
+                       get_item_parameters, normalize_level, probability)
+
+GRID = np.linspace(-6.0, 6.0, 241)
+GRID_STEP = GRID[1] - GRID[0]
+
+TARGET_SE = 0.30
+MIN_ITEMS = 8
+MAX_ITEMS = 30
+RANDOMESQUE = 3
+
+
+class ItemPool:
+    """CAT 문항 풀: 문항 목록과 격자별 정보량/로그 확률 표 (격자 x 문항)"""
+
+    def __init__(self, questions: List[Dict[str, Any]], a: np.ndarray, b: np.ndarray):
+        self.questions = questions
+        P = np.clip(probability(GRID, np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)),
+                    1e-9, 1 - 1e-9)
+        # 격자 행 단위로 읽으므로 (격자 x 문항)으로 연속 배치
+        self.info = np.ascontiguousarray((np.asarray(a)[:, None] ** 2 * P * (1 - P)).T)
+        self.log_p = np.ascontiguousarray(np.log(P).T)
+        self.log_q = np.ascontiguousarray(np.log1p(-P).T)
+
+    def __len__(self):
+        return len(self.questions)
+
+    @classmethod
+    def from_parameters(cls, params, banks: Dict[str, List[Dict[str, Any]]]) -> 'ItemPool':
+        """
+        보정된 레벨의 문항 중 응답 수가 충분하고 보정 이후 정답이 바뀌지 않은 문항으로 풀을 만듭니다.
+        banks는 레벨 -> load_questions() 결과이며, 각 문항에 'level'을 붙여 둡니다.
+        """
+        questions, a, b = [], [], []
+        for level, bank in banks.items():
+            calibrated = params.levels.get(normalize_level(level))
+            if not calibrated:
+                continue
+            by_id = {item['id']: item for item in calibrated['items'] if item['n'] >= MIN_ITEM_RESPONSES}
+            for question in bank:
+                item = by_id.get(int(question['id']))
+                if item is None or item['key'] != question['correct']:
+                    continue
+                questions.append(dict(question, level=LEVEL_NAMES[normalize_level(level)]))
+                a.append(item['a'])
+                b.append(item['b'])
+        return cls(questions, np.array(a), np.array(b))
+
+
+class AdaptiveTest:
+    """한 학생의 적응형 시험 진행 상태"""
+
+    def __init__(self, pool: ItemPool, start_level: str = 'A1', target_se: float = TARGET_SE,
+                 min_items: int = MIN_ITEMS, max_items: int = MAX_ITEMS, randomesque: int = RANDOMESQUE,
+                 seed: Optional[int] = None):
+        self.pool = pool
+        self.target_se = target_se
+        self.min_items = min_items
+        self.max_items = min(max_items, len(pool))
+        self.randomesque = randomesque
+        self.rng = random.Random(seed)
+
+        anchor = LEVEL_ANCHORS.get(normalize_level(start_level), 0.0)
+        self.log_posterior = -0.5 * (GRID - anchor) ** 2
+        self.available = np.ones(len(pool), dtype=bool)
+        self.theta, self.se = anchor, 1.0
+        self.current: Optional[int] = None
+        self.path: List[Dict[str, Any]] = []
+        self._select_ms = 0.0
+
+    @property
+    def finished(self) -> bool:
+        answered = len(self.path)
+        return (answered >= self.max_items
+                or (answered >= self.min_items and self.se <= self.target_se)
+                or (self.current is None and not self.available.any()))
+
+    def next_item(self) -> Optional[Dict[str, Any]]:
+        """다음 문항 (이미 뽑아 둔 미응답 문항이 있으면 그 문항). 끝났으면 None."""
+        if self.current is not None:
+            return self.pool.questions[self.current]
+        if self.finished:
+            return None
+
+        started = time.perf_counter()
+        row = int(round((self.theta - GRID[0]) / GRID_STEP))
+        scores = np.where(self.available, self.pool.info[min(max(row, 0), len(GRID) - 1)], -1.0)
+        k = min(self.randomesque, int(self.available.sum()))
+        top = np.argpartition(scores, -k)[-k:] if k < len(scores) else np.arange(len(scores))
+        top = [int(i) for i in top if self.available[i]]
+        self.current = self.rng.choice(top)
+        self.available[self.current] = False
+        self._select_ms = (time.perf_counter() - started) * 1000
+        return self.pool.questions[self.current]
+
+    def answer(self, correct: bool, response: Optional[int] = None):
+        """현재 문항의 정오답을 반영해 theta/SE를 갱신하고 경로에 기록합니다."""
+        if self.current is None:
+            raise ValueError("no item has been selected")
+        index = self.current
+        table = self.pool.log_p if correct else self.pool.log_q
+        self.log_posterior += table[:, index]
+        post = np.exp(self.log_posterior - self.log_posterior.max())
+        post /= post.sum()
+        self.theta = float(post @ GRID)
+        self.se = float(np.sqrt(max(post @ (GRID * GRID) - self.theta ** 2, 0.0)))
+
+        question = self.pool.questions[index]
+        step = {'level': question['level'], 'id': question['id'], 'correct': bool(correct),
+                'theta': round(self.theta, 3), 'se': round(self.se, 3), 'selectMs': round(self._select_ms, 3)}
+        if response is not None:
+            step['response'] = response
+        self.path.append(step)
+        self.current = None
+
+    def result(self) -> Dict[str, Any]:
+        """utils/irt의 능력 추정치와 같은 형식 (+ 종료 사유)"""
+        if len(self.path) >= self.max_items:
+            reason = 'max_items'
+        elif self.se <= self.target_se:
+            reason = 'target_se'
+        else:
+            reason = 'pool_exhausted'
+        return {'theta': round(self.theta, 3), 'se': round(self.se, 3), 'cefr': cefr_from_theta(self.theta),
+                'items': len(self.path), 'model': 'cat', 'stop': reason}
+
+
+@lru_cache(maxsize=2)
+def _build_pool(params, bank_mtime: float) -> ItemPool:
+    from utils.question_bank import load_questions
+    return ItemPool.from_parameters(params, {level: load_questions(LEVEL_NAMES[level]) for level in LEVEL_ORDER})
+
+
+def get_item_pool() -> Optional[ItemPool]:
+    """
+    CAT 문항 풀 (프로세스 단위 캐시, 문항 모수나 문항 은행 파일이 바뀌면 다시 만듦).
+    보정된 문항이 없으면 None.
+    """
+    params = get_item_parameters()
+    if params is None:
+        return None
+    try:
+        bank_mtime = os.path.getmtime(os.path.join(BASE_DIR, 'extracted_questions.json'))
+    except OSError:
+        bank_mtime = 0.0
+    pool = _build_pool(params, bank_mtime)
+    return pool if len(pool) else None
@@ -6,6 +6,8 @@ from typing import Dict, List, Any
 import json
 from datetime import datetime
 
+from utils.metrics import timed
+
 class CEFRAnalyzer:
     def __init__(self):
         self.cefr_descriptions = {
@@ -256,6 +258,7 @@ class CEFRAnalyzer:
             }
         }
 
+    @timed('cefr_analyzer.analyze_test_results')
     def analyze_test_results(self, test_results: Dict[str, Any]) -> Dict[str, Any]:
         """
         테스트 결과를 분석하여 상담용 데이터 생성
@@ -274,7 +277,9 @@ class CEFRAnalyzer:
             'strengths': [],
             'weaknesses': [],
             'recommendations': [],
-            'current_cefr_level': self._determine_cefr_level(level, score),
+            # IRT 능력 추정치가 있으면 그 레벨, 없으면 점수 구간 (utils/irt.py)
+            'current_cefr_level': (test_results.get('ability') or {}).get('cefr')
+                                  or self._determine_cefr_level(level, score),
             'next_level_goal': self._get_next_level_goal(level, score),
             'learning_curriculum': None
         }
@@ -429,6 +434,7 @@ class CEFRAnalyzer:
 
         return priorities
 
+    @timed('cefr_analyzer.generate_counseling_report')
     def generate_counseling_report(self, analysis: Dict[str, Any]) -> str:
         """
         상담용 리포트 생성
@@ -5,8 +5,10 @@ A4 형식의 프린트 가능한 PDF 리포트 생성
 
 from datetime import datetime
 import json
-import pandas as pd
 
+from utils.metrics import timed
+
+@timed('report.generate_student_counseling_report')
 def generate_student_counseling_report(student_info, test_results, analysis, detailed_questions):
     """
     개별 학생 상담용 A4 PDF 리포트 HTML 생성
@@ -92,6 +94,39 @@ def generate_student_counseling_report(student_info, test_results, analysis, det
         performance_grade = '가'
         performance_comment = '기초부터 다시 시작해야 합니다. 학습법 점검이 필요합니다.'
     
+    # 반복되는 표/오답 카드 HTML은 미리 만들어 둠 (f-string 안에 같은 따옴표의 f-string을 중첩하면 Python 3.11 이하에서 SyntaxError)
+    question_rows_html = "".join([f"""
+                    <tr>
+                        <td>{i+1}</td>
+                        <td>{q['question'][:50]}{'...' if len(q['question']) > 50 else ''}</td>
+                        <td><span class="badge badge-{q['section'].lower()}">{q['section']}</span></td>
+                        <td>{['A','B','C','D'][q['correct_answer']] if q['correct_answer'] >= 0 else '-'}</td>
+                        <td>{['A','B','C','D'][q['user_answer']] if q['user_answer'] >= 0 else '-'}</td>
+                        <td class="{'status-correct' if q['is_correct'] else 'status-incorrect'}">
+                            {'O' if q['is_correct'] else 'X'}
+                        </td>
+                    </tr>
+                    """ for i, q in enumerate(question_details[:15])])
+    incorrect_boxes_html = "".join([f"""
+                <div class="analysis-box weakness">
+                    <div class="analysis-title">오답 문항 #{i+1} ({q['section']})</div>
+                    <div class="analysis-content">
+                        <p style="margin-bottom: 5px;"><strong>문제:</strong> {q['question'][:80]}{'...' if len(q['question']) > 80 else ''}</p>
+                        <p style="margin-bottom: 5px;"><strong>학생 답:</strong> {['A','B','C','D'][q['user_answer']] if q['user_answer'] >= 0 else '미응답'}</p>
+                        <p style="margin-bottom: 5px;"><strong>정답:</strong> {['A','B','C','D'][q['correct_answer']] if q['correct_answer'] >= 0 else '-'}</p>
+                        <p style="color: #e74c3c; font-style: italic;">{q['explanation'] if q['explanation'] else '정답을 선택하지 못했습니다.'}</p>
+                    </div>
+                </div>
+                """ for i, q in enumerate(incorrect_questions[:4])])
+    incorrect_section_html = f'''
+        <div class="section">
+            <div class="section-title">❌ 오답 분석 (Incorrect Answers Analysis)</div>
+            <div class="analysis-grid">
+                {incorrect_boxes_html}
+            </div>
+        </div>
+        ''' if incorrect_questions else ''
+
     html_content = f"""<!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -620,42 +655,14 @@ def generate_student_counseling_report(student_info, test_results, analysis, det
                     </tr>
                 </thead>
                 <tbody>
-                    {"".join([f"""
-                    <tr>
-                        <td>{i+1}</td>
-                        <td>{q['question'][:50]}{'...' if len(q['question']) > 50 else ''}</td>
-                        <td><span class="badge badge-{q['section'].lower()}">{q['section']}</span></td>
-                        <td>{['A','B','C','D'][q['correct_answer']] if q['correct_answer'] >= 0 else '-'}</td>
-                        <td>{['A','B','C','D'][q['user_answer']] if q['user_answer'] >= 0 else '-'}</td>
-                        <td class="{'status-correct' if q['is_correct'] else 'status-incorrect'}">
-                            {'O' if q['is_correct'] else 'X'}
-                        </td>
-                    </tr>
-                    """ for i, q in enumerate(question_details[:15])])}
+                    {question_rows_html}
                 </tbody>
             </table>
             
             {f'<p style="margin-top: 10px; text-align: center; color: #7f8c8d;">※ 총 {len(question_details)}문항 중 15문항만 표시 (상세 내용은 별도 파일 참조)</p>' if len(question_details) > 15 else ''}
         </div>
         
-        {f'''
-        <div class="section">
-            <div class="section-title">❌ 오답 분석 (Incorrect Answers Analysis)</div>
-            <div class="analysis-grid">
-                {"".join([f"""
-                <div class="analysis-box weakness">
-                    <div class="analysis-title">오답 문항 #{i+1} ({q['section']})</div>
-                    <div class="analysis-content">
-                        <p style="margin-bottom: 5px;"><strong>문제:</strong> {q['question'][:80]}{'...' if len(q['question']) > 80 else ''}</p>
-                        <p style="margin-bottom: 5px;"><strong>학생 답:</strong> {['A','B','C','D'][q['user_answer']] if q['user_answer'] >= 0 else '미응답'}</p>
-                        <p style="margin-bottom: 5px;"><strong>정답:</strong> {['A','B','C','D'][q['correct_answer']] if q['correct_answer'] >= 0 else '-'}</p>
-                        <p style="color: #e74c3c; font-style: italic;">{q['explanation'] if q['explanation'] else '정답을 선택하지 못했습니다.'}</p>
-                    </div>
-                </div>
-                """ for i, q in enumerate(incorrect_questions[:4])])}
-            </div>
-        </div>
-        ''' if incorrect_questions else ''}
+        {incorrect_section_html}
         
         <div class="section">
             <div class="teacher-comments">
@@ -1,13 +1,140 @@
 
+import logging
 import sqlite3
-import json
 import os
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+
+from utils.metrics import timed, timer
+from utils import json_codec, query_audit
+from utils.payload_codec import compress_payload, decompress_payload
+from utils.records import Submission
+
+logger = logging.getLogger(__name__)
+
+# New rows store the JSON compressed in submission_blob (submission_data left '') when enabled.
+# Reads always handle both forms, so the flag can be flipped at any time.
+COMPRESS_PAYLOADS = os.getenv('CEFR_COMPRESS_PAYLOADS', '0').lower() in ('1', 'true', 'yes', 'on')
+
+LOAD_SUBMISSIONS_SQL = 'SELECT submission_data, submission_blob FROM submissions ORDER BY submitted_at DESC'
+INSERT_SUBMISSION_SQL = '''
+        INSERT INTO submissions (student_name, level, score, total_questions, passed, submitted_at,
+                                 submission_data, submission_blob)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        '''
+
+
+def submission_row(submission_data: Dict[str, Any], compress: bool = False) -> tuple:
+    """Column values for INSERT_SUBMISSION_SQL (payload compressed into submission_blob if requested)."""
+    student_name = submission_data.get('studentInfo', {}).get('name', 'Unknown')
+    level = submission_data.get('level', 'Unknown')
+    score = submission_data.get('score', 0)
+    total = submission_data.get('total', 0)
+    passed = submission_data.get('passed', False)
+
+    # Use existing timestamp or current time
+    submitted_at_str = submission_data.get('submittedAt')
+    if not submitted_at_str:
+        submitted_at = datetime.now()
+    else:
+        try:
+            submitted_at = datetime.fromisoformat(submitted_at_str)
+        except ValueError:
+            submitted_at = datetime.now()
+
+    json_data = json_codec.dumps(submission_data)
+    blob = None
+    if compress:
+        json_data, blob = '', compress_payload(json_data)
+
+    return (student_name, level, score, total, passed, submitted_at, json_data, blob)
+
+
+def decode_payload(submission_data: str, submission_blob: Optional[bytes]) -> Dict[str, Any]:
+    """Decode a stored payload from whichever column holds it."""
+    if submission_blob is not None:
+        return json_codec.decode_submission(decompress_payload(submission_blob))
+    return json_codec.decode_submission(submission_data)
+
+
+# Streaming exports (utils/export_stream.py) read whole tables in chunks of this many rows
+STREAM_CHUNK_ROWS = 1000
+
+# Analytics snapshots (utils/analytics_snapshot.py) read new rows by id range
+MAX_SUBMISSION_ID_SQL = 'SELECT COALESCE(MAX(id), 0) FROM submissions'
+ROWS_BY_ID_SQL = '''
+    SELECT id, submission_data, submission_blob FROM submissions
+    WHERE id > ? AND id <= ? ORDER BY id
+    '''
+
+
+def build_filter_query(level: Optional[str] = None,
+                       start_date: Optional[datetime] = None,
+                       end_date: Optional[datetime] = None,
+                       student_name: Optional[str] = None,
+                       order_by: str = 'submitted_at DESC'):
+    """Build the dynamic SQL used by filter_submissions(). Returns (query, params)."""
+    query = 'SELECT submission_data, submission_blob FROM submissions WHERE 1=1'
+    params = []
+
+    if level:
+        query += ' AND level = ?'
+        params.append(level)
+
+    if student_name:
+        query += ' AND student_name = ?'
+        params.append(student_name)
+
+    if start_date:
+        query += ' AND submitted_at >= ?'
+        params.append(start_date)
+
+    if end_date:
+        query += ' AND submitted_at <= ?'
+        params.append(end_date)
+
+    query += f' ORDER BY {order_by}'
+    return query, params
+
+
+def _register_queries():
+    """Register every statement shape this module issues, for EXPLAIN QUERY PLAN auditing."""
+    sample_date = datetime(2024, 1, 1)
+    query_audit.register_query('submissions.insert', INSERT_SUBMISSION_SQL,
+                               ('student', 'A1', 80, 40, True, sample_date, '{}', None))
+    query_audit.register_query('submissions.load_all', LOAD_SUBMISSIONS_SQL)
+    query_audit.register_query('submissions.delete_all', 'DELETE FROM submissions', allow_scan=True)
+
+    # filter_submissions(): every combination of optional filters
+    for mask in range(16):
+        kwargs = {
+            'level': 'A1' if mask & 1 else None,
+            'student_name': 'student' if mask & 2 else None,
+            'start_date': sample_date if mask & 4 else None,
+            'end_date': sample_date if mask & 8 else None,
+        }
+        used = [k for k, v in kwargs.items() if v is not None]
+        query, params = build_filter_query(**kwargs)
+        query_audit.register_query('submissions.filter[' + ','.join(used or ['none']) + ']', query, params)
+
+    query_audit.register_query('submissions.max_id', MAX_SUBMISSION_ID_SQL)
+    query_audit.register_query('submissions.rows_by_id', ROWS_BY_ID_SQL, (0, 1000))
+
+    # iter_submissions(by_level=True): one ordered pass grouped by level (served by idx_level_submitted_at)
+    query_audit.register_query('submissions.iter_by_level[none]', build_filter_query(order_by='level, submitted_at')[0])
+    query, params = build_filter_query(level='A1', order_by='level, submitted_at')
+    query_audit.register_query('submissions.iter_by_level[level]', query, params)
+
+
+_register_queries()
+
 
 class DatabaseManager:
-    def __init__(self, db_path: str = "data/cefr_test.db"):
+    def __init__(self, db_path: str = "data/cefr_test.db", trace: Optional[bool] = None,
+                 compress: Optional[bool] = None):
         self.db_path = db_path
+        self.trace = trace
+        self.compress = COMPRESS_PAYLOADS if compress is None else compress
         self.ensure_data_dir()
         self.init_db()
 
@@ -33,56 +160,58 @@ class DatabaseManager:
             total_questions INTEGER NOT NULL,
             passed BOOLEAN NOT NULL,
             submitted_at TIMESTAMP NOT NULL,
-            submission_data TEXT NOT NULL
+            submission_data TEXT NOT NULL,
+            submission_blob BLOB,
+            source_file TEXT,
+            content_hash TEXT
         )
         ''')
+
+        # Databases created before payload compression / JSON import lack the newer columns
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(submissions)').fetchall()}
+        if 'submission_blob' not in columns:
+            cursor.execute('ALTER TABLE submissions ADD COLUMN submission_blob BLOB')
+        for column in ('source_file', 'content_hash'):
+            if column not in columns:
+                cursor.execute(f'ALTER TABLE submissions ADD COLUMN {column} TEXT')
         
-        # Create indexes for common queries
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_student_name ON submissions(student_name)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_level ON submissions(level)')
+        # Create indexes for common queries.
+        # Equality filters are paired with submitted_at so ORDER BY submitted_at needs no temp sort
+        # (checked by explain_queries.py); they replace the old single-column indexes.
+        cursor.execute('DROP INDEX IF EXISTS idx_student_name')
+        cursor.execute('DROP INDEX IF EXISTS idx_level')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_student_submitted_at ON submissions(student_name, submitted_at)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_level_submitted_at ON submissions(level, submitted_at)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_submitted_at ON submissions(submitted_at)')
+        # Rows imported by migrate_db.py are unique per source file (path relative to the data root)
+        # and per payload hash
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_source_file ON submissions(source_file) '
+                       'WHERE source_file IS NOT NULL')
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_content_hash ON submissions(content_hash) '
+                       'WHERE content_hash IS NOT NULL')
         
         conn.commit()
         conn.close()
 
     def connect(self):
-        """Create a database connection."""
-        return sqlite3.connect(self.db_path)
+        """Create a database connection (traced when CEFR_SQL_TRACE=1 or trace=True)."""
+        return query_audit.connect(self.db_path, trace=self.trace)
 
+    @timed('db.save_submission')
     def save_submission(self, submission_data: Dict[str, Any]) -> int:
         """
         Save a submission to the database.
-        Returns the new submission ID.
+        Returns the new submission ID. Raises ValueError if it does not match the submission schema.
         """
+        json_codec.validate_submission(submission_data)  # raises ValueError before anything is written
+
         conn = self.connect()
         cursor = conn.cursor()
 
-        # Extract core fields
-        student_name = submission_data.get('studentInfo', {}).get('name', 'Unknown')
-        level = submission_data.get('level', 'Unknown')
-        score = submission_data.get('score', 0)
-        total = submission_data.get('total', 0)
-        passed = submission_data.get('passed', False)
-        
-        # Use existing timestamp or current time
-        submitted_at_str = submission_data.get('submittedAt')
-        if not submitted_at_str:
-            submitted_at = datetime.now()
-        else:
-            try:
-                submitted_at = datetime.fromisoformat(submitted_at_str)
-            except ValueError:
-                submitted_at = datetime.now()
-        
         # Make sure metadata is in the stored JSON
         submission_data['savedAt'] = datetime.now().isoformat()
-        
-        json_data = json.dumps(submission_data, ensure_ascii=False)
 
-        cursor.execute('''
-        INSERT INTO submissions (student_name, level, score, total_questions, passed, submitted_at, submission_data)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (student_name, level, score, total, passed, submitted_at, json_data))
+        cursor.execute(INSERT_SUBMISSION_SQL, submission_row(submission_data, self.compress))
         
         new_id = cursor.lastrowid
         conn.commit()
@@ -90,6 +219,7 @@ class DatabaseManager:
         
         return new_id
 
+    @timed('db.load_submissions')
     def load_submissions(self) -> List[Dict[str, Any]]:
         """
         Load all submissions, returning them as a list of dictionaries (mimicking strict JSON structure).
@@ -98,20 +228,23 @@ class DatabaseManager:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
-        cursor.execute('SELECT submission_data FROM submissions ORDER BY submitted_at DESC')
-        rows = cursor.fetchall()
+        with timer('db.load_submissions.query'):
+            cursor.execute(LOAD_SUBMISSIONS_SQL)
+            rows = cursor.fetchall()
         
         submissions = []
-        for row in rows:
-            try:
-                data = json.loads(row['submission_data'])
-                submissions.append(data)
-            except json.JSONDecodeError as e:
-                print(f"Error decoding JSON for submission: {e}")
+        with timer('db.load_submissions.decode'):
+            for row in rows:
+                try:
+                    data = decode_payload(row['submission_data'], row['submission_blob'])
+                    submissions.append(data)
+                except ValueError as e:
+                    logger.warning("Skipping undecodable submission payload: %s", e)
 
         conn.close()
         return submissions
 
+    @timed('db.filter_submissions')
     def filter_submissions(self,
                           level: Optional[str] = None,
                           start_date: Optional[datetime] = None,
@@ -124,41 +257,109 @@ class DatabaseManager:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
-        query = 'SELECT submission_data FROM submissions WHERE 1=1'
-        params = []
+        query, params = build_filter_query(level, start_date, end_date, student_name)
         
-        if level:
-            query += ' AND level = ?'
-            params.append(level)
-            
-        if student_name:
-            query += ' AND student_name = ?'
-            params.append(student_name)
-            
-        if start_date:
-            query += ' AND submitted_at >= ?'
-            params.append(start_date)
-            
-        if end_date:
-            query += ' AND submitted_at <= ?'
-            params.append(end_date)
-            
-        query += ' ORDER BY submitted_at DESC'
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        with timer('db.filter_submissions.query'):
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
         
         submissions = []
-        for row in rows:
-            try:
-                data = json.loads(row['submission_data'])
-                submissions.append(data)
-            except json.JSONDecodeError:
-                pass
+        with timer('db.filter_submissions.decode'):
+            for row in rows:
+                try:
+                    data = decode_payload(row['submission_data'], row['submission_blob'])
+                    submissions.append(data)
+                except ValueError as e:
+                    logger.warning("Skipping undecodable submission payload: %s", e)
                 
         conn.close()
         return submissions
 
+    def iter_submissions(self,
+                         level: Optional[str] = None,
+                         start_date: Optional[datetime] = None,
+                         end_date: Optional[datetime] = None,
+                         student_name: Optional[str] = None,
+                         by_level: bool = False,
+                         chunk_rows: int = STREAM_CHUNK_ROWS) -> Iterator[Dict[str, Any]]:
+        """
+        Yield filtered submissions one at a time, fetching chunk_rows rows per round trip,
+        so exports of any size keep memory flat. Newest first, or grouped by level
+        (oldest first within a level) when by_level=True.
+        """
+        order_by = 'level, submitted_at' if by_level else 'submitted_at DESC'
+        query, params = build_filter_query(level, start_date, end_date, student_name, order_by)
+
+        conn = self.connect()
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(chunk_rows)
+                if not rows:
+                    break
+                for submission_data, submission_blob in rows:
+                    try:
+                        yield decode_payload(submission_data, submission_blob)
+                    except ValueError as e:
+                        logger.warning("Skipping undecodable submission payload while streaming: %s", e)
+        finally:
+            conn.close()
+
+    def max_submission_id(self) -> int:
+        conn = self.connect()
+        try:
+            return conn.execute(MAX_SUBMISSION_ID_SQL).fetchone()[0]
+        finally:
+            conn.close()
+
+    def iter_rows_by_id(self, after_id: int, upto_id: int,
+                        chunk_rows: int = STREAM_CHUNK_ROWS) -> Iterator[List[tuple]]:
+        """
+        Yield chunks of (id, submission dict) for after_id < id <= upto_id in id order.
+        Ids only grow (AUTOINCREMENT), so this is how incremental consumers pick up new rows.
+        """
+        conn = self.connect()
+        try:
+            cursor = conn.execute(ROWS_BY_ID_SQL, (after_id, upto_id))
+            while True:
+                rows = cursor.fetchmany(chunk_rows)
+                if not rows:
+                    break
+                chunk = []
+                for row_id, submission_data, submission_blob in rows:
+                    try:
+                        chunk.append((row_id, decode_payload(submission_data, submission_blob)))
+                    except ValueError as e:
+                        logger.warning("Skipping undecodable submission %s: %s", row_id, e)
+                yield chunk
+        finally:
+            conn.close()
+
+    def export_snapshot(self, out_dir: str = 'data/snapshots', fmt: str = 'parquet',
+                        full: bool = False) -> Dict[str, Any]:
+        """
+        Write a columnar (Parquet / Arrow IPC) analytics snapshot of submissions, appending
+        only rows added since the previous snapshot unless full=True. See utils/analytics_snapshot.py.
+        """
+        from utils.analytics_snapshot import write_snapshot
+        return write_snapshot(self, out_dir, fmt, full)
+
+    def load_submission_records(self) -> List[Submission]:
+        """
+        load_submissions() as Submission records (attribute access, lower memory per row).
+        Rows are streamed and converted one at a time, so the dict list is never built.
+        """
+        return [Submission.from_dict(data) for data in self.iter_submissions()]
+
+    def filter_submission_records(self,
+                                  level: Optional[str] = None,
+                                  start_date: Optional[datetime] = None,
+                                  end_date: Optional[datetime] = None,
+                                  student_name: Optional[str] = None) -> List[Submission]:
+        """filter_submissions() as Submission records (streamed like load_submission_records())."""
+        return [Submission.from_dict(data)
+                for data in self.iter_submissions(level, start_date, end_date, student_name)]
+
     def get_student_submissions(self, student_name: str) -> List[Dict[str, Any]]:
         return self.filter_submissions(student_name=student_name)
 
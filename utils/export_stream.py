@@ -0,0 +1,220 @@
+"""
+제출 데이터 스트리밍 내보내기 (CSV / NDJSON / XLSX)
+
+제출 데이터를 한 건씩 받아 바로 파일에 기록하므로 전체 목록이나 DataFrame을 만들지 않고,
+50만 건을 내보내도 메모리 사용량이 일정합니다 (benchmarks/export_stream_bench.py).
+
+    from utils.export_stream import export_from_db
+    export_from_db(DatabaseManager(), 'data/exports/results.xlsx', 'xlsx', level='A1')
+
+- 원본은 제출 dict 또는 Submission 레코드의 iterable입니다.
+  DB에서는 DatabaseManager.iter_submissions()가 커서에서 청크 단위로 읽어 공급합니다.
+- XLSX는 xlsxwriter의 constant_memory 모드로 행을 쓰는 즉시 디스크로 내보냅니다.
+  '전체 결과' 시트, 레벨별 시트, '통계 요약' 시트를 한 번의 순회로 만듭니다
+  (DB에서는 레벨 순으로 정렬해 읽음). 통계는 순회하면서 누적합니다.
+- CSV/XLSX의 섹션별 점수 열은 헤더를 먼저 써야 하므로 sections를 넘기지 않으면
+  원본을 한 번 더 읽어 섹션 이름만 모읍니다 (export_from_db).
+
+열 구성은 DataManager.export_to_csv()/export_to_excel()의 기존 파일과 같습니다.
+"""
+
+import csv
+import os
+import re
+import tempfile
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+from utils import json_codec
+from utils.lazy_imports import lazy_import
+from utils.records import Submission
+
+# xlsxwriter는 XLSX 내보내기 시에만 필요하므로 지연 import
+xlsxwriter = lazy_import('xlsxwriter')
+
+FORMATS = ('csv', 'ndjson', 'xlsx')
+
+CSV_COLUMNS = ['이름', '학교', '학년', '반', '레벨', '점수', '합격여부', '제출시간', '정답수', '전체문제수']
+LEVEL_SHEET_COLUMNS = ['Name', 'School', 'Grade', 'Class', 'Level', 'Score', 'Passed',
+                       'Submission Date', 'Correct', 'Total']
+STATS_COLUMNS = ['Category', 'Count', 'Average Score', 'Pass Rate', 'Passed', 'Failed']
+
+_INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+
+SubmissionLike = Union[Submission, Mapping[str, Any]]
+
+
+def _as_record(item: SubmissionLike) -> Submission:
+    return item if isinstance(item, Submission) else Submission.from_dict(item)
+
+
+def _ensure_parent(path: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def collect_sections(submissions: Iterable[SubmissionLike]) -> List[str]:
+    """섹션 이름 (처음 나온 순서)"""
+    seen = {}
+    for item in submissions:
+        results = item.section_results if isinstance(item, Submission) else item.get('sectionResults') or {}
+        for section in results:
+            seen.setdefault(section, None)
+    return list(seen)
+
+
+def csv_row(s: Submission, sections: List[str]) -> List[Any]:
+    """'전체 결과' 행 (export_to_csv()와 같은 열)"""
+    info = s.student_info
+    row = [info.name or '', info.school or '', info.grade or '', info.class_name or '',
+           s.level or '', s.score, '합격' if s.passed else '불합격', s.submitted_at or '',
+           s.correct, s.total]
+    for section in sections:
+        result = s.section_results.get(section)
+        row.append(round(result.correct / (result.total or 1) * 100) if result else '')
+    return row
+
+
+def level_sheet_row(s: Submission) -> List[Any]:
+    info = s.student_info
+    return [info.name or '', info.school or '', info.grade or '', info.class_name or '',
+            s.level or '', s.score, 'Yes' if s.passed else 'No', s.submitted_at or '',
+            s.correct, s.total]
+
+
+def write_csv(submissions: Iterable[SubmissionLike], path: str, sections: List[str]) -> int:
+    """CSV (Excel 호환 utf-8-sig). 기록한 행 수를 반환합니다."""
+    _ensure_parent(path)
+    count = 0
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS + [f'{section}_점수' for section in sections])
+        for item in submissions:
+            writer.writerow(csv_row(_as_record(item), sections))
+            count += 1
+    return count
+
+
+def write_ndjson(submissions: Iterable[SubmissionLike], path: str) -> int:
+    """한 줄에 제출 1건(저장 형식 JSON)"""
+    _ensure_parent(path)
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for item in submissions:
+            data = item.to_dict() if isinstance(item, Submission) else item
+            f.write(json_codec.dumps(data))
+            f.write('\n')
+            count += 1
+    return count
+
+
+class _LevelStats:
+    __slots__ = ('count', 'total_score', 'passed')
+
+    def __init__(self):
+        self.count = 0
+        self.total_score = 0
+        self.passed = 0
+
+    def add(self, s: Submission):
+        self.count += 1
+        self.total_score += s.score
+        self.passed += bool(s.passed)
+
+    def row(self, category: str) -> List[Any]:
+        return [category, self.count, round(self.total_score / self.count),
+                f"{round(self.passed / self.count * 100)}%", self.passed, self.count - self.passed]
+
+
+def _sheet_name(name: str) -> str:
+    return _INVALID_SHEET_CHARS.sub('_', name)[:31]
+
+
+def write_xlsx(submissions: Iterable[SubmissionLike], path: str, sections: List[str]) -> int:
+    """
+    XLSX ('전체 결과' + 레벨별 시트 + '통계 요약'). constant_memory 모드에서는 시트마다
+    행 순서대로만 쓸 수 있으므로 시트별 다음 행 번호를 따로 관리합니다.
+    """
+    _ensure_parent(path)
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    try:
+        all_sheet = workbook.add_worksheet('전체 결과')
+        all_sheet.write_row(0, 0, CSV_COLUMNS + [f'{section}_점수' for section in sections])
+
+        level_sheets: Dict[str, list] = {}  # level -> [worksheet, 다음 행]
+        overall = _LevelStats()
+        by_level: Dict[str, _LevelStats] = {}
+        count = 0
+
+        for item in submissions:
+            s = _as_record(item)
+            count += 1
+            all_sheet.write_row(count, 0, csv_row(s, sections))
+
+            level = s.level or 'Unknown'
+            if s.level:
+                entry = level_sheets.get(level)
+                if entry is None:
+                    sheet = workbook.add_worksheet(_sheet_name(f'{level} 레벨'))
+                    sheet.write_row(0, 0, LEVEL_SHEET_COLUMNS)
+                    entry = level_sheets[level] = [sheet, 1]
+                entry[0].write_row(entry[1], 0, level_sheet_row(s))
+                entry[1] += 1
+
+            overall.add(s)
+            stats = by_level.get(level)
+            if stats is None:
+                stats = by_level[level] = _LevelStats()
+            stats.add(s)
+
+        stats_sheet = workbook.add_worksheet('통계 요약')
+        if count:
+            stats_sheet.write_row(0, 0, STATS_COLUMNS)
+            stats_sheet.write_row(1, 0, overall.row('전체'))
+            for i, (level, stats) in enumerate(by_level.items(), start=2):
+                stats_sheet.write_row(i, 0, stats.row(f"{level} Level"))
+    finally:
+        workbook.close()
+    return count
+
+
+def write_export(submissions: Iterable[SubmissionLike], path: str, fmt: str,
+                 sections: Optional[List[str]] = None) -> int:
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt} (expected one of {', '.join(FORMATS)})")
+    if fmt == 'ndjson':
+        return write_ndjson(submissions, path)
+    writer = write_csv if fmt == 'csv' else write_xlsx
+    return writer(submissions, path, sections or [])
+
+
+def export_from_db(db, path: str, fmt: str, sections: Optional[List[str]] = None,
+                   chunk_rows: Optional[int] = None, **filters) -> int:
+    """
+    DatabaseManager의 제출 데이터를 커서에서 청크 단위로 읽어 바로 내보냅니다.
+    filters는 filter_submissions()와 같습니다 (level, start_date, end_date, student_name).
+    """
+    def source() -> Iterable[Dict[str, Any]]:
+        kwargs = dict(filters)
+        if chunk_rows:
+            kwargs['chunk_rows'] = chunk_rows
+        return db.iter_submissions(by_level=(fmt == 'xlsx'), **kwargs)
+
+    if sections is None and fmt != 'ndjson':
+        sections = collect_sections(source())
+    return write_export(source(), path, fmt, sections)
+
+
+def export_to_bytes(export: Callable[[str], Any], suffix: str) -> bytes:
+    """
+    임시 파일에 내보낸 뒤 내용을 반환합니다 (st.download_button 용).
+    다운로드 데이터 자체는 메모리에 올라가지만, 중간 목록/DataFrame은 만들지 않습니다.
+    """
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    try:
+        export(path)
+        with open(path, 'rb') as f:
+            return f.read()
+    finally:
+        os.remove(path)
@@ -0,0 +1,371 @@
+"""
+문항 분석 (고전검사이론)
+
+저장된 제출의 응답(원래 선택지 순서 기준 responses + questionIds)으로 레벨별·문항별
+통계를 계산합니다.
+
+- p-value(정답률), 문항-나머지 점수 점이연 상관(변별도), 선택지별 선택 비율과
+  선택 학생의 평균 나머지 점수(오답 매력도, 정답 오류 의심), 레벨별 Cronbach's alpha
+- 응답을 (학생 x 문항) 행렬로 만들어 NumPy로 한 번에 집계합니다.
+  같은 시험지(questionIds가 같은 제출)끼리 묶어 행렬을 만들므로 파이썬 반복은 제출 수가 아니라
+  시험지 종류 수만큼입니다.
+- 통계는 모두 합(sum)으로 누적하므로 새 제출만 더하면 됩니다 (ItemAnalysisStore가 DB id로
+  마지막 위치를 기억). 문항 키(정답)가 바뀌었거나 은행 변경 기록(bank_changelog.json)에서 기존 문항이
+  바뀐 레벨만 처음부터 다시 계산합니다.
+
+응답 값: 0~3 = 원래 선택지 번호, -1 = 미응답, (행렬 내부) -2 = 출제되지 않음.
+responses가 없는 이전 제출은 선택지를 섞은 순서를 알 수 없어 건너뜁니다 (skipped).
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from utils.bank_build import CHANGELOG_PATH, changes_since
+
+NOT_ADMINISTERED = -2
+OMITTED = -1
+N_OPTIONS = 4
+
+DEFAULT_STATE_PATH = 'data/item_analysis.json'
+
+# 표시 기준
+MIN_RESPONSES = 30          # 이보다 적게 응답된 문항은 판정하지 않음
+EASY_P = 0.90
+HARD_P = 0.25               # 4지선다 찍기 확률 수준
+LOW_DISCRIMINATION = 0.20
+MISKEY_MIN_SHARE = 0.10     # 정답보다 평균 점수가 높은 오답을 이 비율 이상 골랐으면 정답 오류 의심
+
+_SUM_FIELDS = ('n_admin', 'n_correct', 'sum_t', 'sum_t2', 'sum_xt')
+
+
+def form_matrix(columns: Dict[int, int], question_ids: Sequence[int], rows: Sequence[Sequence[int]]) -> np.ndarray:
+    """
+    같은 시험지의 응답 목록을 (학생 x 문항) 행렬로 만듭니다.
+    columns는 문항 id -> 열 번호이며, 여기에 없는 문항은 버립니다.
+    """
+    known = [(pos, columns[int(q)]) for pos, q in enumerate(question_ids) if int(q) in columns]
+    matrix = np.full((len(rows), len(columns)), NOT_ADMINISTERED, dtype=np.int8)
+    if known and rows:
+        positions, cols = map(list, zip(*known))
+        matrix[:, cols] = np.asarray(rows, dtype=np.int8)[:, positions]
+    return matrix
+
+
+def group_forms(submissions: Iterable[Dict[str, Any]]) -> tuple:
+    """제출을 시험지(questionIds)별로 묶습니다. ({문항 id 튜플: 응답 목록}, responses 없는 제출 수) 반환."""
+    forms: Dict[tuple, List[Sequence[int]]] = {}
+    skipped = 0
+    for submission in submissions:
+        ids, responses = submission.get('questionIds'), submission.get('responses')
+        if not ids or not responses or len(ids) != len(responses):
+            skipped += 1
+            continue
+        forms.setdefault(tuple(ids), []).append(responses)
+    return forms, skipped
+
+
+class ItemAnalysis:
+    """한 레벨의 누적 문항 통계"""
+
+    def __init__(self, level: str, item_ids: Sequence[int], key: Sequence[int], n_options: int = N_OPTIONS):
+        self.level = level
+        self.item_ids = [int(i) for i in item_ids]
+        self.key = np.asarray(key, dtype=np.int8)
+        self.n_options = n_options
+        self.columns = {item_id: col for col, item_id in enumerate(self.item_ids)}
+
+        n = len(self.item_ids)
+        for field in _SUM_FIELDS:
+            setattr(self, field, np.zeros(n))
+        # 열: 선택지 0..n_options-1, 마지막 = 미응답
+        self.option_counts = np.zeros((n, n_options + 1))
+        self.option_sum_t = np.zeros((n, n_options + 1))
+        self.n_students = 0
+        self.total_sum = 0.0
+        self.total_sq = 0.0
+        self.items_sum = 0.0  # 학생별 출제 문항 수의 합 (alpha의 k)
+        self.skipped = 0
+
+    # -- 누적 -------------------------------------------------------------
+
+    def response_matrix(self, question_ids: Sequence[int], rows: Sequence[Sequence[int]]) -> np.ndarray:
+        return form_matrix(self.columns, question_ids, rows)
+
+    def update_matrix(self, R: np.ndarray):
+        """응답 행렬 R (int8, 학생 x 문항)을 누적합에 더합니다."""
+        if not len(R):
+            return
+        administered = R != NOT_ADMINISTERED
+        correct = (R == self.key) & administered
+        A = administered.astype(np.float64)
+        X = correct.astype(np.float64)
+        T = X.sum(axis=1)
+
+        self.n_admin += A.sum(axis=0)
+        self.n_correct += X.sum(axis=0)
+        self.sum_t += T @ A
+        self.sum_t2 += (T * T) @ A
+        self.sum_xt += T @ X
+        for option in range(self.n_options):
+            chosen = (R == option).astype(np.float64)
+            self.option_counts[:, option] += chosen.sum(axis=0)
+            self.option_sum_t[:, option] += T @ chosen
+        omitted = (R == OMITTED).astype(np.float64)
+        self.option_counts[:, -1] += omitted.sum(axis=0)
+        self.option_sum_t[:, -1] += T @ omitted
+
+        self.n_students += len(R)
+        self.total_sum += T.sum()
+        self.total_sq += (T * T).sum()
+        self.items_sum += A.sum()
+
+    def update(self, submissions: Iterable[Dict[str, Any]]) -> int:
+        """제출 dict 목록을 시험지별로 묶어 누적합니다. 반영한 제출 수를 반환합니다."""
+        forms, skipped = group_forms(submissions)
+        self.skipped += skipped
+        added = 0
+        for ids, rows in forms.items():
+            self.update_matrix(self.response_matrix(ids, rows))
+            added += len(rows)
+        return added
+
+    # -- 결과 -------------------------------------------------------------
+
+    def cronbach_alpha(self) -> Optional[float]:
+        """
+        alpha = k/(k-1) * (1 - 문항 분산 합 / 총점 분산). 레벨마다 시험지가 하나라는 가정이며,
+        시험지가 섞여 있으면 k는 학생당 평균 출제 문항 수인 근사값입니다.
+        """
+        if self.n_students < 2:
+            return None
+        k = self.items_sum / self.n_students
+        mean_t = self.total_sum / self.n_students
+        var_t = self.total_sq / self.n_students - mean_t ** 2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            p = np.where(self.n_admin > 0, self.n_correct / self.n_admin, 0.0)
+        item_var = float((p * (1 - p)).sum())
+        if k <= 1 or var_t <= 0:
+            return None
+        return float(k / (k - 1) * (1 - item_var / var_t))
+
+    def item_statistics(self) -> List[Dict[str, Any]]:
+        """문항별 통계와 판정(flags)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n = self.n_admin
+            p = self.n_correct / n
+            # 나머지 점수 R = T - x (x^2 = x 이므로 합에서 바로 계산)
+            mean_r = (self.sum_t - self.n_correct) / n
+            var_r = (self.sum_t2 - 2 * self.sum_xt + self.n_correct) / n - mean_r ** 2
+            cov_xr = (self.sum_xt - self.n_correct) / n - p * mean_r
+            r_pb = cov_xr / np.sqrt(p * (1 - p) * var_r)
+            share = self.option_counts / n[:, None]
+            # 선택지별 평균 나머지 점수 (정답 선택지를 고른 학생은 이 문항 점수 1을 뺌)
+            rest_sum = self.option_sum_t.copy()
+            keyed = (self.key >= 0) & (self.key < self.n_options)
+            rows = np.flatnonzero(keyed)
+            rest_sum[rows, self.key[keyed]] -= self.option_counts[rows, self.key[keyed]]
+            option_mean = rest_sum / self.option_counts
+
+        stats = []
+        for col, item_id in enumerate(self.item_ids):
+            count = int(n[col])
+            key = int(self.key[col])
+            item = {
+                'id': item_id,
+                'n': count,
+                'key': key,
+                'p_value': float(p[col]) if count else None,
+                'point_biserial': float(r_pb[col]) if count and np.isfinite(r_pb[col]) else None,
+                'option_share': [float(v) if count else 0.0 for v in share[col, :self.n_options]],
+                'omit_share': float(share[col, -1]) if count else 0.0,
+                'option_mean_score': [float(v) if np.isfinite(v) else None for v in option_mean[col, :self.n_options]],
+                'flags': [],
+            }
+            if count >= MIN_RESPONSES:
+                item['flags'] = self._flags(item)
+            stats.append(item)
+        return stats
+
+    def _flags(self, item: Dict[str, Any]) -> List[str]:
+        flags = []
+        p, r = item['p_value'], item['point_biserial']
+        if p >= EASY_P:
+            flags.append('too_easy')
+        elif p <= HARD_P:
+            flags.append('too_hard')
+        if r is not None and r < LOW_DISCRIMINATION:
+            flags.append('negative_discrimination' if r < 0 else 'low_discrimination')
+        key_mean = item['option_mean_score'][item['key']] if 0 <= item['key'] < self.n_options else None
+        for option, (share, mean) in enumerate(zip(item['option_share'], item['option_mean_score'])):
+            if (option != item['key'] and share >= MISKEY_MIN_SHARE and mean is not None
+                    and (key_mean is None or mean > key_mean)):
+                flags.append('possible_miskey')
+                break
+        return flags
+
+    def summary(self) -> Dict[str, Any]:
+        mean_t = self.total_sum / self.n_students if self.n_students else None
+        return {
+            'level': self.level,
+            'students': self.n_students,
+            'items': len(self.item_ids),
+            'mean_score': mean_t,
+            'alpha': self.cronbach_alpha(),
+            'skipped': self.skipped,
+        }
+
+    # -- 저장 -------------------------------------------------------------
+
+    def to_state(self) -> Dict[str, Any]:
+        state = {'item_ids': self.item_ids, 'key': self.key.tolist(), 'n_options': self.n_options,
+                 'n_students': self.n_students, 'total_sum': self.total_sum, 'total_sq': self.total_sq,
+                 'items_sum': self.items_sum, 'skipped': self.skipped,
+                 'option_counts': self.option_counts.tolist(), 'option_sum_t': self.option_sum_t.tolist()}
+        for field in _SUM_FIELDS:
+            state[field] = getattr(self, field).tolist()
+        return state
+
+    @classmethod
+    def from_state(cls, level: str, state: Dict[str, Any]) -> 'ItemAnalysis':
+        analysis = cls(level, state['item_ids'], state['key'], state['n_options'])
+        for field in _SUM_FIELDS:
+            setattr(analysis, field, np.asarray(state[field], dtype=np.float64))
+        analysis.option_counts = np.asarray(state['option_counts'], dtype=np.float64)
+        analysis.option_sum_t = np.asarray(state['option_sum_t'], dtype=np.float64)
+        for field in ('n_students', 'total_sum', 'total_sq', 'items_sum', 'skipped'):
+            setattr(analysis, field, state[field])
+        return analysis
+
+    def with_bank(self, item_ids: Sequence[int], key: Sequence[int]) -> Optional['ItemAnalysis']:
+        """
+        문항 은행이 바뀐 경우: 새 문항만 추가되었으면 기존 통계를 옮긴 분석을 반환하고,
+        기존 문항의 정답이 바뀌었거나 문항이 빠졌으면 None (처음부터 다시 계산해야 함).
+        """
+        new_key = dict(zip((int(i) for i in item_ids), (int(k) for k in key)))
+        if any(new_key.get(item_id) != int(k) for item_id, k in zip(self.item_ids, self.key)):
+            return None
+        extended = ItemAnalysis(self.level, item_ids, key, self.n_options)
+        cols = [extended.columns[item_id] for item_id in self.item_ids]
+        for field in _SUM_FIELDS:
+            getattr(extended, field)[cols] = getattr(self, field)
+        extended.option_counts[cols] = self.option_counts
+        extended.option_sum_t[cols] = self.option_sum_t
+        for field in ('n_students', 'total_sum', 'total_sq', 'items_sum', 'skipped'):
+            setattr(extended, field, getattr(self, field))
+        return extended
+
+
+def normalize_level(level: Optional[str]) -> str:
+    return (level or 'Unknown').upper()
+
+
+def load_bank_keys(levels: Iterable[str]) -> Dict[str, tuple]:
+    """문항 은행의 레벨별 (문항 id 목록, 정답 목록)"""
+    from utils.question_bank import load_questions
+
+    banks = {}
+    for level in levels:
+        questions = load_questions(level)
+        banks[normalize_level(level)] = ([q['id'] for q in questions], [q['correct'] for q in questions])
+    return banks
+
+
+class ItemAnalysisStore:
+    """
+    레벨별 ItemAnalysis와 마지막으로 반영한 제출 id를 JSON 파일에 보관합니다.
+    update_from_db()는 그 이후 제출만 DB에서 청크 단위로 읽어 더합니다.
+    """
+
+    def __init__(self, path: str = DEFAULT_STATE_PATH, changelog_path: str = CHANGELOG_PATH):
+        self.path = path
+        self.changelog_path = changelog_path
+        self.last_id = 0
+        self.bank_build = 0
+        self.levels: Dict[str, ItemAnalysis] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                state = json.load(f)
+            self.last_id = state.get('last_id', 0)
+            self.bank_build = state.get('bank_build', 0)
+            self.levels = {level: ItemAnalysis.from_state(level, s) for level, s in state['levels'].items()}
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'last_id': self.last_id, 'bank_build': self.bank_build,
+                       'levels': {level: a.to_state() for level, a in self.levels.items()}}, f)
+        os.replace(tmp_path, self.path)
+
+    def sync_bank(self, banks: Dict[str, tuple], changed: Optional[Dict[str, set]] = None) -> set:
+        """
+        문항 은행과 맞춥니다. 정답이 바뀌었거나 문항이 빠진 레벨, changed(레벨 -> 내용이 바뀐 문항 id)에
+        기존 문항이 들어 있는 레벨, 새 레벨은 빈 통계로 바꾸고 그 레벨 이름을 반환합니다
+        (update_from_db()가 그 레벨의 지난 제출만 다시 읽음). 다른 레벨의 통계는 그대로 둡니다.
+        """
+        changed = changed or {}
+        rebuilt = {}
+        replay = set()
+        for level, (item_ids, key) in banks.items():
+            current = self.levels.get(level)
+            if current is not None and not changed.get(level, set()) & set(current.item_ids):
+                if current.item_ids == [int(i) for i in item_ids] and current.key.tolist() == list(key):
+                    rebuilt[level] = current
+                    continue
+                extended = current.with_bank(item_ids, key)
+                if extended is not None:
+                    rebuilt[level] = extended
+                    continue
+            rebuilt[level] = ItemAnalysis(level, item_ids, key)
+            if self.last_id:
+                replay.add(level)
+        self.levels = rebuilt
+        return replay
+
+    def reset(self):
+        self.last_id = 0
+        self.levels = {}
+
+    def add(self, submissions: Iterable[Dict[str, Any]], levels: Optional[set] = None) -> int:
+        """제출을 레벨별로 반영합니다 (levels를 주면 그 레벨의 제출만)."""
+        by_level: Dict[str, List[Dict[str, Any]]] = {}
+        for submission in submissions:
+            level = normalize_level(submission.get('level'))
+            if levels is None or level in levels:
+                by_level.setdefault(level, []).append(submission)
+        added = 0
+        for level, items in by_level.items():
+            analysis = self.levels.get(level)
+            if analysis is not None:
+                added += analysis.update(items)
+        return added
+
+    def update_from_db(self, db, banks: Optional[Dict[str, tuple]] = None, chunk_rows: int = 20000) -> int:
+        """DB에서 새 제출을 읽어 반영하고 상태를 저장합니다. 반영한 제출 수를 반환합니다."""
+        if banks is None:
+            banks = load_bank_keys(['PRE-A1', 'A1', 'A2', 'B1', 'B2'])
+        build, changed = changes_since(self.bank_build, self.changelog_path)
+        if changed is None:
+            self.reset()  # 변경 기록이 잘려 어떤 문항이 바뀌었는지 모름
+        replay = self.sync_bank(banks, changed)
+        rebuilt = bool(replay) or build != self.bank_build
+        self.bank_build = build
+
+        added = 0
+        if replay:
+            # 다시 계산할 레벨만 지난 제출부터
+            for chunk in db.iter_rows_by_id(0, self.last_id, chunk_rows):
+                added += self.add((data for _, data in chunk), levels=replay)
+        upto_id = db.max_submission_id()
+        for chunk in db.iter_rows_by_id(self.last_id, upto_id, chunk_rows):
+            added += self.add(data for _, data in chunk)
+        if upto_id != self.last_id or added or rebuilt:
+            self.last_id = upto_id
+            if self.path:
+                self.save()
+        return added
@@ -0,0 +1,145 @@
+import json
+import os
+from typing import Any, Dict, List, Optional, Union
+
+try:  # optional: fastest dict decoding
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # optional: typed (validating) decoding into Structs
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# CEFR_JSON_CODEC selects the backend: auto (msgspec > orjson > stdlib), msgspec, orjson or json.
+# All backends produce UTF-8 text equivalent to json.dumps(..., ensure_ascii=False).
+BACKENDS = ('msgspec', 'orjson', 'json')
+
+
+def _available(name: str) -> bool:
+    return {'msgspec': msgspec, 'orjson': orjson}.get(name, json) is not None
+
+
+def _select_backend(name: str) -> str:
+    if name == 'auto':
+        return next(b for b in BACKENDS if _available(b))
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON codec: {name} (expected auto, {', '.join(BACKENDS)})")
+    if not _available(name):
+        raise ImportError(f"JSON codec '{name}' is not installed")
+    return name
+
+
+BACKEND = _select_backend(os.getenv('CEFR_JSON_CODEC', 'auto'))
+
+
+def set_backend(name: str) -> str:
+    """Switch the process-wide backend (used by benchmarks and tests). Returns the backend in use."""
+    global BACKEND
+    BACKEND = _select_backend(name)
+    return BACKEND
+
+
+# ----------------------------------------------------------------------
+# Submission schema (msgspec only)
+# ----------------------------------------------------------------------
+
+if msgspec is not None:
+    class StudentInfo(msgspec.Struct, omit_defaults=True):
+        name: Optional[str] = None  # old rows may carry an empty studentInfo
+        full_name: Optional[str] = None
+        school: Optional[str] = None
+        grade: Union[int, str, None] = None
+        class_: Optional[str] = msgspec.field(default=None, name='class')
+
+    class SectionResult(msgspec.Struct):
+        correct: int
+        total: int
+
+    class Submission(msgspec.Struct, omit_defaults=True, rename='camel'):
+        """
+        Shape written by save_results(), checked by validate_submission() on write and import.
+        Lenient enough for legacy rows (no name, score saved as text); unknown keys are allowed.
+        """
+        student_info: StudentInfo
+        level: str
+        score: Union[int, float, str]
+        submitted_at: Optional[str] = None
+        passed: bool = False
+        correct: int = 0
+        total: int = 0
+        section_results: Dict[str, SectionResult] = {}
+        answers: List[Optional[int]] = []
+        # 문항 분석/IRT용: 문항 id와 원래 선택지 번호 기준 응답 (-1 = 무응답)
+        question_ids: List[int] = []
+        responses: List[int] = []
+        # IRT 능력 추정치 (theta, se, cefr, ...) / 적응형 시험의 방식과 문항 선택 경로
+        ability: Optional[Dict[str, Any]] = None
+        mode: Optional[str] = None
+        cat_path: List[Dict[str, Any]] = []
+        saved_at: Optional[str] = None
+        filename: Optional[str] = None
+
+    _encoder = msgspec.json.Encoder()
+    _decoder = msgspec.json.Decoder()
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON text (non-ASCII characters kept as-is)."""
+    if BACKEND == 'orjson':
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, option=option).decode('utf-8')
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib handles them
+    elif BACKEND == 'msgspec' and not indent:
+        try:
+            return _encoder.encode(obj).decode('utf-8')
+        except (TypeError, msgspec.EncodeError):
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or UTF-8 bytes. Malformed input raises ValueError on every backend."""
+    if BACKEND == 'orjson':
+        return orjson.loads(data)  # orjson.JSONDecodeError subclasses ValueError
+    if BACKEND == 'msgspec':
+        try:
+            return _decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(data)
+
+
+def decode_submission(data: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Decode one stored submission into a dict (the full stored mapping).
+    Only malformed JSON or a non-object payload raises ValueError: reads never apply the
+    schema, so rows that predate it stay readable. Use validate_submission() on write.
+    """
+    result = loads(data)
+    if not isinstance(result, dict):
+        raise ValueError(f"Invalid submission: expected a JSON object, got {type(result).__name__}")
+    return result
+
+
+def validate_submission(submission: Dict[str, Any]):
+    """
+    Raise ValueError if a submission does not match the Submission schema.
+    Checked with msgspec when installed (whatever the backend); otherwise only the required
+    keys and their basic types are checked.
+    """
+    if msgspec is not None:
+        try:
+            msgspec.convert(submission, Submission)
+        except msgspec.ValidationError as e:
+            raise ValueError(f"Invalid submission: {e}") from e
+        return
+    if not isinstance(submission.get('studentInfo'), dict):
+        raise ValueError("Invalid submission: studentInfo must be an object")
+    if not isinstance(submission.get('level'), str):
+        raise ValueError("Invalid submission: level must be a string")
+    if isinstance(submission.get('score'), bool) or not isinstance(submission.get('score'), (int, float, str)):
+        raise ValueError("Invalid submission: score must be a number or string")
@@ -0,0 +1,70 @@
+"""
+무거운 모듈(pandas, plotly 등)의 지연 import 유틸리티
+
+페이지 스크립트는 매 rerun마다 최상단부터 다시 실행되므로, 로그인 화면처럼
+차트나 데이터프레임을 쓰지 않는 경로에서도 pandas/plotly import 비용을 치르게 됩니다.
+lazy_import()가 반환하는 프록시는 첫 속성 접근 시점에 실제 모듈을 import 합니다.
+"""
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """
+    첫 속성 접근 시 실제 모듈을 import 하는 모듈 프록시
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_name'] = name
+        self.__dict__['_lazy_module'] = None
+        self.__dict__['_lazy_lock'] = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            # Streamlit은 세션마다 별도 스레드에서 스크립트를 실행하므로 import를 직렬화
+            with self.__dict__['_lazy_lock']:
+                module = self.__dict__['_lazy_module']
+                if module is None:
+                    module = importlib.import_module(self.__dict__['_lazy_name'])
+                    self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_lazy_module'] is not None else 'not loaded'
+        return f"<lazy module '{self.__dict__['_lazy_name']}' ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    모듈을 지연 import 합니다.
+
+    이미 import 된 모듈이면 실제 모듈을 그대로 반환하고,
+    그렇지 않으면 첫 속성 접근 때 import 하는 LazyModule을 반환합니다.
+
+    Example:
+        pd = lazy_import('pandas')
+        px = lazy_import('plotly.express')
+    """
+    module = sys.modules.get(name)
+    if module is not None and not isinstance(module, LazyModule):
+        return module
+    return LazyModule(name)
+
+
+def is_loaded(module: ModuleType) -> bool:
+    """지연 모듈이 실제로 import 되었는지 확인합니다."""
+    if isinstance(module, LazyModule):
+        return module.__dict__['_lazy_module'] is not None
+    return True
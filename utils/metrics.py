@@ -0,0 +1,214 @@
+"""
+핵심 경로 실행 시간 계측 (프로세스 내 히스토그램 + Prometheus 텍스트 덤프)
+
+    from utils.metrics import timed, timer
+
+    @timed('db.load_submissions')
+    def load_submissions(...): ...
+
+    with timer('db.load_submissions.decode'):
+        ...
+
+계측은 기본적으로 꺼져 있으며 CEFR_METRICS=1 환경 변수나 enable()로 켭니다.
+꺼져 있을 때 timed()는 전역 플래그 하나만 확인하고, timer()는 공유된 빈 컨텍스트를
+반환하므로 추가 비용은 함수 호출 한 번 수준입니다.
+
+CEFR_METRICS_FILE을 지정하면 DUMP_INTERVAL_SECONDS마다 Prometheus 텍스트 형식으로
+파일에 기록합니다 (node_exporter textfile collector 등에서 수집).
+"""
+
+import bisect
+import functools
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# 히스토그램 구간 상한 (초) - Prometheus 기본 버킷에 sub-ms 구간 추가
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+           0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC_NAME = 'cefr_hot_path_duration_seconds'
+DUMP_INTERVAL_SECONDS = 15
+
+_enabled = os.getenv('CEFR_METRICS', '0').lower() in ('1', 'true', 'yes', 'on')
+_dump_path = os.getenv('CEFR_METRICS_FILE')
+_last_dump = 0.0
+_lock = threading.Lock()
+_histograms: Dict[str, 'Histogram'] = {}
+
+
+class Histogram:
+    """고정 버킷 지연 시간 히스토그램 (호출 스레드에서 갱신, 잠금은 모듈 단위)"""
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """버킷 내 선형 보간으로 분위수를 추정합니다 (초)."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= target and bucket_count:
+                # 관측된 최솟값/최댓값으로 구간을 좁혀 보간 (첫/마지막 버킷 오차 감소)
+                lower = max(BUCKETS[i - 1] if i > 0 else 0.0, self.min)
+                upper = min(BUCKETS[i] if i < len(BUCKETS) else self.max, self.max)
+                return lower + (upper - lower) * (target - seen) / bucket_count
+            seen += bucket_count
+        return self.max
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def enable(dump_path: Optional[str] = None):
+    global _enabled, _dump_path
+    _enabled = True
+    if dump_path:
+        _dump_path = dump_path
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+def observe(name: str, seconds: float):
+    global _last_dump
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+    if _dump_path:
+        now = time.monotonic()
+        if now - _last_dump >= DUMP_INTERVAL_SECONDS:
+            _last_dump = now
+            try:
+                dump_prometheus(_dump_path)
+            except OSError as e:
+                print(f"Metrics dump error: {e}")
+
+
+class _Timer:
+    __slots__ = ('name', 'started')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(name: str):
+    """with 블록의 실행 시간을 name 히스토그램에 기록합니다 (꺼져 있으면 아무것도 하지 않음)."""
+    return _Timer(name) if _enabled else _NULL_TIMER
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """함수 실행 시간을 기록하는 데코레이터 (이름 생략 시 모듈.함수명)"""
+    def decorator(func: Callable) -> Callable:
+        metric = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(metric, time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def snapshot() -> List[Dict[str, Any]]:
+    """이름순 요약 (초 단위): count, total, mean, p50, p95, p99, max"""
+    with _lock:
+        items = sorted(_histograms.items())
+        rows = []
+        for name, h in items:
+            rows.append({
+                'name': name,
+                'count': h.count,
+                'total': h.total,
+                'mean': h.total / h.count if h.count else 0.0,
+                'p50': h.quantile(0.50),
+                'p95': h.quantile(0.95),
+                'p99': h.quantile(0.99),
+                'max': h.max,
+            })
+    return rows
+
+
+def render_prometheus() -> str:
+    """Prometheus 텍스트 노출 형식으로 변환합니다."""
+    lines = [
+        f"# HELP {METRIC_NAME} Wall-clock duration of instrumented hot paths.",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    with _lock:
+        for name, h in sorted(_histograms.items()):
+            label = name.replace('\\', '\\\\').replace('"', '\\"')
+            cumulative = 0
+            for upper, bucket_count in zip(BUCKETS + ('+Inf',), h.counts):
+                cumulative += bucket_count
+                le = upper if isinstance(upper, str) else repr(upper)
+                lines.append(f'{METRIC_NAME}_bucket{{name="{label}",le="{le}"}} {cumulative}')
+            lines.append(f'{METRIC_NAME}_sum{{name="{label}"}} {h.total:.9f}')
+            lines.append(f'{METRIC_NAME}_count{{name="{label}"}} {h.count}')
+    return '\n'.join(lines) + '\n'
+
+
+def dump_prometheus(path: str) -> str:
+    """Prometheus 텍스트를 파일에 원자적으로 기록합니다 (수집기가 반쯤 쓴 파일을 읽지 않도록)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
+    return path
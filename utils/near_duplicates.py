@@ -0,0 +1,201 @@
+"""
+근접 중복 문항 탐지 (MinHash + LSH)
+
+모든 레벨의 문항을 "질문 + 선택지" 텍스트로 보고, 글자 SHINGLE-gram 집합의 Jaccard 유사도가
+threshold 이상인 문항끼리 묶습니다. 이주한 문항(migrate_a2_questions.py)이나 하드코딩 예비 문항이
+레벨을 넘어 다시 들어온 경우를 찾기 위한 도구입니다 (python find_duplicates.py).
+
+- 전체 문항 텍스트를 한 배열로 이어 붙여 shingle 해시와 NUM_PERM개의 MinHash 값을 NumPy로 한꺼번에
+  계산합니다 (곱셈-시프트 해시 -> minimum.reduceat). 두 서명에서 같은 값의 비율이 Jaccard 유사도의
+  추정치이므로, 유사한 문항일수록 띠(서명 조각)가 통째로 같을 확률이 높습니다.
+- 서명을 BANDS개 띠로 나눠 띠 값이 같은 문항만 후보로 삼고(띠마다 정렬 한 번), 같은 버킷의 첫 문항과의
+  실제 Jaccard 유사도를 확인해 union-find로 묶으므로 전체 쌍 비교 없이 문항 수에 선형입니다
+  (5만 문항 약 4초, benchmarks/near_duplicates_bench.py).
+- 한 문항 안의 중복 선택지는 문항별로 따로 확인합니다 (utils/bank_validation.repeated_options).
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.bank_validation import option_text, question_text, repeated_options
+
+SHINGLE = 5
+NUM_PERM = 64
+BANDS = 16              # 16띠 x 4행: 유사도 약 0.5부터 후보가 됨
+THRESHOLD = 0.8
+
+_NON_WORD = re.compile(r'[^0-9a-z가-힣]+')
+
+
+def item_text(question: Dict[str, Any]) -> str:
+    """비교용 문항 텍스트 (질문 + 선택지, 소문자, 문장부호 제거)"""
+    options = question.get('options') if isinstance(question.get('options'), list) else []
+    text = ' '.join([question_text(question).lower()] + [option_text(option) for option in options])
+    return _NON_WORD.sub(' ', text).strip()
+
+
+def shingle_hashes(texts: List[str], size: int = SHINGLE) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    모든 텍스트의 글자 size-gram 해시를 한 배열로 (텍스트 순서대로 이어 붙임)와 텍스트별 gram 수.
+    텍스트 전체를 UTF-32 코드 배열 하나로 만들어 gram마다 다항식 해시를 벡터 연산으로 계산합니다.
+    size보다 짧은 텍스트는 공백을 채워 gram 하나, 빈 텍스트는 0개입니다.
+    같은 gram이 여러 번 나와도 MinHash(최솟값)에는 영향이 없으므로 중복은 제거하지 않습니다.
+    """
+    texts = [text.ljust(size) if text else '' for text in texts]
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    counts = np.maximum(lengths - size + 1, 0)
+    codes = np.frombuffer(''.join(texts).encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    if len(codes) < size:
+        return np.empty(0, dtype=np.uint64), counts
+
+    n_grams = len(codes) - size + 1
+    hashes = np.zeros(n_grams, dtype=np.uint64)
+    multiplier = np.uint64(0x100000001B3)
+    with np.errstate(over='ignore'):
+        for offset in range(size):
+            hashes = hashes * multiplier + codes[offset:offset + n_grams]
+    # 텍스트 경계를 넘는 gram 제외
+    ends = np.repeat(np.cumsum(lengths), lengths)[:n_grams]
+    return hashes[np.arange(n_grams) + size <= ends], counts
+
+
+def minhash_signatures(hashes: np.ndarray, counts: np.ndarray, num_perm: int = NUM_PERM,
+                       seed: int = 1) -> np.ndarray:
+    """
+    문서 x num_perm MinHash 서명 (uint32). hashes/counts는 shingle_hashes()의 결과입니다.
+    해시 함수는 h(x) = (a*x + b) >> 32 (a 홀수, 2^64 나머지). gram이 없는 문서의 행은 모두 0xFFFFFFFF입니다.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2 ** 63, num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+
+    signatures = np.full((len(counts), num_perm), 0xFFFFFFFF, dtype=np.uint32)
+    present = counts > 0
+    if not present.any():
+        return signatures
+    # gram이 없는 문서는 길이 0이라 건너뛰어도 나머지 문서의 시작 위치는 그대로
+    starts = (np.cumsum(counts) - counts)[present]
+    shift = np.uint64(32)
+    with np.errstate(over='ignore'):
+        for j in range(num_perm):
+            signatures[present, j] = np.minimum.reduceat((hashes * a[j] + b[j]) >> shift, starts)
+    return signatures
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def lsh_candidates(signatures: np.ndarray, bands: int = BANDS, skip: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    띠 하나라도 값이 모두 같은 문서 쌍 [(버킷의 첫 문서, 문서), ...] (중복 제거, k x 2 배열).
+    버킷마다 첫 문서와의 쌍만 만들므로 쌍 수는 문서 수 x 띠 수 이하입니다. skip이 True인 문서는 제외합니다.
+    """
+    n, num_perm = signatures.shape
+    rows = num_perm // bands
+    candidates = np.flatnonzero(np.ones(n, dtype=bool) if skip is None else ~skip)
+    if len(candidates) < 2 or rows == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    mixers = np.random.default_rng(7).integers(1, 2 ** 63, rows, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+    reps, members = [], []
+    with np.errstate(over='ignore'):
+        for band in range(bands):
+            keys = (signatures[candidates, band * rows:(band + 1) * rows].astype(np.uint64) * mixers).sum(axis=1)
+            order = np.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            new_run = np.empty(len(order), dtype=bool)
+            new_run[0] = True
+            new_run[1:] = sorted_keys[1:] != sorted_keys[:-1]
+            run_start = np.maximum.accumulate(np.where(new_run, np.arange(len(order)), 0))
+            same = ~new_run
+            reps.append(candidates[order[run_start[same]]])
+            members.append(candidates[order[same]])
+    return np.unique(np.stack([np.concatenate(reps), np.concatenate(members)], axis=1), axis=0)
+
+
+def jaccard(hashes: np.ndarray, counts: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+    """후보 쌍마다 shingle 해시 집합의 실제 Jaccard 유사도"""
+    starts = np.cumsum(counts) - counts
+    cache: Dict[int, np.ndarray] = {}
+
+    def grams(i):
+        if i not in cache:
+            cache[i] = np.unique(hashes[starts[i]:starts[i] + counts[i]])
+        return cache[i]
+
+    scores = np.empty(len(pairs))
+    for k, (i, j) in enumerate(pairs.tolist()):
+        a, b = grams(i), grams(j)
+        shared = len(np.intersect1d(a, b, assume_unique=True))
+        scores[k] = shared / (len(a) + len(b) - shared)
+    return scores
+
+
+def _find(parent: Dict[int, int], i: int) -> int:
+    while parent.setdefault(i, i) != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_pairs(pairs: np.ndarray, scores: np.ndarray, threshold: float = THRESHOLD) -> List[Tuple[List[int], float]]:
+    """
+    유사도가 threshold 이상인 쌍을 union-find로 묶습니다.
+    [(문서 위치 목록, 묶음을 이은 쌍 중 최소 유사도), ...] (첫 문서 위치 순)
+    """
+    parent: Dict[int, int] = {}
+    for i, j in pairs[scores >= threshold].tolist():
+        root_i, root_j = _find(parent, i), _find(parent, j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    groups: Dict[int, List[int]] = {}
+    for i in parent:
+        groups.setdefault(_find(parent, i), []).append(i)
+    lowest: Dict[int, float] = {}
+    for (i, _), score in zip(pairs.tolist(), scores.tolist()):
+        if score >= threshold:
+            root = _find(parent, i)
+            lowest[root] = min(lowest.get(root, 1.0), score)
+    return [(sorted(groups[root]), lowest[root]) for root in sorted(groups)]
+
+
+def find_duplicates(items: List[Tuple[str, Dict[str, Any]]], threshold: float = THRESHOLD,
+                    num_perm: int = NUM_PERM, bands: int = BANDS) -> Dict[str, Any]:
+    """
+    items: [(레벨, 문항), ...]. 근접 중복 묶음과 문항 안의 중복 선택지를 반환합니다.
+    """
+    hashes, counts = shingle_hashes([item_text(question) for _, question in items])
+    signatures = minhash_signatures(hashes, counts, num_perm)
+    pairs = lsh_candidates(signatures, bands, skip=counts == 0)
+
+    def describe(index):
+        level, question = items[index]
+        return {'level': level, 'id': question.get('id'), 'question': question_text(question)}
+
+    clusters = [{'similarity': round(score, 3), 'items': [describe(i) for i in indexes]}
+                for indexes, score in cluster_pairs(pairs, jaccard(hashes, counts, pairs), threshold)]
+    duplicate_options = []
+    for level, question in items:
+        options = question.get('options')
+        repeated = repeated_options(options) if isinstance(options, list) else []
+        if repeated:
+            duplicate_options.append({'level': level, 'id': question.get('id'), 'options': repeated})
+
+    return {
+        'items': len(items),
+        'threshold': threshold,
+        'clusters': clusters,
+        'duplicateOptions': duplicate_options,
+    }
+
+
+def bank_items(data: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """문항 은행(JSON)의 모든 레벨 문항을 [(레벨, 문항), ...]으로 펼칩니다."""
+    return [(level, question) for level, questions in data.items() if isinstance(questions, list)
+            for question in questions if isinstance(question, dict)]
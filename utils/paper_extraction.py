@@ -0,0 +1,180 @@
+"""
+HTML 시험지 문항 추출 파이프라인
+
+기존 HTML 버전의 학생용 시험지(CEFR_<레벨>_English_Level_Test_Student.html)와 정답 파일(js/answer-data.js)에서
+문항/선택지/섹션/지문/정답을 뽑아 문항 은행(extracted_questions.json) 형식으로 만듭니다 (python build_bank.py).
+
+- 정규식은 모두 모듈을 불러올 때 한 번만 컴파일합니다.
+- 문서는 섹션 시작/섹션 제목/지문/문항을 한꺼번에 찾는 정규식 하나로 앞에서부터 한 번만 훑으며, 현재 섹션과
+  마지막 지문을 들고 다닙니다. 이전 스크립트처럼 문항마다 문서 앞부분 전체를 다시 검색하지 않으므로 문항 수와
+  무관하게 문서 길이에 선형입니다.
+- 정답 파일은 한 번만 읽고, 시험지 여러 장은 프로세스 풀로 나눠 처리합니다 (extract_papers).
+- 지문은 같은 섹션 안에서 문항 앞에 나온 마지막 지문입니다 (섹션이 바뀌면 초기화).
+
+lxml/BeautifulSoup 없이 표준 라이브러리만 사용합니다 (requirements.txt에 없는 의존성을 추가하지 않음).
+"""
+
+import glob
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+PAPER_GLOB = 'CEFR_*_English_Level_Test_Student*.html'
+ANSWER_KEY_PATH = os.path.join('js', 'answer-data.js')
+
+SECTION_KEYWORDS = ['Reading', 'Vocabulary', 'Conversation', 'Grammar', 'Writing']
+
+_PAPER_NAME = re.compile(r'CEFR_(?P<level>.+?)_English_Level_Test_Student(?P<form>[^.]*)\.html$')
+_TOKENS = re.compile(
+    r'(?P<section_start><section\b)'
+    r'|<div class="section-header">.*?<h2[^>]*>(?P<heading>.*?)</h2>'
+    r'|<div class="passage">.*?<span class="passage-label">(?P<label>[^<]+)</span>(?P<passage>.*?)</div>'
+    r'|<div class="question">[^<]*<span class="question-number">(?P<number>\d+)</span>(?P<body>.*?)</div>'
+    r'\s*(?=</div>|<div class="question">|</section>)',
+    re.DOTALL)
+_QUESTION_TEXT = re.compile(r'<span class="question-text">(.*?)</span>', re.DOTALL)
+_OPTION = re.compile(r'<input[^>]*\bvalue="([A-D])"[^>]*>.*?<span[^>]*>([^<]+)</span>', re.DOTALL)
+_OPTION_LABEL = re.compile(r'^[A-D]\)\s*')
+_TAG = re.compile(r'<[^>]+>')
+_ANSWER = re.compile(r"'Q(\d+)':\s*'([A-D])'")
+
+
+def paper_level(path: str) -> Optional[str]:
+    """파일 이름에서 은행 레벨 키 (CEFR_A1_..._Student.html -> 'A1', ..._Student_form2.html -> 'A1_form2')"""
+    match = _PAPER_NAME.search(os.path.basename(path))
+    if not match:
+        return None
+    return match.group('level') + match.group('form')
+
+
+def paper_base_level(path: str) -> Optional[str]:
+    """정답 파일에서 찾을 기본 레벨 이름 (대문자, ..._Student_form2.html도 'A1')"""
+    match = _PAPER_NAME.search(os.path.basename(path))
+    return match.group('level').upper() if match else None
+
+
+def find_papers(source_dir: str) -> List[str]:
+    return sorted(path for path in glob.glob(os.path.join(source_dir, PAPER_GLOB)) if paper_level(path))
+
+
+def section_name(heading: str, body: str = '') -> str:
+    """섹션 제목(없으면 문항 앞부분)의 키워드로 섹션 이름 결정"""
+    for keyword in SECTION_KEYWORDS:
+        if keyword in heading:
+            return keyword
+    text = body[:500]
+    lower = text.lower()
+    if "Read the" in text or "passage" in lower:
+        return "Reading"
+    if "mean" in text or "word" in lower:
+        return "Vocabulary"
+    if "conversation" in lower:
+        return "Conversation"
+    if "verb" in lower or "tense" in lower:
+        return "Grammar"
+    if "write" in lower:
+        return "Writing"
+    return "General"
+
+
+def parse_paper(content: str, answers: Optional[Dict[int, str]] = None) -> List[Dict[str, Any]]:
+    """시험지 HTML 하나에서 문항 목록 (선택지가 4개인 문항만, answers는 문항 번호 -> 'A'~'D')"""
+    answers = answers or {}
+    questions = []
+    heading = ''
+    passage = None
+    for match in _TOKENS.finditer(content):
+        if match.group('section_start') is not None:
+            heading, passage = '', None
+        elif match.group('heading') is not None:
+            heading = _TAG.sub('', match.group('heading')).strip()
+        elif match.group('label') is not None:
+            passage = _TAG.sub(' ', match.group('passage')).strip()
+        elif match.group('number') is not None:
+            number = int(match.group('number'))
+            body = match.group('body')
+            text_match = _QUESTION_TEXT.search(body)
+            options = [_OPTION_LABEL.sub('', text).strip() for _, text in _OPTION.findall(body)]
+            if len(options) != 4:
+                continue
+            question = {
+                'id': number,
+                'question': _TAG.sub('', text_match.group(1)).strip() if text_match else f"Question {number}",
+                'options': options,
+                'correct': ord(answers[number]) - ord('A') if number in answers else 0,
+                'section': section_name(heading, body),
+            }
+            if passage:
+                question['passage'] = passage
+            questions.append(question)
+    return questions
+
+
+def load_answer_keys(path: str, levels: List[str]) -> Dict[str, Dict[int, str]]:
+    """answer-data.js를 한 번 읽어 레벨별 정답 (문항 번호 -> 'A'~'D'). 파일이 없으면 빈 dict."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+    except OSError:
+        return {}
+    keys = {}
+    for level in levels:
+        match = re.search(rf"'{re.escape(level)}':.*?answers:\s*\{{([^}}]*)\}}", content, re.DOTALL)
+        if match:
+            keys[level] = {int(number): answer for number, answer in _ANSWER.findall(match.group(1))}
+    return keys
+
+
+def extract_paper(path: str, answers: Optional[Dict[int, str]] = None) -> Tuple[str, List[Dict[str, Any]], float]:
+    """(파일 경로, 문항 목록, 파싱 시간(초)). 프로세스 풀 작업 단위."""
+    started = time.perf_counter()
+    with open(path, encoding='utf-8') as f:
+        content = f.read()
+    return path, parse_paper(content, answers), time.perf_counter() - started
+
+
+def extract_papers(paths: List[str], answer_key_path: Optional[str] = None, workers: Optional[int] = None,
+                   answer_keys: Optional[Dict[str, Dict[int, str]]] = None) -> Dict[str, Any]:
+    """
+    시험지 여러 장을 추출합니다. workers가 1이면 현재 프로세스에서, 아니면 프로세스 풀에서 처리합니다.
+    answer_keys(load_answer_keys() 결과)를 주면 정답 파일을 다시 읽지 않습니다.
+    반환: {'levels': 레벨 키 -> 문항 목록, 'papers': [{path, level, questions, passages, seconds}], 'seconds': 전체 시간}
+    같은 레벨 키의 시험지가 여럿이면 경로 순서로 이어 붙입니다.
+    """
+    started = time.perf_counter()
+    # 정답 파일은 기본 레벨 이름으로 찾음 (..._Student_form2.html도 그 레벨의 정답 사용)
+    bases = [paper_base_level(path) for path in paths]
+    keys = answer_keys
+    if keys is None:
+        keys = load_answer_keys(answer_key_path, sorted({base for base in bases if base})) if answer_key_path else {}
+    jobs = [(path, keys.get(base, {})) for path, base in zip(paths, bases) if base]
+
+    workers = workers or min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1 or len(jobs) <= 1:
+        results = [extract_paper(path, answers) for path, answers in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(extract_paper, *zip(*jobs), chunksize=max(1, len(jobs) // (workers * 4))))
+
+    extracted: Dict[str, List[Dict[str, Any]]] = {}
+    papers = []
+    for path, questions, seconds in results:
+        level = paper_level(path)
+        extracted.setdefault(level, []).extend(questions)
+        papers.append({'path': path, 'level': level, 'questions': len(questions),
+                       'passages': sum(1 for question in questions if 'passage' in question), 'seconds': seconds})
+    return {'levels': extracted, 'papers': papers, 'seconds': time.perf_counter() - started}
+
+
+def merge_levels(bank: Dict[str, Any], extracted: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    추출한 레벨을 기존 은행에 반영합니다. 같은 레벨 키(대소문자 무관)는 통째로 바꾸고,
+    추출하지 않은 레벨은 그대로 두며, 새 레벨은 뒤에 붙입니다.
+    """
+    existing = {key.upper(): key for key in bank}
+    merged = dict(bank)
+    for level, questions in extracted.items():
+        merged[existing.get(level.upper(), level)] = questions
+    return merged
@@ -0,0 +1,111 @@
+"""
+지문 테이블
+
+읽기 지문은 문항마다 복사해 두지 않고 문항 은행(extracted_questions.json)의 'passages' 항목에 한 번만
+저장합니다 (지문 id -> 본문). 문항에는 'passage_id'만 들어 있고, 시험 세션/자동 저장/브라우저로 보내는
+문항 데이터도 id만 들고 다니다가 화면에 그릴 때 get_passage()로 본문을 찾습니다.
+
+- 지문 id는 본문 해시라 같은 지문은 레벨이 달라도 한 번만 저장되고, 다시 추출해도 id가 바뀌지 않습니다.
+- 은행을 고치는 스크립트는 문항에 'passage' 본문을 넣은 뒤 저장 전에 dedupe_passages()를 부르면 됩니다
+  (본문을 테이블로 옮기고, 어느 문항도 쓰지 않는 지문은 지웁니다).
+- 'passages'는 레벨이 아니므로 은행의 레벨을 돌 때는 bank_levels()를 씁니다.
+"""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BANK_PATH = os.path.join(BASE_DIR, 'extracted_questions.json')
+PASSAGES_KEY = 'passages'
+
+# 은행 밖에서 정의된 지문 (로더의 비상용 지문 등) - 프로세스 단위
+_registered: Dict[str, str] = {}
+
+
+def passage_id(text: str) -> str:
+    return 'p' + hashlib.sha256(text.strip().encode('utf-8')).hexdigest()[:12]
+
+
+def bank_levels(data: Dict[str, Any]) -> List[Tuple[str, Any]]:
+    """은행의 (레벨 키, 문항 목록) 목록 ('passages' 제외)"""
+    return [(level, questions) for level, questions in data.items() if level != PASSAGES_KEY]
+
+
+def split_passages(questions: List[Any], table: Dict[str, str]) -> List[Any]:
+    """문항의 'passage' 본문을 table로 옮기고 그 자리에 'passage_id'를 넣은 문항 사본 목록"""
+    result = []
+    for question in questions:
+        text = question.get('passage') if isinstance(question, dict) else None
+        if not isinstance(text, str) or not text.strip():
+            result.append(question)
+            continue
+        pid = passage_id(text)
+        table[pid] = text
+        item = {}
+        for key, value in question.items():
+            if key == 'passage':
+                item['passage_id'] = pid  # 같은 자리에 (JSON diff가 작도록)
+            elif key != 'passage_id':
+                item[key] = value
+        result.append(item)
+    return result
+
+
+def dedupe_passages(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    은행 전체 정리: 문항에 남아 있는 지문 본문을 테이블로 옮기고, 쓰이지 않는 지문은 지웁니다.
+    테이블은 레벨 뒤, 처음 쓰인 순서로 둡니다.
+    """
+    table = dict(data.get(PASSAGES_KEY) or {})
+    result: Dict[str, Any] = {}
+    used = []
+    for level, questions in bank_levels(data):
+        if isinstance(questions, list):
+            questions = split_passages(questions, table)
+            used.extend(q['passage_id'] for q in questions if isinstance(q, dict) and q.get('passage_id'))
+        result[level] = questions
+    result[PASSAGES_KEY] = {pid: table[pid] for pid in dict.fromkeys(used) if pid in table}
+    return result
+
+
+def register_passage(text: str) -> str:
+    """은행에 없는 지문을 등록하고 id를 반환합니다 (get_passage()로 찾을 수 있음)."""
+    pid = passage_id(text)
+    _registered[pid] = text
+    return pid
+
+
+@lru_cache(maxsize=4)
+def _passages_for(bank_path: str, bank_mtime: float) -> Dict[str, str]:
+    with open(bank_path, encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get(PASSAGES_KEY) or {}
+
+
+def load_passages(bank_path: str = BANK_PATH) -> Dict[str, str]:
+    """은행의 지문 테이블 (파일 mtime 기준 캐시, 수정하지 말 것)"""
+    try:
+        return _passages_for(bank_path, os.path.getmtime(bank_path))
+    except (OSError, ValueError):
+        return {}
+
+
+def get_passage(pid: Optional[str], bank_path: str = BANK_PATH) -> Optional[str]:
+    if not pid:
+        return None
+    return load_passages(bank_path).get(pid) or _registered.get(pid)
+
+
+def passage_text(question: Dict[str, Any], passages: Optional[Dict[str, str]] = None) -> str:
+    """
+    문항의 지문 본문 (없으면 ''). passages를 주면 그 테이블에서, 아니면 현재 은행에서 찾습니다.
+    예전 형식(문항에 'passage' 본문)도 그대로 읽습니다.
+    """
+    pid = question.get('passage_id')
+    if pid:
+        text = passages.get(pid) if passages is not None else get_passage(pid)
+        return text or _registered.get(pid) or ''
+    return question.get('passage') or ''
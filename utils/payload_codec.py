@@ -0,0 +1,206 @@
+import os
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+try:  # optional: zstd with a trained dictionary compresses small JSON documents best
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Blob format: 1 tag byte + dictionary version + compressed bytes.
+#   b'z' + 1 byte zlib dictionary version (ZLIB_DICTIONARIES)
+#   b'S' + 4 byte big-endian zstd dict id (full id, so dictionaries can never be confused)
+#   b's' + 1 byte (dict id & 0xFF) - zstd blobs written before the versioned store, read only
+TAG_ZLIB = b'z'
+TAG_ZSTD = b'S'
+TAG_ZSTD_LEGACY = b's'
+
+# zlib preset dictionary (version 1) built from the submission JSON shape saved by
+# save_results(): key names, section names and common values. zlib favours matches
+# near the end of the dictionary, so the most frequent fragments come last.
+# Never edit in place - existing blobs need the exact bytes; add a new version instead.
+ZLIB_DICTIONARIES = {
+    1: (
+        '"Conversation": {"correct": , "total": }, "Writing": {"correct": , "total": }, '
+        '"General": {"correct": , "total": }, "Listening": {"correct": , "total": }, '
+        '"school": "Default School", "grade": "1", "class": "A", "full_name": "", '
+        '"penalty_deduction": 0, "savedAt": "2025-01-01T00:00:00.000000", '
+        '"level": "Pre-A1", "level": "A1", "level": "A2", "level": "B1", "level": "B2", '
+        '"passed": false, "passed": true, "correct": , "total": , "score": , '
+        '"sectionResults": {"Reading": {"correct": , "total": }, "Grammar": {"correct": , "total": }, '
+        '"Vocabulary": {"correct": , "total": }}, "answers": [0, 1, 2, 3, -1, 0, 1, 2, 3], '
+        '{"studentInfo": {"name": "", "school": "", "grade": "", "class": ""}, '
+        '"submittedAt": "2025-01-01T00:00:00.000000", "score": '
+    ).encode('utf-8'),
+}
+# Version 2 appends the compact-separator form of v1 so both stdlib output (", " / ": ")
+# and orjson/msgspec output ("," / ":") find matches (see utils/json_codec.py).
+ZLIB_DICTIONARIES[2] = ZLIB_DICTIONARIES[1] + ZLIB_DICTIONARIES[1].replace(b'": ', b'":').replace(b', ', b',')
+CURRENT_ZLIB_DICTIONARY = 2
+ZLIB_LEVEL = 6
+
+# Trained zstd dictionaries (see train_zstd_dictionary): one file per dict id, <id>.dict, plus
+# CURRENT naming the one new payloads are compressed with. Files are never overwritten or
+# removed, because every blob names the dictionary it needs.
+ZSTD_DICTIONARY_DIR = os.getenv('CEFR_ZSTD_DICT_DIR', 'data/zstd-dicts')
+# Single dictionary file used before the versioned store; still read (and used for new
+# payloads until a dictionary is trained into the store)
+ZSTD_DICTIONARY_PATH = os.getenv('CEFR_ZSTD_DICT', 'data/submission.zstd-dict')
+ZSTD_FIRST_DICT_ID = 32768  # lower ids are reserved by the zstd format
+ZSTD_LEVEL = 9
+
+_zstd_dicts: Dict[str, object] = {}  # file path -> ZstdCompressionDict
+_zstd_current: Dict[str, Optional[int]] = {}  # store directory -> current dict id
+_zstd_lock = threading.Lock()
+
+
+def _read_zstd_dictionary(path: str):
+    zstd_dict = _zstd_dicts.get(path)
+    if zstd_dict is None and zstandard is not None and os.path.exists(path):
+        with open(path, 'rb') as f:
+            zstd_dict = zstandard.ZstdCompressionDict(f.read())
+        _zstd_dicts[path] = zstd_dict
+    return zstd_dict
+
+
+def _dictionary_path(dict_id: int, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or ZSTD_DICTIONARY_DIR, f'{dict_id}.dict')
+
+
+def stored_zstd_dictionary_ids(directory: Optional[str] = None) -> List[int]:
+    """Dict ids in the versioned store, oldest first."""
+    try:
+        names = os.listdir(directory or ZSTD_DICTIONARY_DIR)
+    except FileNotFoundError:
+        return []
+    return sorted(int(name[:-5]) for name in names if name.endswith('.dict') and name[:-5].isdigit())
+
+
+def _load_zstd_dictionary(dict_id: int):
+    """The dictionary with this full id (store first, then the legacy file), or None."""
+    zstd_dict = _read_zstd_dictionary(_dictionary_path(dict_id))
+    if zstd_dict is None:
+        legacy = _read_zstd_dictionary(ZSTD_DICTIONARY_PATH)
+        if legacy is not None and legacy.dict_id() == dict_id:
+            zstd_dict = legacy
+    return zstd_dict
+
+
+def _current_zstd_dictionary():
+    directory = ZSTD_DICTIONARY_DIR
+    if directory not in _zstd_current:
+        with _zstd_lock:
+            try:
+                with open(os.path.join(directory, 'CURRENT'), encoding='ascii') as f:
+                    current = int(f.read().strip())
+            except (FileNotFoundError, ValueError):
+                legacy = _read_zstd_dictionary(ZSTD_DICTIONARY_PATH)
+                current = legacy.dict_id() if legacy is not None else None
+            _zstd_current[directory] = current
+    current = _zstd_current[directory]
+    return _load_zstd_dictionary(current) if current is not None and zstandard is not None else None
+
+
+def compress_payload(text: str, codec: Optional[str] = None) -> bytes:
+    """
+    Compress a JSON payload. codec is 'zstd' or 'zlib'; by default zstd is used
+    when the zstandard package and a trained dictionary are available.
+    """
+    data = text.encode('utf-8')
+    zstd_dict = _current_zstd_dictionary() if codec in (None, 'zstd') else None
+
+    if zstd_dict is not None:
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=zstd_dict,
+                                              write_dict_id=False, write_content_size=True)
+        return TAG_ZSTD + zstd_dict.dict_id().to_bytes(4, 'big') + compressor.compress(data)
+
+    if codec == 'zstd':
+        raise RuntimeError('zstd compression requires the zstandard package and a trained dictionary')
+
+    compressor = zlib.compressobj(ZLIB_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                  zdict=ZLIB_DICTIONARIES[CURRENT_ZLIB_DICTIONARY])
+    return (TAG_ZLIB + bytes([CURRENT_ZLIB_DICTIONARY])
+            + compressor.compress(data) + compressor.flush())
+
+
+def _zstd_decompress(zstd_dict, body: bytes) -> str:
+    try:
+        return zstandard.ZstdDecompressor(dict_data=zstd_dict).decompress(body).decode('utf-8')
+    except (zstandard.ZstdError, UnicodeDecodeError) as e:
+        raise ValueError(f"Corrupt zstd payload: {e}") from e
+
+
+def decompress_payload(blob: bytes) -> str:
+    """Inverse of compress_payload(). Corrupt or unknown blobs (or missing dictionaries) raise ValueError."""
+    tag = blob[:1]
+
+    if tag == TAG_ZLIB and len(blob) >= 2:
+        version, body = blob[1], blob[2:]
+        if version not in ZLIB_DICTIONARIES:
+            raise ValueError(f"Unknown zlib dictionary version: {version}")
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=ZLIB_DICTIONARIES[version])
+        try:
+            return (decompressor.decompress(body) + decompressor.flush()).decode('utf-8')
+        except zlib.error as e:
+            raise ValueError(f"Corrupt zlib payload: {e}") from e
+
+    if tag == TAG_ZSTD and len(blob) >= 5:
+        dict_id = int.from_bytes(blob[1:5], 'big')
+        zstd_dict = _load_zstd_dictionary(dict_id) if zstandard is not None else None
+        if zstd_dict is None:
+            raise ValueError(f"zstd payload needs dictionary {dict_id}, which is not available")
+        return _zstd_decompress(zstd_dict, blob[5:])
+
+    if tag == TAG_ZSTD_LEGACY and len(blob) >= 2:
+        # Only the low byte of the id was recorded: try the legacy file first (it wrote these
+        # blobs), then every stored dictionary with the same low byte
+        version, body = blob[1], blob[2:]
+        candidates = [_read_zstd_dictionary(ZSTD_DICTIONARY_PATH)] if zstandard is not None else []
+        candidates += [_load_zstd_dictionary(i) for i in stored_zstd_dictionary_ids() if i & 0xFF == version]
+        for zstd_dict in candidates:
+            if zstd_dict is not None and zstd_dict.dict_id() & 0xFF == version:
+                try:
+                    return _zstd_decompress(zstd_dict, body)
+                except ValueError:
+                    continue
+        raise ValueError(f"zstd payload needs a dictionary with id & 0xFF == {version}, none matches")
+
+    raise ValueError(f"Unknown or truncated payload (tag {tag!r})")
+
+
+def train_zstd_dictionary(samples: Iterable[str], size: int = 16 * 1024,
+                          directory: Optional[str] = None) -> int:
+    """
+    Train a zstd dictionary on sample JSON payloads, add it to the versioned store under a
+    new dict id and make it current. Earlier dictionaries stay in the store, so blobs written
+    with them remain readable. Returns the new dict id.
+    """
+    if zstandard is None:
+        raise RuntimeError('zstandard is not installed')
+    directory = directory or ZSTD_DICTIONARY_DIR
+
+    with _zstd_lock:
+        known = stored_zstd_dictionary_ids(directory)
+        legacy = _read_zstd_dictionary(ZSTD_DICTIONARY_PATH)
+        if legacy is not None:
+            known.append(legacy.dict_id())
+        dict_id = max(known + [ZSTD_FIRST_DICT_ID - 1]) + 1
+        trained = zstandard.train_dictionary(size, [s.encode('utf-8') for s in samples], dict_id=dict_id)
+
+        os.makedirs(directory, exist_ok=True)
+        path = _dictionary_path(dict_id, directory)
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            # Another process trained one concurrently; never replace a dictionary blobs may use
+            raise RuntimeError(f"zstd dictionary {dict_id} already exists in {directory}; not overwriting")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(trained.as_bytes())
+
+        tmp_path = os.path.join(directory, 'CURRENT.tmp')
+        with open(tmp_path, 'w', encoding='ascii') as f:
+            f.write(str(dict_id))
+        os.replace(tmp_path, os.path.join(directory, 'CURRENT'))
+        _zstd_current[directory] = dict_id
+    return dict_id
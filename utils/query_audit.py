@@ -0,0 +1,207 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Tracing is opt-in; the threshold applies whenever it is on.
+TRACE_ENABLED = os.getenv('CEFR_SQL_TRACE', '0').lower() in ('1', 'true', 'yes', 'on')
+SLOW_QUERY_MS = float(os.getenv('CEFR_SLOW_QUERY_MS', '100'))
+# The progress handler fires every N SQLite VM instructions; steps * N approximates work done.
+PROGRESS_STEP = 1000
+RECENT_QUERY_LIMIT = 500
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_sql(sql: str) -> str:
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+def params_shape(params: Any) -> str:
+    """Describe bound parameters without their values (e.g. 'str,datetime')."""
+    if params is None:
+        return ''
+    if isinstance(params, dict):
+        return ','.join(f"{k}:{type(v).__name__}" for k, v in params.items())
+    return ','.join(type(p).__name__ for p in params)
+
+
+class QueryLog:
+    """In-process record of traced queries: recent entries plus per-statement aggregates."""
+
+    def __init__(self, slow_ms: float = SLOW_QUERY_MS, limit: int = RECENT_QUERY_LIMIT):
+        self.slow_ms = slow_ms
+        self.recent = deque(maxlen=limit)
+        self.aggregates: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, shape: str, duration_ms: float, rows: int, vm_steps: int):
+        text = normalize_sql(sql)
+        entry = {
+            'sql': text,
+            'params': shape,
+            'duration_ms': duration_ms,
+            'rows': rows,
+            'vm_steps': vm_steps * PROGRESS_STEP,
+            'at': time.time(),
+        }
+        with self._lock:
+            self.recent.append(entry)
+            agg = self.aggregates.setdefault(text, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0})
+            agg['count'] += 1
+            agg['total_ms'] += duration_ms
+            agg['max_ms'] = max(agg['max_ms'], duration_ms)
+            agg['rows'] += rows
+
+        if duration_ms >= self.slow_ms:
+            print(f"Slow query ({duration_ms:.1f}ms, {rows} rows, ~{entry['vm_steps']} VM steps): "
+                  f"{text} [{shape}]")
+
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [e for e in self.recent if e['duration_ms'] >= self.slow_ms]
+
+    def clear(self):
+        with self._lock:
+            self.recent.clear()
+            self.aggregates.clear()
+
+
+query_log = QueryLog()
+
+
+class TracingCursor(sqlite3.Cursor):
+    """Cursor that times each statement, counts fetched rows and VM progress steps."""
+
+    def _begin(self, sql: str, shape: str):
+        self._trace = (normalize_sql(sql), shape, time.perf_counter(), self.connection._vm_steps)
+        self._fetched = 0
+
+    def _finish(self, rows: Optional[int] = None):
+        trace = getattr(self, '_trace', None)
+        if trace is None:
+            return
+        self._trace = None
+        sql, shape, started, steps_before = trace
+        if rows is None:
+            rows = self._fetched if self._fetched else max(self.rowcount, 0)
+        query_log.record(sql, shape, (time.perf_counter() - started) * 1000, rows,
+                         self.connection._vm_steps - steps_before)
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        self._begin(sql, params_shape(parameters))
+        super().execute(sql, parameters)
+        if not sql.lstrip().upper().startswith(('SELECT', 'WITH', 'PRAGMA', 'EXPLAIN')):
+            self._finish()
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        seq = list(seq_of_parameters)
+        self._begin(sql, f"{params_shape(seq[0]) if seq else ''} x{len(seq)}")
+        super().executemany(sql, seq)
+        self._finish(max(self.rowcount, 0))
+        return self
+
+    def fetchone(self):
+        row = super().fetchone()
+        if row is None:
+            self._finish()
+        else:
+            self._fetched = getattr(self, '_fetched', 0) + 1
+        return row
+
+    def fetchmany(self, size=None):
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._fetched = getattr(self, '_fetched', 0) + len(rows)
+        if not rows:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = super().fetchall()
+        self._fetched = getattr(self, '_fetched', 0) + len(rows)
+        self._finish()
+        return rows
+
+    def close(self):
+        self._finish()
+        super().close()
+
+
+class TracingConnection(sqlite3.Connection):
+    """
+    sqlite3 connection factory: cursors are TracingCursors and a progress handler
+    counts VM instructions so full scans show up as large step counts.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._vm_steps = 0
+        self.set_progress_handler(self._on_progress, PROGRESS_STEP)
+
+    def _on_progress(self):
+        self._vm_steps += 1
+        return 0
+
+    def cursor(self, factory=TracingCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def connect(db_path: str, trace: Optional[bool] = None, **kwargs) -> sqlite3.Connection:
+    """sqlite3.connect() that installs tracing when enabled (CEFR_SQL_TRACE=1)."""
+    if trace is None:
+        trace = TRACE_ENABLED
+    if trace:
+        kwargs.setdefault('factory', TracingConnection)
+    return sqlite3.connect(db_path, **kwargs)
+
+
+# ----------------------------------------------------------------------
+# Query registry and EXPLAIN QUERY PLAN auditing
+# ----------------------------------------------------------------------
+
+_registry: Dict[str, Tuple[str, Sequence[Any], bool]] = {}
+
+
+def register_query(name: str, sql: str, params: Sequence[Any] = (), allow_scan: bool = False):
+    """
+    Register a statement shape for auditing. params are representative values used only
+    to bind placeholders for EXPLAIN. allow_scan marks statements that are expected to
+    touch every row (e.g. a full table delete).
+    """
+    _registry[name] = (normalize_sql(sql), tuple(params), allow_scan)
+
+
+def registered_queries() -> List[Tuple[str, str, Sequence[Any], bool]]:
+    return [(name,) + entry for name, entry in sorted(_registry.items())]
+
+
+def explain(conn: sqlite3.Connection, sql: str, params: Sequence[Any] = ()) -> List[str]:
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement."""
+    rows = sqlite3.Connection.execute(conn, f"EXPLAIN QUERY PLAN {sql}", tuple(params)).fetchall()
+    return [row[-1] for row in rows]
+
+
+def find_full_scans(plan: List[str]) -> List[str]:
+    """Plan lines that scan a table without an index (SCAN t, not SCAN t USING [COVERING] INDEX)."""
+    problems = []
+    for line in plan:
+        detail = line.strip()
+        if detail.startswith('SCAN ') and 'USING' not in detail and 'CONSTANT ROW' not in detail:
+            problems.append(detail)
+    return problems
+
+
+def find_temp_sorts(plan: List[str]) -> List[str]:
+    return [line.strip() for line in plan if 'USE TEMP B-TREE' in line]
@@ -0,0 +1,511 @@
+"""
+레벨별 시험 문항 로더
+
+extracted_questions.json에서 레벨별 문항을 읽어 정리합니다 (PRE-A1은 별도 격리 로더 사용).
+학생 시험지 페이지와 벤치마크에서 공통으로 사용합니다.
+문항 검사는 utils/bank_validation.py 보고서(bank_report.json)의 유효 문항 목록으로 대신합니다.
+문항에는 지문 본문 대신 지문 id('passage_id')만 넣습니다 (본문은 utils/passages.get_passage()로).
+"""
+
+from functools import lru_cache
+
+from utils.bank_validation import level_version, valid_indexes
+from utils.metrics import timed
+from utils.passages import register_passage
+
+# 비상용 지문 (은행 문항에 지문이 없을 때) - 본문은 한 번만 등록하고 문항에는 지문 id만 둠
+FALLBACK_PASSAGES = {
+    1: register_passage("Hi Tom,\n\nI am at the library. Please come at 3 o'clock.\nBring your English book.\nSee you soon!\n\nMia"),
+    3: register_passage("Henry and his big dog Mudge went camping. Henry's mother knew all about camping. She knew how to set up a tent. She knew how to build a campfire. Henry's father didn't know anything about camping. He just came with a guitar and a smile. They walked and walked. It was beautiful. Henry saw fish in the stream and a rainbow."),
+    5: register_passage("Nate is a detective. He likes pancakes very much. He had pancakes for breakfast. Then the telephone rang. It was Annie. Annie lost a picture. The picture was of her dog, Fang. Nate said, \"I will find the picture.\""),
+}
+
+# 질문 데이터 (실제로는 파일이나 데이터베이스에서 로드)
+@timed('questions.load_questions')
+def load_questions(level):
+    """
+    PRE-A1 UnboundLocalError 방지를 위한 특수 처리 로더
+    레벨 내용 해시(bank_report.json)가 같으면 정리한 문항을 프로세스 단위로 재사용합니다 (문항 사본 반환).
+    """
+    # 입력값 유효성 검사
+    if not level or not isinstance(level, str):
+        level = 'A1'  # 기본값
+
+    version = level_version(level)
+    if version is None:
+        return _load_level(level)
+    return [dict(q) for q in _load_level_cached(level.upper(), version)]
+
+@lru_cache(maxsize=16)
+def _load_level_cached(level, version):
+    # version(레벨 내용 해시)이 바뀐 레벨만 다시 읽음 - 다른 레벨의 캐시는 그대로
+    return tuple(_load_level(level))
+
+def _load_level(level):
+    # PRE-A1 완전 격리 처리 - Ultra-think 해결책 (대소문자 무관)
+    if level.upper() == 'PRE-A1':
+        return load_preA1_questions_isolated()
+
+    # 다른 레벨은 기존 로직 사용
+    return load_other_level_questions(level)
+
+def question_passage_id(q):
+    """은행 문항의 지문 id (예전 형식처럼 본문이 들어 있으면 등록 후 id, 지문이 없으면 None)"""
+    if q.get('passage_id'):
+        return q['passage_id']
+    if q.get('passage'):
+        return register_passage(q['passage'])
+    return None
+
+def load_preA1_questions_isolated():
+    """
+    PRE-A1 전용 완전 격리 로더 - 다른 어떤 코드도 섞이지 않음
+    """
+    # 1. 첫 번째 시도: 좋은 데이터가 있는 extracted_questions.json에서만 로드
+    try:
+        import json
+        import os
+        # 프로젝트 루트 경로 계산 (현재 파일의 상위 상위 디렉토리)
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        json_path = os.path.join(base_dir, 'extracted_questions.json')
+        
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        # 대소문자 무관한 PRE-A1 검색
+        pre_a1_key = None
+        for key in data.keys():
+            if key.upper() == 'PRE-A1':
+                pre_a1_key = key
+                break
+
+        if isinstance(data, dict) and pre_a1_key:
+            raw_questions = data[pre_a1_key]
+
+            if isinstance(raw_questions, list) and len(raw_questions) > 0:
+                cleaned_questions = []
+                # 은행 빌드 시 검증된 문항만 (utils/bank_validation.py)
+                valid = valid_indexes(pre_a1_key)
+
+                for index, q in enumerate(raw_questions):
+                    try:
+                        if valid is None or index in valid:
+                            cleaned_q = {
+                                'id': int(q.get('id', 0)),
+                                'question': str(q.get('question', '')).replace('<span class="question-text">', '').replace('</span>', ''),
+                                'options': [str(opt).replace('A)', '').replace('B)', '').replace('C)', '').replace('D)', '') for opt in q['options']],
+                                'correct': int(q.get('correct', 0)),  # 내부 채점용 - UI에 표시 안됨
+                                'section': str(q.get('section', 'General'))
+                            }
+
+                            # JSON에 지문이 있으면 그 지문 id 사용
+                            passage_id = question_passage_id(q)
+                            if passage_id:
+                                cleaned_q['passage_id'] = passage_id
+                            # 지문이 없고 PRE-A1 Reading 섹션이면 fallback 지문 연결
+                            elif cleaned_q['section'] == 'Reading':
+                                q_id = cleaned_q['id']
+                                # 지문 공유 규칙: 1-2번은 지문 1 공유, 3-4번은 지문 2 공유, 5-8번은 지문 3 공유
+                                if q_id in [1, 2]:
+                                    cleaned_q['passage_id'] = FALLBACK_PASSAGES[1]
+                                elif q_id in [3, 4]:
+                                    cleaned_q['passage_id'] = FALLBACK_PASSAGES[3]
+                                elif q_id in [5, 6, 7, 8]:
+                                    cleaned_q['passage_id'] = FALLBACK_PASSAGES[5]
+
+                            cleaned_questions.append(cleaned_q)
+                    except Exception:
+                        continue  # 개별 질문 오류는 무시
+
+                if cleaned_questions:
+                    return cleaned_questions
+
+    except Exception:
+        pass  # 실패 시 조용히 계속 진행
+
+    # 2. 두 번째 시도: A1 질문을 PRE-A1으로 사용 (fallback)
+    try:
+        a1_questions = load_other_level_questions('A1')
+        if a1_questions and len(a1_questions) > 0:
+            # ID를 PRE-A1 스타일로 조정
+            for q in a1_questions:
+                q['id'] = q['id']  # ID는 그대로 유지
+                q['original_level'] = 'A1'  # 원본 레벨 표시
+            return a1_questions
+    except Exception:
+        pass
+
+    # 3. 최후의 수단: 하드코딩된 비상 질문 (지문 포함)
+    return [
+        {
+            'id': 1,
+            'question': 'Where is Mia?',
+            'options': ['At school', 'At the library', 'At home', 'At the park'],
+            'correct': 1,  # 내부 채점용
+            'section': 'Reading',
+            'passage_id': FALLBACK_PASSAGES[1]  # 지문 포함
+        },
+        {
+            'id': 2,
+            'question': 'What should Tom bring?',
+            'options': ['His lunch box', 'His math book', 'His English book', 'His pencil case'],
+            'correct': 2,  # 내부 채점용
+            'section': 'Reading',
+            'passage_id': FALLBACK_PASSAGES[1]  # 지문 공유
+        },
+        {
+            'id': 3,
+            'question': 'My name _______ Alex.',
+            'options': ['am', 'is', 'are', 'be'],
+            'correct': 1,  # 내부 채점용
+            'section': 'Grammar'
+        },
+        {
+            'id': 4,
+            'question': 'I _______ from Korea.',
+            'options': ['am', 'is', 'are', 'be'],
+            'correct': 0,  # 내부 채점용
+            'section': 'Grammar'
+        },
+        {
+            'id': 5,
+            'question': 'What do you say when you meet someone?',
+            'options': ['Hello', 'Goodbye', 'Thank you', 'Sorry'],
+            'correct': 0,  # 내부 채점용
+            'section': 'Conversation'
+        }
+    ]
+
+def load_other_level_questions(level):
+    """
+    A1, A2, B1, B2 등 PRE-A1 외 레벨용 로더
+    """
+    questions = []  # 기본값으로 빈 리스트 초기화
+    
+    # JSON 파일에서 로드 시도
+    try:
+        import json
+        import os
+        # 프로젝트 루트 경로 계산 (현재 파일의 상위 상위 디렉터리)
+        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        json_path = os.path.join(base_dir, 'extracted_questions.json')
+        
+        with open(json_path, 'r', encoding='utf-8') as f:
+            extracted_questions = json.load(f)
+
+        # 딕셔너리 구조 확인 및 안전한 접근 (대소문자 무관)
+        level_key = None
+        for key in extracted_questions.keys():
+            if key.upper() == level.upper():
+                level_key = key
+                break
+
+        if isinstance(extracted_questions, dict) and level_key:
+            questions = extracted_questions[level_key]
+
+            # 데이터 정리 및 유효성 검사
+            if isinstance(questions, list):
+                cleaned_questions = []
+                # 은행 빌드 시 검증된 문항만 (utils/bank_validation.py)
+                valid = valid_indexes(level_key)
+                for index, q in enumerate(questions):
+                    try:
+                        if valid is None or index in valid:
+                            cleaned_q = {
+                                'id': q.get('id', 0),
+                                'question': str(q.get('question', '')).replace('<span class="question-text">', '').replace('</span>', ''),
+                                'options': [str(opt).replace('A)', '').replace('B)', '').replace('C)', '').replace('D)', '') for opt in q['options']],
+                                'correct': int(q.get('correct', 0)),  # 내부 채점용 - UI에 표시 안됨
+                                'section': str(q.get('section', 'General'))
+                            }
+                            
+                            # JSON에 지문이 있으면 그 지문 id 사용
+                            passage_id = question_passage_id(q)
+                            if passage_id:
+                                cleaned_q['passage_id'] = passage_id
+                            
+                            cleaned_questions.append(cleaned_q)
+                    except Exception:
+                        continue  # 개별 질문 오류는 무시하고 계속 진행
+
+                questions = cleaned_questions
+                if questions:
+                    return questions
+            else:
+                questions = []
+        else:
+            questions = []
+
+    except Exception:
+        questions = []  # 예외 발생시 빈 리스트로 초기화
+
+    # 2. A1 레벨은 하드코딩된 데이터 사용 (fallback)
+    if level == 'A1' and not questions:
+        questions = [
+            # Reading Comprehension (8문항) - 지문 포함
+            {
+                'id': 1,
+                'question': 'Where is Mia?',
+                'options': ['At school', 'At the library', 'At home', 'At the park'],
+                'correct': 1,
+                'section': 'Reading'
+            },
+            {
+                'id': 2,
+                'question': 'What should Tom bring?',
+                'options': ['His lunch box', 'His math book', 'His English book', 'His pencil case'],
+                'correct': 2,
+                'section': 'Reading'
+            },
+            {
+                'id': 3,
+                'question': 'Who knew about camping?',
+                'options': ['Henry\'s father', 'Henry\'s mother', 'Mudge the dog', 'Henry'],
+                'correct': 1,
+                'section': 'Reading'
+            },
+            {
+                'id': 4,
+                'question': 'What did Henry see?',
+                'options': ['Fish and a rainbow', 'Just a rainbow', 'Just fish', 'A guitar'],
+                'correct': 0,
+                'section': 'Reading'
+            },
+            {
+                'id': 5,
+                'question': 'What does Nate like to eat?',
+                'options': ['Sandwiches', 'Pancakes', 'Pizza', 'Cookies'],
+                'correct': 1,
+                'section': 'Reading'
+            },
+            {
+                'id': 6,
+                'question': 'What did Annie lose?',
+                'options': ['Her dog', 'A picture', 'Her phone', 'Her keys'],
+                'correct': 1,
+                'section': 'Reading'
+            },
+            {
+                'id': 7,
+                'question': 'What is the name of Annie\'s dog?',
+                'options': ['Mudge', 'Henry', 'Fang', 'Tom'],
+                'correct': 2,
+                'section': 'Reading'
+            },
+            {
+                'id': 8,
+                'question': 'What does Nate do?',
+                'options': ['He is a teacher', 'He is a doctor', 'He is a detective', 'He is a cook'],
+                'correct': 2,
+                'section': 'Reading'
+            },
+
+            # Vocabulary (12문항)
+            {
+                'id': 9,
+                'question': 'Choose the correct word: I ___ a student.',
+                'options': ['am', 'is', 'are', 'be'],
+                'correct': 0,
+                'section': 'Vocabulary'
+            },
+            {
+                'id': 10,
+                'question': 'What is the opposite of "big"?',
+                'options': ['Small', 'Large', 'Tall', 'Short'],
+                'correct': 0,
+                'section': 'Vocabulary'
+            },
+            {
+                'id': 11,
+                'question': 'What color is the sky?',
+                'options': ['Red', 'Blue', 'Green', 'Yellow'],
+                'correct': 1,
+                'section': 'Vocabulary'
+            },
+            {
+                'id': 12,
+                'question': 'How many days are in a week?',
+                'options': ['5', '6', '7', '8'],
+                'correct': 2,
+                'section': 'Vocabulary'
+            },
+            {
+                'id': 13,
+                'question': 'What do we use to write?',
+                'options': ['Pen', 'Book', 'Table', 'Chair'],
+                'correct': 0,
+                'section': 'Vocabulary'
+            },
+            {
+                'id': 14,
+                'question': 'Which animal says "meow"?',
+                'options': ['Dog', 'Cat', 'Bird', 'Fish'],
+                'correct': 1,
+                'section': 'Vocabulary'
+            },
+            {
+                'id': 15,
+                'question': 'What is the opposite of "hot"?',
+                'options': ['Cold', 'Warm', 'Cool', 'Ice'],
+                'correct': 0,
+                'section': 'Vocabulary'
+            },
+            {
+                'id': 16,
+                'question': 'How many legs does a dog have?',
+                'options': ['Two', 'Four', 'Six', 'Eight'],
+                'correct': 1,
+                'section': 'Vocabulary'
+            },
+            {
+                'id': 17,
+                'question': 'What is the opposite of "happy"?',
+                'options': ['Sad', 'Angry', 'Excited', 'Surprised'],
+                'correct': 0,
+                'section': 'Vocabulary'
+            },
+            {
+                'id': 18,
+                'question': 'What do you do with your eyes?',
+                'options': ['See', 'Hear', 'Smell', 'Taste'],
+                'correct': 0,
+                'section': 'Vocabulary'
+            },
+            {
+                'id': 19,
+                'question': 'What color is an apple?',
+                'options': ['Red', 'Blue', 'Green', 'Yellow'],
+                'correct': 0,
+                'section': 'Vocabulary'
+            },
+            {
+                'id': 20,
+                'question': 'What do you do when you are thirsty?',
+                'options': ['Drink', 'Eat', 'Sleep', 'Run'],
+                'correct': 0,
+                'section': 'Vocabulary'
+            },
+
+            # Conversation (5문항)
+            {
+                'id': 21,
+                'question': 'A: "Hello, how are you?" B: "___"',
+                'options': ['I\'m fine, thank you', 'I\'m 25 years old', 'I\'m a teacher', 'I\'m from Korea'],
+                'correct': 0,
+                'section': 'Conversation'
+            },
+            {
+                'id': 22,
+                'question': 'A: "What time is it?" B: "___"',
+                'options': ['It\'s 3 o\'clock', 'It\'s Monday', 'It\'s sunny', 'It\'s hot'],
+                'correct': 0,
+                'section': 'Conversation'
+            },
+            {
+                'id': 23,
+                'question': 'A: "Where is the library?" B: "___"',
+                'options': ['It\'s over there', 'It\'s expensive', 'It\'s delicious', 'It\'s cold'],
+                'correct': 0,
+                'section': 'Conversation'
+            },
+            {
+                'id': 24,
+                'question': 'A: "Thank you for your help." B: "___"',
+                'options': ['You\'re welcome', 'Thank you too', 'Goodbye', 'Hello'],
+                'correct': 0,
+                'section': 'Conversation'
+            },
+            {
+                'id': 25,
+                'question': 'A: "See you tomorrow." B: "___"',
+                'options': ['See you later', 'Nice to meet you', 'How are you', 'What\'s your name'],
+                'correct': 0,
+                'section': 'Conversation'
+            },
+
+            # Grammar (10문항)
+            {
+                'id': 26,
+                'question': 'She ___ a doctor.',
+                'options': ['am', 'is', 'are', 'be'],
+                'correct': 1,
+                'section': 'Grammar'
+            },
+            {
+                'id': 27,
+                'question': 'They ___ happy.',
+                'options': ['am', 'is', 'are', 'be'],
+                'correct': 2,
+                'section': 'Grammar'
+            },
+            {
+                'id': 28,
+                'question': '___ is your name?',
+                'options': ['What', 'Where', 'When', 'Who'],
+                'correct': 0,
+                'section': 'Grammar'
+            },
+            {
+                'id': 29,
+                'question': '___ do you live?',
+                'options': ['What', 'Where', 'When', 'Who'],
+                'correct': 1,
+                'section': 'Grammar'
+            },
+            {
+                'id': 30,
+                'question': 'She ___ to school every day.',
+                'options': ['go', 'goes', 'going', 'is go'],
+                'correct': 1,
+                'section': 'Grammar'
+            },
+            {
+                'id': 31,
+                'question': 'I ___ coffee every morning.',
+                'options': ['drink', 'drinks', 'drinking', 'is drink'],
+                'correct': 0,
+                'section': 'Grammar'
+            },
+            {
+                'id': 32,
+                'question': 'They ___ in London.',
+                'options': ['live', 'lives', 'living', 'is live'],
+                'correct': 0,
+                'section': 'Grammar'
+            },
+            {
+                'id': 33,
+                'question': 'He ___ very hard.',
+                'options': ['work', 'works', 'working', 'is work'],
+                'correct': 1,
+                'section': 'Grammar'
+            },
+            {
+                'id': 34,
+                'question': '___ old are you?',
+                'options': ['What', 'Where', 'When', 'How'],
+                'correct': 3,
+                'section': 'Grammar'
+            }
+        ]
+
+        # A1 레벨의 Reading 섹션에만 하드코딩된 지문 연결 (fallback용)
+        for question in questions:
+            if question.get('section') == 'Reading' and 'passage_id' not in question:
+                q_id = question['id']
+                # 지문 공유 규칙: 1-2번은 지문 1 공유, 3-4번은 지문 2 공유, 5-8번은 지문 3 공유
+                if q_id in [1, 2]:
+                    question['passage_id'] = FALLBACK_PASSAGES[1]
+                elif q_id in [3, 4]:
+                    question['passage_id'] = FALLBACK_PASSAGES[3]
+                elif q_id in [5, 6, 7, 8]:
+                    question['passage_id'] = FALLBACK_PASSAGES[5]
+
+        return questions
+
+    # 최종 안전장치: questions가 리스트인지 확인하고 반환
+    if not isinstance(questions, list):
+        print(f"Warning: questions is not a list, it's {type(questions)}. Returning empty list.")
+        return []
+
+    return questions
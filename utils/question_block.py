@@ -0,0 +1,90 @@
+"""
+클라이언트 측 문항 블록 컴포넌트 (components/question_block)
+
+한 블록(연속된 같은 섹션/지문 그룹)의 문항을 브라우저에서 렌더링하고, 선택과 블록 내
+이동을 브라우저에 버퍼링합니다. 서버로는 블록 제출, 시험 중단, 이전 블록 이동 시와
+sync_interval 초마다(변경분이 있을 때만) 한 번에 답안을 보냅니다.
+채점은 기존과 동일하게 서버의 calculate_score()가 담당하므로 정답 정보는 전송하지 않습니다.
+지문은 문항마다 싣지 않고 블록의 지문 id -> 본문 표로 한 번만 보내며, 브라우저는 블록을 푸는 동안
+지문을 문항 위에 고정해 둡니다 (문항을 넘길 때 다시 그리지 않음).
+"""
+
+import os
+from typing import Any, Dict, List, Optional
+
+import streamlit.components.v1 as components
+
+from utils.passages import passage_text
+from utils.test_progress import passage_key
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FRONTEND_DIR = os.path.join(BASE_DIR, 'components', 'question_block')
+
+# 브라우저에 버퍼링된 답안을 주기적으로 서버에 동기화하는 간격(초)
+DEFAULT_SYNC_INTERVAL = 60
+
+# 브라우저로 보내는 문항 필드 (정답 관련 필드 제외)
+CLIENT_FIELDS = ('id', 'question', 'options', 'section')
+
+_component_func = None
+
+
+def _component():
+    global _component_func
+    if _component_func is None:
+        _component_func = components.declare_component('question_block', path=FRONTEND_DIR)
+    return _component_func
+
+
+def client_questions(questions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """브라우저로 보낼 문항 데이터 - 정답(correct, original_correct 등)을 제거하고 지문은 그룹 키만 남깁니다."""
+    payload = []
+    for q in questions:
+        item = {field: q[field] for field in CLIENT_FIELDS if field in q}
+        if passage_key(q):
+            item['passage_id'] = passage_key(q)
+        payload.append(item)
+    return payload
+
+
+def client_passages(questions: List[Dict[str, Any]]) -> Dict[str, str]:
+    """블록 문항들이 쓰는 지문 (그룹 키 -> 본문, 지문마다 한 번)"""
+    passages = {}
+    for q in questions:
+        key = passage_key(q)
+        if key and key not in passages:
+            passages[key] = passage_text(q)
+    return passages
+
+
+def question_block(questions: List[Dict[str, Any]],
+                   answers: List[int],
+                   start: int,
+                   end: int,
+                   total: int,
+                   session_id: str,
+                   sync_interval: int = DEFAULT_SYNC_INTERVAL,
+                   key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    questions[start:end] 블록을 렌더링합니다.
+
+    Returns:
+        브라우저가 마지막으로 보낸 동기화 값 (없으면 None):
+        {"sync_id", "start", "answers": [선택 인덱스 또는 None], "cursor", "action"}
+        action은 "sync" | "submit_block" | "prev_block" | "abort" 중 하나입니다.
+    """
+    block_answers = [answers[i] if i < len(answers) else None for i in range(start, end)]
+    block = questions[start:end]
+
+    return _component()(
+        questions=client_questions(block),
+        passages=client_passages(block),
+        answers=block_answers,
+        start=start,
+        total=total,
+        is_last=end >= total,
+        session_id=session_id,
+        sync_interval=sync_interval,
+        key=key or f"question_block_{start}",
+        default=None,
+    )
@@ -0,0 +1,168 @@
+"""
+제출 결과 레코드 타입
+
+DB와 JSON 파일의 제출 데이터는 dict로 저장되지만, 대시보드/리포트/내보내기처럼 행마다
+여러 필드를 읽는 코드는 레코드로 변환해 속성으로 접근합니다 (dict 대비 메모리와
+조회 비용 감소 - benchmarks/record_memory.py).
+
+Python 3.8 호환을 위해 dataclass(slots=True) 대신 __slots__를 직접 선언합니다.
+__slots__와 기본값을 함께 쓸 수 없으므로 모든 필드는 from_dict()에서 채웁니다.
+
+기존 dict 기반 코드(분석기, 리포트 생성기 등)에 그대로 넘길 수 있도록 레코드는
+원래 JSON 키로 읽는 record['level'], record.get('studentInfo', {}) 도 지원합니다.
+저장하거나 JSON으로 내보낼 때는 to_dict()를 사용합니다.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+
+class _Record:
+    """JSON 키 기반 읽기 전용 접근 + frozen/slots 객체의 pickle 지원"""
+
+    __slots__ = ()
+    _KEYS: Dict[str, str] = {}  # JSON 키 -> 속성 이름
+
+    def __getitem__(self, key: str) -> Any:
+        attr = self._KEYS.get(key)
+        if attr is not None:
+            value = getattr(self, attr)
+            if value is not None:
+                return value
+        extra = getattr(self, 'extra', None)
+        if extra and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    # frozen dataclass는 __setattr__를 막으므로 기본 slots pickle 복원이 실패함 (3.10+ slots=True와 동일 처리)
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class StudentInfo(_Record):
+    __slots__ = ('name', 'full_name', 'school', 'grade', 'class_name')
+    _KEYS = {'name': 'name', 'full_name': 'full_name', 'school': 'school',
+             'grade': 'grade', 'class': 'class_name'}
+
+    name: Optional[str]
+    full_name: Optional[str]
+    school: Optional[str]
+    grade: Union[str, int, None]
+    class_name: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'StudentInfo':
+        get = data.get
+        return cls(get('name'), get('full_name'), get('school'), get('grade'), get('class'))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, attr) for key, attr in self._KEYS.items()
+                if getattr(self, attr) is not None}
+
+
+@dataclass(frozen=True)
+class SectionResult(_Record):
+    __slots__ = ('correct', 'total')
+    _KEYS = {'correct': 'correct', 'total': 'total'}
+
+    correct: int
+    total: int
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'SectionResult':
+        return cls(data.get('correct', 0), data.get('total', 0))
+
+    @property
+    def percentage(self) -> float:
+        return self.correct / self.total * 100 if self.total else 0.0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {'correct': self.correct, 'total': self.total}
+
+
+_SUBMISSION_KEYS = {
+    'studentInfo': 'student_info', 'level': 'level', 'submittedAt': 'submitted_at',
+    'score': 'score', 'passed': 'passed', 'correct': 'correct', 'total': 'total',
+    'sectionResults': 'section_results', 'answers': 'answers', 'savedAt': 'saved_at',
+}
+
+
+@dataclass(frozen=True)
+class Submission(_Record):
+    __slots__ = ('student_info', 'level', 'submitted_at', 'score', 'passed', 'correct', 'total',
+                 'section_results', 'answers', 'saved_at', 'extra')
+    _KEYS = _SUBMISSION_KEYS
+
+    student_info: StudentInfo
+    level: Optional[str]
+    submitted_at: Optional[str]
+    score: Union[int, float]
+    passed: bool
+    correct: int
+    total: int
+    section_results: Dict[str, SectionResult]
+    answers: Tuple[Optional[int], ...]
+    saved_at: Optional[str]
+    extra: Optional[Dict[str, Any]]  # 스키마 밖의 키 (filename, accuracy 등) - 없으면 None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'Submission':
+        get = data.get
+        extra = {k: v for k, v in data.items() if k not in _SUBMISSION_KEYS} or None
+        return cls(
+            StudentInfo.from_dict(get('studentInfo') or {}),
+            get('level'),
+            get('submittedAt'),
+            get('score', 0),
+            get('passed', False),
+            get('correct', 0),
+            get('total', 0),
+            {section: SectionResult.from_dict(result)
+             for section, result in (get('sectionResults') or {}).items()},
+            tuple(get('answers') or ()),
+            get('savedAt'),
+            extra,
+        )
+
+    @property
+    def student_name(self) -> str:
+        return self.student_info.name or 'Unknown'
+
+    def to_dict(self) -> Dict[str, Any]:
+        """저장 형식(save_results()와 같은 키)의 dict"""
+        data = {
+            'studentInfo': self.student_info.to_dict(),
+            'level': self.level,
+            'submittedAt': self.submitted_at,
+            'score': self.score,
+            'passed': self.passed,
+            'correct': self.correct,
+            'total': self.total,
+            'sectionResults': {section: r.to_dict() for section, r in self.section_results.items()},
+            'answers': list(self.answers),
+            'savedAt': self.saved_at,
+        }
+        data = {k: v for k, v in data.items() if v is not None}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+def as_submissions(items: Iterable[Union[Submission, Mapping[str, Any]]]) -> List[Submission]:
+    """dict/레코드가 섞인 제출 목록을 레코드 목록으로 (이미 레코드면 그대로)"""
+    return [s if isinstance(s, Submission) else Submission.from_dict(s) for s in items]
+
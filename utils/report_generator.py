@@ -6,6 +6,9 @@ EduPrompT v12.0 Premium Report Generator
 from datetime import datetime
 import json
 
+from utils.metrics import timed
+
+@timed('report.generate_premium_report')
 def generate_premium_report(student_info, test_results, analysis):
     """
     학생의 시험 결과를 EduPrompT v12.0 디자인 시스템을 적용한
@@ -0,0 +1,76 @@
+"""
+시험 채점 유틸리티
+"""
+
+from utils.metrics import timed
+
+# 채점 함수
+@timed('scoring.calculate_score')
+def calculate_score(answers, questions):
+    correct = 0
+    penalty_deduction = 0
+    total = len(questions)
+    section_results = {}
+
+    for i, question in enumerate(questions):
+        # 섹션 초기화
+        section = question['section']
+        if section not in section_results:
+            section_results[section] = {'correct': 0, 'total': 0}
+        section_results[section]['total'] += 1
+
+        # 정답 체크
+        if i < len(answers):
+            if answers[i] == question['correct']:
+                correct += 1
+                section_results[section]['correct'] += 1
+            elif answers[i] == -1: # 미응시/시험중단 패널티
+                # 틀린 것으로 처리됨(점수 없음) + 추가 패널티 부여
+                # 패널티: 1문항 당 0.25점 감점 (예시) -> 총점 백분율에서 차감용
+                # 혹은 맞은 개수에서 차감할 수도 있음.
+                # 여기서는 '추가 패널티'를 정답 수에서 0.25개 차감하는 것으로 구현 (부분 점수 깎임)
+                penalty_deduction += 0.25
+        # answers 길이가 부족한 경우(혹시나)는 틀린걸로 처리됨 (0점)
+
+    # 기본 점수 계산 (백분율)
+    # 패널티 적용: 정답 수에서 패널티만큼 차감
+    adjusted_correct = max(0, correct - penalty_deduction)
+    percentage = (adjusted_correct / total) * 100 if total > 0 else 0
+
+    return {
+        'score': round(percentage),
+        'correct': correct, # 실제 맞은 개수
+        'total': total,
+        'passed': percentage >= 70,
+        'section_results': section_results,
+        'penalty_deduction': penalty_deduction # 정보용
+    }
+
+def original_responses(answers, questions):
+    """
+    화면에 섞여 표시된 선택지 번호(answers)를 문항 은행의 원래 선택지 번호로 바꿉니다
+    (문항 분석용, -1 = 미응답). 섞은 순서(option_order)가 없는 문항이 있으면 None.
+    """
+    responses = []
+    for i, question in enumerate(questions):
+        order = question.get('option_order')
+        if order is None:
+            return None
+        answer = answers[i] if i < len(answers) else -1
+        responses.append(order[answer] if 0 <= answer < len(order) else -1)
+    return responses
+
+
+def estimate_ability(level, answers, questions):
+    """
+    보정된 문항 모수(item_params.json, calibrate_items.py)가 있으면 IRT 능력 추정치
+    {'theta', 'se', 'cefr', 'items', 'model'}를, 없으면 None을 반환합니다.
+    """
+    from utils.irt import get_item_parameters
+
+    params = get_item_parameters()
+    if params is None:
+        return None
+    correct = [i < len(answers) and answers[i] == question['correct'] for i, question in enumerate(questions)]
+    keys = [question.get('original_correct', question['correct']) for question in questions]
+    return params.estimate(level, [question['id'] for question in questions], correct, keys)
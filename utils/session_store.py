@@ -0,0 +1,296 @@
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple
+
+from utils import json_codec, query_audit
+
+DEFAULT_DB_PATH = "data/cefr_test.db"
+
+LOAD_SESSION_SQL = ('SELECT student_name, level, start_time, current_question, questions, answer_mappings '
+                    'FROM test_sessions WHERE session_key = ?')
+LOAD_SESSION_ANSWERS_SQL = 'SELECT q_idx, option FROM test_session_answers WHERE session_key = ? ORDER BY q_idx'
+DELETE_SESSION_ANSWERS_SQL = 'DELETE FROM test_session_answers WHERE session_key = ?'
+DELETE_SESSION_SQL = 'DELETE FROM test_sessions WHERE session_key = ?'
+INSERT_SESSION_SQL = '''
+INSERT INTO test_sessions
+    (session_key, student_name, level, start_time, questions, answer_mappings, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+UPSERT_SESSION_ANSWER_SQL = '''
+INSERT INTO test_session_answers (session_key, q_idx, option) VALUES (?, ?, ?)
+ON CONFLICT(session_key, q_idx) DO UPDATE SET option = excluded.option
+'''
+UPDATE_SESSION_POSITION_SQL = '''
+UPDATE test_sessions
+SET current_question = COALESCE(?, current_question), updated_at = ?
+WHERE session_key = ?
+'''
+
+query_audit.register_query('test_sessions.load', LOAD_SESSION_SQL, ('student:A1',))
+query_audit.register_query('test_session_answers.load', LOAD_SESSION_ANSWERS_SQL, ('student:A1',))
+query_audit.register_query('test_session_answers.delete', DELETE_SESSION_ANSWERS_SQL, ('student:A1',))
+query_audit.register_query('test_sessions.delete', DELETE_SESSION_SQL, ('student:A1',))
+query_audit.register_query('test_sessions.insert', INSERT_SESSION_SQL,
+                           ('student:A1', 'student', 'A1', 0.0, '[]', None, 0.0))
+query_audit.register_query('test_session_answers.upsert', UPSERT_SESSION_ANSWER_SQL, ('student:A1', 0, 0))
+query_audit.register_query('test_sessions.update_position', UPDATE_SESSION_POSITION_SQL, (0, 0.0, 'student:A1'))
+
+
+def session_key(student_name: str, level: str) -> str:
+    """Identify an in-progress test by student login and level."""
+    return f"{student_name}:{level}"
+
+
+class SessionStore:
+    """
+    Durable autosave of in-progress test sessions.
+
+    Writes (answers, position changes) are queued and applied by a single
+    background thread in batched transactions, so a click never waits on
+    SQLite. Repeated updates to the same answer or position inside a batch
+    are coalesced, and updates queued after a finish for the same key are
+    dropped. Reads (resume) use their own short-lived connection.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH,
+                 flush_interval: float = 0.05, max_batch: int = 1000, trace: Optional[bool] = None):
+        self.db_path = db_path
+        self.trace = trace
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+        directory = os.path.dirname(self.db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        self.init_db()
+
+    def connect(self) -> sqlite3.Connection:
+        """Create a database connection (traced when CEFR_SQL_TRACE=1 or trace=True)."""
+        conn = query_audit.connect(self.db_path, trace=self.trace, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def init_db(self):
+        """Create the in-progress session tables."""
+        conn = self.connect()
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS test_sessions (
+            session_key TEXT PRIMARY KEY,
+            student_name TEXT NOT NULL,
+            level TEXT NOT NULL,
+            start_time REAL NOT NULL,
+            current_question INTEGER NOT NULL DEFAULT 0,
+            questions TEXT NOT NULL,
+            answer_mappings TEXT,
+            updated_at REAL NOT NULL
+        )
+        ''')
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS test_session_answers (
+            session_key TEXT NOT NULL,
+            q_idx INTEGER NOT NULL,
+            option INTEGER NOT NULL,
+            PRIMARY KEY (session_key, q_idx)
+        ) WITHOUT ROWID
+        ''')
+        conn.commit()
+        conn.close()
+
+    # ------------------------------------------------------------------
+    # Write API (non-blocking)
+    # ------------------------------------------------------------------
+
+    def start_session(self, key: str, student_name: str, level: str, start_time: float,
+                      questions: List[Dict[str, Any]], answer_mappings: Optional[List[int]] = None):
+        """Register a new attempt, replacing any earlier in-progress one for the same key."""
+        payload = json_codec.dumps(questions)
+        mappings = json_codec.dumps(answer_mappings) if answer_mappings is not None else None
+        self._submit(('start', key, (student_name, level, start_time, payload, mappings)))
+
+    def record_answer(self, key: str, q_idx: int, option: int):
+        self._submit(('answer', key, (q_idx, option)))
+
+    def record_answers(self, key: str, start: int, options: List[int]):
+        for offset, option in enumerate(options):
+            self._submit(('answer', key, (start + offset, option)))
+
+    def record_position(self, key: str, current_question: int):
+        self._submit(('position', key, current_question))
+
+    def finish_session(self, key: str):
+        """Drop the autosave once the attempt has been submitted."""
+        self._submit(('finish', key, None))
+
+    def _submit(self, op: Tuple[str, str, Any]):
+        if self._closed:
+            return
+        self._ensure_writer()
+        self._queue.put(op)
+
+    # ------------------------------------------------------------------
+    # Read API
+    # ------------------------------------------------------------------
+
+    def load_session(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load an in-progress session, or None.
+        Answers are returned as the contiguous prefix the test page expects.
+        """
+        self.flush()
+        conn = self.connect()
+        try:
+            row = conn.execute(LOAD_SESSION_SQL, (key,)).fetchone()
+            if row is None:
+                return None
+            stored = conn.execute(LOAD_SESSION_ANSWERS_SQL, (key,)).fetchall()
+        finally:
+            conn.close()
+
+        answers = []
+        for q_idx, option in stored:
+            if q_idx != len(answers):
+                break
+            answers.append(option)
+
+        questions = json_codec.loads(row[4])
+        return {
+            'student_name': row[0],
+            'level': row[1],
+            'start_time': row[2],
+            'current_question': min(row[3], len(questions)),
+            'questions': questions,
+            'answer_mappings': json_codec.loads(row[5]) if row[5] else None,
+            'answers': answers,
+        }
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def flush(self):
+        """Block until every queued write has been committed."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        self.flush()
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _ensure_writer(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='session-store-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        conn = self.connect()
+        try:
+            while True:
+                op = self._queue.get()
+                if op is None:
+                    self._queue.task_done()
+                    return
+
+                batch = [op]
+                # Let a burst of clicks accumulate, then drain into one transaction
+                time.sleep(self.flush_interval)
+                stop = False
+                while len(batch) < self.max_batch:
+                    try:
+                        nxt = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is None:
+                        stop = True
+                        self._queue.task_done()
+                        break
+                    batch.append(nxt)
+
+                try:
+                    self._write_batch(conn, batch)
+                except sqlite3.Error as e:
+                    print(f"Session autosave error: {e}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Tuple[str, str, Any]]):
+        deletes = set()
+        finished = set()
+        starts = {}
+        answers = {}
+        positions = {}
+
+        for kind, key, value in batch:
+            if kind == 'start':
+                deletes.add(key)
+                finished.discard(key)
+                starts[key] = value
+                positions.pop(key, None)
+                for k in [k for k in answers if k[0] == key]:
+                    del answers[k]
+            elif kind == 'finish':
+                deletes.add(key)
+                finished.add(key)
+                starts.pop(key, None)
+                positions.pop(key, None)
+                for k in [k for k in answers if k[0] == key]:
+                    del answers[k]
+            elif key in finished:
+                # Late answer/position after a submit: deletes run first, so it would be orphaned
+                continue
+            elif kind == 'answer':
+                answers[(key, value[0])] = value[1]
+            elif kind == 'position':
+                positions[key] = value
+
+        now = time.time()
+        with conn:
+            if deletes:
+                keys = [(k,) for k in deletes]
+                conn.executemany(DELETE_SESSION_ANSWERS_SQL, keys)
+                conn.executemany(DELETE_SESSION_SQL, keys)
+            if starts:
+                conn.executemany(INSERT_SESSION_SQL, [(key,) + value + (now,) for key, value in starts.items()])
+            if answers:
+                conn.executemany(UPSERT_SESSION_ANSWER_SQL,
+                                 [(key, q_idx, option) for (key, q_idx), option in answers.items()])
+            touched = set(positions) | {key for key, _ in answers}
+            if touched:
+                conn.executemany(UPDATE_SESSION_POSITION_SQL, [(positions.get(key), now, key) for key in touched])
+
+
+_stores: Dict[str, SessionStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_session_store(db_path: str = DEFAULT_DB_PATH) -> SessionStore:
+    """Process-wide store per database file (shared by all Streamlit sessions)."""
+    store = _stores.get(db_path)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(db_path)
+            if store is None:
+                store = SessionStore(db_path)
+                _stores[db_path] = store
+                atexit.register(store.close)
+    return store
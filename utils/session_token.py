@@ -0,0 +1,142 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# How long a token restores a session without logging in again. Student tokens cover a whole
+# test; a leaked teacher/admin URL is worth far more, so those expire much sooner.
+TOKEN_TTL = int(os.getenv('CEFR_SESSION_TOKEN_TTL', str(4 * 60 * 60)))
+PRIVILEGED_TOKEN_TTL = int(os.getenv('CEFR_PRIVILEGED_TOKEN_TTL', str(15 * 60)))
+STUDENT_ROLE = 'student'
+# Generated on first use when neither CEFR_SESSION_SECRET nor st.secrets['session_secret'] is set,
+# so tokens survive server restarts
+SECRET_FILE = os.getenv('CEFR_SESSION_SECRET_FILE', 'data/.session_secret')
+
+_secret: Optional[bytes] = None
+_secret_lock = threading.Lock()
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+
+def _load_secret() -> bytes:
+    secret = os.getenv('CEFR_SESSION_SECRET')
+    if secret:
+        return secret.encode('utf-8')
+
+    try:
+        import streamlit as st
+        if 'session_secret' in st.secrets:
+            return str(st.secrets['session_secret']).encode('utf-8')
+    except Exception:  # no secrets.toml
+        pass
+
+    try:
+        with open(SECRET_FILE, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        directory = os.path.dirname(SECRET_FILE)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        secret = os.urandom(32)
+        try:
+            fd = os.open(SECRET_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:  # another worker created it first
+            with open(SECRET_FILE, 'rb') as f:
+                return f.read()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(secret)
+        return secret
+
+
+def get_secret() -> bytes:
+    global _secret
+    if _secret is None:
+        with _secret_lock:
+            if _secret is None:
+                _secret = _load_secret()
+    return _secret
+
+
+def set_secret(secret: Optional[bytes]):
+    """Override the signing key (tests); None reloads it from the configuration on next use."""
+    global _secret
+    _secret = secret
+
+
+def token_ttl(role: Optional[str]) -> int:
+    """Maximum token lifetime for a role."""
+    return TOKEN_TTL if role == STUDENT_ROLE else min(TOKEN_TTL, PRIVILEGED_TOKEN_TTL)
+
+
+def _sign(payload: bytes) -> str:
+    return _b64encode(hmac.new(get_secret(), payload, hashlib.sha256).digest())
+
+
+def issue_token(username: str, role: str, student_info: Optional[Dict[str, Any]] = None,
+                test_session: Optional[str] = None, test_level: Optional[str] = None,
+                ttl: Optional[int] = None, generation: int = 0) -> str:
+    """
+    Sign the login state as '<payload>.<signature>' (both base64url).
+    The payload is readable by the client, so it only carries what the session already shows.
+    generation is the user's token generation (UserStore.token_generation); the caller
+    rejects tokens whose generation is no longer current.
+    """
+    now = int(time.time())
+    claims = {'u': username, 'r': role, 'iat': now, 'exp': now + (ttl or token_ttl(role))}
+    if generation:
+        claims['g'] = generation
+    if student_info:
+        claims['si'] = student_info
+    if test_session:
+        claims['ts'] = test_session
+    if test_level:
+        claims['tl'] = test_level
+    payload = json.dumps(claims, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    return f"{_b64encode(payload)}.{_sign(payload)}"
+
+
+def verify_token(token: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Return the claims of a valid, unexpired token, else None.
+    Keys: username, role, student_info, test_session, test_level, generation, issued_at, expires_at.
+    Tokens living longer than token_ttl(role) are rejected as well (e.g. a teacher token
+    issued before the privileged TTL was lowered).
+    """
+    if not token or token.count('.') != 1:
+        return None
+    encoded, signature = token.split('.')
+    try:
+        payload = _b64decode(encoded)
+    except ValueError:
+        return None
+    if not hmac.compare_digest(signature, _sign(payload)):
+        return None
+
+    try:
+        claims = json.loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(claims, dict) or claims.get('exp', 0) < time.time():
+        return None
+    if claims['exp'] - claims.get('iat', 0) > token_ttl(claims.get('r')):
+        return None
+    return {
+        'username': claims.get('u'),
+        'role': claims.get('r'),
+        'student_info': claims.get('si') or {},
+        'test_session': claims.get('ts'),
+        'test_level': claims.get('tl'),
+        'generation': claims.get('g', 0),
+        'issued_at': claims.get('iat'),
+        'expires_at': claims.get('exp'),
+    }
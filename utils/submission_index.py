@@ -0,0 +1,207 @@
+"""
+제출 파일 사이드카 인덱스 (DataManager 파일 백엔드)
+
+submissions/ 디렉토리의 제출 JSON마다 한 줄씩 요약(파일명, 이름, 레벨, 제출/저장 시각, 점수,
+합격 여부)을 _index.jsonl에 기록합니다. 필터링과 오래된 파일 정리는 이 인덱스만 보고 하며,
+제출 파일은 실제로 내용이 필요한 항목만 열어서 읽습니다.
+
+- save_submission()이 파일을 쓴 뒤 인덱스에 한 줄을 추가합니다 (append - 파일 전체를 다시 쓰지 않음).
+  같은 파일명이 다시 기록되면 나중 줄이 이깁니다.
+- 메모리의 인덱스는 디렉토리와 인덱스 파일의 mtime/크기가 바뀌었을 때만 다시 맞춥니다.
+  인덱스에 없는 제출 파일(인덱스 도입 전 파일, 직접 복사한 파일)은 그 파일만 열어 추가하고,
+  사라진 파일의 항목은 버린 뒤 인덱스를 다시 씁니다. rebuild()는 모든 파일을 열어 새로 만듭니다.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from utils import json_codec
+
+INDEX_FILE = '_index.jsonl'
+# mtime은 커널 틱 단위로만 바뀌므로, 방금 바뀐 디렉토리의 시그니처는 믿지 않음 (racy-git 방식)
+SIGNATURE_SETTLE_NS = 2 * 10**9
+
+
+def index_entry(filename: str, data: Mapping[str, Any]) -> Dict[str, Any]:
+    """제출 dict의 인덱스 항목"""
+    info = data.get('studentInfo') or {}
+    return {
+        'filename': filename,
+        'name': info.get('name'),
+        'level': data.get('level'),
+        'submittedAt': data.get('submittedAt'),
+        'savedAt': data.get('savedAt'),
+        'score': data.get('score', 0),
+        'passed': bool(data.get('passed', False)),
+    }
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+class SubmissionIndex:
+    def __init__(self, submissions_dir: str):
+        self.submissions_dir = submissions_dir
+        self.path = os.path.join(submissions_dir, INDEX_FILE)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._signature = None  # 마지막으로 맞춘 시점의 (디렉토리 mtime, 인덱스 mtime, 인덱스 크기)
+        self._lock = threading.Lock()
+
+    def _current_signature(self):
+        dir_stat = os.stat(self.submissions_dir)
+        try:
+            index_stat = os.stat(self.path)
+            return dir_stat.st_mtime_ns, index_stat.st_mtime_ns, index_stat.st_size
+        except FileNotFoundError:
+            return dir_stat.st_mtime_ns, None, 0
+
+    def _settled_signature(self):
+        signature = self._current_signature()
+        newest = max(signature[0], signature[1] or 0)
+        return signature if time.time_ns() - newest > SIGNATURE_SETTLE_NS else None
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        entries = {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        entries[entry['filename']] = entry
+                    except (ValueError, KeyError, TypeError):
+                        continue  # 쓰다 만 마지막 줄 등
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _write_index(self, entries: Mapping[str, Dict[str, Any]]):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False))
+                f.write('\n')
+        os.replace(tmp_path, self.path)
+
+    def _append(self, entries: List[Dict[str, Any]]):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries))
+
+    def _index_file(self, filename: str) -> Optional[Dict[str, Any]]:
+        try:
+            return index_entry(filename, self.load(filename))
+        except Exception as e:
+            print(f"Error indexing {filename}: {e}")
+            return None
+
+    def refresh(self) -> Dict[str, Dict[str, Any]]:
+        """인덱스를 디렉토리와 맞추고 항목(filename -> 항목)을 반환합니다."""
+        with self._lock:
+            signature = self._current_signature()
+            if signature == self._signature:
+                return self._entries
+
+            entries = self._read_index()
+            files = {f for f in os.listdir(self.submissions_dir) if f.endswith('.json')}
+
+            added = []
+            for filename in sorted(files - entries.keys()):
+                entry = self._index_file(filename)
+                if entry is not None:
+                    entries[filename] = entry
+                    added.append(entry)
+
+            stale = entries.keys() - files
+            if stale:
+                for filename in stale:
+                    del entries[filename]
+                self._write_index(entries)
+            elif added:
+                self._append(added)
+
+            self._entries = entries
+            self._signature = self._settled_signature()
+            return entries
+
+    def rebuild(self) -> int:
+        """모든 제출 파일을 열어 인덱스를 새로 만들고 항목 수를 반환합니다."""
+        with self._lock:
+            entries = {}
+            for filename in sorted(os.listdir(self.submissions_dir)):
+                if filename.endswith('.json'):
+                    entry = self._index_file(filename)
+                    if entry is not None:
+                        entries[filename] = entry
+            self._write_index(entries)
+            self._entries = entries
+            self._signature = self._settled_signature()
+            return len(entries)
+
+    def add(self, filename: str, data: Mapping[str, Any]):
+        """save_submission()이 파일을 쓴 직후 호출합니다."""
+        entry = index_entry(filename, data)
+        with self._lock:
+            # 마지막 refresh() 이후 인덱스 파일이 그대로였다면(다른 프로세스의 추가 없음)
+            # 메모리 항목만 갱신하고 다음 refresh()에서 다시 읽지 않도록 시그니처를 맞춤
+            in_sync = self._signature is not None and self._current_signature()[1:] == self._signature[1:]
+            self._append([entry])
+            if in_sync:
+                self._entries[filename] = entry
+                self._signature = self._settled_signature()
+            else:
+                self._signature = None
+
+    def remove(self, filenames: List[str]):
+        """파일을 지운 뒤 해당 항목을 빼고 인덱스를 다시 씁니다."""
+        with self._lock:
+            entries = self._read_index()
+            for filename in filenames:
+                entries.pop(filename, None)
+            self._write_index(entries)
+            self._entries = entries
+            self._signature = None
+
+    def query(self,
+              level: Optional[str] = None,
+              start_date: Optional[datetime] = None,
+              end_date: Optional[datetime] = None,
+              student_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """조건에 맞는 인덱스 항목 (DataManager.filter_submissions()와 같은 조건)"""
+        matched = []
+        for entry in self.refresh().values():
+            if level and entry.get('level') != level:
+                continue
+            if student_name and entry.get('name') != student_name:
+                continue
+            if start_date or end_date:
+                submitted_at = _parse_time(entry.get('submittedAt'))
+                if submitted_at is None:
+                    continue
+                if start_date and submitted_at < start_date:
+                    continue
+                if end_date and submitted_at > end_date:
+                    continue
+            matched.append(entry)
+        return matched
+
+    def load(self, filename: str) -> Dict[str, Any]:
+        """제출 파일 하나를 읽습니다."""
+        with open(os.path.join(self.submissions_dir, filename), 'rb') as f:
+            return json_codec.decode_submission(f.read())
+
+    def iter_load(self, entries: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """항목의 제출 파일을 하나씩 읽습니다 (읽을 수 없는 파일은 건너뜀)."""
+        for entry in entries:
+            try:
+                yield self.load(entry['filename'])
+            except FileNotFoundError:
+                continue  # 그 사이 정리된 파일
+            except Exception as e:
+                print(f"Error loading {entry['filename']}: {e}")
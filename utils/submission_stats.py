@@ -0,0 +1,80 @@
+"""
+제출 결과 통계 (교사용 대시보드)
+"""
+
+from datetime import datetime
+
+from utils.metrics import timed
+from utils.records import as_submissions
+
+# 통계 계산 함수 (제출 dict 또는 Submission 레코드 목록)
+@timed('stats.calculate_statistics')
+def calculate_statistics(submissions):
+    if not submissions:
+        return {
+            'total_students': 0,
+            'avg_score': 0,
+            'pass_rate': 0,
+            'today_submissions': 0,
+            'level_distribution': {},
+            'score_distribution': {},
+            'section_averages': {}
+        }
+
+    submissions = as_submissions(submissions)
+    total_students = len(submissions)
+    avg_score = sum(s.score for s in submissions) / total_students
+    passed_count = sum(1 for s in submissions if s.passed)
+    pass_rate = (passed_count / total_students) * 100
+
+    # 오늘 제출 수
+    today = datetime.now().date()
+    today_submissions = sum(1 for s in submissions
+                          if datetime.fromisoformat(s.submitted_at or '').date() == today)
+
+    # 레벨별 분포
+    level_distribution = {}
+    for s in submissions:
+        level = s.level or 'Unknown'
+        level_distribution[level] = level_distribution.get(level, 0) + 1
+
+    # 점수 분포
+    score_ranges = {
+        '90-100': 0, '80-89': 0, '70-79': 0,
+        '60-69': 0, '50-59': 0, '0-49': 0
+    }
+    for s in submissions:
+        score = s.score
+        if score >= 90: score_ranges['90-100'] += 1
+        elif score >= 80: score_ranges['80-89'] += 1
+        elif score >= 70: score_ranges['70-79'] += 1
+        elif score >= 60: score_ranges['60-69'] += 1
+        elif score >= 50: score_ranges['50-59'] += 1
+        else: score_ranges['0-49'] += 1
+
+    # 섹션별 평균
+    section_totals = {}
+    section_counts = {}
+    for s in submissions:
+        for section, result in s.section_results.items():
+            if section not in section_totals:
+                section_totals[section] = 0
+                section_counts[section] = 0
+            if result.total > 0:
+                section_totals[section] += result.correct / result.total * 100
+                section_counts[section] += 1
+
+    section_averages = {
+        section: section_totals[section] / section_counts[section]
+        for section in section_totals
+    }
+
+    return {
+        'total_students': total_students,
+        'avg_score': round(avg_score),
+        'pass_rate': round(pass_rate),
+        'today_submissions': today_submissions,
+        'level_distribution': level_distribution,
+        'score_distribution': score_ranges,
+        'section_averages': section_averages
+    }
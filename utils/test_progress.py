@@ -0,0 +1,162 @@
+"""
+시험 진행 상태(섹션별 응답 수) 관리 유틸리티
+
+문항을 클릭할 때마다 전체 문항을 순회하며 섹션별 진행률을 다시 계산하지 않도록,
+시험 시작 시 문항 → 섹션 인덱스를 한 번 만들어 두고 답변이 추가될 때마다
+해당 섹션의 응답 수만 증가시킵니다.
+
+응답 여부는 기존 화면과 동일하게 "인덱스 < len(answers)" 기준입니다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def build_progress_index(questions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    문항 목록으로부터 섹션 진행 인덱스를 생성합니다.
+
+    Returns:
+        Dict: {
+            "sections": 섹션 이름 리스트 (등장 순서),
+            "section_of": 문항별 섹션 인덱스,
+            "totals": 섹션별 문항 수,
+            "answered": 섹션별 응답 수 (0으로 초기화)
+        }
+    """
+    sections = []
+    position = {}
+    section_of = []
+    totals = []
+
+    for q in questions:
+        section = q.get('section', 'General')
+        if section not in position:
+            position[section] = len(sections)
+            sections.append(section)
+            totals.append(0)
+        idx = position[section]
+        section_of.append(idx)
+        totals[idx] += 1
+
+    return {
+        'sections': sections,
+        'section_of': section_of,
+        'totals': totals,
+        'answered': [0] * len(sections),
+    }
+
+
+def sync_progress(progress: Dict[str, Any], answered_count: int) -> Dict[str, Any]:
+    """
+    세션 초기화 등으로 응답 수가 어긋난 경우 answers 길이에 맞춰 다시 계산합니다.
+    일반적인 경우 O(섹션 수)의 검사만 수행합니다.
+    """
+    if sum(progress['answered']) == answered_count:
+        return progress
+
+    answered = [0] * len(progress['sections'])
+    for idx in progress['section_of'][:answered_count]:
+        answered[idx] += 1
+    progress['answered'] = answered
+    return progress
+
+
+def record_answer(answers: List[int], progress: Dict[str, Any], q_idx: int, option: int) -> None:
+    """
+    답변을 기록하고 섹션별 응답 수를 증분 갱신합니다.
+    이미 답한 문항이면 답만 바꾸고, 새 답변이면 answers 끝에 추가합니다.
+    """
+    if q_idx < len(answers):
+        answers[q_idx] = option
+        return
+
+    answers.append(option)
+    new_idx = len(answers) - 1
+    if new_idx < len(progress['section_of']):
+        progress['answered'][progress['section_of'][new_idx]] += 1
+
+
+def fill_unanswered(answers: List[int], progress: Dict[str, Any], total: int, value: int = -1) -> None:
+    """남은 문항을 미응답(-1)으로 채웁니다 (시험 중단/미답변 제출)."""
+    while len(answers) < total:
+        record_answer(answers, progress, len(answers), value)
+
+
+def group_passages(questions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    같은 지문을 쓰는 문항을 그 지문이 처음 나온 자리로 모은 문항 목록을 반환합니다.
+
+    은행에서는 한 레벨의 지문이 번갈아 나오기도 하므로(1, 3, 5번과 2, 4, 6번이 서로 다른 지문)
+    떨어져 있는 문항도 모아야 build_question_blocks()가 지문마다 한 블록을 만듭니다.
+    지문이 없는 문항의 순서와 지문 그룹 사이의 순서(처음 나온 순서)는 그대로입니다.
+    응답 여부가 "인덱스 < len(answers)" 기준이므로 답안이 생기기 전(시험 시작 시)에만 부릅니다.
+    """
+    groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    ordered: List[List[Dict[str, Any]]] = []
+    for q in questions:
+        key = _block_key(q)
+        if not key[1]:
+            ordered.append([q])
+            continue
+        if key not in groups:
+            groups[key] = []
+            ordered.append(groups[key])
+        groups[key].append(q)
+    return [q for group in ordered for q in group]
+
+
+def build_question_blocks(questions: List[Dict[str, Any]]) -> List[Tuple[int, int]]:
+    """
+    연속된 같은 섹션(읽기 문항은 같은 지문)의 문항을 하나의 블록으로 묶습니다.
+    같은 지문의 문항이 떨어져 있으면 시험 시작 시 group_passages()로 먼저 모아 둡니다.
+
+    Returns:
+        List[Tuple[int, int]]: 블록별 (시작 인덱스, 끝 인덱스) - 끝은 포함하지 않음
+    """
+    blocks = []
+    start = 0
+    for i in range(1, len(questions) + 1):
+        if i == len(questions) or _block_key(questions[i]) != _block_key(questions[start]):
+            blocks.append((start, i))
+            start = i
+    return blocks
+
+
+def passage_key(question: Dict[str, Any]) -> str:
+    """문항의 지문 그룹 키 (지문 id, 예전 세션처럼 본문이 들어 있으면 본문, 지문이 없으면 '')"""
+    return question.get('passage_id') or question.get('passage') or ''
+
+
+def _block_key(question: Dict[str, Any]) -> Tuple[str, str]:
+    return (question.get('section', 'General'), passage_key(question))
+
+
+def find_block(blocks: List[Tuple[int, int]], q_idx: int) -> int:
+    """문항 인덱스가 속한 블록 번호를 반환합니다 (범위를 벗어나면 마지막 블록)."""
+    for i, (start, end) in enumerate(blocks):
+        if start <= q_idx < end:
+            return i
+    return len(blocks) - 1
+
+
+def merge_answer_batch(answers: List[int], progress: Dict[str, Any], start: int,
+                       batch: List[Optional[int]]) -> int:
+    """
+    브라우저에서 모아 보낸 블록 답안을 세션 답안에 반영합니다.
+
+    기존 답안은 갱신하고, 새 답안은 answers 끝에서부터 이어지는 구간만 추가합니다
+    (응답 여부가 "인덱스 < len(answers)" 기준이므로 중간이 빈 답안은 브라우저 버퍼에 남겨 둠).
+
+    Returns:
+        int: 반영된 답안 수
+    """
+    merged = 0
+    for offset, option in enumerate(batch):
+        if option is None:
+            continue
+        q_idx = start + offset
+        if q_idx > len(answers):
+            break
+        record_answer(answers, progress, q_idx, int(option))
+        merged += 1
+    return merged
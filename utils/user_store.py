@@ -0,0 +1,390 @@
+import base64
+import csv
+import hashlib
+import hmac
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils import query_audit
+
+DEFAULT_DB_PATH = "data/cefr_test.db"
+
+# scrypt cost (~50 ms / 16 MiB per hash). hashlib.scrypt releases the GIL, so
+# concurrent logins hash in parallel. Override with CEFR_SCRYPT_N for tests/benchmarks.
+SCRYPT_N = int(os.getenv('CEFR_SCRYPT_N', str(2 ** 14)))
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+# Successful verifications remembered per process (a reconnecting student skips scrypt)
+VERIFY_CACHE_SIZE = 2048
+
+# Failed attempts allowed inside THROTTLE_WINDOW seconds before further attempts are refused.
+# The per-user limit counts failures per (username, client address), so guessing a known
+# username from elsewhere cannot lock its owner out. A whole exam hall usually shares one
+# public IP, so the per-IP limit is much looser.
+THROTTLE_WINDOW = 300
+MAX_FAILURES_PER_USER = int(os.getenv('CEFR_LOGIN_MAX_FAILURES_PER_USER', '5'))
+MAX_FAILURES_PER_IP = int(os.getenv('CEFR_LOGIN_MAX_FAILURES_PER_IP', '200'))
+
+PROFILE_FIELDS = ('name', 'school', 'grade', 'class')
+USER_COLUMNS = ('username', 'password_hash', 'role') + PROFILE_FIELDS
+
+LOAD_USERS_SQL = f"SELECT {', '.join(USER_COLUMNS)} FROM users"
+UPSERT_USER_SQL = f'''
+    INSERT INTO users ({', '.join(USER_COLUMNS)}, updated_at)
+    VALUES ({', '.join('?' * (len(USER_COLUMNS) + 1))})
+    ON CONFLICT(username) DO UPDATE SET
+        {', '.join(f'{c} = excluded.{c}' for c in USER_COLUMNS[1:])}, updated_at = excluded.updated_at
+    '''
+DELETE_USER_SQL = 'DELETE FROM users WHERE username = ?'
+# Session tokens (utils/session_token.py) carry the user's generation; logout bumps it,
+# which revokes every token issued before. Rows exist only for users who logged out.
+LOAD_TOKEN_GENERATIONS_SQL = 'SELECT username, generation FROM token_generations'
+BUMP_TOKEN_GENERATION_SQL = '''
+    INSERT INTO token_generations (username, generation) VALUES (?, 1)
+    ON CONFLICT(username) DO UPDATE SET generation = generation + 1
+    '''
+# Single-row counter bumped in the same transaction as every users/token_generations write
+USERS_VERSION_SQL = 'SELECT version FROM users_version WHERE id = 0'
+BUMP_USERS_VERSION_SQL = 'UPDATE users_version SET version = version + 1 WHERE id = 0'
+
+query_audit.register_query('users.load_all', LOAD_USERS_SQL, allow_scan=True)  # whole table, once per change
+query_audit.register_query('users.upsert', UPSERT_USER_SQL,
+                           ('student', 'scrypt$...', 'student', 'Kim', 'School', '3', 'A', datetime(2024, 1, 1)))
+query_audit.register_query('users.delete', DELETE_USER_SQL, ('student',))
+query_audit.register_query('users.load_token_generations', LOAD_TOKEN_GENERATIONS_SQL, allow_scan=True)
+query_audit.register_query('users.bump_token_generation', BUMP_TOKEN_GENERATION_SQL, ('student',))
+query_audit.register_query('users.version', USERS_VERSION_SQL)
+query_audit.register_query('users.bump_version', BUMP_USERS_VERSION_SQL)
+
+# Roster CSV headers (English or the Korean labels used in exports)
+ROSTER_ALIASES = {
+    'username': 'username', 'id': 'username', '아이디': 'username',
+    'password': 'password', '비밀번호': 'password',
+    'role': 'role', '역할': 'role',
+    'name': 'name', '이름': 'name',
+    'school': 'school', '학교': 'school',
+    'grade': 'grade', '학년': 'grade',
+    'class': 'class', '반': 'class',
+}
+
+
+class LoginThrottled(Exception):
+    """Too many failed attempts for this user or client address."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Too many failed login attempts; retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode('ascii')
+
+
+def hash_password(password: str, n: int = None) -> str:
+    """Encode a password as 'scrypt$n$r$p$salt$hash'."""
+    n = n or SCRYPT_N
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=SCRYPT_R, p=SCRYPT_P,
+                            maxmem=256 * n * SCRYPT_R, dklen=32)
+    return f"scrypt${n}${SCRYPT_R}${SCRYPT_P}${_b64(salt)}${_b64(digest)}"
+
+
+def verify_password(password: str, encoded: str) -> bool:
+    try:
+        scheme, n, r, p, salt, expected = encoded.split('$')
+        if scheme != 'scrypt':
+            return False
+        n, r, p = int(n), int(r), int(p)
+        digest = hashlib.scrypt(password.encode('utf-8'), salt=base64.b64decode(salt), n=n, r=r, p=p,
+                                maxmem=256 * n * r, dklen=32)
+    except (ValueError, TypeError):
+        return False
+    return hmac.compare_digest(digest, base64.b64decode(expected))
+
+
+class FailureThrottle:
+    """Sliding-window failure counter per key (username + client address, or client address)."""
+
+    def __init__(self, limit: int, window: float = THROTTLE_WINDOW):
+        self.limit = limit
+        self.window = window
+        self._failures: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def _prune(self, key: str, now: float) -> Optional[deque]:
+        failures = self._failures.get(key)
+        if failures is not None:
+            while failures and failures[0] <= now - self.window:
+                failures.popleft()
+            if not failures:
+                del self._failures[key]
+                return None
+        return failures
+
+    def retry_after(self, key: str) -> float:
+        """Seconds until the next attempt is allowed (0 when not throttled)."""
+        now = time.monotonic()
+        with self._lock:
+            failures = self._prune(key, now)
+            if failures is None or len(failures) < self.limit:
+                return 0.0
+            return failures[-self.limit] + self.window - now
+
+    def record_failure(self, key: str):
+        with self._lock:
+            self._failures.setdefault(key, deque()).append(time.monotonic())
+
+    def reset(self, key: str):
+        with self._lock:
+            self._failures.pop(key, None)
+
+
+class UserStore:
+    """
+    Hashed credentials in the SQLite users table.
+
+    The whole table is loaded into a process-wide dict and only re-read when the
+    users_version row changes (every write through this class bumps it, so commits to
+    other tables in the shared database do not trigger a reload); a login costs one
+    primary-key read, one dict lookup and one scrypt verification. Recent successful verifications are
+    kept in a bounded LRU keyed by an HMAC of the credentials, so a student who
+    reconnects does not pay for scrypt again; a password change invalidates the entry.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, cache_size: int = VERIFY_CACHE_SIZE):
+        self.db_path = db_path
+        self.cache_size = cache_size
+        self.user_throttle = FailureThrottle(MAX_FAILURES_PER_USER)
+        self.ip_throttle = FailureThrottle(MAX_FAILURES_PER_IP)
+        self._users: Dict[str, Dict[str, Any]] = {}
+        self._token_generations: Dict[str, int] = {}
+        self._users_version = None
+        self._verified: 'OrderedDict[bytes, str]' = OrderedDict()
+        self._cache_key = os.urandom(32)
+        self._dummy = None
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        self.init_db()
+        # Kept open to poll users_version
+        self._version_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+
+    def connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def init_db(self):
+        conn = self.connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                username TEXT PRIMARY KEY,
+                password_hash TEXT NOT NULL,
+                role TEXT NOT NULL DEFAULT 'student',
+                name TEXT,
+                school TEXT,
+                grade TEXT,
+                class TEXT,
+                updated_at TIMESTAMP NOT NULL
+            )
+        ''')
+        conn.execute('CREATE TABLE IF NOT EXISTS token_generations (username TEXT PRIMARY KEY, '
+                     'generation INTEGER NOT NULL)')
+        conn.execute('CREATE TABLE IF NOT EXISTS users_version (id INTEGER PRIMARY KEY CHECK (id = 0), '
+                     'version INTEGER NOT NULL)')
+        conn.execute('INSERT OR IGNORE INTO users_version VALUES (0, 0)')
+        conn.commit()
+        conn.close()
+
+    def close(self):
+        self._version_conn.close()
+
+    # -- loaded index ---------------------------------------------------
+
+    def _current_users(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            version = self._version_conn.execute(USERS_VERSION_SQL).fetchone()[0]
+            if version != self._users_version:
+                conn = self.connect()
+                try:
+                    rows = conn.execute(LOAD_USERS_SQL).fetchall()
+                    generations = dict(conn.execute(LOAD_TOKEN_GENERATIONS_SQL).fetchall())
+                finally:
+                    conn.close()
+                self._users = {row[0]: dict(zip(USER_COLUMNS, row)) for row in rows}
+                self._token_generations = generations
+                self._users_version = version
+            return self._users
+
+    def has_users(self) -> bool:
+        return bool(self._current_users())
+
+    def get_user(self, username: str) -> Optional[Dict[str, Any]]:
+        user = self._current_users().get(username)
+        return None if user is None else {k: v for k, v in user.items() if k != 'password_hash'}
+
+    def usernames(self) -> List[str]:
+        return sorted(self._current_users())
+
+    def token_generation(self, username: str) -> int:
+        """Current session token generation (also for users that only exist in the legacy config)."""
+        self._current_users()
+        return self._token_generations.get(username, 0)
+
+    # -- writes ---------------------------------------------------------
+
+    def upsert_users(self, users: Iterable[Dict[str, Any]], workers: int = 8) -> int:
+        """
+        Add or update users given as dicts with username, password, role and profile fields.
+        Passwords are hashed on a thread pool; all rows are written in one transaction.
+        """
+        users = [u for u in users if u.get('username')]
+
+        def row(user):
+            return ((user['username'], hash_password(str(user['password'])), user.get('role') or 'student')
+                    + tuple(None if user.get(f) in (None, '') else str(user[f]) for f in PROFILE_FIELDS)
+                    + (datetime.now(),))
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            rows = list(pool.map(row, users))
+
+        conn = self.connect()
+        try:
+            with conn:
+                conn.executemany(UPSERT_USER_SQL, rows)
+                conn.execute(BUMP_USERS_VERSION_SQL)
+        finally:
+            conn.close()
+        return len(rows)
+
+    def add_user(self, username: str, password: str, role: str = 'student', **profile):
+        self.upsert_users([dict(profile, username=username, password=password, role=role)], workers=1)
+
+    def delete_user(self, username: str):
+        conn = self.connect()
+        try:
+            with conn:
+                conn.execute(DELETE_USER_SQL, (username,))
+                conn.execute(BUMP_USERS_VERSION_SQL)
+        finally:
+            conn.close()
+
+    def revoke_tokens(self, username: str):
+        """Invalidate every session token issued to username so far (called on logout)."""
+        conn = self.connect()
+        try:
+            with conn:
+                conn.execute(BUMP_TOKEN_GENERATION_SQL, (username,))
+                conn.execute(BUMP_USERS_VERSION_SQL)
+        finally:
+            conn.close()
+
+    def import_roster(self, path: str, default_role: str = 'student',
+                      password_length: int = 8) -> List[Dict[str, Any]]:
+        """
+        Import a class roster CSV (username, password, name, school, grade, class, role;
+        Korean headers also accepted). Rows without a password get a generated one.
+        Returns the imported users including plaintext passwords, for handing out.
+        """
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            reader = csv.DictReader(f)
+            users = []
+            for raw in reader:
+                user = {ROSTER_ALIASES[k.strip().lower()]: (v or '').strip()
+                        for k, v in raw.items() if k and k.strip().lower() in ROSTER_ALIASES}
+                if not user.get('username'):
+                    continue
+                user['role'] = user.get('role') or default_role
+                if not user.get('password'):
+                    user['password'] = secrets.token_urlsafe(password_length)[:password_length]
+                users.append(user)
+        self.upsert_users(users)
+        return users
+
+    # -- verification ---------------------------------------------------
+
+    def _dummy_hash(self) -> str:
+        if self._dummy is None:
+            self._dummy = hash_password(secrets.token_hex(8))
+        return self._dummy
+
+    def _credential_key(self, username: str, password: str) -> bytes:
+        return hmac.new(self._cache_key, f"{username}\0{password}".encode('utf-8'), hashlib.sha256).digest()
+
+    def verify(self, username: str, password: str) -> Optional[Dict[str, Any]]:
+        """Return the user (without hash) if the password matches, else None. No throttling."""
+        user = self._current_users().get(username)
+        if user is None:
+            # Spend the same time as a real check so unknown usernames cannot be told apart
+            verify_password(password, self._dummy_hash())
+            return None
+
+        key = self._credential_key(username, password)
+        with self._lock:
+            cached = self._verified.get(key)
+            if cached is not None:
+                self._verified.move_to_end(key)
+        if cached != user['password_hash']:
+            if not verify_password(password, user['password_hash']):
+                return None
+            with self._lock:
+                self._verified[key] = user['password_hash']
+                self._verified.move_to_end(key)
+                while len(self._verified) > self.cache_size:
+                    self._verified.popitem(last=False)
+        return {k: v for k, v in user.items() if k != 'password_hash'}
+
+    @staticmethod
+    def _user_key(username: str, client_ip: Optional[str]) -> str:
+        return f"{username}\0{client_ip}" if client_ip else username
+
+    def check_throttle(self, username: str, client_ip: Optional[str] = None):
+        """Raise LoginThrottled if the user (from this address) or the address has too many recent failures."""
+        retry_after = self.user_throttle.retry_after(self._user_key(username, client_ip))
+        if client_ip:
+            retry_after = max(retry_after, self.ip_throttle.retry_after(client_ip))
+        if retry_after > 0:
+            raise LoginThrottled(retry_after)
+
+    def record_result(self, username: str, client_ip: Optional[str], success: bool):
+        key = self._user_key(username, client_ip)
+        if success:
+            self.user_throttle.reset(key)
+        else:
+            self.user_throttle.record_failure(key)
+            if client_ip:
+                self.ip_throttle.record_failure(client_ip)
+
+    def authenticate(self, username: str, password: str,
+                     client_ip: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Throttled verify(). Raises LoginThrottled instead of checking when locked out."""
+        self.check_throttle(username, client_ip)
+        user = self.verify(username, password)
+        self.record_result(username, client_ip, user is not None)
+        return user
+
+
+_stores: Dict[str, UserStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_user_store(db_path: str = DEFAULT_DB_PATH) -> UserStore:
+    """Process-wide store per database file (shared by all Streamlit sessions)."""
+    store = _stores.get(db_path)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(db_path)
+            if store is None:
+                store = UserStore(db_path)
+                _stores[db_path] = store
+    return store
@@ -1,9 +1,13 @@
 
-import plotly.graph_objects as go
-import plotly.express as px
 from typing import Dict, Any
+from utils.lazy_imports import lazy_import
+from utils.metrics import timed
 
-def create_radar_chart(section_data: Dict[str, Any], title: str = "Section Performance") -> go.Figure:
+# plotly는 차트를 처음 그릴 때 import
+go = lazy_import('plotly.graph_objects')
+
+@timed('chart.create_radar_chart')
+def create_radar_chart(section_data: Dict[str, Any], title: str = "Section Performance") -> 'go.Figure':
     """
     Creates a radar chart from section performance data.
     
@@ -0,0 +1,46 @@
+import argparse
+import os
+import sys
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.bank_validation import BANK_PATH, REPORT_PATH, RULES, build_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate the question bank and write a machine-readable report')
+    parser.add_argument('--bank', default=BANK_PATH, help=f'question bank (default: {BANK_PATH})')
+    parser.add_argument('--out', default=REPORT_PATH, help=f'report file (default: {REPORT_PATH})')
+    parser.add_argument('--no-save', action='store_true', help='print the findings without writing the report')
+    parser.add_argument('--strict', action='store_true', help='exit with status 1 on warnings as well as errors')
+    parser.add_argument('--rules', action='store_true', help='list the registered rules and exit')
+    args = parser.parse_args()
+
+    if args.rules:
+        for item_rule in RULES:
+            print(f"{item_rule.name:20} {item_rule.severity:8} {item_rule.scope:9} {item_rule.description}")
+        return
+
+    if not os.path.exists(args.bank):
+        print(f"Question bank not found: {args.bank}")
+        sys.exit(1)
+
+    report = build_report(args.bank, None if args.no_save else args.out)
+    for level, level_report in report['levels'].items():
+        print(f"[{level}] {len(level_report['valid'])}/{level_report['questions']} usable")
+        for issue in level_report['issues']:
+            where = f"Q{issue['id']} " if issue['index'] is not None else ''
+            print(f"  {issue['severity']:7} {issue['rule']}: {where}{issue['message']}")
+
+    summary = report['summary']
+    print(f"{summary['valid']}/{summary['questions']} questions usable, "
+          f"{summary['errors']} errors, {summary['warnings']} warnings")
+    if not args.no_save:
+        print(f"Report saved to {args.out}")
+    if summary['errors'] or (args.strict and summary['warnings']):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()